@@ -1,17 +1,20 @@
 import sys
 import os
 
-# Dynamically add the project root to the Python path
+# Dynamically add the package sources to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
-sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
 
 from typing import Any, Dict
-from src.custom_gaussian.__main__ import gauss_parse_file_to_model
+from parse_patrol import gaussian_parse
 
 def parse_gaussian_files(directory: str):
     """
     Parse Gaussian files in the specified directory.
 
+    For large directories, prefer the command line tool, which parses in parallel and resumes:
+    `parse-patrol parse <directory> --parser gaussian -o results.jsonl`
+
     Args:
         directory (str): Path to the directory containing Gaussian files.
 
@@ -29,7 +32,7 @@ def parse_gaussian_files(directory: str):
                 continue
 
             print(f"Parsing file: {filename}")
-            parsed_data = gauss_parse_file_to_model(filepath)
+            parsed_data = gaussian_parse(filepath)
             results[filename] = parsed_data
 
         except Exception as e:
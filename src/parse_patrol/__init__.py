@@ -47,4 +47,9 @@ def available_parsers():
     """Return a list of available parsers based on installed dependencies."""
     return _available_parsers.copy()
 
-__all__.append("available_parsers")
\ No newline at end of file
+__all__.append("available_parsers")
+
+from .dispatch import parse_any, MergedModel  # noqa: E402 (needs PARSERS above)
+from .utils.serialize import dump_fast  # noqa: E402
+
+__all__.extend(["parse_any", "MergedModel", "dump_fast"])
\ No newline at end of file
@@ -4,7 +4,18 @@ Unified MCP server entrypoint for parse-patrol.
 Collects and exposes all tools from subservers.
 """
 
+import asyncio
+import os
+import sys
+import threading
+from typing import Optional
+
 from mcp.server.fastmcp import FastMCP # pyright: ignore[reportMissingImports]
+from . import aio
+from .utils import pool, profiling
+from .utils.metrics import METRICS_PORT_ENV, REGISTRY, CONTENT_TYPE, label_parser, start_http_server, track_tool
+from .utils.serialize import dump_fast
+from .utils.triage import TriageReport, triage
 
 mcp = FastMCP("Parse Patrol - Unified Chemistry Parser")
 RESOURCE_PREFIX = "parse-patrol://"
@@ -13,6 +24,7 @@ RESOURCE_PREFIX = "parse-patrol://"
 parser_configs = [
     {
         "name": "cclib parser",
+        "metrics_label": "cclib",
         "module": ".parsers.cclib.__main__",
         "imports": ["cclib_parse_file_to_model", "cclib_test_prompt"],
         "tools": ["cclib_parse_file_to_model"],
@@ -21,21 +33,24 @@ parser_configs = [
     },
     {
         "name": "gaussian parser", 
+        "metrics_label": "gaussian",
         "module": ".parsers.gaussian.__main__",
-        "imports": ["gauss_parse_file_to_model", "custom_gaussian_test_prompt"],
-        "tools": ["gauss_parse_file_to_model"],
+        "imports": ["gauss_parse_file_to_model", "gauss_follow_log", "gauss_query_log", "gauss_parse_jobs", "custom_gaussian_test_prompt"],
+        "tools": ["gauss_parse_file_to_model", "gauss_follow_log", "gauss_query_log", "gauss_parse_jobs"],
         "prompts": ["custom_gaussian_test_prompt"]
     },
     {
         "name": "iodata parser",
+        "metrics_label": "iodata",
         "module": ".parsers.iodata.__main__", 
-        "imports": ["iodata_parse_file_to_model", "iodata_test_prompt"],
-        "tools": ["iodata_parse_file_to_model"],
+        "imports": ["iodata_parse_file_to_model", "iodata_sample_trajectory", "iodata_test_prompt"],
+        "tools": ["iodata_parse_file_to_model", "iodata_sample_trajectory"],
         "resources": ["iodata_documentation"],
         "prompts": ["iodata_test_prompt"]
     },
     {
         "name": "NOMAD database",
+        "metrics_label": "nomad",
         "module": ".databases.nomad.__main__",
         "imports": ["search_nomad_entries", "get_nomad_raw_files", "get_nomad_archive", "nomad_materials_prompt"],
         "tools": ["search_nomad_entries", "get_nomad_raw_files", "get_nomad_archive"],
@@ -53,10 +68,10 @@ def register_parsers():
             from importlib import import_module
             module = import_module(config["module"], package=__package__)
             
-            # Register tools
+            # Register tools, reporting every call into the metrics registry
             for tool_name in config.get("tools", []):
                 tool_func = getattr(module, tool_name)
-                mcp.tool()(tool_func)
+                mcp.tool()(track_tool(tool_func, parser=config.get("metrics_label", "none")))
 
             # Register resources
             for resource_name in config.get("resources", []):
@@ -97,6 +112,93 @@ def call_tools_as_code_dependencies():
     """
 
 
+@mcp.resource(f'{RESOURCE_PREFIX}metrics', mime_type=CONTENT_TYPE.split(";")[0])
+def metrics() -> str:
+    """Server metrics (tool calls, latency, bytes parsed, cache hits, errors) in Prometheus text format."""
+    return REGISTRY.render()
+
+
+@mcp.resource(f'{RESOURCE_PREFIX}profiles', mime_type="application/json")
+def profiles() -> str:
+    """Parse profiles per parser and file type, and the slowest files, if `PARSE_PATROL_PROFILE` is set.
+
+    Workers write their profiles every few seconds, so the latest parses may be missing.
+    """
+    if not os.environ.get(profiling.PROFILE_ENV):
+        return dump_fast({"error": f"Profiling is off; start the server with {profiling.PROFILE_ENV}=<directory>"}).decode("utf-8")
+    profiling.dump()
+    return profiling.profile_report().model_dump_json()
+
+
+async def triage_files(path: str = ".data", parse: bool = False) -> TriageReport:
+    """
+    Quickly find corrupted computational chemistry files in a file or directory tree.
+
+    Checks every file from its head and tail only, in parallel: empty files, binary garbage,
+    invalid UTF-8, logs without a normal-termination message (truncated/crashed jobs) and
+    formatted checkpoints with incomplete sections. Much faster than parsing every file.
+
+    Args:
+        path: File or directory to check (recursively, skipping hidden entries)
+        parse: Also fully parse the files that pass, with the parser matching their sniffed type
+
+    Returns:
+        TriageReport with per-file status ('ok', 'corrupted', 'parsed', 'parse_failed'), issues and counts.
+        A missing path is reported as one 'corrupted' entry with an 'unreadable' issue.
+        In code: `from parse_patrol.utils.triage import triage; triage(path, parse=parse)`
+    """
+    return await asyncio.to_thread(triage, path, parse=parse)
+
+
+mcp.tool()(track_tool(triage_files))
+
+
+async def parse_file_to_json(filepath: str, parser: Optional[str] = None, precision: Optional[int] = None) -> str:
+    """
+    Parse a chemistry file and return the result as compact JSON text.
+
+    The file is parsed in a worker process and its large arrays (orbitals, Hessians, cube grids)
+    are written to JSON straight from shared memory, which is much faster than building the
+    model in this process first. Use `precision` to round floats and shrink large results.
+
+    Args:
+        filepath: Path to the chemistry file
+        parser: 'cclib', 'gaussian' or 'iodata' (default: the best available parser for the file)
+        precision: Round floats to this many decimals (default: full precision)
+
+    Returns:
+        The parsed model as JSON, or `{"error": ...}` if the file could not be parsed.
+        In code: `await parse_patrol.aio.parse_json(filepath, parser, precision)`, or `dump_fast(model, precision)`
+    """
+    label_parser(parser)
+    try:
+        payload = await aio.parse_json(filepath, parser, precision)
+    except (FileNotFoundError, ValueError, ImportError) as e:
+        payload = dump_fast({"error": str(e)})
+    return payload.decode("utf-8")
+
+
+mcp.tool()(track_tool(parse_file_to_json, parser="auto"))
+
+
+def warm_worker_pool() -> threading.Thread:
+    """Start the parser worker pool's fork server (and a first worker) in the background, so the first parse does not pay the parser imports."""
+    thread = threading.Thread(target=pool.warm, args=(1,), name="parse-patrol-warm", daemon=True)
+    thread.start()
+    return thread
+
+
+def start_metrics_endpoint():
+    """Serve the metrics over HTTP if `PARSE_PATROL_METRICS_PORT` is set."""
+    port = os.environ.get(METRICS_PORT_ENV)
+    if not port:
+        return None
+    server = start_http_server(int(port))
+    # stdout carries the MCP stdio transport
+    print(f"✓ Serving metrics on http://127.0.0.1:{port}/metrics", file=sys.stderr)
+    return server
+
+
 @mcp.prompt()
 async def parse_patrol_assistant_prompt(
     task_description: str, preferred_tools: str = "any available parsers"
@@ -138,8 +240,12 @@ async def cleanup_corrupted_files_prompt() -> str:
     return """
     You are helping me clean up corrupted computational chemistry files.
     
-    1. Check the folders in `.data` with the various parsing tools.
-    2. Report back to me any files that raise errors, null fields with all parser tools.
+    1. Run `triage_files` on `.data` with `parse=True`. It checks every file cheaply
+       (truncation, binary garbage, encoding, empty files, incomplete FCHK sections)
+       and fully parses only the files that pass.
+    2. Report back to me the files with status `corrupted` or `parse_failed`, with their issues.
+       Only if a file passed but looks suspicious, inspect it further with the individual parser tools
+       (e.g., for null fields).
     3. Then you ask me whether I want to delete these files. Simple yes/no question.
     """
 
@@ -189,6 +295,16 @@ async def parse_patrol_parser_pipeline_prompt(
     )
 
 
-register_parsers()
-if __name__ == "__main__":
+def main():
+    """Run the MCP server (the `parse-patrol-mcp` entry point), with the metrics endpoint and a warm worker pool."""
+    start_metrics_endpoint()
+    warm_worker_pool()
     mcp.run()
+
+
+# A spawned worker process (e.g., parse_patrol.utils.isolate) re-imports the entry script as
+# __mp_main__; it must not register tools (printing to the MCP stdio stream)
+if "__mp_main__" not in sys.modules:
+    register_parsers()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+Asyncio interface to the parsers.
+
+The coroutines here run the parsers in a shared process pool, so the event loop never
+blocks on parsing or reading files:
+
+- `cclib_parse`, `gaussian_parse`, `iodata_parse` and `parse_any` mirror the sync functions
+- `parse_stream` parses many files concurrently and yields a `ParseResult` per file
+- `parse_json` parses a file and returns its JSON (see `utils.serialize.dump_fast`)
+- `parse_stream(..., output="msgpack")` (or `"json"`) has the workers encode each result, for
+  forwarding without rebuilding the models here (see `utils.wire`)
+
+The pool is the shared pool of pre-warmed workers of `utils.pool`, created on first use with
+`PARSE_PATROL_WORKERS` processes (default: one per CPU); `configure` resizes it and
+`shutdown` stops it. Cancelling a coroutine drops its job
+if it has not started yet; a job already running finishes in its worker and is discarded.
+
+```python
+from parse_patrol import aio
+
+model = await aio.gaussian_parse("job.log")
+async for result in aio.parse_stream(paths, max_pending=32):
+    print(result.source, result.error or result.model.final_energy)
+```
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import Future
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, Iterable, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from .dispatch import _parser_function, _run_parser
+from .dispatch import parse_any as _parse_any
+from .utils.metrics import label_parser
+from .utils.serialize import dump_fast
+from .utils import pool
+from .utils.shm import SharedResult, receive, share
+from .utils.sources import MemorySource, Source, as_source
+from .utils.wire import _require_msgpack, encode
+
+Output = Literal["model", "json", "msgpack"]
+
+
+class ParseResult(BaseModel):
+    """Outcome of parsing one file in `parse_stream`."""
+
+    source: str = Field(description="Path (or name of the in-memory data) that was parsed")
+    model: Optional[Any] = Field(default=None, description="Parsed model, if the parse succeeded (output='model')")
+    data: Optional[bytes] = Field(default=None, description="Encoded model, if the parse succeeded (output='json' or 'msgpack')")
+    error: Optional[str] = Field(default=None, description="Why the parse failed")
+    elapsed: float = Field(default=0.0, description="Parse time in the worker (s)")
+
+
+def configure(max_workers: Optional[int] = None, max_tasks_per_child: Optional[int] = None) -> None:
+    """Set the size of the shared pool (default: `PARSE_PATROL_WORKERS`, or one per CPU), and
+    after how many tasks a worker is replaced (default: `PARSE_PATROL_MAX_TASKS_PER_CHILD`).
+
+    A running pool is shut down once its queued jobs are done; the next call starts a new one.
+    """
+    pool.configure(max_workers, max_tasks_per_child)
+
+
+def get_pool() -> pool.WorkerPool:
+    """The shared process pool (`utils.pool`), started on first use."""
+    return pool.get_pool()
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop the shared pool, cancelling queued jobs."""
+    pool.shutdown(wait)
+
+
+def _discard_shared(future: "Future[Any]") -> None:
+    """Free the shared memory of a result nobody is waiting for anymore."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    result = future.result()
+    for item in result if isinstance(result, tuple) else (result,):
+        if isinstance(item, SharedResult):
+            item.discard()
+
+
+async def _submit(func: Callable[..., Any], *args: Any) -> Any:
+    future = get_pool().submit(func, *args)
+    try:
+        # Cancelling the awaiting task cancels the pool future, so queued jobs never start
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        future.add_done_callback(_discard_shared)  # a running job still delivers its result
+        raise
+
+
+async def _portable(source: Source) -> Union[str, MemorySource]:
+    """A source that can be sent to a worker process; file-like objects are read off the loop."""
+    if isinstance(source, (str, os.PathLike)):
+        return os.fspath(source)
+    if not isinstance(source, (bytes, bytearray, memoryview, MemorySource)):
+        source = await asyncio.to_thread(as_source, source)
+    source = as_source(source)
+    if isinstance(source.data, memoryview):  # memoryviews do not pickle
+        source = MemorySource(source.data.tobytes(), source.name)
+    return source
+
+
+def _call(name: str, source: Union[str, MemorySource], instrument: Union[bool, str, None]) -> Any:
+    func = _parser_function(name)
+    if func is None:
+        raise ImportError(f"The {name} parser is not available (missing dependencies)")
+    return share(func(source, instrument=instrument))
+
+
+def _call_any(source: Union[str, MemorySource], kwargs: Dict[str, Any]) -> Any:
+    return share(_parse_any(source, **kwargs))
+
+
+async def cclib_parse(filepath: Source, instrument: Union[bool, str, None] = None) -> Any:
+    """Async `parse_patrol.cclib_parse`, run in the shared pool."""
+    return receive(await _submit(_call, "cclib", await _portable(filepath), instrument))
+
+
+async def gaussian_parse(filepath: Source, instrument: Union[bool, str, None] = None) -> Any:
+    """Async `parse_patrol.gaussian_parse`, run in the shared pool."""
+    return receive(await _submit(_call, "gaussian", await _portable(filepath), instrument))
+
+
+async def iodata_parse(filepath: Source, instrument: Union[bool, str, None] = None) -> Any:
+    """Async `parse_patrol.iodata_parse`, run in the shared pool."""
+    return receive(await _submit(_call, "iodata", await _portable(filepath), instrument))
+
+
+async def parse_any(filepath: Source, **kwargs: Any) -> Any:
+    """Async `parse_patrol.parse_any`, run in the shared pool.
+
+    The parser order learned by "fallback" is kept per worker process.
+    """
+    return receive(await _submit(_call_any, await _portable(filepath), kwargs))
+
+
+async def parse_json(filepath: Source, parser: Optional[str] = None, precision: Optional[int] = None) -> bytes:
+    """Parse in the shared pool and serialize the result with `dump_fast`.
+
+    Large arrays are written to JSON straight from the worker's shared memory, without
+    rebuilding the model's lists in this process. Within a tool wrapped by `track_tool`,
+    the call is labelled with the parser `parse_any` chose.
+
+    Args:
+        filepath: Path or in-memory source
+        parser: Parser name ('cclib', 'gaussian' or 'iodata'); default: `parse_any`
+        precision: Round floats to this many decimals (default: full precision)
+    """
+    source = await _portable(filepath)
+    if parser:
+        result = await _submit(_call, parser, source, None)
+    else:
+        result = await _submit(_call_any, source, {})
+        model = result.skeleton if isinstance(result, SharedResult) else result
+        label_parser(((getattr(model, "metadata", None) or {}).get("parse_any") or {}).get("parser"))
+    return dump_fast(result, precision)
+
+
+def _stream_job(parser: Optional[str], source: Union[str, MemorySource], output: Output = "model") -> Tuple[Any, Optional[str], float]:
+    start = time.perf_counter()
+    if parser:
+        model, error, elapsed = _run_parser(parser, source)
+    else:
+        try:
+            model, error = _parse_any(source), None
+        except Exception as e:
+            model, error = None, f"{type(e).__name__}: {str(e)[:500]}"
+        elapsed = time.perf_counter() - start
+    if model is None or output == "model":
+        return share(model), error, elapsed
+    return (dump_fast(model) if output == "json" else encode(model)), error, elapsed
+
+
+async def _iterate(sources: Union[Iterable[Source], AsyncIterable[Source]]) -> AsyncIterator[Source]:
+    if isinstance(sources, AsyncIterable):
+        async for source in sources:
+            yield source
+    else:
+        for source in sources:
+            yield source
+
+
+async def parse_stream(
+    sources: Union[Iterable[Source], AsyncIterable[Source]],
+    parser: Optional[str] = None,
+    max_pending: Optional[int] = None,
+    ordered: bool = False,
+    output: Output = "model",
+) -> AsyncIterator[ParseResult]:
+    """Parse many files concurrently in the shared pool, yielding a result per file.
+
+    At most `max_pending` files are being parsed or waiting to be consumed at any time,
+    so a slow consumer holds back the producer instead of piling up results. Failed
+    parses are reported in `ParseResult.error` rather than raised.
+
+    Args:
+        sources: Paths or in-memory sources, as a (possibly async) iterable
+        parser: Parser name ('cclib', 'gaussian' or 'iodata'); default: `parse_any` picks per file
+        max_pending: Bound on in-flight and unconsumed results (default: twice the pool size)
+        ordered: Yield results in input order (default: as soon as each is done)
+        output: 'model' for `ParseResult.model`; 'json' (`dump_fast`) or 'msgpack' (`utils.wire.encode`)
+            for the encoded model in `ParseResult.data`, encoded in the worker
+
+    Yields:
+        ParseResult per source
+    """
+    if output == "msgpack":
+        _require_msgpack()
+    limit = max_pending or 2 * pool.pool_size()
+    slots = asyncio.Semaphore(limit)
+    done: "asyncio.Queue[Tuple[int, Any]]" = asyncio.Queue()
+    tasks: set = set()
+
+    async def run(index: int, source: Source) -> None:
+        label = os.fspath(source) if isinstance(source, (str, os.PathLike)) else str(getattr(source, "name", None) or "<memory>")
+        try:
+            model, error, elapsed = await _submit(_stream_job, parser, await _portable(source), output)
+            if isinstance(model, bytes):
+                result = ParseResult(source=label, data=model, error=error, elapsed=elapsed)
+            else:
+                result = ParseResult(source=label, model=receive(model), error=error, elapsed=elapsed)
+        except Exception as e:  # e.g., an unreadable file-like object or a crashed worker
+            result = ParseResult(source=label, error=f"{type(e).__name__}: {e}")
+        done.put_nowait((index, result))
+
+    async def produce() -> None:
+        index = 0
+        try:
+            async for source in _iterate(sources):
+                await slots.acquire()
+                task = asyncio.create_task(run(index, source))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                index += 1
+        except Exception as e:
+            done.put_nowait((index, e))
+            return
+        done.put_nowait((index, None))  # end marker, with the number of sources
+
+    producer = asyncio.create_task(produce())
+    total: Optional[int] = None
+    received = 0
+    waiting: Dict[int, ParseResult] = {}
+    next_index = 0
+    try:
+        while total is None or received < total:
+            index, item = await done.get()
+            if not isinstance(item, ParseResult):
+                if isinstance(item, Exception):
+                    raise item
+                total = index
+                continue
+            received += 1
+            if not ordered:
+                slots.release()
+                yield item
+                continue
+            waiting[index] = item
+            while next_index in waiting:
+                slots.release()
+                yield waiting.pop(next_index)
+                next_index += 1
+    finally:
+        producer.cancel()
+        for task in list(tasks):
+            task.cancel()
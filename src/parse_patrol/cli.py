@@ -0,0 +1,564 @@
+"""
+Command-line interface for bulk parsing.
+
+`parse-patrol parse` parses files, directory trees and glob patterns in parallel (in the
+pre-warmed worker pool of `utils.pool`) and appends one record per file to a results file:
+
+- `jsonl` (default): one JSON line per file, `{"path", "parser", "status", "error", "elapsed", "size", "data"}`
+- `json`: one JSON file per input in an output directory, plus `_checkpoint.jsonl` there
+- `parquet`: part files of `--batch-size` rows in an output directory (needs `pyarrow`),
+  plus `_checkpoint.jsonl`; the selected fields become columns, with one schema for all parts
+
+Records are only ever appended, and a file counts as done once its record is written, so
+an interrupted run (Ctrl-C, a killed job) resumes where it stopped when started again with
+the same output; `--retry-failed` parses the failed files again, `--restart` starts over.
+Throughput is reported on stderr.
+
+`--profile DIR` profiles every parse (see `utils.profiling`), and `parse-patrol profile DIR`
+merges the profiles and lists the slowest files.
+
+```bash
+parse-patrol parse .data "runs/**/*.log" -o results.jsonl --jobs 8 --fields final_energy,atomcoords
+parse-patrol parse .data --parser cclib --format parquet -o results/
+parse-patrol parse .data --profile profiles --profiler sample && parse-patrol profile profiles
+```
+"""
+
+import argparse
+import glob
+import hashlib
+import importlib
+import json
+import os
+import re
+import sys
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union, get_args, get_origin
+
+from . import PARSERS
+from .dispatch import _run_parser
+from .dispatch import parse_any as _parse_any
+from .utils import pool, profiling
+from .utils.serialize import _fields, dump_fast
+from .utils.sniff import sniff
+from .utils.triage import _default_parser, iter_files
+
+FORMATS = ["jsonl", "json", "parquet"]
+CHECKPOINT = "_checkpoint.jsonl"  # "_" keeps it out of Parquet datasets
+PROGRESS_INTERVAL = 10.0  # seconds between progress lines
+
+
+def expand_paths(patterns: Iterable[str], recursive: bool = True) -> Iterator[str]:
+    """Files named by paths, directories (walked, skipping hidden entries) and glob patterns, each once."""
+    seen: Set[str] = set()
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        if not matches or not os.path.exists(matches[0]):
+            raise FileNotFoundError(f"No such file or directory: {pattern}")
+        for match in matches:
+            for path in sorted(iter_files(match, recursive)):
+                path = os.path.normpath(path)
+                if path not in seen:
+                    seen.add(path)
+                    yield path
+
+
+def _parse_record(path: str, parser: Optional[str], fields: Optional[List[str]], precision: Optional[int],
+                  profile: Optional[Tuple[str, str]] = None) -> Tuple[Dict[str, Any], bytes]:
+    """Parse one file into a record; returns the record without its data, and the whole record as JSON.
+
+    Runs in the worker processes: only the (small) encoded record travels back.
+    """
+    if profile:
+        profiling.enable(*profile)
+    start = time.perf_counter()
+    record: Dict[str, Any] = {"path": path, "parser": parser, "status": "ok", "error": None, "elapsed": 0.0, "size": None}
+    data = None
+    try:
+        record["size"] = os.path.getsize(path)
+        if parser:
+            model, error, _ = _run_parser(parser, path)
+        elif _default_parser(sniff(path)) is None:  # not a file any parser recognizes, as in triage
+            model, error = None, None
+            record["status"] = "unsupported"
+        else:
+            model, error = _parse_any(path), None
+            record["parser"] = model.metadata["parse_any"]["parser"]
+    except Exception as e:
+        model, error = None, f"{type(e).__name__}: {str(e)[:500]}"
+    if error is not None:
+        record["status"], record["error"] = "error", error
+    if model is not None and error is None:
+        values = _fields(model)
+        data = values if fields is None else {name: values.get(name) for name in fields}
+    record["elapsed"] = round(time.perf_counter() - start, 6)
+    return dict(record), dump_fast({**record, "data": data}, precision)
+
+
+class _Writer(ABC):
+    """Append-only results with a checkpoint: `done()` lists the files already written."""
+
+    @abstractmethod
+    def done(self) -> Dict[str, str]:
+        """Status per path of the files recorded by earlier runs."""
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any], payload: bytes) -> None:
+        """Add the record of one file (`payload` is the whole record as JSON)."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove the results of earlier runs."""
+
+    def close(self) -> None:
+        pass
+
+
+def _read_records(path: str) -> List[Dict[str, Any]]:
+    """The records of a JSONL file; a torn last line (interrupted write) is cut off."""
+    records: List[Dict[str, Any]] = []
+    if not os.path.exists(path):
+        return records
+    with open(path, "rb+") as f:
+        end = 0
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            end += len(line)
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+        f.truncate(end)
+    return records
+
+
+def _read_checkpoint(path: str) -> Dict[str, str]:
+    """Status per path in a JSONL file of records; a torn last line (interrupted write) is cut off."""
+    return {record["path"]: record["status"] for record in _read_records(path)}
+
+
+def _rewrite_lines(path: str, records: List[Dict[str, Any]]) -> None:
+    temp = f"{path}.tmp"
+    with open(temp, "wb") as f:
+        f.writelines(dump_fast(record) + b"\n" for record in records)
+    os.replace(temp, path)
+
+
+def _remove(path: str) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+
+
+class _Lines:
+    """An append-only JSONL file, flushed after every line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def append(self, line: bytes) -> None:
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, "ab")
+        self._file.write(line + b"\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+            self._file.close()
+            self._file = None
+
+
+class JsonlWriter(_Writer):
+    """All records in one JSONL file, which is its own checkpoint."""
+
+    def __init__(self, path: str):
+        self.lines = _Lines(path)
+
+    def done(self) -> Dict[str, str]:
+        return _read_checkpoint(self.lines.path)
+
+    def write(self, record: Dict[str, Any], payload: bytes) -> None:
+        self.lines.append(payload)
+
+    def clear(self) -> None:
+        _remove(self.lines.path)
+
+    def close(self) -> None:
+        self.lines.close()
+
+
+class JsonDirWriter(_Writer):
+    """One JSON file per input (named after it, plus a hash of its path) and a checkpoint of written files.
+
+    A file written but not yet checkpointed is parsed again on resume and overwritten under the same name.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.checkpoint = _Lines(os.path.join(directory, CHECKPOINT))
+
+    def done(self) -> Dict[str, str]:
+        return _read_checkpoint(self.checkpoint.path)
+
+    def write(self, record: Dict[str, Any], payload: bytes) -> None:
+        digest = hashlib.sha1(record["path"].encode("utf-8")).hexdigest()[:10]
+        name = f"{os.path.basename(record['path'])}-{digest}.json"
+        os.makedirs(self.directory, exist_ok=True)
+        temp = os.path.join(self.directory, f".{name}.tmp")
+        with open(temp, "wb") as f:
+            f.write(payload)
+        os.replace(temp, os.path.join(self.directory, name))
+        self.checkpoint.append(dump_fast({**record, "result": name}))
+
+    def clear(self) -> None:
+        for record in _read_records(self.checkpoint.path):
+            if record.get("result"):
+                _remove(os.path.join(self.directory, record["result"]))
+        _remove(self.checkpoint.path)
+
+    def close(self) -> None:
+        self.checkpoint.close()
+
+
+def _arrow_type(annotation: Any) -> Any:
+    """Arrow type of a model field; dicts, untyped lists and mixed types are stored as JSON text (None)."""
+    import pyarrow as pa
+
+    origin, args = get_origin(annotation), get_args(annotation)
+    if origin is Union:
+        types = [arg for arg in args if arg is not type(None)]
+        return _arrow_type(types[0]) if len(types) == 1 else None
+    if origin in (list, List) and len(args) == 1:
+        item = _arrow_type(args[0])
+        return pa.list_(item) if item is not None else None
+    return {bool: pa.bool_(), int: pa.int64(), float: pa.float64(), str: pa.string()}.get(annotation)
+
+
+def parquet_schema(parser: Optional[str] = None, fields: Optional[List[str]] = None) -> Any:
+    """One schema for all parts: the record columns, then a column per model field.
+
+    The fields are those of the parser's model (of all parsers' models for 'auto'), or `fields`.
+    A field typed differently by two models, and any field without a plain Arrow type, is JSON text.
+    """
+    import pyarrow as pa
+
+    types: Dict[str, Any] = {}
+    for module_path, _, model_name, parser_name in PARSERS:
+        if parser and parser_name != parser:
+            continue
+        try:
+            model = getattr(importlib.import_module(module_path, package=__package__), model_name)
+        except ImportError:
+            continue
+        for name, info in model.model_fields.items():
+            arrow = _arrow_type(info.annotation)
+            types[name] = arrow if types.get(name, arrow) == arrow else None
+    columns = [("path", pa.string()), ("parser", pa.string()), ("status", pa.string()),
+               ("error", pa.string()), ("elapsed", pa.float64()), ("size", pa.int64())]
+    for name in fields if fields is not None else list(types):
+        columns.append((name, types.get(name) or pa.string()))
+    return pa.schema(columns)
+
+
+class ParquetWriter(_Writer):
+    """Part files of `batch_size` rows with one schema (a column per field) and a checkpoint of the files in written parts.
+
+    On resume, a part whose files are not all in the checkpoint (interrupted after the part was
+    written) is removed together with its checkpoint lines, so its files are parsed again once.
+    """
+
+    def __init__(self, directory: str, batch_size: int = 1000, parser: Optional[str] = None, fields: Optional[List[str]] = None):
+        try:
+            import pyarrow
+            import pyarrow.parquet  # noqa: F401
+        except ImportError as e:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow") from e
+        self.directory = directory
+        self.batch_size = batch_size
+        self.schema = parquet_schema(parser, fields)
+        self._text = {field.name for field in self.schema if field.type == pyarrow.string()}
+        self.checkpoint = _Lines(os.path.join(directory, CHECKPOINT))
+        self._rows: List[Dict[str, Any]] = []
+        self._records: List[Dict[str, Any]] = []
+
+    def _parts(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name for name in os.listdir(self.directory) if re.fullmatch(r"part-\d+\.parquet", name))
+
+    def done(self) -> Dict[str, str]:
+        import pyarrow.parquet as pq
+
+        records = _read_records(self.checkpoint.path)
+        listed: Dict[str, Set[str]] = {}
+        for record in records:
+            listed.setdefault(record.get("result"), set()).add(record["path"])
+        complete = set()
+        for name in self._parts():
+            paths = set(pq.read_table(os.path.join(self.directory, name), columns=["path"]).column("path").to_pylist())
+            if paths == listed.get(name):
+                complete.add(name)
+            else:
+                os.remove(os.path.join(self.directory, name))
+        kept = [record for record in records if record.get("result") in complete]
+        if len(kept) < len(records):
+            _rewrite_lines(self.checkpoint.path, kept)
+        return {record["path"]: record["status"] for record in kept}
+
+    def write(self, record: Dict[str, Any], payload: bytes) -> None:
+        row = json.loads(payload)
+        data = row.pop("data") or {}
+        for name, value in data.items():
+            # Columns without a plain Arrow type hold the value as JSON text
+            if value is not None and name in self._text and not isinstance(value, str):
+                value = json.dumps(value)
+            row[name] = value
+        self._rows.append(row)
+        self._records.append(record)
+        if len(self._rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        os.makedirs(self.directory, exist_ok=True)
+        parts = self._parts()
+        name = f"part-{int(parts[-1][5:-8]) + 1 if parts else 0:05d}.parquet"
+        temp = os.path.join(self.directory, f".{name}.tmp")
+        pq.write_table(pa.Table.from_pylist(self._rows, schema=self.schema), temp)
+        os.replace(temp, os.path.join(self.directory, name))
+        # Only files in a written part are done: an interrupted batch is parsed again
+        for record in self._records:
+            self.checkpoint.append(dump_fast({**record, "result": name}))
+        self._rows, self._records = [], []
+
+    def clear(self) -> None:
+        for name in self._parts():
+            os.remove(os.path.join(self.directory, name))
+        _remove(self.checkpoint.path)
+
+    def close(self) -> None:
+        self.flush()
+        self.checkpoint.close()
+
+
+def open_writer(output: str, output_format: str, batch_size: int = 1000, restart: bool = False,
+                parser: Optional[str] = None, fields: Optional[List[str]] = None) -> _Writer:
+    """The writer for a results file (jsonl) or directory (json, parquet); `restart` drops earlier results."""
+    writer: _Writer
+    if output_format == "jsonl":
+        writer = JsonlWriter(output)
+    elif output_format == "json":
+        writer = JsonDirWriter(output)
+    elif output_format == "parquet":
+        writer = ParquetWriter(output, batch_size, parser, fields)
+    else:
+        raise ValueError(f"Unknown output format: {output_format}")
+    if restart:
+        writer.clear()
+    return writer
+
+
+class _Progress:
+    """Counts and throughput of a run, reported on stderr."""
+
+    def __init__(self, quiet: bool = False):
+        self.quiet = quiet
+        self.counts: Dict[str, int] = {}
+        self.bytes = 0
+        self.start = self.last = time.perf_counter()
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.counts[record["status"]] = self.counts.get(record["status"], 0) + 1
+        self.bytes += record.get("size") or 0
+        now = time.perf_counter()
+        if not self.quiet and now - self.last >= PROGRESS_INTERVAL:
+            self.last = now
+            self.report(final=False)
+
+    def report(self, final: bool = True, skipped: int = 0) -> None:
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        total = sum(self.counts.values())
+        counts = ", ".join(f"{count} {status}" for status, count in sorted(self.counts.items())) or "0 parsed"
+        if skipped:
+            counts += f", {skipped} already done"
+        print(f"{'done' if final else '...'}: {counts} in {elapsed:.1f} s "
+              f"({total / elapsed:.1f} files/s, {self.bytes / elapsed / 1e6:.1f} MB/s)", file=sys.stderr, flush=True)
+
+
+def run_parse(
+    paths: Sequence[str],
+    output: str,
+    parser: Optional[str] = None,
+    jobs: Optional[int] = None,
+    fields: Optional[List[str]] = None,
+    output_format: str = "jsonl",
+    precision: Optional[int] = None,
+    batch_size: int = 1000,
+    retry_failed: bool = False,
+    restart: bool = False,
+    quiet: bool = False,
+    profile: Optional[str] = None,
+    profiler: str = "cprofile",
+) -> Dict[str, int]:
+    """Parse files into an append-only, resumable results file (the `parse-patrol parse` command).
+
+    Args:
+        paths: Files, directories (parsed recursively) and glob patterns
+        output: Results file (jsonl) or directory (json, parquet)
+        parser: 'cclib', 'gaussian' or 'iodata' (default: `parse_any` picks per file)
+        jobs: Worker processes (default: `PARSE_PATROL_WORKERS`, or one per CPU); 1 parses in this process
+        fields: Model fields to keep (default: all)
+        output_format: 'jsonl', 'json' or 'parquet'
+        precision: Round floats to this many decimals (default: full precision)
+        batch_size: Rows per Parquet part file
+        retry_failed: Parse files recorded as failed by an earlier run again
+        restart: Drop the results of earlier runs instead of resuming
+        quiet: No progress lines (the final summary is still printed)
+        profile: Profile every parse into this directory (see `utils.profiling`)
+        profiler: 'cprofile' or 'sample'
+
+    Returns:
+        Number of files per status ('ok', 'error', 'unsupported'), and 'skipped' for files done earlier
+    """
+    files = list(expand_paths(paths))
+    writer = open_writer(output, output_format, batch_size, restart, parser, fields)
+    done = writer.done()
+    skip = {path for path, status in done.items() if status != "error" or not retry_failed}
+    skipped = 0
+    progress = _Progress(quiet)
+    jobs = jobs or pool.default_size()
+    executor = pool.create_pool(jobs) if jobs > 1 else None
+    pending: Dict[Future, str] = {}
+    profile_args = (profile, profiler) if profile else None
+
+    def collect(futures: Iterable[Future]) -> None:
+        for future in futures:
+            path = pending.pop(future)
+            try:
+                record, payload = future.result()
+            except Exception as e:  # the worker died, e.g. killed for memory
+                record = {"path": path, "parser": parser, "status": "error", "error": f"{type(e).__name__}: {e}", "elapsed": 0.0, "size": None}
+                payload = dump_fast({**record, "data": None})
+            writer.write(record, payload)
+            progress.add(record)
+
+    try:
+        for path in files:
+            if path in skip:
+                skipped += 1
+                continue
+            if executor is None:
+                record, payload = _parse_record(path, parser, fields, precision, profile_args)
+                writer.write(record, payload)
+                progress.add(record)
+                continue
+            if len(pending) >= 2 * jobs:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(finished)
+            pending[executor.submit(_parse_record, path, parser, fields, precision, profile_args)] = path
+        collect(list(pending))
+    finally:
+        # On an interrupt, results that are already in are kept: the next run resumes after them
+        for future in pending:
+            future.cancel()
+        collect([future for future in pending if future.done() and not future.cancelled()])
+        if executor is not None:
+            # Profiling workers write their profiles when they exit
+            executor.shutdown(wait=profile is not None, cancel_futures=True)
+        if profile and executor is None:
+            profiling.disable()
+        writer.close()
+        progress.report(skipped=skipped)
+        if profile:
+            print(f"profiles: {profile} (parse-patrol profile {profile})", file=sys.stderr)
+    return {**progress.counts, "skipped": skipped}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """The argument parser of the `parse-patrol` command."""
+    parser = argparse.ArgumentParser(prog="parse-patrol", description="Parse computational chemistry files in bulk.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parse = commands.add_parser("parse", help="Parse files, directories and globs into a resumable results file")
+    parse.add_argument("paths", nargs="+", help="Files, directories (walked recursively) and glob patterns (quote them, '**' recurses)")
+    parse.add_argument("-o", "--output", default="parse-patrol.jsonl", help="Results file (jsonl) or directory (json, parquet)")
+    parse.add_argument("-f", "--format", dest="output_format", choices=FORMATS, default="jsonl", help="Output format (default: jsonl)")
+    parse.add_argument("-p", "--parser", choices=["auto"] + [name for *_, name in PARSERS], default="auto",
+                       help="Parser to use (default: auto, the best available parser per file)")
+    parse.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: PARSE_PATROL_WORKERS, or one per CPU)")
+    parse.add_argument("--fields", default=None, help="Comma-separated model fields to keep (default: all)")
+    parse.add_argument("--precision", type=int, default=None, help="Round floats to this many decimals")
+    parse.add_argument("--batch-size", type=int, default=1000, help="Rows per Parquet part file (default: 1000)")
+    parse.add_argument("--retry-failed", action="store_true", help="Parse files that failed in an earlier run again")
+    parse.add_argument("--restart", action="store_true", help="Discard earlier results instead of resuming")
+    parse.add_argument("-q", "--quiet", action="store_true", help="Only print the final summary")
+    parse.add_argument("--profile", metavar="DIR", default=None, help="Profile every parse, per parser and file type, into DIR")
+    parse.add_argument("--profiler", choices=list(profiling.METHODS), default="cprofile", help="cProfile statistics or sampled stacks (default: cprofile)")
+
+    report = commands.add_parser("profile", help="Merge the profiles in a profile directory and list the slowest files")
+    report.add_argument("directory", help="Directory written by --profile or PARSE_PATROL_PROFILE")
+    report.add_argument("--slowest", type=float, default=0.01, help="Fraction of the files to list (default: 0.01)")
+    return parser
+
+
+def print_profile_report(directory: str, slowest: float = 0.01) -> int:
+    """The `parse-patrol profile` command: merged profiles and the slowest files, on stdout."""
+    report = profiling.profile_report(directory, slowest)
+    if not report.groups:
+        print(f"parse-patrol: error: no profiles in {directory}", file=sys.stderr)
+        return 2
+    for group in report.groups:
+        print(f"{group.parser}/{group.file_type}: {group.files} files, {group.total_time:.2f} s, "
+              f"mean {group.mean_time:.3f} s, p99 {group.p99_time:.3f} s, max {group.max_time:.3f} s")
+        for path in group.profiles:
+            print(f"  {path}")
+    print("slowest:")
+    for item in report.slowest:
+        print(f"  {item.wall_time:.3f} s  {item.parser}/{item.file_type}  {item.source}  {item.profile or '(no profile kept)'}")
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point of the `parse-patrol` command; returns the exit status (1 if any file failed)."""
+    args = build_parser().parse_args(argv)
+    if args.command == "profile":
+        return print_profile_report(args.directory, args.slowest)
+    fields = [name.strip() for name in args.fields.split(",") if name.strip()] if args.fields else None
+    try:
+        counts = run_parse(
+            args.paths,
+            args.output,
+            parser=None if args.parser == "auto" else args.parser,
+            jobs=args.jobs,
+            fields=fields,
+            output_format=args.output_format,
+            precision=args.precision,
+            batch_size=args.batch_size,
+            retry_failed=args.retry_failed,
+            restart=args.restart,
+            quiet=args.quiet,
+            profile=args.profile,
+            profiler=args.profiler,
+        )
+    except KeyboardInterrupt:
+        print("interrupted: run the same command again to resume", file=sys.stderr)
+        return 130
+    except (FileNotFoundError, ImportError) as e:
+        print(f"parse-patrol: error: {e}", file=sys.stderr)
+        return 2
+    return 1 if counts.get("error") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Cross-parser comparison in canonical names and units.
+
+`compare_parsers` parses one file with every suited parser in parallel worker processes,
+maps their results onto the canonical fields of `parse_patrol.utils.normalize`, and reports
+per-field agreement within NumPy tolerances. Since the parsers run concurrently, a
+comparison costs about as much as the slowest single parser. Both functions run on the
+shared pool of pre-warmed workers of `parse_patrol.utils.pool`, so no worker start-up is
+paid per call, and `compare_corpus` queues all its files at once.
+
+```python
+from parse_patrol.compare import compare_parsers
+
+report = compare_parsers("my_calculation.log")
+for field in report.disagreements:
+    print(field.name, field.values)
+```
+"""
+
+from concurrent.futures import Executor, Future
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .dispatch import STATS, _file_key, _run_parser_shared, candidate_parsers
+from .utils.normalize import CANONICAL_FIELDS, normalize
+from .utils.pool import create_pool, get_pool
+from .utils.shm import receive
+from .utils.sniff import sniff
+
+# (rtol, atol) per canonical field. Values printed with few decimals need a looser atol;
+# energies converted from eV carry the relative error of the parser's conversion factor.
+DEFAULT_TOLERANCES: Dict[str, Tuple[float, float]] = {
+    "coordinates": (0.0, 1e-4),
+    "total_energy": (1e-7, 1e-6),
+    "scf_energies": (1e-7, 1e-6),
+    "frequencies": (0.0, 1e-2),
+    "ir_intensities": (0.0, 1e-2),
+    "reduced_masses": (0.0, 1e-3),
+    "mulliken_charges": (0.0, 1e-5),
+}
+
+
+class FieldComparison(BaseModel):
+    """Agreement of one canonical field across parsers."""
+
+    name: str = Field(description="Canonical field name")
+    unit: Optional[str] = Field(default=None, description="Unit of the compared values")
+    values: Dict[str, Any] = Field(default_factory=dict, description="Value per parser that reported the field, in canonical units")
+    missing: List[str] = Field(default_factory=list, description="Parsers that map this field and succeeded, but reported no value")
+    agree: Optional[bool] = Field(default=None, description="Whether all reported values match within tolerance (None if fewer than two parsers report it)")
+    max_abs_diff: Optional[float] = Field(default=None, description="Largest absolute deviation from the first parser's value (None on shape mismatch)")
+
+
+class ComparisonReport(BaseModel):
+    """Per-field comparison of all parsers on one file."""
+
+    path: str = Field(description="Path of the compared file")
+    parsers: List[str] = Field(default_factory=list, description="Parsers that succeeded")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Error per failed parser")
+    timings: Dict[str, float] = Field(default_factory=dict, description="Parse time per parser (seconds)")
+    fields: List[FieldComparison] = Field(default_factory=list, description="Comparison per canonical field reported by any parser")
+
+    @property
+    def disagreements(self) -> List[FieldComparison]:
+        return [f for f in self.fields if f.agree is False]
+
+
+def _compare_values(values: List[Any], rtol: float, atol: float) -> Tuple[bool, Optional[float]]:
+    reference = np.asarray(values[0], dtype=float)
+    agree, max_diff = True, 0.0
+    for value in values[1:]:
+        other = np.asarray(value, dtype=float)
+        if other.shape != reference.shape:
+            return False, None
+        if other.size:
+            max_diff = max(max_diff, float(np.max(np.abs(other - reference))))
+        agree = agree and bool(np.allclose(other, reference, rtol=rtol, atol=atol))
+    return agree, max_diff
+
+
+def compare_models(
+    models: Dict[str, Any],
+    tolerances: Optional[Dict[str, Tuple[float, float]]] = None,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+) -> List[FieldComparison]:
+    """Compare already parsed models field by field.
+
+    Args:
+        models: Model per parser name, in reference order (the first one is the reference)
+        tolerances: (rtol, atol) per canonical field, overriding `DEFAULT_TOLERANCES`
+        rtol: Relative tolerance for fields without a specific tolerance
+        atol: Absolute tolerance for fields without a specific tolerance
+
+    Returns:
+        FieldComparison per canonical field reported by at least one parser
+    """
+    tolerances = {**DEFAULT_TOLERANCES, **(tolerances or {})}
+    normalized = {parser: normalize(parser, model) for parser, model in models.items()}
+    comparisons = []
+    for name, (unit, extractors) in CANONICAL_FIELDS.items():
+        values = {parser: data[name] for parser, data in normalized.items() if name in data}
+        if not values:
+            continue
+        comparison = FieldComparison(
+            name=name,
+            unit=unit,
+            values=values,
+            missing=[parser for parser in normalized if parser in extractors and name not in normalized[parser]],
+        )
+        if len(values) > 1:
+            field_rtol, field_atol = tolerances.get(name, (rtol, atol))
+            try:
+                comparison.agree, comparison.max_abs_diff = _compare_values(list(values.values()), field_rtol, field_atol)
+            except (TypeError, ValueError):  # ragged or non-numeric values
+                comparison.agree = all(v == comparison.values[next(iter(values))] for v in values.values())
+        comparisons.append(comparison)
+    return comparisons
+
+
+def _collect(filepath: str, futures: Dict[str, "Future"], **tolerance_args: Any) -> ComparisonReport:
+    report = ComparisonReport(path=filepath)
+    models: Dict[str, Any] = {}
+    key = _file_key(sniff(filepath))
+    for parser, future in futures.items():
+        try:
+            model, error, elapsed = future.result()
+            model = receive(model)
+        except Exception as e:  # e.g. a worker process that died
+            model, error, elapsed = None, f"{type(e).__name__}: {e}", 0.0
+        STATS.record(key, parser, error is None, elapsed)
+        report.timings[parser] = elapsed
+        if error is None:
+            models[parser] = model
+        else:
+            report.errors[parser] = error
+    report.parsers = list(models)
+    report.fields = compare_models(models, **tolerance_args)
+    return report
+
+
+def compare_parsers(
+    filepath: str,
+    parsers: Optional[List[str]] = None,
+    executor: Optional[Executor] = None,
+    tolerances: Optional[Dict[str, Tuple[float, float]]] = None,
+    rtol: float = 1e-5,
+    atol: float = 1e-8,
+) -> ComparisonReport:
+    """Parse a file with all suited parsers in parallel and compare the results.
+
+    Args:
+        filepath: Path to the chemistry file
+        parsers: Parser names to compare (default: all available parsers suited for the file type)
+        executor: Executor to run the parsers on (default: the shared pool of `utils.pool`)
+        tolerances: (rtol, atol) per canonical field, overriding `DEFAULT_TOLERANCES`
+        rtol: Relative tolerance for fields without a specific tolerance
+        atol: Absolute tolerance for fields without a specific tolerance
+
+    Returns:
+        ComparisonReport with per-field agreement, errors and timings
+    """
+    parsers = parsers or candidate_parsers(filepath)
+    executor = executor or get_pool()
+    futures = {parser: executor.submit(_run_parser_shared, parser, filepath) for parser in parsers}
+    return _collect(filepath, futures, tolerances=tolerances, rtol=rtol, atol=atol)
+
+
+def compare_corpus(
+    filepaths: Iterable[str],
+    parsers: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    tolerances: Optional[Dict[str, Tuple[float, float]]] = None,
+) -> List[ComparisonReport]:
+    """Compare the parsers on many files, sharing one process pool.
+
+    All (file, parser) jobs are queued at once, so the pool stays busy across files.
+
+    Args:
+        filepaths: Paths of the chemistry files
+        parsers: Parser names to compare (default: all available parsers suited for each file)
+        max_workers: Number of worker processes of a dedicated pool (default: the shared pool of `utils.pool`)
+        tolerances: (rtol, atol) per canonical field, overriding `DEFAULT_TOLERANCES`
+
+    Returns:
+        ComparisonReport per file, in input order
+    """
+    executor = create_pool(max_workers) if max_workers else get_pool()
+    try:
+        jobs = [
+            (path, {parser: executor.submit(_run_parser_shared, parser, path) for parser in (parsers or candidate_parsers(path))})
+            for path in filepaths
+        ]
+        return [_collect(path, futures, tolerances=tolerances) for path, futures in jobs]
+    finally:
+        if max_workers:
+            executor.shutdown()
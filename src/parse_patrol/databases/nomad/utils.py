@@ -190,26 +190,30 @@ def nomad_search_entries(
         raise Exception(f"Failed to query NOMAD API: {str(e)}")
 
 
-def nomad_get_raw_files(entry_id: str, data_root: str='tests/.data') -> str:
+def nomad_get_raw_files(entry_id: str, data_root: str='tests/.data', extract: bool = True) -> str:
     """Download and extract NOMAD raw files.
 
     Args:
         entry_id: NOMAD entry ID
         data_root: Optional root directory for downloads. Defaults to tests/.data if not specified.
+        extract: Extract the zip. If False, keep it: the parsers read its members directly
+            as `<zip path>::<member>` (see `parse_patrol.utils.sources.iter_members`).
 
     Returns:
-        Path to extracted files directory
+        Path to extracted files directory, or to the zip if `extract` is False
     """
     # Create entry-specific directory
     data_dir = Path(data_root) / entry_id
     data_dir.mkdir(parents=True, exist_ok=True)
+    zip_path = data_dir / f"{entry_id}_raw.zip"
 
     # Check if files already downloaded
-    if any(data_dir.iterdir()):
+    if not extract and zip_path.exists():
+        return str(zip_path)
+    if extract and any(p != zip_path for p in data_dir.iterdir()):
         return str(data_dir)
 
     url = f"https://nomad-lab.eu/prod/v1/api/v1/entries/{entry_id}/raw"
-    zip_path = data_dir / f"{entry_id}_raw.zip"
 
     try:
         response = requests.get(url, timeout=120)
@@ -221,6 +225,9 @@ def nomad_get_raw_files(entry_id: str, data_root: str='tests/.data') -> str:
         
         with open(zip_path, "wb") as f:
             f.write(response.content)
+        if not extract:
+            zipfile.ZipFile(zip_path).close()  # validate
+            return str(zip_path)
 
         # Extract zip
         with zipfile.ZipFile(zip_path, "r") as zip_ref:
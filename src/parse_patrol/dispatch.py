@@ -0,0 +1,419 @@
+"""
+Unified entry point over all available parsers.
+
+`parse_any` picks the parsers suited for a file (from its sniffed program and type) and
+combines them with one of three strategies:
+
+- "fallback": try the parsers one after the other, in a learned order, until one succeeds
+- "race": run them concurrently in separate processes, take the first good result and terminate the rest
+- "merge": run them all and combine their fields under the canonical names of
+  `parse_patrol.utils.normalize`, recording which parser provided each field
+
+Success rate and latency per file type and parser are kept in `STATS`, which orders
+the parsers for the next file of the same type. The statistics are shared by all processes
+(pool workers, CLI runs, the MCP server) through `~/.cache/parse_patrol/parser_stats.json`
+(see `stats_path`; `PARSE_PATROL_STATS=off` keeps them per process). With `isolated=True`, "fallback" and "merge"
+run each parser in a worker process under time and memory limits (see `utils.isolate`),
+so a parser that hangs or runs out of memory counts as a failed attempt.
+
+```python
+from parse_patrol import parse_any
+
+result = parse_any("my_calculation.log")                # best parser for Gaussian logs
+merged = parse_any("my_calculation.log", strategy="merge")
+print(merged.provenance["frequencies"])                 # e.g. 'gaussian'
+```
+"""
+
+import importlib
+import json
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from multiprocessing import util
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: merges are not serialized between processes
+    fcntl = None  # type: ignore[assignment]
+
+from pydantic import BaseModel, Field
+
+from .utils import pool
+from .utils.normalize import normalize
+from .utils.shm import SharedResult, receive, share
+from .utils.sniff import FileSignature, sniff
+
+Strategy = Literal["fallback", "race", "merge"]
+
+# Default preference per sniffed file type, before any statistics are collected
+_DEFAULT_ORDER = {
+    "log": ["gaussian", "cclib", "iodata"],
+    "fchk": ["gaussian", "iodata", "cclib"],
+    "input": ["gaussian", "iodata"],
+    "xyz": ["iodata"],
+    "cube": ["iodata"],
+    "molden": ["iodata"],
+    "poscar": ["iodata"],
+    "chgcar": ["iodata"],
+    "locpot": ["iodata"],
+    "chk": [],
+    "archive": [],
+    "binary": [],
+}
+
+# Fields that describe the parse rather than the calculation
+_META_FIELDS = {"metadata", "source_format", "source_version", "source_extension", "file_extension", "detected_software"}
+
+
+class MergedModel(BaseModel):
+    """Fields combined from several parsers."""
+
+    data: Dict[str, Any] = Field(default_factory=dict, description="Merged fields under canonical names and units; the first parser (in preference order) with a value wins")
+    provenance: Dict[str, str] = Field(default_factory=dict, description="Parser that provided each field of `data`")
+    parsers: List[str] = Field(default_factory=list, description="Parsers that succeeded, in preference order")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Error per failed parser")
+    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
+
+
+STATS_ENV = "PARSE_PATROL_STATS"
+SYNC_INTERVAL = 30.0  # seconds between merges of a process's statistics into the stats file
+
+
+def stats_path() -> Optional[str]:
+    """File the parser statistics are shared through: `PARSE_PATROL_STATS`, or
+    `<PARSE_PATROL_CACHE_DIR or ~/.cache/parse_patrol>/parser_stats.json`; None if set to 'off'."""
+    value = os.environ.get(STATS_ENV)
+    if value and value.lower() in ("0", "off", "false", "no"):
+        return None
+    cache_dir = os.environ.get("PARSE_PATROL_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "parse_patrol")
+    return value or os.path.join(cache_dir, "parser_stats.json")
+
+
+def _add_stats(total: Dict[str, Dict[str, Dict[str, float]]], delta: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+    for file_key, parsers in delta.items():
+        for parser, entry in parsers.items():
+            target = total.setdefault(file_key, {}).setdefault(parser, {"successes": 0, "failures": 0, "time": 0.0})
+            for name, value in entry.items():
+                target[name] = target.get(name, 0) + value
+
+
+def _read_stats(path: str) -> Dict[str, Dict[str, Dict[str, float]]]:
+    try:
+        with open(path) as f:
+            stats = json.load(f)
+    except (OSError, ValueError):  # missing, or cut off by a crash
+        return {}
+    return stats if isinstance(stats, dict) else {}
+
+
+class ParserStats:
+    """Success rate and latency per (file type, parser), used to order the parsers.
+
+    With `persist=True` the statistics are shared between processes (pool workers, the CLI,
+    the MCP server) through a JSON file (see `stats_path`): each process loads it on first use,
+    and merges the counts it recorded into it every `SYNC_INTERVAL` seconds and at exit.
+    """
+
+    def __init__(self, persist: bool = False, path: Optional[str] = None):
+        self.persist = persist
+        self.path = path  # default: `stats_path()` when first used
+        self._stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._pending: Dict[str, Dict[str, Dict[str, float]]] = {}  # recorded since the last merge
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None  # process that loaded the file
+        self._last_sync = time.monotonic()
+
+    def _ensure_loaded(self) -> None:
+        """Load the stats file once per process (a forked copy starts from the file too); call under the lock."""
+        if not self.persist or self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._pending = {}  # the parent merges its own counts
+        self.path = self.path or stats_path()
+        if self.path is None:
+            return
+        self._stats = _read_stats(self.path)
+        self._last_sync = time.monotonic()
+        util.Finalize(None, self.sync, exitpriority=10)  # at exit, also of pool workers
+
+    def record(self, file_key: str, parser: str, success: bool, elapsed: float) -> None:
+        delta = {file_key: {parser: {"successes" if success else "failures": 1, "time": elapsed}}}
+        with self._lock:
+            self._ensure_loaded()
+            _add_stats(self._stats, delta)
+            if self.persist:
+                _add_stats(self._pending, delta)
+            due = self.persist and time.monotonic() - self._last_sync >= SYNC_INTERVAL
+        if due:
+            self.sync()
+
+    def sync(self) -> None:
+        """Merge the counts recorded by this process into the stats file, and load the merged statistics."""
+        with self._lock:
+            if not self.persist or self._pid != os.getpid() or self.path is None:
+                return
+            self._last_sync = time.monotonic()
+            pending, self._pending = self._pending, {}
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                with open(f"{self.path}.lock", "a") as lock:
+                    if fcntl is not None:
+                        fcntl.flock(lock, fcntl.LOCK_EX)  # other processes merge into the same file
+                    stats = _read_stats(self.path)
+                    _add_stats(stats, pending)
+                    if pending:
+                        temp = f"{self.path}.{os.getpid()}.tmp"
+                        with open(temp, "w") as f:
+                            json.dump(stats, f)
+                        os.replace(temp, self.path)
+            except OSError:
+                _add_stats(self._pending, pending)  # try again at the next merge
+                return
+            self._stats = stats
+
+    def order(self, file_key: str, candidates: List[str]) -> List[str]:
+        """Sort `candidates` by smoothed success rate, then mean latency; unseen parsers keep their default rank."""
+        with self._lock:
+            self._ensure_loaded()
+            stats = {name: dict(entry) for name, entry in self._stats.get(file_key, {}).items()}
+
+        def score(item: Tuple[int, str]) -> Tuple[float, float, int]:
+            rank, name = item
+            entry = stats.get(name)
+            if entry is None:
+                return (-0.5, 0.0, rank)  # uninformed prior
+            runs = entry["successes"] + entry["failures"]
+            return (-(entry["successes"] + 1) / (runs + 2), entry["time"] / runs, rank)
+
+        return [name for _, name in sorted(enumerate(candidates), key=score)]
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            return json.loads(json.dumps(self._stats))
+
+    def load(self, stats: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+        """Replace the statistics of this process, e.g. with a `to_dict()` snapshot; the stats file is left as is."""
+        with self._lock:
+            self._ensure_loaded()
+            self._stats = json.loads(json.dumps(stats))
+            self._pending = {}
+            self._last_sync = time.monotonic()
+
+    def clear(self) -> None:
+        """Forget the statistics of this process; the stats file is left as is."""
+        self.load({})
+
+
+STATS = ParserStats(persist=True)
+
+
+def _parser_function(name: str) -> Optional[Callable]:
+    """Import the parse function of parser `name`, or None if its dependencies are missing."""
+    from . import PARSERS
+    for module_path, func_name, _, parser_name in PARSERS:
+        if parser_name == name:
+            try:
+                return getattr(importlib.import_module(module_path, package=__package__), func_name)
+            except ImportError:
+                return None
+    return None
+
+
+def _file_key(info: FileSignature) -> str:
+    return f"{info.program or 'unknown'}:{info.file_type or 'unknown'}"
+
+
+def candidate_parsers(filepath: str) -> List[str]:
+    """Available parsers suited for a file, in the learned order for its file type."""
+    from . import available_parsers
+    info = sniff(filepath)
+    available = available_parsers()
+    default = _DEFAULT_ORDER.get(info.file_type or "", ["gaussian", "cclib", "iodata"])
+    if info.program not in (None, "gaussian"):
+        default = [name for name in default if name != "gaussian"]
+    return STATS.order(_file_key(info), [name for name in default if name in available])
+
+
+def _is_good(model: Any) -> bool:
+    """A result is good if it reports no error and holds at least one data field."""
+    if model is None:
+        return False
+    metadata = getattr(model, "metadata", None) or {}
+    if metadata.get("error") or metadata.get("warning"):
+        return False
+    return any(v is not None for k, v in model if k not in _META_FIELDS)
+
+
+def _run_parser(name: str, filepath: str) -> Tuple[Any, Optional[str], float]:
+    """Run one parser; returns (model, error, elapsed). Importable, so it can run in a worker process."""
+    start = time.perf_counter()
+    func = _parser_function(name)
+    if func is None:
+        return None, f"{name} not available", 0.0
+    try:
+        model = func(filepath)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {str(e)[:500]}", time.perf_counter() - start
+    error = None if _is_good(model) else str((model.metadata or {}).get("error") or (model.metadata or {}).get("warning") or "empty result")
+    return model, error, time.perf_counter() - start
+
+
+def _run_parser_shared(name: str, filepath: str) -> Tuple[Any, Optional[str], float]:
+    """`_run_parser` for worker processes: large arrays come back through shared memory (see `utils.shm`)."""
+    model, error, elapsed = _run_parser(name, filepath)
+    return share(model), error, elapsed
+
+
+def _race_worker(name: str, filepath: str, results: "multiprocessing.Queue") -> None:
+    model, error, elapsed = _run_parser(name, filepath)
+    # Once shared, the result's block can only be freed by the parent: ignore termination
+    # (of a loser) until the result is fully sent, so the parent can discard it
+    if hasattr(signal, "pthread_sigmask"):
+        signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+    results.put((name, share(model), error, elapsed))
+    results.close()
+    results.join_thread()
+
+
+def _annotate(model: Any, strategy: str, parser: str, errors: Dict[str, str]) -> Any:
+    metadata = dict(model.metadata or {})
+    metadata["parse_any"] = {"strategy": strategy, "parser": parser, "errors": errors}
+    model.metadata = metadata
+    return model
+
+
+def _runner(limits: Optional[Dict[str, Any]]) -> Callable[[str, str], Tuple[Any, Optional[str], float]]:
+    """`_run_parser`, or its isolated version under `limits` (see `utils.isolate`)."""
+    if limits is None:
+        return _run_parser
+    from .utils.isolate import run_parser_isolated
+
+    return lambda name, filepath: run_parser_isolated(name, filepath, **limits)
+
+
+def _fallback(filepath: str, parsers: List[str], key: str, limits: Optional[Dict[str, Any]] = None) -> Any:
+    errors: Dict[str, str] = {}
+    run = _runner(limits)
+    for name in parsers:
+        model, error, elapsed = run(name, filepath)
+        STATS.record(key, name, error is None, elapsed)
+        if error is None:
+            return _annotate(model, "fallback", name, errors)
+        errors[name] = error
+    raise ValueError(f"No parser could parse {filepath}: {errors}")
+
+
+def _race(filepath: str, parsers: List[str], key: str, timeout: Optional[float]) -> Any:
+    ctx = pool.context()  # forkserver: the racers start warm, without a copy of this process
+    results: "multiprocessing.Queue" = ctx.Queue()
+    processes = {name: ctx.Process(target=_race_worker, args=(name, filepath, results), daemon=True) for name in parsers}
+    for process in processes.values():
+        process.start()
+
+    errors: Dict[str, str] = {}
+    pending = set(parsers)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        while pending and (deadline is None or time.monotonic() < deadline):
+            try:
+                name, model, error, elapsed = results.get(timeout=0.05)
+            except queue.Empty:
+                # A worker that died without reporting (e.g. a segfault in a C extension)
+                for name in [n for n in pending if processes[n].exitcode not in (None, 0)]:
+                    errors[name] = f"Worker exited with code {processes[name].exitcode}"
+                    pending.discard(name)
+                continue
+            pending.discard(name)
+            STATS.record(key, name, error is None, elapsed)
+            if error is None:
+                return _annotate(receive(model), "race", name, errors)
+            errors[name] = error
+            if isinstance(model, SharedResult):
+                model.discard()
+    finally:
+        # Cancel the losers
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        # Free the shared memory of the losers' results (sent before or while they were terminated)
+        while True:
+            try:
+                late = results.get_nowait()[1]
+            except (queue.Empty, OSError, ValueError, EOFError):
+                break
+            if isinstance(late, SharedResult):
+                late.discard()
+        results.close()
+    errors.update({name: "timed out" for name in pending})
+    raise ValueError(f"No parser could parse {filepath}: {errors}")
+
+
+def _merge(filepath: str, parsers: List[str], key: str, limits: Optional[Dict[str, Any]] = None) -> MergedModel:
+    merged = MergedModel()
+    run = _runner(limits)
+    for name in parsers:
+        model, error, elapsed = run(name, filepath)
+        STATS.record(key, name, error is None, elapsed)
+        if error is not None:
+            merged.errors[name] = error
+            continue
+        merged.parsers.append(name)
+        for field, value in normalize(name, model, keep_unmapped=True).items():
+            if field in _META_FIELDS or field in merged.data:
+                continue
+            merged.data[field] = value
+            merged.provenance[field] = name
+    if not merged.parsers:
+        raise ValueError(f"No parser could parse {filepath}: {merged.errors}")
+    merged.metadata = {"source": filepath, "parse_any": {"strategy": "merge", "parser": merged.parsers[0], "errors": merged.errors}}
+    return merged
+
+
+def parse_any(
+    filepath: str,
+    strategy: Strategy = "fallback",
+    parsers: Optional[List[str]] = None,
+    timeout: Optional[float] = None,
+    isolated: bool = False,
+    memory_mb: Optional[int] = None,
+) -> Any:
+    """Parse a file with whichever available parser handles it best.
+
+    Args:
+        filepath: Path to the chemistry file
+        strategy: "fallback" (sequential, learned order), "race" (concurrent processes, first good
+            result wins) or "merge" (all parsers, fields combined with per-field provenance)
+        parsers: Parser names to use, in this order (default: suited parsers in learned order)
+        timeout: For "race", seconds to wait for a good result before giving up; for isolated
+            "fallback" and "merge", seconds per parser attempt (default: `utils.isolate.get_limits`)
+        isolated: Run each parser attempt in an isolated worker process, killed on a time or
+            memory limit ("race" already runs each parser in its own process)
+        memory_mb: For isolated parses, address-space cap of the worker in MiB
+
+    Returns:
+        The winning parser's model (with `metadata["parse_any"]`), or a MergedModel for "merge"
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If no parser produced a good result, or the strategy is unknown
+    """
+    info = sniff(filepath)
+    key = _file_key(info)
+    parsers = parsers or candidate_parsers(filepath)
+    if not parsers:
+        raise ValueError(f"No available parser for {filepath} ({key})")
+
+    limits = {"timeout": timeout, "memory_mb": memory_mb} if isolated else None
+    if strategy == "fallback":
+        return _fallback(filepath, parsers, key, limits)
+    if strategy == "race":
+        return _race(filepath, parsers, key, timeout)
+    if strategy == "merge":
+        return _merge(filepath, parsers, key, limits)
+    raise ValueError(f"Unknown strategy: {strategy}")
@@ -1,6 +1,9 @@
 from mcp.server.fastmcp import FastMCP # pyright: ignore[reportMissingImports]
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger # pyright: ignore[reportMissingImports]
-from .utils import cclib_parse, CCDataModel
+import asyncio
+from ... import aio
+from ...utils.isolate import isolated_parse, isolation_enabled
+from .utils import CCDataModel
 
 configure_logging("INFO")
 logger = get_logger(__name__)
@@ -103,11 +106,13 @@ async def cclib_parse_file_to_model(filepath: str) -> CCDataModel:
         
     Raises:
         FileNotFoundError: If file cannot be opened or is an unsupported format
-        ValueError: If file parsing fails
+        ValueError: If file parsing fails, or ran out of time or memory (with `PARSE_PATROL_ISOLATE=1`)
     """
     logger.info("Parsing file: %s ...", filepath)
     try:
-        return cclib_parse(filepath)
+        if isolation_enabled():
+            return (await asyncio.to_thread(isolated_parse, "cclib", filepath)).unwrap()
+        return await aio.cclib_parse(filepath)  # in the shared worker pool, off the event loop
     except (FileNotFoundError, ValueError) as e:
         logger.error("Failed to parse file: %s", e)
         raise  # Re-raise the exception to be handled by MCP error handling
@@ -4,8 +4,13 @@ This module provides sync functions that can be imported and used directly.
 """
 
 from . import external_cclib as cclib
-from typing import Optional, Dict, List, Any
+from contextlib import ExitStack
+from typing import Optional, Dict, List, Any, Union
 from pydantic import BaseModel, Field # pyright: ignore[reportMissingImports]
+from ...utils.instrumentation import parse_session, stage
+from ...utils.sniff import sniff
+from ...utils.sources import Source, as_source, is_virtual, open_text
+from ...utils.trusted import build_model
 
 
 class CCDataModel(BaseModel):
@@ -93,16 +98,26 @@ class CCDataModel(BaseModel):
     zpve: Optional[float] = Field(default=None, description="Zero-point vibrational energy correction (hartree/particle, float)")
 
 
-def ccdata_to_model(ccdata: cclib.parser.data.ccData, filepath: str = None) -> CCDataModel:  # type: ignore
+def ccdata_to_model(ccdata: cclib.parser.data.ccData, filepath: str = None, validate: Optional[bool] = None) -> CCDataModel:  # type: ignore
     """Convert ccData object to CCDataModel (Pydantic) format.
     
     Args:
         ccdata: Parsed ccData object from cclib
         filepath: Original filepath for metadata extraction
+        validate: Validate the converted values (default: `PARSE_PATROL_VALIDATE` environment
+            variable); they come from cclib's arrays, so the model is trusted otherwise
     
     Returns:
         CCDataModel with converted data types for JSON serialization
     """
+    with stage("convert"):
+        result = _ccdata_to_dict(ccdata, filepath)
+    with stage("validate"):
+        return build_model(CCDataModel, result, validate)
+
+
+def _ccdata_to_dict(ccdata: cclib.parser.data.ccData, filepath: Optional[str] = None) -> Dict[str, Any]:  # type: ignore
+    """Collect the `CCDataModel` fields of a ccData object as plain Python types."""
     result: Dict[str, Any] = {}
 
     # Add format metadata if available
@@ -133,16 +148,21 @@ def ccdata_to_model(ccdata: cclib.parser.data.ccData, filepath: str = None) -> C
                 result[field_name] = [item.tolist() for item in value]
             else:
                 result[field_name] = value
-    return CCDataModel(**result)
+    return result
 
 
-def cclib_parse(filepath: str) -> CCDataModel:
+def cclib_parse(filepath: Source, instrument: Union[bool, str, None] = None, validate: Optional[bool] = None) -> CCDataModel:
     """Parse chemistry file using cclib and return as CCDataModel.
     
     This is the core sync function for direct usage in production code.
     
     Args:
-        filepath: Path to chemistry output file
+        filepath: Path to chemistry output file; compressed files (`.gz`, `.bz2`, `.xz`) and
+            archive members (`bundle.tar.gz::job.log`) are read on the fly. In-memory content
+            (bytes, memoryview, file-like object or MemorySource) is accepted as well
+        instrument: Record per-stage timing/memory under `metadata["instrumentation"]`
+            (default: `PARSE_PATROL_INSTRUMENT` environment variable)
+        validate: Validate the model fields (see `ccdata_to_model`)
     
     Returns:
         CCDataModel with parsed data converted for JSON serialization
@@ -151,14 +171,24 @@ def cclib_parse(filepath: str) -> CCDataModel:
         FileNotFoundError: If file cannot be opened
         ValueError: If file cannot be parsed
     """
-    filereader = cclib.io.ccopen(filepath)  # type: ignore
-    if filereader is None:
-        raise FileNotFoundError(f"File not found or unsupported format: {filepath}")
-    
-    ccdata = filereader.parse()
-    if ccdata is None:
-        raise ValueError(f"Failed to parse file: {filepath}")
-        
-    return ccdata_to_model(ccdata, filepath)
+    source = as_source(filepath)
+    with parse_session("cclib", source, instrument) as session, ExitStack() as stack:
+        with stage("detect"):
+            # The sniffed header names the cclib parser directly; ccopen rescans the file otherwise
+            parser_name = sniff(source).cclib_parser
+            parser_class = getattr(cclib.parser, parser_name, None) if parser_name else None
+            # Compressed sources, archive members and in-memory data are streamed in as text
+            stream = stack.enter_context(open_text(source)) if is_virtual(source) else source
+            filereader = parser_class(stream) if parser_class else cclib.io.ccopen(stream)  # type: ignore
+        if filereader is None:
+            raise FileNotFoundError(f"File not found or unsupported format: {source}")
+
+        with stage("parse"):
+            ccdata = filereader.parse()
+        if ccdata is None:
+            raise ValueError(f"Failed to parse file: {source}")
+
+        model = ccdata_to_model(ccdata, str(source), validate)
+        return session.attach(model) if session else model
 
 
@@ -1,6 +1,13 @@
 from mcp.server.fastmcp import FastMCP  # pyright: ignore[reportMissingImports]
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger
-from .utils import gaussian_parse, CustomGaussianDataModel
+import asyncio
+from typing import List, Optional
+from ... import aio
+from ...utils.isolate import isolated_parse, isolation_enabled
+from .follow import GaussianLogWatcher
+from .index import QUERY_SECTIONS, IndexedLog
+from .jobs import gaussian_parse_jobs
+from .utils import CustomGaussianDataModel
 
 configure_logging("INFO")
 logger = get_logger(__name__)
@@ -8,6 +15,17 @@ logger = get_logger(__name__)
 
 mcp = FastMCP("Custom Gaussian Parser")
 
+# Followers kept across calls, so repeated polls of a running job only read the new output;
+# dropped once their job terminated, or after an hour without polls
+_watcher = GaussianLogWatcher()
+FOLLOW_IDLE_SECONDS = 3600.0
+
+
+def _follow(filepath: str) -> CustomGaussianDataModel:
+    model = _watcher.add(filepath).poll()
+    _watcher.prune(idle=FOLLOW_IDLE_SECONDS)
+    return model
+
 
 @mcp.tool()
 async def gauss_parse_file_to_model(filepath: str) -> CustomGaussianDataModel:
@@ -27,12 +45,89 @@ async def gauss_parse_file_to_model(filepath: str) -> CustomGaussianDataModel:
     """
     logger.info("Parsing Gaussian file: %s ...", filepath)
     try:
-        return gaussian_parse(filepath)
+        if isolation_enabled():  # under the time and memory limits of parse_patrol.utils.isolate
+            return (await asyncio.to_thread(isolated_parse, "gaussian", filepath)).unwrap()
+        return await aio.gaussian_parse(filepath)  # in the shared worker pool, off the event loop
     except (FileNotFoundError, ValueError) as e:
         logger.error("Failed to parse file: %s", e)
         return CustomGaussianDataModel(metadata={"error": str(e)})
 
 
+@mcp.tool()
+async def gauss_follow_log(filepath: str) -> CustomGaussianDataModel:
+    """
+    Report the current state of a Gaussian log that may still be running.
+
+    The first call parses the whole log; later calls on the same path only process the
+    output appended since, so polling a running job is cheap (once the job terminated, a
+    later call parses the log from the start again). Besides the usual fields,
+    `metadata` holds the optimization step, the last convergence table, and whether the
+    optimization converged and the job terminated.
+
+    Args:
+        filepath: Path to the Gaussian .log/.out file.
+
+    Returns:
+        CustomGaussianDataModel with the contents parsed so far.
+    """
+    logger.info("Following Gaussian log: %s ...", filepath)
+    try:
+        return await asyncio.to_thread(_follow, filepath)
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("Failed to follow file: %s", e)
+        return CustomGaussianDataModel(metadata={"error": str(e)})
+
+
+@mcp.tool()
+async def gauss_query_log(filepath: str, sections: Optional[List[str]] = None) -> CustomGaussianDataModel:
+    """
+    Extract selected sections of a (large) Gaussian log through a byte-offset index.
+
+    The first query scans the log once and saves an index of its sections; later queries on
+    the same, unchanged log read only the requested lines, so asking for the energies, then
+    the geometry, then the frequencies does not re-read the whole file each time.
+
+    Args:
+        filepath: Path to the Gaussian .log/.out file.
+        sections: Any of 'energies', 'geometry' (last Standard orientation), 'frequencies',
+            'thermochemistry' (default: all).
+
+    Returns:
+        CustomGaussianDataModel with the requested fields; `metadata` holds the number of geometries and jobs.
+    """
+    logger.info("Querying Gaussian log: %s ...", filepath)
+    try:
+        # Building or loading the index scans the log, so it runs off the event loop too
+        return await asyncio.to_thread(lambda: IndexedLog(filepath).query(sections or list(QUERY_SECTIONS)))
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("Failed to query file: %s", e)
+        return CustomGaussianDataModel(metadata={"error": str(e)})
+
+
+@mcp.tool()
+async def gauss_parse_jobs(filepath: str) -> List[CustomGaussianDataModel]:
+    """
+    Parse a multi-job Gaussian log or input (Link1 / `--Link1--`) into one model per job.
+
+    `gauss_parse_file_to_model` merges the jobs of a log (e.g., an optimization followed by a
+    frequency job) into one model, and reads only the first job of an input. Here each job
+    is parsed on its own; large logs are split across worker processes.
+
+    Args:
+        filepath: Path to the Gaussian .log/.out or .gjf/.com file.
+
+    Returns:
+        A CustomGaussianDataModel per job, in file order; `metadata` holds the job number,
+        and for logs the route and whether the job terminated normally.
+    """
+    logger.info("Parsing Gaussian jobs: %s ...", filepath)
+    try:
+        return await asyncio.to_thread(gaussian_parse_jobs, filepath)
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("Failed to parse file: %s", e)
+        return [CustomGaussianDataModel(metadata={"error": str(e)})]
+
+
 @mcp.prompt()
 async def custom_gaussian_test_prompt(
     file_description: str, analysis_type: str = "comprehensive analysis"
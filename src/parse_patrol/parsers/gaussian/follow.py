@@ -0,0 +1,264 @@
+"""
+Incremental parsing of Gaussian logs that are still being written.
+
+`GaussianLogFollower` remembers its byte offset in the log and the state of any block it
+is in the middle of (e.g., a Standard orientation table cut off by the last write), so each
+`poll()` only reads and processes the bytes appended since the previous one. A log that
+was replaced (by a restarted job: another inode, an older modification time, different
+first bytes, or a shorter file) is parsed again from the start.
+`GaussianLogWatcher` tracks many logs from one process: a poll first compares each file's
+size and modification time, and only opens files that changed.
+
+Watching is done by polling `os.stat` rather than inotify, which keeps it portable and
+also works on the network filesystems that cluster jobs usually write to.
+
+```python
+from parse_patrol.parsers.gaussian.follow import GaussianLogWatcher
+
+watcher = GaussianLogWatcher(["job1.log", "job2.log"])
+for path, model in watcher.watch(interval=60):
+    print(path, model.final_energy, model.metadata["optimization_converged"])
+```
+"""
+
+import os
+import re
+import threading
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .utils import CustomGaussianDataModel, _LogExtractor, _re_orient_divider, _re_std_orient_header
+
+_re_converged_item = re.compile(rb"^\s*(Maximum Force|RMS\s+Force|Maximum Displacement|RMS\s+Displacement)\s+(\S+)\s+(\S+)\s+(YES|NO)\s*$")
+_re_step = re.compile(rb"Step number\s+(\d+)")
+
+# Leading bytes kept to recognize a log rewritten in place (the job header differs per run)
+HEAD_BYTES = 4096
+
+
+class GaussianLogFollower:
+    """Stateful parser for one growing Gaussian log; see the module docstring."""
+
+    def __init__(self, filepath: str):
+        self.path = str(filepath)
+        self.offset = 0
+        self._lock = threading.Lock()  # polls may come from several threads (the MCP tool)
+        self._reset()
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self._partial = b""  # bytes of an incomplete last line
+        self._extractor = _LogExtractor()
+        # Standard orientation block: None outside, else the number of dividers seen so far
+        self._orient_dividers: Optional[int] = None
+        self._orient_rows: List[Tuple[int, List[float]]] = []
+        self.atomnos: Optional[List[int]] = None
+        self.atomcoords: Optional[List[List[float]]] = None
+        self.geometries = 0
+        self.opt_step: Optional[int] = None
+        self.convergence: Dict[str, Dict[str, object]] = {}
+        self.optimization_converged = False
+        self.completed = False
+        self.error_termination = False
+        # What the bytes read so far came from: (st_dev, st_ino), st_mtime_ns and the first bytes
+        self._identity: Optional[Tuple[int, int]] = None
+        self._mtime_ns = 0
+        self._head = b""
+
+    def _replaced(self, f, st: os.stat_result) -> bool:
+        """Whether the open log `f` is no longer the file the bytes read so far came from."""
+        if self._identity is None:
+            return False
+        if (st.st_dev, st.st_ino) != self._identity or st.st_size < self.offset or st.st_mtime_ns < self._mtime_ns:
+            return True
+        f.seek(0)
+        return f.read(len(self._head)) != self._head
+
+    def poll(self) -> CustomGaussianDataModel:
+        """Process the bytes appended since the last poll and return the current state.
+
+        A file that was replaced or truncated (e.g., by a restarted job) is parsed again from the start.
+
+        Raises:
+            FileNotFoundError: If the log does not exist
+        """
+        with self._lock:
+            return self._poll()
+
+    def _poll(self) -> CustomGaussianDataModel:
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if self._replaced(f, st):
+                self._reset()
+            f.seek(self.offset)
+            data = f.read(st.st_size - self.offset)
+        if self.offset < HEAD_BYTES and len(self._head) == self.offset:
+            self._head += data[:HEAD_BYTES - self.offset]
+        self._identity, self._mtime_ns = (st.st_dev, st.st_ino), st.st_mtime_ns
+        self.feed(data)
+        return self.snapshot()
+
+    def feed(self, data: bytes) -> None:
+        """Process a chunk of appended bytes; an incomplete last line is kept for the next chunk."""
+        self.offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        for line in lines:
+            self._feed_line(line.rstrip(b"\r"))
+
+    def _feed_line(self, line: bytes) -> None:
+        if self._orient_dividers is not None:
+            self._feed_orientation(line)
+            return
+        if _re_std_orient_header.match(line):
+            self._orient_dividers = 0
+            self._orient_rows = []
+            return
+
+        self._extractor.feed(line)
+
+        if b"Converged?" in line:
+            self.convergence = {}
+            return
+        m = _re_converged_item.match(line)
+        if m:
+            name, value, threshold, converged = (group.decode("ascii") for group in m.groups())
+            self.convergence[" ".join(name.split())] = {"value": value, "threshold": threshold, "converged": converged == "YES"}
+            return
+        m = _re_step.search(line)
+        if m:
+            self.opt_step = int(m.group(1))
+            return
+        if b"Optimization completed" in line or b"Stationary point found" in line:
+            self.optimization_converged = True
+        elif b"Normal termination" in line:
+            self.completed = True
+        elif b"Error termination" in line:
+            self.error_termination = True
+        elif b"Proceeding to internal job step" in line:  # next --Link1-- job
+            self.completed = False
+
+    def _feed_orientation(self, line: bytes) -> None:
+        # Header, divider, two column header rows, divider, rows, divider
+        if _re_orient_divider.match(line):
+            self._orient_dividers += 1
+            if self._orient_dividers == 3:
+                if self._orient_rows:
+                    self.atomnos = [an for an, _ in self._orient_rows]
+                    self.atomcoords = [xyz for _, xyz in self._orient_rows]
+                    self.geometries += 1
+                self._orient_dividers = None
+            return
+        if self._orient_dividers == 2:
+            parts = line.split()
+            if len(parts) >= 6:
+                try:
+                    self._orient_rows.append((int(parts[1]), [float(parts[3]), float(parts[4]), float(parts[5])]))
+                except ValueError as e:
+                    raise ValueError(f"Error parsing geometry line '{line.decode(errors='replace')}': {e}")
+
+    def snapshot(self) -> CustomGaussianDataModel:
+        """The current state as a model; the geometry is the last complete Standard orientation block."""
+        return CustomGaussianDataModel(
+            natom=len(self.atomnos) if self.atomnos else None,
+            atomnos=list(self.atomnos) if self.atomnos else None,
+            atomcoords=[list(xyz) for xyz in self.atomcoords] if self.atomcoords else None,
+            metadata={
+                "source": self.path,
+                "parser": "gaussian-log-follow",
+                "offset": self.offset,
+                "geometries": self.geometries,
+                "opt_step": self.opt_step,
+                "convergence": {name: dict(item) for name, item in self.convergence.items()},
+                "optimization_converged": self.optimization_converged,
+                "completed": self.completed,
+                "error_termination": self.error_termination,
+            },
+            **self._extractor.fields(),
+        )
+
+
+class GaussianLogWatcher:
+    """Follow many Gaussian logs from one process by polling their size and modification time.
+
+    A long-lived watcher (e.g., the MCP server's) drops the followers of finished or
+    abandoned jobs with `prune`.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self._followers: Dict[str, GaussianLogFollower] = {}
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+        self._used: Dict[str, float] = {}
+        for path in paths:
+            self.add(path)
+
+    def add(self, path: str) -> GaussianLogFollower:
+        path = str(path)
+        if path not in self._followers:
+            self._followers[path] = GaussianLogFollower(path)
+        self._used[path] = time.monotonic()
+        return self._followers[path]
+
+    def remove(self, path: str) -> None:
+        self._followers.pop(str(path), None)
+        self._stamps.pop(str(path), None)
+        self._used.pop(str(path), None)
+
+    def prune(self, idle: Optional[float] = None) -> List[str]:
+        """Remove the followers of terminated jobs (normally or with an error).
+
+        Args:
+            idle: Also remove followers not added for this many seconds (default: keep them)
+
+        Returns:
+            The removed paths
+        """
+        now = time.monotonic()
+        removed = [
+            path for path, follower in list(self._followers.items())
+            if follower.completed or follower.error_termination
+            or (idle is not None and now - self._used.get(path, now) > idle)
+        ]
+        for path in removed:
+            self.remove(path)
+        return removed
+
+    @property
+    def paths(self) -> List[str]:
+        return list(self._followers)
+
+    def poll(self) -> Dict[str, CustomGaussianDataModel]:
+        """Parse the new content of every log that changed since the last poll.
+
+        Logs that do not exist (yet) are skipped.
+
+        Returns:
+            Current state per changed log
+        """
+        changed = {}
+        for path, follower in self._followers.items():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            stamp = (st.st_size, st.st_mtime_ns)
+            if self._stamps.get(path) == stamp:
+                continue
+            self._stamps[path] = stamp
+            changed[path] = follower.poll()
+        return changed
+
+    def watch(self, interval: float = 5.0, stop_when_done: bool = True) -> Iterator[Tuple[str, CustomGaussianDataModel]]:
+        """Poll every `interval` seconds and yield (path, state) for each change.
+
+        Args:
+            interval: Seconds between polls
+            stop_when_done: Stop once every log terminated (normally or with an error)
+        """
+        while True:
+            yield from self.poll().items()
+            if stop_when_done and self._followers and all(
+                f.completed or f.error_termination for f in self._followers.values()
+            ):
+                return
+            time.sleep(interval)
@@ -0,0 +1,263 @@
+"""
+Byte-offset index of the sections of a Gaussian log, for random-access queries.
+
+`build_index` finds every Standard orientation table, SCF Done line, frequency block,
+thermochemistry line, Link1 boundary and termination line with substring searches over the
+memory-mapped log (no per-line Python work), recording the byte offset of each line. `IndexedLog` answers queries (energies, last
+geometry, frequencies, thermochemistry, or the full model) by seeking straight to those
+lines, so only a few kilobytes are read per query.
+
+Indexes are cached in memory and saved as JSON under `PARSE_PATROL_CACHE_DIR` (default:
+`~/.cache/parse_patrol`), keyed by the log's absolute path and checked against its size and
+modification time, so a rewritten or grown log is indexed anew.
+
+```python
+from parse_patrol.parsers.gaussian.index import IndexedLog
+
+log = IndexedLog("big.log")        # scans the log once, or loads the saved index
+print(log.energies()[-1])
+atomnos, coords = log.geometry()    # last Standard orientation
+print(log.frequencies()["vibfreqs"])
+```
+"""
+
+import hashlib
+import mmap
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ...utils.sniff import sniff
+from .utils import CustomGaussianDataModel, _LogExtractor, _parse_last_standard_orientation, _re_orient_divider
+
+INDEX_VERSION = 1
+
+# Section kind -> the text marking its lines (every line the log parser matches contains one)
+SECTION_MARKERS: Dict[str, Tuple[bytes, ...]] = {
+    "charge": (b"Multiplicity",),
+    "scf": (b"SCF Done:",),
+    "orientation": (b"Standard orientation:",),
+    "frequencies": (b"Frequencies --",),
+    "zpve": (b"Zero-point vibrational energy",),
+    "thermo": (b"Sum of electronic and",),
+    "temperature": (b"Temperature",),
+    "link1": (b"Proceeding to internal job step",),
+    "termination": (b"Normal termination", b"Error termination"),
+}
+
+QUERY_SECTIONS = ("energies", "geometry", "frequencies", "thermochemistry")
+
+# Lines of a frequency block read after its "Frequencies --" line (Red. masses, Frc consts, IR Inten)
+_FREQ_BLOCK_LINES = 4
+
+_memory: "OrderedDict[str, LogIndex]" = OrderedDict()
+_memory_lock = threading.Lock()
+_MEMORY_SIZE = 64
+
+
+class LogIndex(BaseModel):
+    """Byte offsets of the section lines of one Gaussian log."""
+
+    path: str = Field(description="Absolute path of the log")
+    size: int = Field(description="Size of the log when indexed (bytes)")
+    mtime_ns: int = Field(description="Modification time of the log when indexed (ns since the epoch)")
+    version: int = Field(default=INDEX_VERSION, description="Index format version")
+    sections: Dict[str, List[int]] = Field(default_factory=dict, description="Line offsets per section kind (see SECTION_MARKERS)")
+
+    def matches(self, st: os.stat_result) -> bool:
+        return self.version == INDEX_VERSION and (self.size, self.mtime_ns) == (st.st_size, st.st_mtime_ns)
+
+
+def _cache_dir() -> str:
+    return os.environ.get("PARSE_PATROL_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "parse_patrol")
+
+
+def index_path(filepath: str, cache_dir: Optional[str] = None) -> str:
+    """Where the index of a log is saved: `<cache_dir>/index/<hash of the absolute path>.json`."""
+    digest = hashlib.blake2b(os.path.abspath(filepath).encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(cache_dir or _cache_dir(), "index", f"{digest}.json")
+
+
+def build_index(filepath: str) -> LogIndex:
+    """Scan a log once and record the offset of every section line.
+
+    Raises:
+        FileNotFoundError: If the log does not exist
+    """
+    path = os.path.abspath(filepath)
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        sections: Dict[str, List[int]] = {kind: [] for kind in SECTION_MARKERS}
+        if st.st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for kind, markers in SECTION_MARKERS.items():
+                    starts = set()
+                    for marker in markers:
+                        pos = mm.find(marker)
+                        while pos != -1:
+                            start = mm.rfind(b"\n", 0, pos) + 1
+                            starts.add(start)
+                            # Continue after this line: one offset per line
+                            end = mm.find(b"\n", pos)
+                            pos = -1 if end == -1 else mm.find(marker, end)
+                    sections[kind] = sorted(starts)
+    return LogIndex(path=path, size=st.st_size, mtime_ns=st.st_mtime_ns, sections=sections)
+
+
+def load_index(filepath: str, cache_dir: Optional[str] = None, save: bool = True) -> LogIndex:
+    """The index of a log: from memory, else from the saved file, else built (and saved).
+
+    Args:
+        filepath: Path of the Gaussian log
+        cache_dir: Directory for saved indexes (default: `PARSE_PATROL_CACHE_DIR` or `~/.cache/parse_patrol`)
+        save: Save a newly built index; an unwritable cache directory is silently skipped
+    """
+    path = os.path.abspath(filepath)
+    st = os.stat(path)
+    with _memory_lock:
+        index = _memory.get(path)
+    if index is None or not index.matches(st):
+        saved = index_path(path, cache_dir)
+        try:
+            with open(saved, encoding="utf-8") as f:
+                index = LogIndex.model_validate_json(f.read())
+        except (OSError, ValueError):
+            index = None
+        if index is None or index.path != path or not index.matches(st):
+            index = build_index(path)
+            if save:
+                try:
+                    os.makedirs(os.path.dirname(saved), exist_ok=True)
+                    tmp = f"{saved}.{os.getpid()}.tmp"
+                    with open(tmp, "w", encoding="utf-8") as f:
+                        f.write(index.model_dump_json())
+                    os.replace(tmp, saved)
+                except OSError:
+                    pass
+    with _memory_lock:
+        _memory[path] = index
+        _memory.move_to_end(path)
+        while len(_memory) > _MEMORY_SIZE:
+            _memory.popitem(last=False)
+    return index
+
+
+class IndexedLog:
+    """Random-access queries on a Gaussian log through its section index; see the module docstring."""
+
+    def __init__(self, filepath: str, cache_dir: Optional[str] = None):
+        self.path = os.path.abspath(filepath)
+        self.index = load_index(self.path, cache_dir)
+
+    def _lines(self, offsets: List[int], count: int = 1) -> List[Tuple[int, bytes]]:
+        """`count` lines starting at each offset, as (offset, line) pairs."""
+        lines: List[Tuple[int, bytes]] = []
+        if not offsets:
+            return lines
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for offset in offsets:
+                for _ in range(count):
+                    if offset >= len(mm):
+                        break
+                    end = mm.find(b"\n", offset)
+                    end = len(mm) if end == -1 else end
+                    lines.append((offset, mm[offset:end].rstrip(b"\r")))
+                    offset = end + 1
+        return lines
+
+    def _extract(self, kinds: List[str]) -> _LogExtractor:
+        """Feed the indexed lines of the given kinds to a log extractor, in file order."""
+        lines: Dict[int, bytes] = {}
+        for kind in kinds:
+            count = 1 + _FREQ_BLOCK_LINES if kind == "frequencies" else 1
+            lines.update(self._lines(self.index.sections.get(kind, []), count))
+        extractor = _LogExtractor()
+        for offset in sorted(lines):
+            extractor.feed(lines[offset])
+        return extractor
+
+    def energies(self) -> List[float]:
+        """SCF energies (Hartree), in order."""
+        return self._extract(["scf"]).scfenergies
+
+    def geometry(self, step: int = -1) -> Tuple[Optional[List[int]], Optional[List[List[float]]]]:
+        """Atomic numbers and coordinates (Å) of a Standard orientation table (default: the last)."""
+        offsets = self.index.sections.get("orientation", [])
+        if not offsets:
+            return None, None
+        lines = []
+        dividers = 0
+        with open(self.path, "rb") as f:
+            f.seek(offsets[step])
+            # Header, divider, two column header rows, divider, rows, divider
+            for line in f:
+                line = line.rstrip(b"\r\n")
+                lines.append(line)
+                if _re_orient_divider.match(line):
+                    dividers += 1
+                    if dividers == 3:
+                        break
+        return _parse_last_standard_orientation(lines)
+
+    @property
+    def geometries(self) -> int:
+        """Number of Standard orientation tables."""
+        return len(self.index.sections.get("orientation", []))
+
+    @property
+    def jobs(self) -> int:
+        """Number of jobs (1 + Link1 boundaries)."""
+        return 1 + len(self.index.sections.get("link1", []))
+
+    def frequencies(self) -> Dict[str, Optional[List[float]]]:
+        """Vibrational frequencies (cm-1), IR intensities (km/mol) and reduced masses (amu)."""
+        fields = self._extract(["frequencies"]).fields()
+        return {name: fields[name] for name in ("vibfreqs", "vibirs", "vibrmasses")}
+
+    def thermochemistry(self) -> Dict[str, Optional[float]]:
+        """Zero-point energy, the sums of electronic and thermal energies (Hartree), and the temperature (K)."""
+        fields = self._extract(["zpve", "thermo", "temperature"]).fields()
+        return {
+            name: fields[name]
+            for name in ("zpve", "sum_electronic_and_zero_point", "sum_electronic_and_thermal_energies",
+                         "sum_electronic_and_thermal_enthalpies", "sum_electronic_and_thermal_free_energies", "temperature")
+        }
+
+    def to_model(self) -> CustomGaussianDataModel:
+        """The same model as `gaussian_parse`, read from the indexed sections only."""
+        extractor = self._extract(["charge", "scf", "zpve", "thermo", "temperature", "frequencies"])
+        atomnos, coords = self.geometry()
+        info = sniff(self.path)
+        return CustomGaussianDataModel(
+            natom=len(atomnos) if atomnos else None,
+            atomnos=atomnos,
+            atomcoords=coords,
+            metadata={"source": self.path, "parser": "gaussian-log", "version": info.version, "completed": info.completed},
+            **extractor.fields(),
+        )
+
+    def query(self, sections: List[str]) -> CustomGaussianDataModel:
+        """A model holding only the requested sections: 'energies', 'geometry', 'frequencies', 'thermochemistry'.
+
+        Raises:
+            ValueError: For an unknown section name
+        """
+        unknown = set(sections) - set(QUERY_SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown sections {sorted(unknown)}; choose from {list(QUERY_SECTIONS)}")
+        fields: Dict[str, object] = {}
+        if "energies" in sections:
+            energies = self.energies()
+            fields.update(scfenergies=energies or None, final_energy=energies[-1] if energies else None)
+        if "geometry" in sections:
+            atomnos, coords = self.geometry()
+            fields.update(natom=len(atomnos) if atomnos else None, atomnos=atomnos, atomcoords=coords)
+        if "frequencies" in sections:
+            fields.update(self.frequencies())
+        if "thermochemistry" in sections:
+            fields.update(self.thermochemistry())
+        metadata = {"source": self.path, "parser": "gaussian-log-index", "geometries": self.geometries, "jobs": self.jobs}
+        return CustomGaussianDataModel(metadata=metadata, **fields)  # type: ignore[arg-type]
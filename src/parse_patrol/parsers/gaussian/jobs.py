@@ -0,0 +1,157 @@
+"""
+Per-job parsing of multi-job Gaussian logs and inputs (`--Link1--`).
+
+A multi-step run (e.g., `opt` followed by `freq`, or a CBS-QB3 chain) writes all its jobs
+into one log, which `gaussian_parse` reads as a whole. Here the jobs are split at their
+boundaries and parsed independently:
+
+- logs: a new job starts at its "Link1:  Proceeding to internal job step number N" line
+- inputs: jobs are separated by `--Link1--` lines
+
+`iter_gaussian_jobs` reads and parses one job at a time, so only the current job is held in
+memory. `gaussian_parse_jobs` parses the jobs of a large log in parallel worker processes,
+each reading its own byte range of the file.
+
+```python
+from parse_patrol.parsers.gaussian.jobs import gaussian_parse_jobs
+
+opt, freq = gaussian_parse_jobs("opt_freq.log")
+print(opt.final_energy, freq.vibfreqs[:3])
+```
+"""
+
+import os
+import re
+from concurrent.futures import Executor
+from typing import Iterator, List, Optional, Tuple, Union
+
+from ...utils.pool import create_pool, get_pool
+from ...utils.shm import receive, share
+from ...utils.sniff import sniff
+from ...utils.sources import MemorySource, Source, as_source, is_virtual, read_bytes, read_text
+from .index import SECTION_MARKERS, load_index
+from .utils import CustomGaussianDataModel, _gaussian_dispatch, _parse_gjf, _parse_log_or_out
+
+# Logs from this size on are parsed in parallel by default
+PARALLEL_MIN_BYTES = 64 << 20
+
+# The route echo, between dashed lines; Gaussian wraps long routes at a fixed width, even inside a keyword
+_re_route = re.compile(rb"^ -+\r?\n( #.*?)\r?\n -+\r?$", re.MULTILINE | re.DOTALL)
+_re_link1 = re.compile(r"^[ \t]*--link1--[ \t]*(?:\r?\n|$)", re.IGNORECASE | re.MULTILINE)
+
+
+def log_job_spans(source: Union[str, MemorySource]) -> List[Tuple[int, int]]:
+    """Byte ranges [start, end) of the jobs in a Gaussian log.
+
+    Plain files use the section index (see `index.py`), so the boundaries of a log are found once.
+    """
+    if not is_virtual(source):
+        index = load_index(str(source))
+        boundaries, size = index.sections.get("link1", []), index.size
+    else:
+        data = read_bytes(source)
+        data = data if isinstance(data, (bytes, bytearray)) else bytes(data)
+        (marker,) = SECTION_MARKERS["link1"]
+        boundaries, size = [data.rfind(b"\n", 0, m.start()) + 1 for m in re.finditer(re.escape(marker), data)], len(data)
+    starts = [0] + [start for start in boundaries if start > 0]
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _read_span(source: Union[str, MemorySource], start: int, end: int) -> bytes:
+    if isinstance(source, MemorySource) or is_virtual(source):
+        return bytes(read_bytes(source)[start:end])
+    with open(source, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _parse_log_job(data: bytes, label: str, job: int, njobs: int, start: int, version: Optional[str]) -> CustomGaussianDataModel:
+    model = _parse_log_or_out(MemorySource(data, label), label)
+    route = _re_route.search(data)
+    if route:
+        route = b"".join(line[1:] for line in route.group(1).splitlines())
+    model.route = route.decode("utf-8", "replace").strip() if route else None
+    model.metadata.update({
+        "version": version,
+        "completed": b"Normal termination" in data,
+        "job": job,
+        "jobs": njobs,
+        "offset": start,
+    })
+    return model
+
+
+def _parse_log_span(path: str, job: int, njobs: int, start: int, end: int, version: Optional[str]) -> object:
+    """Parse one job of a log file; runs in a worker process."""
+    return share(_parse_log_job(_read_span(path, start, end), path, job, njobs, start, version))
+
+
+def iter_gaussian_jobs(filepath: Source) -> Iterator[CustomGaussianDataModel]:
+    """Lazily parse the jobs of a Gaussian log or input, one model per job.
+
+    Each job's model carries `metadata["job"]` (0-based) and `metadata["jobs"]`. Other
+    Gaussian files (e.g., .fchk) yield a single model, as `gaussian_parse` returns it.
+
+    Args:
+        filepath: Path to the Gaussian file, or its content (see `gaussian_parse`)
+    """
+    source = as_source(filepath)
+    label = str(source)
+    info = sniff(source)
+    if info.program not in (None, "gaussian") or info.file_type not in ("log", "input"):
+        yield _gaussian_dispatch(source)
+        return
+
+    if info.file_type == "input":
+        sections = [section for section in _re_link1.split(read_text(source)) if section.strip()]
+        for job, section in enumerate(sections):
+            model = _parse_gjf(MemorySource(section, label), label)
+            model.metadata.update({"job": job, "jobs": len(sections)})
+            yield model
+        return
+
+    spans = log_job_spans(source)
+    for job, (start, end) in enumerate(spans):
+        yield _parse_log_job(_read_span(source, start, end), label, job, len(spans), start, info.version)
+
+
+def gaussian_parse_jobs(
+    filepath: Source,
+    parallel: Optional[bool] = None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+) -> List[CustomGaussianDataModel]:
+    """Parse every job of a Gaussian log or input; see `iter_gaussian_jobs`.
+
+    Args:
+        filepath: Path to the Gaussian file, or its content (see `gaussian_parse`)
+        parallel: Parse the jobs of a log file in worker processes (default: for logs of
+            at least `PARALLEL_MIN_BYTES` with several jobs); in-memory and compressed sources
+            are always parsed sequentially
+        executor: Executor to run the jobs on (default: the shared pool of `utils.pool`)
+        max_workers: Number of worker processes of a dedicated pool (default: the shared pool)
+
+    Returns:
+        One CustomGaussianDataModel per job, in file order
+    """
+    source = as_source(filepath)
+    if isinstance(source, MemorySource) or is_virtual(source) or parallel is False:
+        return list(iter_gaussian_jobs(source))
+    info = sniff(source)
+    if info.program not in (None, "gaussian") or info.file_type != "log":
+        return list(iter_gaussian_jobs(source))
+    spans = log_job_spans(source)
+    if len(spans) < 2 or (parallel is None and os.path.getsize(source) < PARALLEL_MIN_BYTES):
+        return list(iter_gaussian_jobs(source))
+
+    own_executor = executor is None and max_workers is not None
+    executor = executor or (create_pool(max_workers) if max_workers else get_pool())
+    try:
+        futures = [
+            executor.submit(_parse_log_span, source, job, len(spans), start, end, info.version)
+            for job, (start, end) in enumerate(spans)
+        ]
+        return [receive(future.result()) for future in futures]
+    finally:
+        if own_executor:
+            executor.shutdown()
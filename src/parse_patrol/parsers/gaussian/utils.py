@@ -6,12 +6,18 @@ for parsing Gaussian computation files (.log/.out, .gjf/.com, .fchk).
 """
 
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Tuple
+from typing import Optional, Dict, List, Any, Tuple, Union
 import re
 
 from pydantic import BaseModel, Field
 import periodictable
 
+from ...utils.instrumentation import parse_session, stage
+from ...utils.normalize import BOHR_TO_ANGSTROM
+from ...utils.numeric import fortran_floats, fortran_ints
+from ...utils.sniff import sniff
+from ...utils.sources import MemorySource, Source, as_source, logical_name, read_bytes, read_text, source_exists
+
 
 class CustomGaussianDataModel(BaseModel):
     # Common job info
@@ -44,32 +50,80 @@ class CustomGaussianDataModel(BaseModel):
     metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional metadata")
 
 
-# Regular expression patterns for parsing Gaussian output
-_float_re = r"[-+]?\d+(?:\.\d*)?(?:[DEde][+-]?\d+)?"
-_re_charge_mult = re.compile(r"Charge\s*=\s*(-?\d+)\s+Multiplicity\s*=\s*(\d+)")
-_re_scf_done = re.compile(r"SCF Done:\s+E\([^\)]+\)\s*=\s*(" + _float_re + r")")
-_re_zpve = re.compile(r"Zero-point vibrational energy\s+(" + _float_re + r")")
-_re_sum_zpe = re.compile(r"Sum of electronic and zero-point Energies=\s*(" + _float_re + r")")
-_re_sum_therm_e = re.compile(r"Sum of electronic and thermal Energies=\s*(" + _float_re + r")")
-_re_sum_therm_h = re.compile(r"Sum of electronic and thermal Enthalpies=\s*(" + _float_re + r")")
-_re_sum_therm_g = re.compile(r"Sum of electronic and thermal Free Energies=\s*(" + _float_re + r")")
-_re_temperature = re.compile(r"Temperature\s+(" + _float_re + r")")
-_re_freqs = re.compile(r"Frequencies --\s*(.*)")
-_re_ir = re.compile(r"IR Inten\s+--\s*(.*)")
-_re_redmasses = re.compile(r"Red\.?\s*masses\s+--\s*(.*)", re.IGNORECASE)
-_re_header = re.compile(r"^[A-Za-z].*\s+[IRL]\s+\d+")
+# Regular expression patterns for parsing Gaussian output.
+# Logs and formatted checkpoints are scanned as bytes, so buffers are never decoded as a whole.
+_float_re = rb"[-+]?\d+(?:\.\d*)?(?:[DEde][+-]?\d+)?"
+_re_charge_mult = re.compile(rb"Charge\s*=\s*(-?\d+)\s+Multiplicity\s*=\s*(\d+)")
+_re_scf_done = re.compile(rb"SCF Done:\s+E\([^\)]+\)\s*=\s*(" + _float_re + rb")")
+_re_zpve = re.compile(rb"Zero-point vibrational energy\s+(" + _float_re + rb")")
+_re_sum_zpe = re.compile(rb"Sum of electronic and zero-point Energies=\s*(" + _float_re + rb")")
+_re_sum_therm_e = re.compile(rb"Sum of electronic and thermal Energies=\s*(" + _float_re + rb")")
+_re_sum_therm_h = re.compile(rb"Sum of electronic and thermal Enthalpies=\s*(" + _float_re + rb")")
+_re_sum_therm_g = re.compile(rb"Sum of electronic and thermal Free Energies=\s*(" + _float_re + rb")")
+_re_temperature = re.compile(rb"Temperature\s+(" + _float_re + rb")")
+_re_freqs = re.compile(rb"Frequencies --\s*(.*)")
+_re_ir = re.compile(rb"IR Inten\s+--\s*(.*)")
+_re_redmasses = re.compile(rb"Red\.?\s*masses\s+--\s*(.*)", re.IGNORECASE)
+_re_header = re.compile(rb"^[A-Za-z].*\s+[IRLC]\s+(?:N=\s*)?[-+]?\d")
+_re_line_start = re.compile(rb"\n[A-Za-z]")  # candidate FCHK header lines
+_re_header_at = re.compile(_re_header.pattern[1:])  # `^` does not anchor at a match position
+_re_newline = re.compile(rb"\n")  # also searches memoryviews, which have no .find()
 
 # Standard orientation block headers in Gaussian logs
-_re_std_orient_header = re.compile(r"^\s*Standard orientation:\s*$")
-_re_orient_divider = re.compile(r"^\s*-{2,}\s*$")
+_re_std_orient_header = re.compile(rb"^\s*Standard orientation:\s*$")
+_re_orient_divider = re.compile(rb"^\s*-{2,}\s*$")
+
+
+def _safe_float(s: bytes) -> float:
+    """Convert bytes to float, handling Gaussian's D notation for exponents."""
+    try:
+        return float(s)
+    except ValueError:
+        return float(s.replace(b"D", b"E").replace(b"d", b"e"))
+
+
+def _floats_by_line(groups: List[bytes]) -> List[float]:
+    """Convert the value groups of several lines at once; a malformed line is skipped on its own."""
+    try:
+        return fortran_floats(b" ".join(groups))
+    except ValueError:
+        values: List[float] = []
+        for group in groups:
+            try:
+                values.extend(fortran_floats(group))
+            except ValueError:
+                pass
+        return values
 
 
-def _safe_float(s: str) -> float:
-    """Convert string to float, handling Gaussian's D notation for exponents."""
-    return float(s.replace("D", "E").replace("d", "e"))
+_LINES_CHUNK = 1 << 20
 
 
-def _parse_last_standard_orientation(lines: List[str]) -> Tuple[Optional[List[int]], Optional[List[List[float]]]]:
+def _read_lines(source: Union[str, MemorySource]) -> List[bytes]:
+    """Split a source into byte lines, without decoding.
+
+    A memoryview is split a chunk at a time, so the buffer is never copied as a whole
+    besides its lines.
+    """
+    data = read_bytes(source)
+    if not isinstance(data, memoryview):
+        return data.splitlines()
+    lines: List[bytes] = []
+    pos, size = 0, len(data)
+    while pos < size:
+        end = min(pos + _LINES_CHUNK, size)
+        if end < size:  # cut after the chunk's last newline (or the next one, for a longer line)
+            newline = None
+            for newline in _re_newline.finditer(data, pos, end):
+                pass
+            newline = newline or _re_newline.search(data, end)
+            end = newline.end() if newline else size
+        lines.extend(bytes(data[pos:end]).splitlines())
+        pos = end
+    return lines
+
+
+def _parse_last_standard_orientation(lines: List[bytes]) -> Tuple[Optional[List[int]], Optional[List[List[float]]]]:
     """Parse the last standard orientation block from Gaussian log file lines."""
     atomnos: List[int] = []
     coords: List[List[float]] = []
@@ -106,6 +160,20 @@ def _parse_last_standard_orientation(lines: List[str]) -> Tuple[Optional[List[in
         i += 1  # second divider
 
     # Now read data until next divider
+    start = i
+    while i < len(lines) and not _re_orient_divider.match(lines[i]):
+        i += 1
+
+    # Rows are "center, atomic number, atomic type, x, y, z": convert the whole table at once
+    try:
+        values = fortran_floats(b"\n".join(lines[start:i]), count=6 * (i - start))
+    except ValueError:
+        values = None
+    if values:
+        return [int(an) for an in values[1::6]], [values[j:j + 3] for j in range(3, len(values), 6)]
+
+    # Irregular rows: convert row by row, skipping short ones
+    i = start
     while i < len(lines) and not _re_orient_divider.match(lines[i]):
         parts = lines[i].split()
         if len(parts) >= 6:
@@ -117,7 +185,7 @@ def _parse_last_standard_orientation(lines: List[str]) -> Tuple[Optional[List[in
                 atomnos.append(an)
                 coords.append([x, y, z])
             except ValueError as e:
-                raise ValueError(f"Error parsing geometry line '{lines[i]}': {e}")
+                raise ValueError(f"Error parsing geometry line '{lines[i].decode(errors='replace')}': {e}")
         i += 1
 
     if not atomnos:
@@ -125,129 +193,143 @@ def _parse_last_standard_orientation(lines: List[str]) -> Tuple[Optional[List[in
     return atomnos, coords
 
 
-def _parse_log_or_out(path: Path) -> CustomGaussianDataModel:
-    """Parse Gaussian log/out file and extract computational results."""
-    text = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+class _LogExtractor:
+    """Line-by-line extraction of the scalar and vibrational results of a Gaussian log.
 
-    charge: Optional[int] = None
-    mult: Optional[int] = None
-    scfenergies: List[float] = []
-    final_energy: Optional[float] = None
-    zpve: Optional[float] = None
-    sum_e_zpe: Optional[float] = None
-    sum_e_therm: Optional[float] = None
-    sum_h_therm: Optional[float] = None
-    sum_g_therm: Optional[float] = None
-    temperature: Optional[float] = None
-
-    vibfreqs: List[float] = []
-    vibirs: List[float] = []
-    vibrmasses: List[float] = []
-
-    for line in text:
-        if charge is None or mult is None:
+    Shared by the one-shot parser and the incremental follower (`follow.py`), which feeds
+    it only the lines appended since its last poll.
+    """
+
+    def __init__(self):
+        self.charge: Optional[int] = None
+        self.mult: Optional[int] = None
+        self.scfenergies: List[float] = []
+        self.final_energy: Optional[float] = None
+        self.zpve: Optional[float] = None
+        self.sum_e_zpe: Optional[float] = None
+        self.sum_e_therm: Optional[float] = None
+        self.sum_h_therm: Optional[float] = None
+        self.sum_g_therm: Optional[float] = None
+        self.temperature: Optional[float] = None
+        # Value groups of the vibrational lines, converted in bulk by fields()
+        self.vibfreqs: List[bytes] = []
+        self.vibirs: List[bytes] = []
+        self.vibrmasses: List[bytes] = []
+
+    def feed(self, line: bytes) -> None:
+        if self.charge is None or self.mult is None:
             m = _re_charge_mult.search(line)
             if m:
-                charge = int(m.group(1))
-                mult = int(m.group(2))
-                continue
+                self.charge = int(m.group(1))
+                self.mult = int(m.group(2))
+                return
 
         m = _re_scf_done.search(line)
         if m:
             e = _safe_float(m.group(1))
-            scfenergies.append(e)
-            final_energy = e
-            continue
+            self.scfenergies.append(e)
+            self.final_energy = e
+            return
 
-        if zpve is None:
+        if self.zpve is None:
             m = _re_zpve.search(line)
             if m:
-                zpve = _safe_float(m.group(1))
-                continue
+                self.zpve = _safe_float(m.group(1))
+                return
 
-        if sum_e_zpe is None:
+        if self.sum_e_zpe is None:
             m = _re_sum_zpe.search(line)
             if m:
-                sum_e_zpe = _safe_float(m.group(1))
-                continue
+                self.sum_e_zpe = _safe_float(m.group(1))
+                return
 
-        if sum_e_therm is None:
+        if self.sum_e_therm is None:
             m = _re_sum_therm_e.search(line)
             if m:
-                sum_e_therm = _safe_float(m.group(1))
-                continue
+                self.sum_e_therm = _safe_float(m.group(1))
+                return
 
-        if sum_h_therm is None:
+        if self.sum_h_therm is None:
             m = _re_sum_therm_h.search(line)
             if m:
-                sum_h_therm = _safe_float(m.group(1))
-                continue
+                self.sum_h_therm = _safe_float(m.group(1))
+                return
 
-        if sum_g_therm is None:
+        if self.sum_g_therm is None:
             m = _re_sum_therm_g.search(line)
             if m:
-                sum_g_therm = _safe_float(m.group(1))
-                continue
+                self.sum_g_therm = _safe_float(m.group(1))
+                return
 
-        if temperature is None:
+        if self.temperature is None:
             m = _re_temperature.search(line)
             if m:
                 try:
-                    temperature = _safe_float(m.group(1))
+                    self.temperature = _safe_float(m.group(1))
                 except Exception:
                     pass
 
         m = _re_freqs.search(line)
         if m:
-            try:
-                vibfreqs.extend([_safe_float(x) for x in m.group(1).split()])
-            except Exception:
-                pass
-            continue
+            self.vibfreqs.append(m.group(1))
+            return
 
         m = _re_ir.search(line)
         if m:
-            try:
-                vibirs.extend([_safe_float(x) for x in m.group(1).split()])
-            except Exception:
-                pass
-            continue
+            self.vibirs.append(m.group(1))
+            return
 
         m = _re_redmasses.search(line)
         if m:
-            try:
-                vibrmasses.extend([_safe_float(x) for x in m.group(1).split()])
-            except Exception:
-                pass
-            continue
+            self.vibrmasses.append(m.group(1))
+
+    def fields(self) -> Dict[str, Any]:
+        """The extracted values as CustomGaussianDataModel keyword arguments."""
+        return dict(
+            charge=self.charge,
+            mult=self.mult,
+            scfenergies=list(self.scfenergies) or None,
+            final_energy=self.final_energy,
+            zpve=self.zpve,
+            sum_electronic_and_zero_point=self.sum_e_zpe,
+            sum_electronic_and_thermal_energies=self.sum_e_therm,
+            sum_electronic_and_thermal_enthalpies=self.sum_h_therm,
+            sum_electronic_and_thermal_free_energies=self.sum_g_therm,
+            temperature=self.temperature,
+            vibfreqs=_floats_by_line(self.vibfreqs) or None,
+            vibirs=_floats_by_line(self.vibirs) or None,
+            vibrmasses=_floats_by_line(self.vibrmasses) or None,
+        )
 
-    atomnos, coords = _parse_last_standard_orientation(text)
+
+def _parse_log_or_out(source: Union[str, MemorySource], label: str) -> CustomGaussianDataModel:
+    """Parse Gaussian log/out file and extract computational results."""
+    with stage("read"):
+        text = _read_lines(source)
+
+    extractor = _LogExtractor()
+    with stage("extract"):
+        for line in text:
+            extractor.feed(line)
+
+    with stage("geometry"):
+        atomnos, coords = _parse_last_standard_orientation(text)
     natom = len(atomnos) if atomnos else None
 
-    return CustomGaussianDataModel(
-        charge=charge,
-        mult=mult,
-        natom=natom,
-        atomnos=atomnos,
-        atomcoords=coords,
-        scfenergies=scfenergies or None,
-        final_energy=final_energy,
-        zpve=zpve,
-        sum_electronic_and_zero_point=sum_e_zpe,
-        sum_electronic_and_thermal_energies=sum_e_therm,
-        sum_electronic_and_thermal_enthalpies=sum_h_therm,
-        sum_electronic_and_thermal_free_energies=sum_g_therm,
-        temperature=temperature,
-        vibfreqs=vibfreqs or None,
-        vibirs=vibirs or None,
-        vibrmasses=vibrmasses or None,
-        metadata={"source": str(path), "parser": "gaussian-log"},
-    )
-
-
-def _parse_gjf(path: Path) -> CustomGaussianDataModel:
+    with stage("validate"):
+        return CustomGaussianDataModel(
+            natom=natom,
+            atomnos=atomnos,
+            atomcoords=coords,
+            metadata={"source": label, "parser": "gaussian-log"},
+            **extractor.fields(),
+        )
+
+
+def _parse_gjf(source: Union[str, MemorySource], label: str) -> CustomGaussianDataModel:
     """Parse Gaussian input file (.gjf/.com) and extract job parameters."""
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+    with stage("read"):
+        lines = read_text(source).splitlines()
 
     # Gaussian input format:
     # (Link0 commands, optional)
@@ -321,110 +403,118 @@ def _parse_gjf(path: Path) -> CustomGaussianDataModel:
             "Sb": 51, "Te": 52, "I": 53, "Xe": 54,
         }
 
+    # Collect the coordinate columns of the atom lines, then convert them in one call
+    columns: List[str] = []
     while i < len(lines) and lines[i].strip() != "":
         parts = lines[i].split()
         if parts and parts[0] not in periodic and not parts[0].startswith("-"):
             symbol = parts[0]
             if symbol in element_to_Z and len(parts) >= 4:
-                try:
-                    x = float(parts[1])
-                    y = float(parts[2])
-                    z = float(parts[3])
-                    atomnos.append(element_to_Z[symbol])
-                    coords.append([x, y, z])
-                except Exception:
-                    pass
+                atomnos.append(element_to_Z[symbol])
+                columns.append(" ".join(parts[1:4]))
         i += 1
 
+    try:
+        values = fortran_floats("\n".join(columns), count=3 * len(columns))
+        coords = [values[j:j + 3] for j in range(0, len(values), 3)]
+    except ValueError:
+        # Some atom line has non-numeric coordinates (e.g., Z-matrix variables): keep the numeric ones
+        kept = []
+        for an, column in zip(atomnos, columns):
+            try:
+                coords.append(fortran_floats(column, count=3))
+                kept.append(an)
+            except ValueError:
+                pass
+        atomnos = kept
+
     natom = len(atomnos) if atomnos else None
     route = " ".join(route_lines) if route_lines else None
 
-    return CustomGaussianDataModel(
-        route=route,
-        title=title,
-        charge=charge,
-        mult=mult,
-        natom=natom,
-        atomnos=atomnos or None,
-        atomcoords=coords or None,
-        metadata={"source": str(path), "parser": "gaussian-gjf"},
-    )
+    with stage("validate"):
+        return CustomGaussianDataModel(
+            route=route,
+            title=title,
+            charge=charge,
+            mult=mult,
+            natom=natom,
+            atomnos=atomnos or None,
+            atomcoords=coords or None,
+            metadata={"source": label, "parser": "gaussian-gjf"},
+        )
 
 
-def _parse_fchk(path: Path) -> CustomGaussianDataModel:
+def _parse_fchk(source: Union[str, MemorySource], label: str) -> CustomGaussianDataModel:
     """Parse Gaussian formatted checkpoint file (.fchk) and extract basic data."""
     # Minimal extraction: atomic numbers and coordinates if present.
     # Note: Formatted checkpoint keys:
     #  - Atomic numbers: "Atomic numbers"
     #  - Current cartesian coordinates: "Current cartesian coordinates"
     # Values may be in blocks over multiple lines.
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
+    with stage("read"):
+        data = read_bytes(source)  # memoryviews are searched in place; only the sections read are copied
     atomnos: List[int] = []
     coords: List[float] = []
 
-    def read_block(start_idx: int) -> Tuple[int, List[str]]:
+    def read_block(key: bytes) -> Optional[bytes]:
         """
-        Reads a block of lines from the input, starting at the given index, until a line matching the FCHK file header pattern is encountered.
+        Finds the section whose header line starts with `key` and returns its value lines, up to the next line matching the FCHK file header pattern.
 
         Args:
-            start_idx (int): The index in the lines list to start reading from.
+            key (bytes): Start of the section's header line (e.g., b"Atomic numbers").
 
         Returns:
-            Tuple[int, List[str]]: A tuple containing the index of the next header line and a list of string values collected from the block.
+            Optional[bytes]: The section's value lines as one buffer, for bulk conversion, or None if the section is absent.
 
         Notes:
-            The function uses a regular expression to detect FCHK file headers (via `_re_header`).
+            The buffer is searched directly (no split into lines), so the large sections after the
+            requested one (e.g., MO coefficients) are never touched. Headers are detected via `_re_header`.
         """
-        # Reads subsequent lines until a line matching the header regex is found:
-        # i.e., a line that looks like "<Label>  <Type>  <Count>" (e.g., "Atomic numbers           I   N=Natom")
-        vals: List[str] = []
-        i = start_idx
-
-        while i < len(lines):
-            if _re_header.match(lines[i]):
-                break
-            vals.extend(lines[i].split())
-            i += 1
-        return i, vals
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.startswith("Atomic numbers"):
-            # Example: "Atomic numbers           I   N=Natom"
-            i += 1
-            i, vals = read_block(i)
-            try:
-                atomnos = [int(v) for v in vals]
-            except Exception:
-                atomnos = []
-            continue
-        if line.startswith("Current cartesian coordinates"):
-            # Example: "Current cartesian coordinates    R   N=3*Natom"
-            i += 1
-            i, vals = read_block(i)
-            try:
-                floats = [float(v) for v in vals]
-                coords = floats
-            except Exception:
-                coords = []
-            continue
-        i += 1
+        # A header is a line that looks like "<Label>  <Type>  <Count>" (e.g., "Atomic numbers           I   N=Natom")
+        header = re.compile(rb"(?:\A|\n)" + re.escape(key)).search(data)
+        if header is None:
+            return None
+        newline = _re_newline.search(data, header.end())
+        if newline is None:
+            return b""
+        start = newline.end()
+        for m in _re_line_start.finditer(data, start - 1):
+            end = _re_newline.search(data, m.end())
+            if _re_header_at.match(data, m.start() + 1, end.start() if end else len(data)):
+                return data[start:m.start()]
+        return data[start:]
+
+    # Example: "Atomic numbers           I   N=Natom"
+    block = read_block(b"Atomic numbers")
+    if block is not None:
+        try:
+            atomnos = fortran_ints(block)
+        except ValueError:
+            atomnos = []
+    # Example: "Current cartesian coordinates    R   N=3*Natom"
+    block = read_block(b"Current cartesian coordinates")
+    if block is not None:
+        try:
+            # FCHK coordinates are in bohr
+            coords = fortran_floats(block, scale=BOHR_TO_ANGSTROM)
+        except ValueError:
+            coords = []
 
     natom = len(atomnos) if atomnos else None
     coord_triplets: Optional[List[List[float]]] = None
     if natom and len(coords) >= 3 * natom:
         coord_triplets = [coords[j:j+3] for j in range(0, 3 * natom, 3)]
 
-    return CustomGaussianDataModel(
-        natom=natom,
-        atomnos=atomnos or None,
-        atomcoords=coord_triplets or None,
-        metadata={"source": str(path), "parser": "gaussian-fchk"},
-    )
+    with stage("validate"):
+        return CustomGaussianDataModel(
+            natom=natom,
+            atomnos=atomnos or None,
+            atomcoords=coord_triplets or None,
+            metadata={"source": label, "parser": "gaussian-fchk"},
+        )
 
 
-def gaussian_parse(filepath: str) -> CustomGaussianDataModel:
+def gaussian_parse(filepath: Source, instrument: Union[bool, str, None] = None) -> CustomGaussianDataModel:
     """
     Parse a Gaussian file (.log/.out, .gjf/.com, .fchk) and return a CustomGaussianDataModel.
 
@@ -433,33 +523,61 @@ def gaussian_parse(filepath: str) -> CustomGaussianDataModel:
     - .fchk: Extracts atomic numbers and coordinates.
     - .chk (binary): Not supported; convert with 'formchk' first.
 
+    The file type is sniffed from the content (see `parse_patrol.utils.sniff`), so
+    misnamed files are routed correctly. Logs also report the Gaussian version and
+    whether the job terminated normally under `metadata`.
+
+    Besides paths, compressed files (`.gz`, `.bz2`, `.xz`), archive members
+    (`bundle.tar.gz::job.log`) and in-memory data are accepted (see `parse_patrol.utils.sources`).
+    Logs and checkpoints held in memory are scanned as bytes, without decoding them to text
+    (a memoryview is not copied as a whole); inputs (.gjf/.com), which are small, are decoded.
+
+    The jobs of a multi-job (Link1) log are merged into one model, and only the first job of
+    an input is read; `parse_patrol.parsers.gaussian.jobs` returns one model per job.
+
     Args:
-        filepath: Path to Gaussian file.
+        filepath: Path to Gaussian file, or its content as bytes, memoryview, file-like object or MemorySource.
+        instrument: Record per-stage timing/memory under `metadata["instrumentation"]`
+            (default: `PARSE_PATROL_INSTRUMENT` environment variable)
 
     Returns:
         CustomGaussianDataModel with parsed contents.
     """
-    path = Path(filepath)
-    if not path.exists():
-        return CustomGaussianDataModel(metadata={"error": f"File not found: {filepath}"})
+    source = as_source(filepath)
+    with parse_session("gaussian", source, instrument) as session:
+        model = _gaussian_dispatch(source)
+        return session.attach(model) if session else model
+
+
+def _gaussian_dispatch(source: Union[str, MemorySource]) -> CustomGaussianDataModel:
+    """Route a Gaussian file to the parser matching its content (see `parse_patrol.utils.sniff`)."""
+    if not source_exists(source):
+        return CustomGaussianDataModel(metadata={"error": f"File not found: {source}"})
+    label = str(Path(source)) if isinstance(source, str) else str(source)
+
+    with stage("sniff"):
+        info = sniff(source)
 
-    ext = path.suffix.lower()
+    if info.program not in (None, "gaussian"):
+        return CustomGaussianDataModel(metadata={"source": label, "warning": f"Not a Gaussian file (detected: {info.program})"})
 
-    if ext in {".log", ".out"}:
-        return _parse_log_or_out(path)
+    if info.file_type == "log":
+        model = _parse_log_or_out(source, label)
+        model.metadata.update({"version": info.version, "completed": info.completed})
+        return model
 
-    if ext in {".gjf", ".com"}:
-        return _parse_gjf(path)
+    if info.file_type == "input":
+        return _parse_gjf(source, label)
 
-    if ext == ".fchk":
-        return _parse_fchk(path)
+    if info.file_type == "fchk":
+        return _parse_fchk(source, label)
 
-    if ext == ".chk":
+    if info.file_type == "chk":
         return CustomGaussianDataModel(
             metadata={
-                "source": str(path),
+                "source": label,
                 "warning": "Binary .chk not supported. Convert to .fchk using: formchk input.chk output.fchk"
             }
         )
 
-    return CustomGaussianDataModel(metadata={"source": str(path), "warning": f"Unrecognized extension: {ext}"})
\ No newline at end of file
+    return CustomGaussianDataModel(metadata={"source": label, "warning": f"Unrecognized file type: {info.file_type or Path(logical_name(source)).suffix.lower()}"})
@@ -1,6 +1,10 @@
 from mcp.server.fastmcp import FastMCP  # pyright: ignore[reportMissingImports]
 from mcp.server.fastmcp.utilities.logging import configure_logging, get_logger # pyright: ignore[reportMissingImports]
-from .utils import iodata_parse, IODataModel
+import asyncio
+from typing import Optional
+from ... import aio
+from ...utils.isolate import isolated_parse, isolation_enabled
+from .utils import iodata_sample_frames, IODataModel, IODataTrajectoryModel
 
 configure_logging("INFO")
 logger = get_logger(__name__)
@@ -217,8 +221,32 @@ async def iodata_parse_file_to_model(filepath: str) -> IODataModel:
     Returns:
         IODataModel with parsed data converted for JSON serialization
     """
-    
-    return iodata_parse(filepath)
+    if isolation_enabled():  # under the time and memory limits of parse_patrol.utils.isolate
+        return (await asyncio.to_thread(isolated_parse, "iodata", filepath)).unwrap()
+    return await aio.iodata_parse(filepath)  # in the shared worker pool, off the event loop
+
+
+@mcp.tool()
+async def iodata_sample_trajectory(
+    filepath: str, samples: int = 10, start: int = 0, stop: Optional[int] = None, step: int = 1
+) -> IODataTrajectoryModel:
+    """Count the frames of a multi-frame file (XYZ trajectory, SDF, PDB, GRO, ...) and return a random sample of them.
+
+    The file is streamed frame by frame, so arbitrarily long MD trajectories can be inspected.
+
+    Args:
+        filepath: Path to the multi-frame file
+        samples: Number of frames to return
+        start: Index of the first frame to consider
+        stop: Index after the last frame to consider (default: end of the file)
+        step: Consider every `step`-th frame only
+
+    Returns:
+        IODataTrajectoryModel with the frame count and the sampled frames in file order
+    """
+    logger.info("Sampling frames of: %s ...", filepath)
+    # Sampling reads the whole trajectory: keep the event loop free for other clients meanwhile
+    return await asyncio.to_thread(iodata_sample_frames, filepath, samples=samples, start=start, stop=stop, step=step)
 
 
 @mcp.tool()
@@ -1,6 +1,12 @@
 import iodata as iodata_package
-from typing import Optional, Dict, List, Any
+import random
+from itertools import islice
+from typing import Optional, Dict, Iterator, List, Any, Tuple, Union
 from pydantic import BaseModel, Field # pyright: ignore[reportMissingImports]
+from ...utils.instrumentation import parse_session, stage
+from ...utils.sniff import PROGRAM_NAMES, classify, sniff
+from ...utils.sources import MemorySource, Source, as_source, local_path, logical_name
+from ...utils.trusted import build_model
 
 
 class IODataCubeModel(BaseModel):
@@ -30,13 +36,13 @@ class IODataModel(BaseModel):
     atmasses: Optional[List[float]] = Field(default=None, description="A (N,) float array with atomic masses.")
     atnums: Optional[List[int]] = Field(default=None, description="A (N,) int vector with the atomic numbers.")
     basisdef: Optional[str] = Field(default=None, description="A basis set definition, i.e. a dictionary whose keys are symbols (of chemical elements), atomic numbers (similar to previous, str to make distinction with following) or an atom index (integer referring to a specific atom in a molecule). The format of the values is to be decided when implementing a load function for basis set definitions.")
-    bonds: Optional[List[int]] = Field(default=None, description="An (nbond, 3) array with the list of covalent bonds. Each row represents one bond and consists of three integers: first atom index (starting from zero), second atom index & an optional bond type. Numerical values of bond types are defined in ``iodata.periodic``.")
-    cellvecs: Optional[List[float]] = Field(default=None, description="A (NP, 3) array with (real-space) cell vectors describing periodic boundary conditions. A single vector corresponds to a 1D cell, e.g. for a wire. Two vectors describe a 2D cell, e.g. for a membrane. Three vectors describe a 3D cell, e.g. a crystalline solid.")
+    bonds: Optional[List[List[int]]] = Field(default=None, description="An (nbond, 3) array with the list of covalent bonds. Each row represents one bond and consists of three integers: first atom index (starting from zero), second atom index & an optional bond type. Numerical values of bond types are defined in ``iodata.periodic``.")
+    cellvecs: Optional[List[List[float]]] = Field(default=None, description="A (NP, 3) array with (real-space) cell vectors describing periodic boundary conditions. A single vector corresponds to a 1D cell, e.g. for a wire. Two vectors describe a 2D cell, e.g. for a membrane. Three vectors describe a 3D cell, e.g. a crystalline solid.")
     charge: Optional[float] = Field(default=None, description="The net charge of the system. When possible, this is derived from atcorenums and nelec.")
     core_energy: Optional[float] = Field(default=None, description="The Hartree-Fock energy due to the core orbitals.")
     cube: Optional[IODataCubeModel] = Field(default=None, description="An instance of Cube, describing the volumetric data from a cube (or similar) file. Common sources: Gaussian .cube files, VASP CHGCAR/LOCPOT files, or other volumetric density data.")
     energy: Optional[float] = Field(default=None, description="The total energy (electronic + nn) in Hartree. Available from most QM software output files (.log, .out, .fchk files).")
-    extcharges: Optional[List[float]] = Field(default=None, description="Array with values of external charges, with shape (nextcharge, 4). First three columns for Cartesian X, Y and Z coordinates, last column for the actual charge. Used in QM/MM calculations.")
+    extcharges: Optional[List[List[float]]] = Field(default=None, description="Array with values of external charges, with shape (nextcharge, 4). First three columns for Cartesian X, Y and Z coordinates, last column for the actual charge. Used in QM/MM calculations.")
     extra: Optional[dict] = Field(default=None, description="A dictionary with additional data loaded from a file. Any data which cannot be assigned to the other attributes belongs here. It may be decided in future to move some of the results from this dictionary to IOData attributes, with a more final name.")
     g_rot: Optional[float] = Field(default=None, description="The rotational symmetry number of the molecule.")
     lot: Optional[str] = Field(default=None, description="The level of theory used to compute the orbitals (and other properties).")
@@ -53,52 +59,76 @@ class IODataModel(BaseModel):
     two_ints: Optional[dict] = Field(default=None, description="Dictionary where keys are names and values are numpy arrays with two-body operators, typically integrals of two-body operator with four of (Gaussian) basis functions. Names can start with ``er`` (electron repulsion) or ``two`` (general pairswise interaction). When relevant, these names must have a suffix ``_ao`` or ``_mo`` to clarify in which basis the integrals are computed.  See ``one_ints`` for more details. Array indexes are in physicists' notation.")
     two_rdms: Optional[dict] = Field(default=None, description="Dictionary where keys are names and values are two-particle density matrices. Names can be ``post_scf`` or ``post_scf_spin``. When relevant, these names must have a suffix ``_ao`` or ``_mo`` to clarify in which basis the RDMs are computed. See ``one_rdms`` for more details. Array indexes are in physicists' notation.")
 
+    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional parse-patrol metadata (e.g., instrumentation records)")
 
-def iodata_to_model(ext_data: iodata_package.IOData, filepath: Optional[str] = None) -> IODataModel: # pyright: ignore[reportAttributeAccessIssue]
+
+class IODataFrameModel(BaseModel):
+    """One frame of a multi-frame file (e.g., an XYZ trajectory), with only the per-frame fields."""
+
+    index: int = Field(description="Zero-based index of the frame in the file")
+    title: Optional[str] = Field(default=None, description="Frame title (e.g., the comment line of an XYZ frame)")
+    energy: Optional[float] = Field(default=None, description="The total energy of the frame in Hartree, if the format stores one.")
+    atnums: Optional[List[int]] = Field(default=None, description="A (N,) int vector with the atomic numbers.")
+    atcoords: Optional[List[List[float]]] = Field(default=None, description="A (N, 3) float array with Cartesian coordinates of the atoms.")
+    atgradient: Optional[List[List[float]]] = Field(default=None, description="A (N, 3) float array with the first derivatives of the energy w.r.t. Cartesian atomic displacements.")
+    cellvecs: Optional[List[List[float]]] = Field(default=None, description="A (NP, 3) array with (real-space) cell vectors.")
+
+
+class IODataTrajectoryModel(BaseModel):
+    """Frame count and a sample of the frames of a multi-frame file."""
+
+    nframes: int = Field(description="Number of frames in the selected range")
+    frames: List[IODataFrameModel] = Field(default_factory=list, description="Sampled frames, in file order")
+    metadata: Optional[Dict[str, Any]] = Field(default=None, description="Additional parse-patrol metadata (e.g., instrumentation records)")
+
+
+def iodata_to_model(ext_data: iodata_package.IOData, filepath: Union[str, MemorySource, None] = None, validate: Optional[bool] = None) -> IODataModel: # pyright: ignore[reportAttributeAccessIssue]
     """Convert IOData object to IODataModel (Pydantic) format.
     
     Args:
         ext_data: Parsed iodata object from IOData
         filepath: Original filepath for metadata extraction
+        validate: Validate the converted values (default: `PARSE_PATROL_VALIDATE` environment
+            variable); they come from iodata's arrays, so the model is trusted otherwise
     
     Returns:
         IODataModel with converted data types for JSON serialization
     """
+    with stage("convert"):
+        result = _iodata_to_dict(ext_data, filepath)
+    with stage("validate"):
+        return build_model(IODataModel, result, validate)
+
+
+def _iodata_to_dict(ext_data: iodata_package.IOData, filepath: Union[str, MemorySource, None] = None) -> Dict[str, Any]: # pyright: ignore[reportAttributeAccessIssue]
+    """Collect the `IODataModel` fields of an IOData object as plain Python types."""
     result: Dict[str, Any] = {}
 
     # Add format metadata if available
     if filepath:
         import os
-        basename = os.path.basename(filepath)
-        ext = os.path.splitext(filepath)[1] if '.' in basename else None
+        basename = os.path.basename(logical_name(filepath))
+        ext = os.path.splitext(basename)[1] if '.' in basename else None
         result['source_extension'] = ext or basename  # For VASP files without extensions
-        
-        # Detect software based on file patterns
-        if ext in ['.fchk', '.log', '.out', '.gjf', '.com'] or 'gaussian' in filepath.lower():
-            result['detected_software'] = 'Gaussian'
-            result['source_format'] = 'gaussian'
-        elif 'POSCAR' in basename or 'CONTCAR' in basename or 'OUTCAR' in basename or 'CHGCAR' in basename:
-            result['detected_software'] = 'VASP'
-            result['source_format'] = 'vasp'
-        elif ext == '.cube' or '.cube' in basename:
-            result['source_format'] = 'cube'
-        elif ext in ['.xyz']:
-            result['source_format'] = 'xyz'
-        elif 'orca' in filepath.lower():
-            result['detected_software'] = 'ORCA'
-            result['source_format'] = 'orca'
-        else:
-            result['detected_software'] = None
-            result['source_format'] = None
-    
+
+        # Detect software from the file content (cached), or from the name if the file is gone
+        try:
+            info = sniff(filepath)
+        except OSError:
+            info = classify(b"", filepath=filepath)
+        result['detected_software'] = PROGRAM_NAMES.get(info.program) if info.program else None
+        result['source_format'] = info.program or info.file_type
+
     for field_name in IODataModel.model_fields.keys():
-        if field_name in ['source_format', 'source_extension', 'detected_software']:
+        if field_name in ['source_format', 'source_extension', 'detected_software', 'metadata']:
             continue  # Already handled above
             
         value = getattr(ext_data, field_name, None)
         if value is None:
             continue
-        if hasattr(value, 'tolist'):
+        if field_name == 'cube':
+            result[field_name] = {'origin': value.origin.tolist(), 'axes': value.axes.tolist(), 'data': value.data.tolist(), 'shape': list(value.shape)}
+        elif hasattr(value, 'tolist'):
             result[field_name] = value.tolist()
         elif isinstance(value, dict):
             result[field_name] = {k: v.tolist() if hasattr(v, 'tolist') else v for k, v in value.items()}
@@ -106,17 +136,113 @@ def iodata_to_model(ext_data: iodata_package.IOData, filepath: Optional[str] = N
             result[field_name] = [item.tolist() for item in value]
         else:
             result[field_name] = value
-    return IODataModel(**result)
+    return result
 
 
-def iodata_parse(filepath: str) -> IODataModel:
+def iodata_parse(filepath: Source, instrument: Union[bool, str, None] = None, validate: Optional[bool] = None) -> IODataModel:
     """Parse chemistry file and return as IODataModel for JSON serialization.
     
     Args:
-        filepath: Path to chemistry output file
+        filepath: Path to chemistry output file, or its content (bytes, memoryview, file-like
+            object or MemorySource; name it for formats iodata only detects by extension)
+        instrument: Record per-stage timing/memory under `metadata["instrumentation"]`
+            (default: `PARSE_PATROL_INSTRUMENT` environment variable)
+        validate: Validate the model fields (see `iodata_to_model`)
     
     Returns:
         IODataModel with parsed data converted for JSON serialization
     """
-    data = iodata_package.load_one(filepath) # pyright: ignore[reportAttributeAccessIssue]
-    return iodata_to_model(data, filepath)
\ No newline at end of file
+    source = as_source(filepath)
+    with parse_session("iodata", source, instrument) as session:
+        with stage("sniff"):
+            fmt = sniff(source).iodata_format
+        with stage("load"):
+            # iodata only reads from paths: compressed, archived and in-memory sources get a temporary copy
+            with local_path(source) as path:
+                data = iodata_package.load_one(path, fmt=fmt) # pyright: ignore[reportAttributeAccessIssue]
+        model = iodata_to_model(data, source, validate)
+        return session.attach(model) if session else model
+
+def _frame_to_model(index: int, frame: iodata_package.IOData) -> IODataFrameModel:  # pyright: ignore[reportAttributeAccessIssue]
+    fields: Dict[str, Any] = {"index": index, "title": frame.title, "energy": frame.energy}
+    for name in ("atnums", "atcoords", "atgradient", "cellvecs"):
+        value = getattr(frame, name, None)
+        if value is not None:
+            fields[name] = value.tolist()
+    return build_model(IODataFrameModel, fields)
+
+
+def iodata_iter_frames(
+    filepath: Source,
+    start: int = 0,
+    stop: Optional[int] = None,
+    step: int = 1,
+    arrays: bool = False,
+) -> Iterator[Union[IODataFrameModel, Any]]:
+    """Lazily yield the frames of a multi-frame file (XYZ, extended XYZ, SDF, PDB, MOL2, GRO, fchk trajectories).
+
+    Frames are read one at a time with `iodata.load_many`, so memory use does not grow
+    with the length of the file. Frames outside `start:stop:step` are read but not converted.
+
+    Args:
+        filepath: Path to the file, or its content (see `iodata_parse`)
+        start: Index of the first frame
+        stop: Index after the last frame (default: end of the file)
+        step: Yield every `step`-th frame
+        arrays: Yield the `iodata.IOData` frames themselves, with NumPy arrays, instead of models
+
+    Yields:
+        IODataFrameModel (or `iodata.IOData`) per selected frame
+    """
+    source = as_source(filepath)
+    fmt = sniff(source).iodata_format
+    with local_path(source) as path:
+        frames = iodata_package.load_many(path, fmt=fmt)  # pyright: ignore[reportAttributeAccessIssue]
+        for index, frame in islice(enumerate(frames), start, stop, step):
+            yield frame if arrays else _frame_to_model(index, frame)
+
+
+def iodata_sample_frames(
+    filepath: Source,
+    samples: int = 10,
+    start: int = 0,
+    stop: Optional[int] = None,
+    step: int = 1,
+    seed: Optional[int] = 0,
+    instrument: Union[bool, str, None] = None,
+) -> IODataTrajectoryModel:
+    """Count the frames of a multi-frame file and draw a uniform random sample of them.
+
+    The file is read in a single pass (reservoir sampling), keeping at most `samples` frames in memory.
+
+    Args:
+        filepath: Path to the file, or its content (see `iodata_parse`)
+        samples: Number of frames to sample (0 only counts)
+        start, stop, step: Range of frames to count and sample from (see `iodata_iter_frames`)
+        seed: Random seed, for a reproducible sample (None: not reproducible)
+        instrument: Record per-stage timing/memory under `metadata["instrumentation"]`
+
+    Returns:
+        IODataTrajectoryModel with the frame count and the sampled frames in file order
+    """
+    source = as_source(filepath)
+    rng = random.Random(seed)
+    with parse_session("iodata", source, instrument) as session:
+        reservoir: List[Tuple[int, Any]] = []
+        nframes = 0
+        with stage("load"):
+            for nframes, frame in enumerate(iodata_iter_frames(source, start, stop, step, arrays=True), 1):
+                if len(reservoir) < samples:
+                    reservoir.append((nframes - 1, frame))
+                elif samples:
+                    slot = rng.randrange(nframes)
+                    if slot < samples:
+                        reservoir[slot] = (nframes - 1, frame)
+        reservoir.sort(key=lambda item: item[0])
+        model = IODataTrajectoryModel(
+            nframes=nframes,
+            # Indices in the file, not in the selected range
+            frames=[_frame_to_model(start + position * step, frame) for position, frame in reservoir],
+            metadata={"source": str(source), "start": start, "stop": stop, "step": step},
+        )
+        return session.attach(model) if session else model
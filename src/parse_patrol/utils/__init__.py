@@ -0,0 +1,3 @@
+"""
+Utilities and helpers shared across parse-patrol tools.
+"""
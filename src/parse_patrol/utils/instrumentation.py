@@ -0,0 +1,225 @@
+"""
+Opt-in per-stage instrumentation for the parse functions.
+
+Every parser entry point (`cclib_parse`, `iodata_parse`, `gaussian_parse`) opens a
+parse session and wraps its internal steps (format detection, reading, conversion,
+validation, ...) in named stages. When instrumentation is disabled, the stages are
+no-ops. When enabled, each stage records wall time, CPU time and (optionally) the
+peak memory allocated by Python while it ran.
+
+Instrumentation is enabled either per call (`cclib_parse(path, instrument=True)`)
+or globally via the `PARSE_PATROL_INSTRUMENT` environment variable:
+
+- `1`, `true`, `all`: time and memory
+- `time`: time only (no `tracemalloc` overhead)
+- `profile`: time, and a `cProfile` or sampling profile of the parse, aggregated over many
+  files (see `profiling.py`; also enabled for every parse by `PARSE_PATROL_PROFILE`)
+
+The resulting `ParseRecord` is attached to the result under
+`metadata["instrumentation"]` and passed to every registered hook:
+
+```python
+from parse_patrol.utils.instrumentation import register_hook
+
+register_hook(lambda record: print(record.parser, record.wall_time))
+```
+"""
+
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from . import profiling
+from .sources import MemorySource
+
+INSTRUMENT_ENV = "PARSE_PATROL_INSTRUMENT"
+
+
+class StageRecord(BaseModel):
+    """Resource usage of a single parse stage."""
+
+    name: str = Field(description="Stage name (e.g., 'detect', 'parse', 'convert', 'validate')")
+    wall_time: float = Field(description="Elapsed wall-clock time (seconds)")
+    cpu_time: float = Field(description="CPU time consumed by this process (seconds)")
+    peak_memory: Optional[int] = Field(default=None, description="Peak memory allocated during the stage (bytes), if traced")
+
+
+class ParseRecord(BaseModel):
+    """Structured instrumentation record of one parse call."""
+
+    parser: str = Field(description="Parser name (e.g., 'cclib', 'iodata', 'gaussian')")
+    source: Optional[str] = Field(default=None, description="Input file path")
+    file_size: Optional[int] = Field(default=None, description="Input file size (bytes)")
+    stages: List[StageRecord] = Field(default_factory=list, description="Per-stage measurements, in execution order")
+    wall_time: float = Field(default=0.0, description="Total wall-clock time (seconds)")
+    cpu_time: float = Field(default=0.0, description="Total CPU time (seconds)")
+    peak_memory: Optional[int] = Field(default=None, description="Peak memory over all stages (bytes), if traced")
+    error: Optional[str] = Field(default=None, description="Exception type if the parse failed")
+
+
+Hook = Callable[[ParseRecord], Any]
+
+_hooks: List[Hook] = []
+_current: ContextVar[Optional["ParseSession"]] = ContextVar("parse_patrol_session", default=None)
+
+
+def register_hook(hook: Hook) -> Hook:
+    """Register a callback receiving every completed `ParseRecord`.
+
+    Returns the hook, so this can also be used as a decorator.
+    """
+    if hook not in _hooks:
+        _hooks.append(hook)
+    return hook
+
+
+def unregister_hook(hook: Hook) -> None:
+    """Remove a previously registered hook (no-op if absent)."""
+    if hook in _hooks:
+        _hooks.remove(hook)
+
+
+def _resolve_mode(instrument: Union[bool, str, None]) -> Optional[str]:
+    """Map the `instrument` argument (or environment fallback) to 'all', 'time', 'profile' or None."""
+    if instrument is None:
+        instrument = os.environ.get(INSTRUMENT_ENV, "")
+    if isinstance(instrument, bool):
+        return "all" if instrument else None
+    value = instrument.strip().lower()
+    if value in {"", "0", "false", "no", "off"}:
+        return None
+    if value in ("time", "profile"):
+        return value
+    return "all"
+
+
+class ParseSession:
+    """Collects stage records for one parse call."""
+
+    def __init__(self, parser: str, source: Any, mode: str):
+        self.mode = mode
+        self.record = ParseRecord(parser=parser)
+        if isinstance(source, (str, os.PathLike)):
+            self.record.source = os.fspath(source)
+            try:
+                self.record.file_size = os.path.getsize(source)
+            except OSError:
+                pass
+        elif isinstance(source, MemorySource):
+            self.record.source = source.name
+            self.record.file_size = len(source)
+        self._started_tracing = False
+        self._profile: Optional[profiling.Profile] = None
+        self.profile_data: Any = None
+        self._result: Optional[BaseModel] = None
+        self._wall0 = 0.0
+        self._cpu0 = 0.0
+
+    def _start(self) -> None:
+        if self.mode == "all" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if self.mode == "profile":
+            self._profile = profiling.collector(create=True).start()
+        self._wall0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+
+    def _stop(self) -> None:
+        self.record.wall_time = time.perf_counter() - self._wall0
+        self.record.cpu_time = time.process_time() - self._cpu0
+        if self._profile is not None:
+            self.profile_data = self._profile.stop()
+        peaks = [s.peak_memory for s in self.record.stages if s.peak_memory is not None]
+        if peaks:
+            self.record.peak_memory = max(peaks)
+        if self._started_tracing:
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        trace = self.mode == "all" and tracemalloc.is_tracing()
+        if trace:
+            base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        wall0 = time.perf_counter()
+        cpu0 = time.process_time()
+        try:
+            yield
+        finally:
+            peak = tracemalloc.get_traced_memory()[1] - base if trace else None
+            self.record.stages.append(StageRecord(
+                name=name,
+                wall_time=time.perf_counter() - wall0,
+                cpu_time=time.process_time() - cpu0,
+                peak_memory=peak,
+            ))
+
+    def attach(self, model: BaseModel) -> BaseModel:
+        """Mark the result to receive the record under `metadata["instrumentation"]`.
+
+        The record is written when the session closes, so it includes the totals.
+        """
+        self._result = model
+        return model
+
+    def _write_result(self) -> None:
+        if self._result is None:
+            return
+        metadata = dict(getattr(self._result, "metadata", None) or {})
+        metadata["instrumentation"] = self.record.model_dump()
+        setattr(self._result, "metadata", metadata)
+
+
+@contextmanager
+def parse_session(parser: str, source: Any, instrument: Union[bool, str, None] = None) -> Iterator[Optional[ParseSession]]:
+    """Open an instrumentation session around one parse call.
+
+    Yields None when instrumentation is disabled, so callers can skip `attach`.
+    Hooks are notified when the session closes, also on failure.
+    """
+    mode = _resolve_mode(instrument)
+    if mode is None and instrument is not False and profiling.collector() is not None:
+        mode = "profile"  # PARSE_PATROL_PROFILE, or `profiling.enable()`
+    if mode is None or _current.get() is not None:
+        # Disabled, or nested inside another parser's session: stages report to the outer one
+        yield None
+        return
+
+    session = ParseSession(parser, source, mode)
+    token = _current.set(session)
+    session._start()
+    try:
+        yield session
+    except BaseException as e:
+        session.record.error = type(e).__name__
+        raise
+    finally:
+        session._stop()
+        _current.reset(token)
+        session._write_result()
+        if session.profile_data is not None:
+            try:
+                profiling.collector(create=True).add(session.record, session.profile_data)
+            except Exception:
+                pass  # Nor may a full disk
+        for hook in list(_hooks):
+            try:
+                hook(session.record)
+            except Exception:
+                pass  # A faulty metrics sink must never break parsing
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time a named stage of the active parse session (no-op when disabled)."""
+    session = _current.get()
+    if session is None:
+        yield
+        return
+    with session.stage(name):
+        yield
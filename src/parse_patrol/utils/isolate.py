@@ -0,0 +1,318 @@
+"""
+Isolated parsing, with hard per-file time and memory limits.
+
+A pathological file can keep `cclib` or `iodata` busy for tens of minutes, or make it
+allocate until the machine swaps; in-process, that stalls the whole pipeline (or the MCP
+server). `isolated_parse` runs each parse in a separate worker process instead:
+
+- `timeout`: wall-clock seconds; the worker is killed when they run out
+- `memory_mb`: address-space cap (`RLIMIT_AS`) of the worker, so allocations beyond it fail
+- `rss_mb`: resident-memory cap, checked by the waiting parent, which kills the worker beyond it
+
+A worker that hits a limit (or crashes) is killed and replaced on the next call; healthy
+workers are kept for reuse. Workers are forked from the pre-warmed server of `utils.pool`,
+so a replacement starts with the parsers already imported. Limits are resolved from
+the call's arguments, then `set_limits(parser, ...)`, then `set_limits(None, ...)`, then the
+`PARSE_PATROL_TIMEOUT`, `PARSE_PATROL_MEMORY_MB` and `PARSE_PATROL_RSS_MB` environment
+variables. With `PARSE_PATROL_ISOLATE=1`, the MCP parse tools run isolated too.
+
+```python
+from parse_patrol.utils.isolate import isolated_parse, set_limits
+
+set_limits("cclib", timeout=600, memory_mb=4096)
+result = isolated_parse("cclib", "huge.log", timeout=60)  # per-call override
+if result.status == "ok":
+    model = result.model
+else:
+    print(result.status, result.error)  # 'timeout', 'oom', 'crashed' or 'error'
+```
+
+Memory limits need the `resource` module (POSIX); the RSS cap is read from `/proc` (Linux).
+Elsewhere those limits are ignored.
+"""
+
+import atexit
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from .pool import context as pool_context
+from .shm import receive, share
+from .sources import MemorySource
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+IsolatedStatus = Literal["ok", "error", "timeout", "oom", "crashed"]
+
+ISOLATE_ENV = "PARSE_PATROL_ISOLATE"
+_LIMIT_ENVS = {"timeout": "PARSE_PATROL_TIMEOUT", "memory_mb": "PARSE_PATROL_MEMORY_MB", "rss_mb": "PARSE_PATROL_RSS_MB"}
+_POLL_INTERVAL = 0.05
+_MB = 1 << 20
+
+Parser = Union[str, Callable[[Any], Any]]
+
+
+class Limits(BaseModel):
+    """Resource limits of one isolated parse; None means unlimited."""
+
+    timeout: Optional[float] = Field(default=None, description="Wall-clock time per parse (s)")
+    memory_mb: Optional[int] = Field(default=None, description="Address-space cap (RLIMIT_AS) of the worker process (MiB)")
+    rss_mb: Optional[int] = Field(default=None, description="Resident-memory cap of the worker process, checked while waiting (MiB)")
+
+
+class IsolatedResult(BaseModel):
+    """Outcome of an isolated parse."""
+
+    parser: str = Field(description="Parser name (or function name)")
+    status: IsolatedStatus = Field(description="'ok', 'error' (the parser raised), 'timeout', 'oom' (memory limit) or 'crashed' (worker died)")
+    model: Optional[Any] = Field(default=None, description="Parsed model, if the parse succeeded")
+    error: Optional[str] = Field(default=None, description="What went wrong, if it did")
+    error_type: Optional[str] = Field(default=None, description="Exception type raised by the parser, for status 'error'")
+    elapsed: float = Field(default=0.0, description="Time from sending the job to the result or the kill (s)")
+    limits: Limits = Field(default_factory=Limits, description="Limits the parse ran under")
+
+    def unwrap(self) -> Any:
+        """The model, or raise: ParseLimitError on a limit or crash, the parser's error type (or ValueError) otherwise."""
+        if self.status == "ok":
+            return self.model
+        if self.status == "error":
+            raise {"FileNotFoundError": FileNotFoundError, "ImportError": ImportError}.get(self.error_type or "", ValueError)(self.error)
+        raise ParseLimitError(self)
+
+
+class ParseLimitError(ValueError):
+    """An isolated parse ran out of time or memory, or its worker crashed."""
+
+    def __init__(self, result: IsolatedResult):
+        super().__init__(f"{result.parser}: {result.status}: {result.error}")
+        self.result = result
+
+
+_DEFAULT_LIMITS: Dict[str, Any] = {}
+_PARSER_LIMITS: Dict[str, Dict[str, Any]] = {}
+
+
+def set_limits(parser: Optional[str] = None, **limits: Any) -> None:
+    """Set default limits for one parser, or for all (`parser=None`); a None value removes a limit.
+
+    Args:
+        parser: Parser name, or None for the defaults of every parser
+        **limits: `timeout`, `memory_mb` and/or `rss_mb`
+    """
+    unknown = set(limits) - set(Limits.model_fields)
+    if unknown:
+        raise ValueError(f"Unknown limits {sorted(unknown)} (expected {sorted(Limits.model_fields)})")
+    target = _DEFAULT_LIMITS if parser is None else _PARSER_LIMITS.setdefault(parser, {})
+    target.update(limits)
+
+
+def get_limits(parser: Optional[str] = None, **overrides: Any) -> Limits:
+    """The limits for a parse: non-None `overrides`, then `set_limits`, then the environment variables."""
+    resolved: Dict[str, Any] = {}
+    for name, env in _LIMIT_ENVS.items():
+        if os.environ.get(env):
+            resolved[name] = float(os.environ[env]) if name == "timeout" else int(os.environ[env])
+    resolved.update(_DEFAULT_LIMITS)
+    resolved.update(_PARSER_LIMITS.get(parser or "", {}))
+    resolved.update({name: value for name, value in overrides.items() if value is not None})
+    return Limits(**resolved)
+
+
+def isolation_enabled() -> bool:
+    """Whether `PARSE_PATROL_ISOLATE` asks the MCP tools to parse in isolated workers."""
+    return os.environ.get(ISOLATE_ENV, "").strip().lower() not in {"", "0", "false", "no", "off"}
+
+
+def _set_memory_limit(memory_mb: Optional[int]) -> None:
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    soft = hard if memory_mb is None else memory_mb * _MB
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def _worker_main(conn: Any) -> None:
+    """Worker loop: import the parsers, then run jobs until told to stop (or killed)."""
+    from ..dispatch import _parser_function
+
+    for name in ("cclib", "gaussian", "iodata"):  # before any memory limit applies
+        _parser_function(name)
+    conn.send("ready")
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        parser, source, memory_mb = job
+        start = time.perf_counter()
+        func = _parser_function(parser) if isinstance(parser, str) else parser
+        try:
+            if func is None:
+                raise ImportError(f"The {parser} parser is not available (missing dependencies)")
+            _set_memory_limit(memory_mb)
+            try:
+                model = func(source)
+            finally:
+                _set_memory_limit(None)
+            conn.send(("ok", share(model), None, None, time.perf_counter() - start))
+        except MemoryError as e:
+            _set_memory_limit(None)
+            message = f"Address space exceeded the {memory_mb} MiB cap" if memory_mb else "Out of memory"
+            conn.send(("oom", None, f"{message} (MemoryError{': ' + str(e)[:500] if str(e) else ''})", "MemoryError", time.perf_counter() - start))
+            return  # the heap may be fragmented or half-built: recycle the worker
+        except Exception as e:
+            conn.send(("error", None, f"{type(e).__name__}: {str(e)[:500]}", type(e).__name__, time.perf_counter() - start))
+
+
+def _rss_mb(pid: int) -> Optional[float]:
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / _MB
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class _Worker:
+    """One isolated worker process and its job pipe."""
+
+    def __init__(self):
+        context = pool_context()  # forked from the fork server: no inherited threads or address space
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True, name="parse-patrol-isolated")
+        self.process.start()
+        child.close()
+        if self.conn.recv() != "ready":  # raises EOFError if the worker died while importing
+            raise RuntimeError("Isolated worker failed to start")
+
+    def run(self, parser: Parser, source: Any, limits: Limits, label: str) -> Tuple[IsolatedResult, bool]:
+        """Run a job; returns the result and whether the worker can be reused."""
+        start = time.perf_counter()
+        deadline = None if limits.timeout is None else time.monotonic() + limits.timeout
+        self.conn.send((parser, source, limits.memory_mb))
+
+        def fail(status: IsolatedStatus, error: Optional[str] = None) -> Tuple[IsolatedResult, bool]:
+            self.kill()
+            error = error or f"Worker exited with code {self.process.exitcode}"
+            return IsolatedResult(parser=label, status=status, error=error, elapsed=time.perf_counter() - start, limits=limits), False
+
+        while True:
+            wait = _POLL_INTERVAL if deadline is None else max(0.0, min(_POLL_INTERVAL, deadline - time.monotonic()))
+            if self.conn.poll(wait):
+                try:
+                    status, model, error, error_type, elapsed = self.conn.recv()
+                except (EOFError, OSError):
+                    return fail("crashed")
+                result = IsolatedResult(parser=label, status=status, model=receive(model), error=error,
+                                        error_type=error_type, elapsed=elapsed, limits=limits)
+                if status == "oom":
+                    self.kill()
+                return result, status != "oom"
+            if not self.process.is_alive():
+                return fail("crashed")
+            if limits.rss_mb is not None:
+                rss = _rss_mb(self.process.pid)  # pyright: ignore[reportArgumentType]
+                if rss is not None and rss > limits.rss_mb:
+                    return fail("oom", f"Resident memory {rss:.0f} MiB exceeded the {limits.rss_mb} MiB cap")
+            if deadline is not None and time.monotonic() >= deadline:
+                return fail("timeout", f"Timed out after {limits.timeout} s")
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1.0)
+        self.kill()
+
+
+_idle: List[_Worker] = []
+_idle_lock = threading.Lock()
+_MAX_IDLE = os.cpu_count() or 1
+
+
+def _acquire() -> _Worker:
+    with _idle_lock:
+        if _idle:
+            return _idle.pop()
+    return _Worker()
+
+
+def _release(worker: _Worker) -> None:
+    with _idle_lock:
+        if len(_idle) < _MAX_IDLE:
+            _idle.append(worker)
+            return
+    worker.stop()
+
+
+def shutdown() -> None:
+    """Stop the idle isolated workers (new ones are started on the next call)."""
+    with _idle_lock:
+        workers = list(_idle)
+        _idle.clear()
+    for worker in workers:
+        worker.stop()
+
+
+atexit.register(shutdown)
+
+
+def isolated_parse(
+    parser: Parser,
+    filepath: Union[str, os.PathLike, MemorySource],
+    timeout: Optional[float] = None,
+    memory_mb: Optional[int] = None,
+    rss_mb: Optional[int] = None,
+) -> IsolatedResult:
+    """Parse a file in an isolated worker process, under time and memory limits.
+
+    Args:
+        parser: Parser name ('cclib', 'gaussian' or 'iodata'), or an importable function taking the source
+        filepath: Path or in-memory source
+        timeout: Wall-clock seconds (default: see `get_limits`)
+        memory_mb: Address-space cap of the worker in MiB (default: see `get_limits`)
+        rss_mb: Resident-memory cap of the worker in MiB (default: see `get_limits`)
+
+    Returns:
+        IsolatedResult; limits and crashes are reported in `status`, not raised
+    """
+    label = parser if isinstance(parser, str) else getattr(parser, "__name__", repr(parser))
+    limits = get_limits(label, timeout=timeout, memory_mb=memory_mb, rss_mb=rss_mb)
+    source = os.fspath(filepath) if isinstance(filepath, os.PathLike) else filepath
+    worker = _acquire()
+    try:
+        result, reusable = worker.run(parser, source, limits, label)
+    except BaseException:
+        worker.kill()
+        raise
+    if reusable:
+        _release(worker)
+    return result
+
+
+def run_parser_isolated(name: str, filepath: str, **limits: Any) -> Tuple[Any, Optional[str], float]:
+    """`dispatch._run_parser` in an isolated worker: returns (model, error, elapsed)."""
+    from ..dispatch import _is_good
+
+    result = isolated_parse(name, filepath, **limits)
+    if result.status != "ok":
+        return None, f"{result.status}: {result.error}", result.elapsed
+    model = result.model
+    error = None if _is_good(model) else str((model.metadata or {}).get("error") or (model.metadata or {}).get("warning") or "empty result")
+    return model, error, result.elapsed
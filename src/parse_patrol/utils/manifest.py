@@ -0,0 +1,298 @@
+"""
+Persistent manifest of parsed files, for incremental re-parsing of directory trees.
+
+A `Manifest` is a SQLite database with one row per file: size, modification time,
+content hash, sniffed program and file type, the parser used, the parse status and
+where the result was written. `Manifest.scan` walks a tree and parses only new or
+changed files, so re-running it on an unchanged tree costs a directory walk:
+
+- size and modification time unchanged: skipped without opening the file
+- modification time changed but content hash unchanged (e.g., `touch`): skipped, row updated
+- otherwise: parsed with `parse_any` (or the given parser) and the result stored as JSON
+  (or MessagePack, with `result_format="msgpack"`; see `parse_patrol.utils.wire`)
+
+Hashing and parsing run in the shared process pool (`parse_patrol.utils.pool`). Each result
+is recorded as it completes and committed every `COMMIT_EVERY` files or `COMMIT_SECONDS`, so
+an interrupted scan keeps what it has done so far.
+
+```python
+from parse_patrol.utils.manifest import Manifest
+
+with Manifest(".data/manifest.sqlite") as manifest:
+    report = manifest.scan(".data", results_dir=".data/results")
+    print(report.counts)  # e.g. {'unchanged': 4980, 'changed': 12, 'parsed': 12}
+```
+"""
+
+import hashlib
+import itertools
+import os
+import sqlite3
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from .pool import create_pool, get_pool, pool_size
+from .sniff import sniff
+from .triage import iter_files
+from .wire import _require_msgpack, encode
+
+ParseStatus = Literal["parsed", "failed", "skipped"]
+ResultFormat = Literal["json", "msgpack"]
+
+HASH_CHUNK = 1 << 20
+# A scan commits its progress every this many files or seconds, whichever comes first
+COMMIT_EVERY = 500
+COMMIT_SECONDS = 5.0
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    program TEXT,
+    file_type TEXT,
+    parser TEXT,
+    status TEXT NOT NULL,
+    error TEXT,
+    result_path TEXT,
+    parsed_at REAL NOT NULL
+)
+"""
+
+
+class ManifestEntry(BaseModel):
+    """Manifest record of one file."""
+
+    path: str = Field(description="Absolute path of the file")
+    size: int = Field(description="File size in bytes")
+    mtime_ns: int = Field(description="Modification time (ns since the epoch)")
+    hash: str = Field(description="BLAKE2b digest of the content")
+    program: Optional[str] = Field(default=None, description="Sniffed program (see parse_patrol.utils.sniff)")
+    file_type: Optional[str] = Field(default=None, description="Sniffed file type")
+    parser: Optional[str] = Field(default=None, description="Parser that produced the result")
+    status: ParseStatus = Field(description="'parsed', 'failed', or 'skipped' (no suited parser)")
+    error: Optional[str] = Field(default=None, description="Parse error, if failed")
+    result_path: Optional[str] = Field(default=None, description="File holding the parsed model (JSON or MessagePack), if stored")
+    parsed_at: float = Field(description="Time of the last parse (s since the epoch)")
+
+
+class ScanReport(BaseModel):
+    """Outcome of a manifest scan."""
+
+    new: List[str] = Field(default_factory=list, description="Files not in the manifest before")
+    changed: List[str] = Field(default_factory=list, description="Known files parsed again (content changed, or a retried failure)")
+    unchanged: int = Field(default=0, description="Number of files skipped as unchanged")
+    removed: List[str] = Field(default_factory=list, description="Files in the manifest that no longer exist")
+    failed: List[str] = Field(default_factory=list, description="Files whose (re-)parse failed")
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        parsed = len(self.new) + len(self.changed) - len(self.failed)
+        counts = {"unchanged": self.unchanged, "new": len(self.new), "changed": len(self.changed),
+                  "removed": len(self.removed), "parsed": parsed, "failed": len(self.failed)}
+        return {key: value for key, value in counts.items() if value}
+
+
+def file_hash(filepath: str) -> str:
+    """BLAKE2b digest of a file's content, read in 1 MiB chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Manifest:
+    """SQLite-backed record of parsed files; see the module docstring."""
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.row_factory = sqlite3.Row
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, _SCHEMA_VERSION):
+            raise ValueError(f"Unsupported manifest schema version {version} in {self.db_path}")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "Manifest":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get(self, path: str) -> Optional[ManifestEntry]:
+        row = self._conn.execute("SELECT * FROM files WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return ManifestEntry(**dict(row)) if row else None
+
+    def entries(self, status: Optional[ParseStatus] = None) -> List[ManifestEntry]:
+        if status is None:
+            rows = self._conn.execute("SELECT * FROM files ORDER BY path")
+        else:
+            rows = self._conn.execute("SELECT * FROM files WHERE status = ? ORDER BY path", (status,))
+        return [ManifestEntry(**dict(row)) for row in rows]
+
+    def _put(self, entry: ManifestEntry) -> None:
+        data = entry.model_dump()
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO files ({', '.join(data)}) VALUES ({', '.join('?' * len(data))})",
+            tuple(data.values()),
+        )
+
+    def scan(
+        self,
+        root: str,
+        parser: Optional[str] = None,
+        results_dir: Optional[str] = None,
+        recursive: bool = True,
+        retry_failed: bool = False,
+        max_workers: Optional[int] = None,
+        result_format: ResultFormat = "json",
+    ) -> ScanReport:
+        """Parse the new and changed files under `root` and record them.
+
+        Args:
+            root: Directory (or single file) to scan
+            parser: Parser name ('cclib', 'gaussian' or 'iodata'); default: `parse_any` picks per file
+            results_dir: Directory to store each parsed model as `<hash>.<format>` (default: results not stored)
+            recursive: Descend into subdirectories
+            retry_failed: Also re-parse unchanged files whose last parse failed
+            max_workers: Number of worker processes of a dedicated pool for hashing and parsing
+                (default: the shared pool of `utils.pool`)
+            result_format: Store results as 'json' (`<hash>.json`) or 'msgpack' (`<hash>.msgpack`, see `utils.wire`)
+
+        Returns:
+            ScanReport of new, changed, unchanged, removed and failed files
+        """
+        report = ScanReport()
+        known = {row["path"]: row for row in self._conn.execute("SELECT * FROM files")}
+        # Neither the manifest (and its journal) nor stored results are inputs
+        excluded: Tuple[str, ...] = (os.path.abspath(self.db_path),)
+        if results_dir:
+            excluded += (os.path.join(os.path.abspath(results_dir), ""),)
+        seen = set()
+        todo: List[Tuple[str, os.stat_result, Optional[sqlite3.Row]]] = []
+        for filepath in iter_files(root, recursive):
+            path = os.path.abspath(filepath)
+            if path.startswith(excluded):
+                continue
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:  # deleted since it was listed: reported as removed if known
+                continue
+            seen.add(path)
+            row = known.get(path)
+            if row and row["size"] == st.st_size and row["mtime_ns"] == st.st_mtime_ns and not (retry_failed and row["status"] == "failed"):
+                report.unchanged += 1
+                continue
+            todo.append((path, st, row))
+
+        if result_format not in ("json", "msgpack"):
+            raise ValueError(f"Unknown result format {result_format!r} (expected 'json' or 'msgpack')")
+        if result_format == "msgpack":
+            _require_msgpack()
+        if results_dir:
+            results_dir = os.path.abspath(results_dir)  # workers may run in another directory
+            os.makedirs(results_dir, exist_ok=True)
+
+        # Results are stored as they complete and committed in batches, so an interrupted scan
+        # keeps its progress; at most a few tasks per worker are queued at a time
+        executor = create_pool(max_workers) if max_workers else get_pool()
+        window = 4 * (max_workers or pool_size())
+        pending: Dict[Future, Optional[sqlite3.Row]] = {}
+        items = iter(todo)
+        uncommitted, last_commit = 0, time.monotonic()
+        try:
+            while True:
+                for path, st, row in itertools.islice(items, window - len(pending)):
+                    future = executor.submit(_scan_file, path, st, dict(row) if row else None, parser, results_dir,
+                                             retry_failed, result_format)
+                    pending[future] = row
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    row = pending.pop(future)
+                    entry, reparsed = future.result()
+                    self._put(entry)
+                    uncommitted += 1
+                    if not reparsed:
+                        report.unchanged += 1
+                        continue
+                    (report.changed if row else report.new).append(entry.path)
+                    if entry.status == "failed":
+                        report.failed.append(entry.path)
+                if uncommitted >= COMMIT_EVERY or time.monotonic() - last_commit >= COMMIT_SECONDS:
+                    self._conn.commit()
+                    uncommitted, last_commit = 0, time.monotonic()
+        finally:
+            for future in pending:
+                future.cancel()
+            self._conn.commit()
+            if max_workers:
+                executor.shutdown()
+
+        root_path = os.path.abspath(root)
+        for path in known:
+            if path not in seen and (path == root_path or path.startswith(os.path.join(root_path, ""))):
+                if recursive or os.path.dirname(path) == root_path:
+                    report.removed.append(path)
+        self._conn.executemany("DELETE FROM files WHERE path = ?", [(path,) for path in report.removed])
+        self._conn.commit()
+        for paths in (report.new, report.changed, report.removed, report.failed):
+            paths.sort()
+        return report
+
+
+def _scan_file(path: str, st: os.stat_result, row: Optional[Dict[str, Any]], parser: Optional[str],
+               results_dir: Optional[str], retry_failed: bool, result_format: ResultFormat) -> Tuple[ManifestEntry, bool]:
+    """Hash a new or touched file in a worker process and parse it if its content changed."""
+    digest = file_hash(path)
+    if row and row["hash"] == digest and not (retry_failed and row["status"] == "failed"):
+        return ManifestEntry(**{**row, "size": st.st_size, "mtime_ns": st.st_mtime_ns}), False
+    return _parse_entry(path, st, digest, parser, results_dir, result_format), True
+
+
+def _parse_entry(path: str, st: os.stat_result, digest: str, parser: Optional[str], results_dir: Optional[str],
+                 result_format: ResultFormat = "json") -> ManifestEntry:
+    from ..dispatch import parse_any
+
+    info = sniff(path)
+    entry = ManifestEntry(path=path, size=st.st_size, mtime_ns=st.st_mtime_ns, hash=digest, program=info.program,
+                          file_type=info.file_type, status="skipped", parsed_at=time.time())
+    try:
+        model = parse_any(path, parsers=[parser] if parser else None)
+    except ValueError as e:
+        if str(e).startswith("No available parser"):
+            return entry
+        entry.status, entry.error = "failed", str(e)[:2000]
+        return entry
+    except Exception as e:
+        entry.status, entry.error = "failed", f"{type(e).__name__}: {e}"[:2000]
+        return entry
+    entry.status = "parsed"
+    entry.parser = (model.metadata or {}).get("parse_any", {}).get("parser")
+    if results_dir:
+        entry.result_path = os.path.abspath(os.path.join(results_dir, f"{digest}.{result_format}"))
+        with open(entry.result_path, "wb") as f:
+            f.write(encode(model) if result_format == "msgpack" else model.model_dump_json().encode("utf-8"))
+    return entry
+
+
+def scan(root: str, db_path: Optional[str] = None, **kwargs: Any) -> ScanReport:
+    """Scan `root` with the manifest at `db_path` (default: `<root>/.parse_patrol_manifest.sqlite`).
+
+    Keyword arguments are passed on to `Manifest.scan`.
+    """
+    db_path = db_path or os.path.join(root, ".parse_patrol_manifest.sqlite")
+    with Manifest(db_path) as manifest:
+        return manifest.scan(root, **kwargs)
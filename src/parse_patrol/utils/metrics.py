@@ -0,0 +1,328 @@
+"""
+Process-wide metrics registry with Prometheus text exposition.
+
+All MCP tools report into the default `REGISTRY` via `track_tool`, which records
+call counts, latency, bytes parsed, errors by exception type and in-flight calls.
+A tool that returns its error (in `metadata["error"]`, or as `{"error": ...}` JSON) instead
+of raising counts as a `ReportedError`. Caches report hits and misses via `record_cache`.
+
+Counters incremented in the worker processes of `utils.pool` (e.g., sniff-cache lookups
+while parsing) travel back with each task's result (`take_counts` / `add_counts`), so the
+registry of the server process covers its workers too.
+
+The unified server exposes the registry as the `parse-patrol://metrics` resource.
+For scraping, `start_http_server` serves the same text on a local HTTP port
+(enabled in the server via the `PARSE_PATROL_METRICS_PORT` environment variable).
+"""
+
+import contextvars
+import functools
+import math
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+METRICS_PORT_ENV = "PARSE_PATROL_METRICS_PORT"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class for labelled metrics."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, k)} {_format_value(v)}" for k, v in items]
+
+
+class Gauge(Counter):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed bucket upper bounds."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        counts = self._counts.get(self._key(labels))
+        return counts[-1] if counts else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted((k, list(v), self._sums[k]) for k, v in self._counts.items())
+        for key, counts, total in items:
+            for bound, count in zip(self.buckets, counts):
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {counts[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(m.render() for m in metrics) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+TOOL_CALLS = REGISTRY.counter("parse_patrol_tool_calls_total", "Number of MCP tool calls.", ["tool", "parser"])
+TOOL_LATENCY = REGISTRY.histogram("parse_patrol_tool_latency_seconds", "MCP tool call latency in seconds.", ["tool", "parser"])
+TOOL_ERRORS = REGISTRY.counter("parse_patrol_tool_errors_total", "Failed MCP tool calls by exception type (ReportedError: error returned in the result).", ["tool", "parser", "exception"])
+TOOL_IN_FLIGHT = REGISTRY.gauge("parse_patrol_tool_calls_in_flight", "MCP tool calls currently executing.", ["tool"])
+BYTES_PARSED = REGISTRY.counter("parse_patrol_bytes_parsed_total", "Input bytes handed to parsers.", ["parser"])
+CACHE_REQUESTS = REGISTRY.counter("parse_patrol_cache_requests_total", "Cache lookups by cache and result (hit/miss).", ["cache", "result"])
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count a cache lookup; the hit ratio is hits / (hits + misses) per cache."""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+CounterValues = Dict[str, Dict[LabelValues, float]]
+
+
+def take_counts(registry: MetricsRegistry = REGISTRY) -> CounterValues:
+    """The counter increments of this process since the last call, which are reset (call in a worker)."""
+    counts: CounterValues = {}
+    with registry._lock:
+        metrics = [m for m in registry._metrics.values() if type(m) is Counter]
+    for metric in metrics:
+        with metric._lock:
+            values, metric._values = metric._values, {}
+        if values:
+            counts[metric.name] = values
+    return counts
+
+
+def add_counts(counts: CounterValues, registry: MetricsRegistry = REGISTRY) -> None:
+    """Add counter increments taken in another process (see `take_counts`)."""
+    for name, values in counts.items():
+        metric = registry._metrics.get(name)
+        if not isinstance(metric, Counter):
+            continue
+        with metric._lock:
+            for key, value in values.items():
+                metric._values[key] = metric._values.get(key, 0.0) + value
+
+
+_parser_label: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("parse_patrol_parser_label", default=None)
+
+
+def label_parser(parser: Optional[str]) -> None:
+    """Label the current tool call with the parser that actually handled it (called inside the tool)."""
+    _parser_label.set(parser)
+
+
+_ERROR_JSON = re.compile(r'\A\s*\{\s*"error"\s*:')
+
+
+def _reported_error(result: Any) -> bool:
+    """Whether a tool returned its failure instead of raising it."""
+    if isinstance(result, list):
+        return any(_reported_error(item) for item in result)
+    if isinstance(result, str):
+        return bool(_ERROR_JSON.match(result))
+    metadata = getattr(result, "metadata", None)
+    return isinstance(metadata, dict) and bool(metadata.get("error"))
+
+
+def _input_size(args: tuple, kwargs: Dict[str, Any]) -> Optional[int]:
+    filepath = kwargs.get("filepath", args[0] if args else None)
+    if isinstance(filepath, (str, os.PathLike)):
+        try:
+            return os.path.getsize(filepath)
+        except OSError:
+            return None
+    return None
+
+
+def track_tool(func: Callable, tool: Optional[str] = None, parser: str = "none") -> Callable:
+    """Wrap an async MCP tool so that every call reports into the registry.
+
+    The wrapper keeps the signature and docstring of `func` (via `functools.wraps`),
+    so MCP sees the same tool schema. Calls are labelled with `parser`, unless the tool
+    names the parser it used with `label_parser`.
+    """
+    name = tool or func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        TOOL_IN_FLIGHT.inc(tool=name)
+        token = _parser_label.set(None)
+        start = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            result = await func(*args, **kwargs)
+            if _reported_error(result):
+                error = "ReportedError"
+            return result
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            label = _parser_label.get() or parser
+            _parser_label.reset(token)
+            TOOL_CALLS.inc(tool=name, parser=label)
+            TOOL_LATENCY.observe(time.perf_counter() - start, tool=name, parser=label)
+            TOOL_IN_FLIGHT.dec(tool=name)
+            if error is not None:
+                TOOL_ERRORS.inc(tool=name, parser=label, exception=error)
+            elif label != "none":
+                size = _input_size(args, kwargs)
+                if size is not None:
+                    BYTES_PARSED.inc(size, parser=label)
+
+    return wrapper
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of the MCP server's stdio
+
+
+def start_http_server(port: int, addr: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """Serve `registry` on `http://addr:port/metrics` from a daemon thread.
+
+    Returns the server; call `shutdown()` on it to stop serving.
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((addr, port), handler)
+    thread = threading.Thread(target=server.serve_forever, name="parse-patrol-metrics", daemon=True)
+    thread.start()
+    return server
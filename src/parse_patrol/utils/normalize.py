@@ -0,0 +1,130 @@
+"""
+Canonical field names and units across the parsers.
+
+The parsers name and scale the same properties differently: cclib reports `atomnos`,
+coordinates per geometry in angstrom and energies in eV, iodata reports `atnums`,
+coordinates in bohr and energies in Hartree, and the custom Gaussian parser follows cclib's
+names with Hartree energies. `normalize` maps a parser's model onto one set of names:
+
+| Canonical field    | Unit     | cclib                    | gaussian                                 | iodata               |
+|--------------------|----------|--------------------------|------------------------------------------|----------------------|
+| natom              |          | natom                    | natom                                    | len(atnums)          |
+| atomic_numbers     |          | atomnos                  | atomnos                                  | atnums               |
+| coordinates        | angstrom | atomcoords[-1]           | atomcoords                               | atcoords (bohr)      |
+| charge             | e        | charge                   | charge                                   | charge               |
+| multiplicity       |          | mult                     | mult                                     | spinpol + 1          |
+| total_energy       | hartree  | scfenergies[-1] (eV)     | final_energy                             | energy               |
+| scf_energies       | hartree  | scfenergies (eV)         | scfenergies                              |                      |
+| frequencies        | cm^-1    | vibfreqs                 | vibfreqs                                 |                      |
+| ir_intensities     | km/mol   | vibirs                   | vibirs                                   |                      |
+| reduced_masses     | amu      | vibrmasses               | vibrmasses                               |                      |
+| enthalpy           | hartree  | enthalpy                 | sum_electronic_and_thermal_enthalpies    |                      |
+| free_energy        | hartree  | freeenergy               | sum_electronic_and_thermal_free_energies |                      |
+| temperature        | K        | temperature              | temperature                              |                      |
+| mulliken_charges   | e        | atomcharges["mulliken"]  |                                          | atcharges["mulliken"]|
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+HARTREE_TO_EV = 27.211386245988
+BOHR_TO_ANGSTROM = 0.529177210903
+
+
+def _last(values: Optional[list]) -> Any:
+    return values[-1] if values else None
+
+
+def _scale(value: Any, factor: float) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, list):
+        return [_scale(v, factor) for v in value]
+    return value * factor
+
+
+def _get(name: str) -> Callable[[Any], Any]:
+    return lambda model: getattr(model, name, None)
+
+
+def _charges(field: str, kind: str) -> Callable[[Any], Any]:
+    return lambda model: (getattr(model, field, None) or {}).get(kind)
+
+
+# Canonical field -> (unit, {parser: extractor returning the value in canonical units})
+CANONICAL_FIELDS: Dict[str, Tuple[Optional[str], Dict[str, Callable[[Any], Any]]]] = {
+    "natom": (None, {
+        "cclib": _get("natom"),
+        "gaussian": _get("natom"),
+        "iodata": lambda m: len(m.atnums) if m.atnums else None,
+    }),
+    "atomic_numbers": (None, {
+        "cclib": _get("atomnos"),
+        "gaussian": _get("atomnos"),
+        "iodata": _get("atnums"),
+    }),
+    "coordinates": ("angstrom", {
+        "cclib": lambda m: _last(m.atomcoords),
+        "gaussian": _get("atomcoords"),
+        "iodata": lambda m: _scale(m.atcoords, BOHR_TO_ANGSTROM),
+    }),
+    "charge": ("e", {
+        "cclib": _get("charge"),
+        "gaussian": _get("charge"),
+        "iodata": _get("charge"),
+    }),
+    "multiplicity": (None, {
+        "cclib": _get("mult"),
+        "gaussian": _get("mult"),
+        "iodata": lambda m: None if m.spinpol is None else round(m.spinpol) + 1,
+    }),
+    "total_energy": ("hartree", {
+        "cclib": lambda m: _scale(_last(m.scfenergies), 1 / HARTREE_TO_EV),
+        "gaussian": _get("final_energy"),
+        "iodata": _get("energy"),
+    }),
+    "scf_energies": ("hartree", {
+        "cclib": lambda m: _scale(m.scfenergies, 1 / HARTREE_TO_EV),
+        "gaussian": _get("scfenergies"),
+    }),
+    "frequencies": ("cm^-1", {"cclib": _get("vibfreqs"), "gaussian": _get("vibfreqs")}),
+    "ir_intensities": ("km/mol", {"cclib": _get("vibirs"), "gaussian": _get("vibirs")}),
+    "reduced_masses": ("amu", {"cclib": _get("vibrmasses"), "gaussian": _get("vibrmasses")}),
+    "enthalpy": ("hartree", {"cclib": _get("enthalpy"), "gaussian": _get("sum_electronic_and_thermal_enthalpies")}),
+    "free_energy": ("hartree", {"cclib": _get("freeenergy"), "gaussian": _get("sum_electronic_and_thermal_free_energies")}),
+    "temperature": ("K", {"cclib": _get("temperature"), "gaussian": _get("temperature")}),
+    "mulliken_charges": ("e", {"cclib": _charges("atomcharges", "mulliken"), "iodata": _charges("atcharges", "mulliken")}),
+}
+
+# Parser fields consumed by the mapping above (not repeated under their own name)
+_MAPPED_FIELDS = {
+    "cclib": {"natom", "atomnos", "atomcoords", "charge", "mult", "scfenergies", "vibfreqs", "vibirs", "vibrmasses",
+              "enthalpy", "freeenergy", "temperature"},
+    "gaussian": {"natom", "atomnos", "atomcoords", "charge", "mult", "final_energy", "scfenergies", "vibfreqs", "vibirs",
+                 "vibrmasses", "sum_electronic_and_thermal_enthalpies", "sum_electronic_and_thermal_free_energies", "temperature"},
+    "iodata": {"atnums", "atcoords", "charge", "spinpol", "energy"},
+}
+
+
+def normalize(parser: str, model: Any, keep_unmapped: bool = False) -> Dict[str, Any]:
+    """Map a parser's model onto the canonical field names and units.
+
+    Args:
+        parser: Parser name ('cclib', 'gaussian' or 'iodata')
+        model: The model returned by that parser
+        keep_unmapped: Also return the fields without a canonical counterpart, under their own name
+
+    Returns:
+        Dictionary of the fields with a value
+    """
+    result: Dict[str, Any] = {}
+    for name, (_, extractors) in CANONICAL_FIELDS.items():
+        extractor = extractors.get(parser)
+        value = extractor(model) if extractor else None
+        if value is not None:
+            result[name] = value
+    if keep_unmapped:
+        mapped = _MAPPED_FIELDS.get(parser, set())
+        for name, value in model:
+            if value is not None and name not in mapped and name not in result:
+                result[name] = value
+    return result
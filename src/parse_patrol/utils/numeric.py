@@ -0,0 +1,102 @@
+"""
+Bulk conversion of Fortran-formatted numbers.
+
+Quantum chemistry codes print numbers in Fortran formats, with `D` as well as `E`
+exponents (`-1.2345D-03`). Converting them one token at a time (`float(token)` per value)
+dominates the parse time of numeric blocks such as FCHK arrays and geometry tables. The
+functions here convert a whole block of whitespace-separated values in one NumPy call,
+falling back to a Python loop when NumPy is not installed.
+
+```python
+from parse_patrol.utils.numeric import fortran_array, fortran_floats
+
+fortran_floats(b" 1.0D+00 -2.5D-01\\n 3.0E+00")   # [1.0, -0.25, 3.0]
+fortran_array(block, count=3 * natom).reshape(-1, 3)
+```
+"""
+
+import warnings
+from typing import Any, List, Optional, Union
+
+_D_TO_E = bytes.maketrans(b"Dd", b"Ee")
+
+
+def _exponents(block: Union[bytes, memoryview, str]) -> bytes:
+    """The block as bytes, with Fortran `D` exponents turned into `E`."""
+    if isinstance(block, str):
+        block = block.encode("ascii", "replace")
+    elif not isinstance(block, bytes):  # NumPy converts bytes only: copy the block (not the whole buffer)
+        block = bytes(block)
+    return block.translate(_D_TO_E) if b"D" in block or b"d" in block else block
+
+
+def _check(count: Optional[int], size: int) -> None:
+    if count is not None and size != count:
+        raise ValueError(f"Expected {count} values, found {size}")
+
+
+def fortran_array(block: Union[bytes, memoryview, str], count: Optional[int] = None, dtype: str = "float64") -> Any:
+    """Convert a block of whitespace-separated Fortran numbers into a NumPy array.
+
+    Args:
+        block: Values separated by spaces and/or newlines (e.g., a slice of a memoryview)
+        count: Expected number of values (checked when given)
+        dtype: NumPy dtype of the result; integer dtypes reject fractional values
+
+    Returns:
+        1-D np.ndarray
+
+    Raises:
+        ValueError: For a token that is not a number, or a count mismatch
+        ImportError: If NumPy is not installed
+    """
+    import numpy as np
+
+    block = _exponents(block)
+    if not block.strip():  # fromstring would parse whitespace alone as one value (-1.0 or 0)
+        _check(count, 0)
+        return np.empty(0, dtype)
+    # Text mode (sep=" "), not the deprecated binary mode. Before NumPy 2.3 a malformed
+    # token only warned and truncated the result, so turn that warning into the error.
+    if np.lib.NumpyVersion(np.__version__) >= "2.3.0":
+        array = np.fromstring(block, dtype=dtype, sep=" ")
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                array = np.fromstring(block, dtype=dtype, sep=" ")
+            except DeprecationWarning as e:
+                raise ValueError(str(e)) from None
+    _check(count, array.size)
+    return array
+
+
+def fortran_floats(block: Union[bytes, memoryview, str], count: Optional[int] = None, scale: Optional[float] = None) -> List[float]:
+    """Convert a block of whitespace-separated Fortran floats into a list, optionally scaled.
+
+    Raises:
+        ValueError: For a token that is not a number, or a count mismatch
+    """
+    try:
+        array = fortran_array(block, count)
+    except ImportError:
+        values = [float(token) for token in _exponents(block).split()]
+        _check(count, len(values))
+        return [value * scale for value in values] if scale is not None else values
+    if scale is not None:
+        array *= scale
+    return array.tolist()
+
+
+def fortran_ints(block: Union[bytes, memoryview, str], count: Optional[int] = None) -> List[int]:
+    """Convert a block of whitespace-separated integers into a list.
+
+    Raises:
+        ValueError: For a token that is not an integer, or a count mismatch
+    """
+    try:
+        return fortran_array(block, count, dtype="int64").tolist()
+    except ImportError:
+        values = [int(token) for token in _exponents(block).split()]
+        _check(count, len(values))
+        return values
@@ -0,0 +1,250 @@
+"""
+Shared, pre-warmed process pool for parsing.
+
+A fresh worker process pays the import of cclib, iodata and NumPy (hundreds of ms) before
+it parses anything, which dominates the cost of small files. The pool here starts its
+workers with the `forkserver` method instead: one server process imports the parsers
+once (`set_forkserver_preload`), and every worker is forked from it, already warm.
+
+- `get_pool()`: the process-wide pool, shared by `aio`, `compare`, `gaussian_parse_jobs`
+  and the MCP server (started on first use, or ahead of time with `warm()`)
+- `create_pool(n)`: a separate pool of `n` workers with the same preloading
+- workers are replaced after about `PARSE_PATROL_MAX_TASKS_PER_CHILD` tasks each (default
+  100; 0 to keep them), so memory a parser leaks or fragments is returned to the system
+
+Recycling is done per generation: after `workers * max_tasks_per_child` submissions, new
+tasks go to a fresh set of workers while the old ones finish their queue and exit. (The
+standard library's `max_tasks_per_child` can deadlock once more tasks are queued than a
+worker may run, e.g. on CPython 3.11.) A generation whose worker died (e.g., killed for
+memory) is replaced on the next submission too.
+
+Counter increments made in a worker (see `utils.metrics`) are returned with each result and
+added to the registry of the submitting process.
+
+The pool size is `PARSE_PATROL_WORKERS` (default: one per CPU). Without `forkserver`
+(Windows, macOS with some Pythons), workers are spawned and import the parsers themselves.
+
+```python
+from parse_patrol.utils.pool import get_pool, warm
+
+warm()                                     # start the workers now, not on the first parse
+future = get_pool().submit(func, path)
+```
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, Future, InvalidStateError, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional
+
+from .metrics import add_counts, take_counts
+
+WORKERS_ENV = "PARSE_PATROL_WORKERS"
+MAX_TASKS_ENV = "PARSE_PATROL_MAX_TASKS_PER_CHILD"
+DEFAULT_MAX_TASKS_PER_CHILD = 100
+
+# Imported once by the fork server; missing optional parsers are skipped
+PRELOAD: List[str] = [
+    "numpy",
+    "parse_patrol.dispatch",
+    "parse_patrol.parsers.cclib.utils",
+    "parse_patrol.parsers.gaussian.utils",
+    "parse_patrol.parsers.iodata.utils",
+]
+
+_server_lock = threading.Lock()
+_server_started = False
+_pool: Optional["WorkerPool"] = None
+_pool_size: Optional[int] = None
+_pool_max_tasks: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def default_size() -> int:
+    """`PARSE_PATROL_WORKERS`, or the number of CPUs."""
+    return int(os.environ.get(WORKERS_ENV) or 0) or os.cpu_count() or 1
+
+
+def default_max_tasks() -> Optional[int]:
+    """`PARSE_PATROL_MAX_TASKS_PER_CHILD` (default 100); None if 0, i.e., workers are never replaced."""
+    value = os.environ.get(MAX_TASKS_ENV)
+    count = DEFAULT_MAX_TASKS_PER_CHILD if value is None or value.strip() == "" else int(value)
+    return count or None
+
+
+def _start_fork_server() -> None:
+    """Start the fork server with this package importable, also when it is only on `sys.path`
+    (e.g., a source checkout): some Python versions (3.11) ignore the parent's `sys.path` there."""
+    global _server_started
+    from multiprocessing import forkserver
+
+    with _server_lock:
+        if _server_started:
+            return
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        old = os.environ.get("PYTHONPATH")
+        os.environ["PYTHONPATH"] = os.pathsep.join([root, old] if old else [root])
+        try:
+            forkserver.ensure_running()
+        finally:
+            if old is None:
+                del os.environ["PYTHONPATH"]
+            else:
+                os.environ["PYTHONPATH"] = old
+        _server_started = True
+
+
+def context() -> Any:
+    """Multiprocessing context of the parser workers: `forkserver` with the parsers preloaded, or `spawn`."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload(PRELOAD)
+        _start_fork_server()
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+def _call_with_counts(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Run `fn` in a worker; return its result with the worker's counter increments."""
+    try:
+        return fn(*args, **kwargs), take_counts()
+    except BaseException as e:
+        e._worker_counts = take_counts()  # type: ignore[attr-defined]
+        raise
+
+
+class _WorkerFuture(Future):
+    """Future of a pool task that unwraps the worker's counters into this process's registry.
+
+    Cancelling succeeds only while the task is still queued, as with the executor's own futures.
+    """
+
+    def __init__(self, inner: Future):
+        super().__init__()
+        self._inner = inner
+        inner.add_done_callback(self._transfer)
+
+    def cancel(self) -> bool:
+        return self._inner.cancel() and super().cancel()
+
+    def _transfer(self, inner: Future) -> None:
+        if inner.cancelled():
+            super().cancel()
+            return
+        error = inner.exception()
+        try:
+            if error is not None:
+                add_counts(vars(error).pop("_worker_counts", {}))
+                self.set_exception(error)
+            else:
+                result, counts = inner.result()
+                add_counts(counts)
+                self.set_result(result)
+        except InvalidStateError:  # cancelled while the result was on its way
+            pass
+
+
+class WorkerPool(Executor):
+    """Process pool of pre-warmed parser workers, replaced by a fresh generation every so many tasks."""
+
+    def __init__(self, max_workers: Optional[int] = None, max_tasks_per_child: Optional[int] = None):
+        self.max_workers = max_workers or default_size()
+        self.max_tasks_per_child = max_tasks_per_child or default_max_tasks()
+        self._context = context()
+        self._lock = threading.Lock()
+        self._executor = self._new_generation()
+        self._submitted = 0
+        self.generations = 1
+
+    def _new_generation(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._context)
+
+    def _rotate(self) -> None:
+        # The old generation runs its queued tasks, then its workers exit
+        old, self._executor, self._submitted = self._executor, self._new_generation(), 0
+        self.generations += 1
+        old.shutdown(wait=False)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        with self._lock:
+            if self.max_tasks_per_child and self._submitted >= self.max_workers * self.max_tasks_per_child:
+                self._rotate()
+            self._submitted += 1
+            try:
+                inner = self._executor.submit(_call_with_counts, fn, *args, **kwargs)
+            except BrokenProcessPool:  # a worker of this generation died: start a new one
+                self._rotate()
+                self._submitted += 1
+                inner = self._executor.submit(_call_with_counts, fn, *args, **kwargs)
+        return _WorkerFuture(inner)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            executor = self._executor
+        executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def create_pool(max_workers: Optional[int] = None, max_tasks_per_child: Optional[int] = None) -> WorkerPool:
+    """A new pool of pre-warmed parser workers (the caller shuts it down).
+
+    Args:
+        max_workers: Number of workers (default: `PARSE_PATROL_WORKERS`, or one per CPU)
+        max_tasks_per_child: Tasks per worker after which the workers are replaced (default: `PARSE_PATROL_MAX_TASKS_PER_CHILD`)
+    """
+    return WorkerPool(max_workers, max_tasks_per_child)
+
+
+def configure(max_workers: Optional[int] = None, max_tasks_per_child: Optional[int] = None) -> None:
+    """Set the size and recycling of the shared pool (default: from the environment).
+
+    A running pool is shut down once its queued jobs are done; the next call starts a new one.
+    """
+    global _pool, _pool_size, _pool_max_tasks
+    with _pool_lock:
+        old, _pool, _pool_size, _pool_max_tasks = _pool, None, max_workers, max_tasks_per_child
+    if old is not None:
+        old.shutdown(wait=False)
+
+
+def get_pool() -> WorkerPool:
+    """The shared process pool, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = create_pool(_pool_size, _pool_max_tasks)
+        return _pool
+
+
+def pool_size() -> int:
+    """Number of workers of the shared pool (started or not)."""
+    return _pool_size or default_size()
+
+
+def shutdown(wait: bool = True) -> None:
+    """Stop the shared pool, cancelling queued jobs."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _ready() -> int:
+    return os.getpid()
+
+
+def warm(workers: Optional[int] = None) -> int:
+    """Start the shared pool's fork server and workers ahead of the first parse.
+
+    Args:
+        workers: Number of workers to start (default: all of them)
+
+    Returns:
+        Number of distinct worker processes that answered
+    """
+    pool = get_pool()
+    futures = [pool.submit(_ready) for _ in range(workers or pool_size())]
+    wait(futures)
+    return len({future.result() for future in futures})
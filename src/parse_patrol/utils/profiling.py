@@ -0,0 +1,421 @@
+"""
+Opt-in profiling of the parse functions, aggregated over many files.
+
+Stage timings (`instrumentation.py`) tell which step of a parse is slow; the profiles here
+tell which functions inside cclib, iodata or the Gaussian parser the time goes to. Profiling
+is enabled for every parse with `PARSE_PATROL_PROFILE=<directory>` (also in worker processes
+and the MCP server), per call with `instrument="profile"`, or with `enable(directory)`.
+Each profiled parse runs under one of two profilers (`PARSE_PATROL_PROFILER`):
+
+- `cprofile` (default): deterministic `cProfile` statistics, written as `.pstats`
+  (view with `python -m pstats`, `snakeviz` or `flameprof`)
+- `sample`: the parsing thread's stack is sampled every 5 ms from a helper thread, written
+  as collapsed stacks (`.collapsed`, for `flamegraph.pl` or speedscope); lower overhead, and
+  pure-Python loops are not slowed down more than C code as under `cProfile`
+
+Profiles are summed per parser and file type, and the profiles of the slowest files (1% by
+default) are kept one by one. Every process writes its own subdirectory (at exit and every
+few seconds), and `profile_report` (or `parse-patrol profile <directory>`) merges them:
+
+    <directory>/<process>/gaussian.log.pstats     # all Gaussian-parser parses of logs
+    <directory>/<process>/slowest/...             # one profile per slow file
+    <directory>/<process>/slowest.json            # which sessions those profiles belong to
+    <directory>/<process>/sessions.jsonl          # timing of every profiled parse (appended)
+
+A collector keeps only the summed profiles and the slowest parses in memory; session
+timings are appended to `sessions.jsonl` on each write, so long runs do not grow it.
+
+```python
+from parse_patrol.utils.profiling import enable, profile_report
+
+enable("profiles", method="sample")
+...  # parse
+report = profile_report("profiles")  # writes the merged profiles to profiles/
+print(report.slowest[0].source, report.slowest[0].profile)
+```
+"""
+
+import cProfile
+import heapq
+import json
+import math
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from multiprocessing import util
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+PROFILE_ENV = "PARSE_PATROL_PROFILE"
+PROFILER_ENV = "PARSE_PATROL_PROFILER"
+DEFAULT_DIRECTORY = "parse-patrol-profiles"
+METHODS = ("cprofile", "sample")
+EXTENSIONS = {"cprofile": ".pstats", "sample": ".collapsed"}
+SAMPLE_INTERVAL = 0.005  # seconds, the interpreter's default thread switch interval
+FLUSH_INTERVAL = 10.0  # seconds between writes of a process's profiles
+
+
+class SlowFile(BaseModel):
+    """A profiled parse among the slowest."""
+
+    source: Optional[str] = Field(default=None, description="Parsed file")
+    parser: str = Field(description="Parser name")
+    file_type: str = Field(description="Sniffed file type (or the file extension)")
+    wall_time: float = Field(description="Parse time (s)")
+    profile: Optional[str] = Field(default=None, description="Path of this parse's profile, if it was kept")
+
+
+class ProfileGroup(BaseModel):
+    """Profiled parses of one parser and file type."""
+
+    parser: str = Field(description="Parser name")
+    file_type: str = Field(description="Sniffed file type (or the file extension)")
+    files: int = Field(description="Number of profiled parses")
+    total_time: float = Field(description="Summed parse time (s)")
+    mean_time: float = Field(description="Mean parse time (s)")
+    p99_time: float = Field(description="99th percentile of the parse time (s)")
+    max_time: float = Field(description="Slowest parse (s)")
+    profiles: List[str] = Field(default_factory=list, description="Merged profiles of the group (.pstats and/or .collapsed)")
+
+
+class ProfileReport(BaseModel):
+    """Profiles of all processes in a profile directory, merged."""
+
+    directory: str = Field(description="Profile directory")
+    groups: List[ProfileGroup] = Field(default_factory=list, description="Per parser and file type, by total time")
+    slowest: List[SlowFile] = Field(default_factory=list, description="The slowest parses, slowest first")
+
+
+class _Sampler(threading.Thread):
+    """Counts the stacks of one thread, sampled every `interval` seconds."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        super().__init__(name="parse-patrol-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                path = code.co_filename
+                stack.append(f"{code.co_name} ({os.path.basename(os.path.dirname(path))}/{os.path.basename(path)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> Counter:
+        self._done.set()
+        self.join()
+        return self.stacks
+
+
+class Profile:
+    """A running profile of one parse in the current thread."""
+
+    def __init__(self, method: str):
+        self.method = method
+        self._profiler: Optional[cProfile.Profile] = None
+        self._sampler: Optional[_Sampler] = None
+        if method == "cprofile":
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        else:
+            self._sampler = _Sampler(threading.get_ident(), SAMPLE_INTERVAL)
+            self._sampler.start()
+
+    def stop(self) -> Any:
+        """Stop profiling; returns the `pstats.Stats` (cprofile) or the stack counts (sample)."""
+        if self._profiler is not None:
+            self._profiler.disable()
+            return pstats.Stats(self._profiler)
+        return self._sampler.stop()
+
+
+def _empty(method: str) -> Any:
+    return pstats.Stats() if method == "cprofile" else Counter()
+
+
+def _add(total: Any, data: Any) -> None:
+    if isinstance(total, pstats.Stats):
+        total.add(data)
+    else:
+        total.update(data)
+
+
+def _write(data: Any, path: str) -> None:
+    """Write a profile atomically: `.pstats` for `pstats.Stats`, collapsed stacks for stack counts."""
+    temp = f"{path}.tmp"
+    if isinstance(data, pstats.Stats):
+        data.dump_stats(temp)
+    else:
+        with open(temp, "w") as f:
+            f.writelines(f"{stack} {count}\n" for stack, count in data.items())
+    os.replace(temp, path)
+
+
+def _file_type(source: Optional[str]) -> str:
+    """Sniffed file type of a parsed file, else its extension, else 'unknown'."""
+    if not source:
+        return "unknown"
+    try:
+        from .sniff import sniff
+        file_type = sniff(source).file_type if os.path.isfile(source) else None
+    except Exception:
+        file_type = None
+    return file_type or os.path.splitext(source)[1].lstrip(".").lower() or "unknown"
+
+
+def _safe(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name)[:80]
+
+
+class ProfileCollector:
+    """Profiles of this process's parses, summed per parser and file type, plus the slowest ones."""
+
+    def __init__(self, directory: str, method: str = "cprofile", slowest: float = 0.01, max_files: int = 100):
+        if method not in METHODS:
+            raise ValueError(f"Unknown profiler: {method} (expected one of {', '.join(METHODS)})")
+        self.directory = directory
+        self.method = method
+        self.slowest = slowest
+        self.max_files = max_files
+        self.pid = os.getpid()
+        self.name = f"{time.strftime('%Y%m%dT%H%M%S')}-{self.pid}"
+        self._lock = threading.Lock()
+        self._groups: Dict[Tuple[str, str], Any] = {}
+        self._sessions = 0
+        self._pending: List[Dict[str, Any]] = []  # sessions not yet appended to sessions.jsonl
+        self._slow: List[Tuple[float, int, Dict[str, Any], Any]] = []  # min-heap of the slowest parses
+        self._last_dump = time.monotonic()
+
+    def start(self) -> Optional[Profile]:
+        """Start profiling a parse in this thread (None if another profiler is already active)."""
+        try:
+            return Profile(self.method)
+        except ValueError:  # e.g., the program itself runs under cProfile
+            return None
+
+    def add(self, record: Any, data: Any) -> None:
+        """Add the profile of one parse, with its `instrumentation.ParseRecord`."""
+        entry = {
+            "source": record.source,
+            "parser": record.parser,
+            "file_type": _file_type(record.source),
+            "wall_time": record.wall_time,
+            "cpu_time": record.cpu_time,
+            "file_size": record.file_size,
+            "error": record.error,
+        }
+        with self._lock:
+            self._sessions += 1
+            entry["id"] = self._sessions
+            self._pending.append(entry)
+            key = (entry["parser"], entry["file_type"])
+            if key not in self._groups:
+                self._groups[key] = _empty(self.method)
+            _add(self._groups[key], data)
+            heapq.heappush(self._slow, (record.wall_time, self._sessions, entry, data))
+            if len(self._slow) > self.max_files:
+                heapq.heappop(self._slow)
+            due = time.monotonic() - self._last_dump >= FLUSH_INTERVAL
+        if due:
+            self.dump()
+
+    def dump(self) -> str:
+        """Write this process's profiles to `<directory>/<process>/`; returns that path."""
+        root = os.path.join(self.directory, self.name)
+        extension = EXTENSIONS[self.method]
+        with self._lock:
+            self._last_dump = time.monotonic()
+            count = max(1, math.ceil(self.slowest * self._sessions))
+            slow = heapq.nlargest(min(count, len(self._slow)), self._slow)
+            os.makedirs(os.path.join(root, "slowest"), exist_ok=True)
+            for (parser, file_type), data in self._groups.items():
+                _write(data, os.path.join(root, f"{_safe(parser)}.{_safe(file_type)}{extension}"))
+
+            kept = {}
+            for rank, (wall_time, index, entry, data) in enumerate(slow):
+                name = f"{rank:03d}-{_safe(entry['parser'])}.{_safe(entry['file_type'])}-{_safe(os.path.basename(entry['source'] or 'memory'))}{extension}"
+                _write(data, os.path.join(root, "slowest", name))
+                kept[index] = os.path.join(self.name, "slowest", name)
+            if self._pending:
+                with open(os.path.join(root, "sessions.jsonl"), "a") as f:
+                    f.write("".join(json.dumps(entry) + "\n" for entry in self._pending))
+                self._pending.clear()
+        for name in set(os.listdir(os.path.join(root, "slowest"))) - {os.path.basename(path) for path in kept.values()}:
+            os.remove(os.path.join(root, "slowest", name))  # no longer among the slowest
+        temp = os.path.join(root, "slowest.json.tmp")
+        with open(temp, "w") as f:
+            json.dump({str(index): path for index, path in kept.items()}, f)
+        os.replace(temp, os.path.join(root, "slowest.json"))
+        return root
+
+
+_collector: Optional[ProfileCollector] = None
+_collector_lock = threading.Lock()
+_finalizer_pid: Optional[int] = None
+
+
+def _dump_at_exit() -> None:
+    if _collector is not None and _collector.pid == os.getpid():
+        try:
+            _collector.dump()
+        except OSError:
+            pass
+
+
+def enable(directory: Optional[str] = None, method: Optional[str] = None, slowest: float = 0.01, max_files: int = 100) -> ProfileCollector:
+    """Profile every parse of this process from now on.
+
+    Args:
+        directory: Where to write the profiles (default: `PARSE_PATROL_PROFILE`, or `parse-patrol-profiles`)
+        method: 'cprofile' or 'sample' (default: `PARSE_PATROL_PROFILER`, or 'cprofile')
+        slowest: Fraction of the parses whose profiles are kept one by one, slowest first
+        max_files: At most this many single-parse profiles are kept
+
+    Returns:
+        The process's collector (the running one, if it has the same directory and method)
+    """
+    global _collector, _finalizer_pid
+    directory = directory or os.environ.get(PROFILE_ENV) or DEFAULT_DIRECTORY
+    method = method or os.environ.get(PROFILER_ENV) or "cprofile"
+    with _collector_lock:
+        current = _collector
+        if current is not None and current.pid == os.getpid() and (current.directory, current.method) == (directory, method):
+            return current
+        _collector = ProfileCollector(directory, method, slowest, max_files)
+        if _finalizer_pid != os.getpid():
+            # Runs at interpreter exit, and also when a worker process (e.g., of the pool) exits
+            util.Finalize(None, _dump_at_exit, exitpriority=10)
+            _finalizer_pid = os.getpid()
+    if current is not None and current.pid == os.getpid():
+        current.dump()
+    return _collector
+
+
+def disable() -> Optional[str]:
+    """Stop profiling in this process; returns the directory its profiles were written to."""
+    global _collector
+    with _collector_lock:
+        current, _collector = _collector, None
+    if current is None or current.pid != os.getpid():
+        return None
+    return current.dump()
+
+
+def collector(create: bool = False) -> Optional[ProfileCollector]:
+    """This process's collector: enabled by `enable`, by `PARSE_PATROL_PROFILE`, or (`create`) on demand."""
+    current = _collector
+    if current is not None and current.pid == os.getpid():
+        return current
+    if current is not None or create or os.environ.get(PROFILE_ENV):
+        # A forked child starts its own collector, with the parent's settings
+        if current is not None:
+            return enable(current.directory, current.method, current.slowest, current.max_files)
+        return enable()
+    return None
+
+
+def dump() -> Optional[str]:
+    """Write this process's profiles now (they are also written at exit); returns their directory."""
+    current = collector()
+    return current.dump() if current is not None else None
+
+
+def _merge(paths: List[str], target: str) -> None:
+    if target.endswith(".pstats"):
+        pstats.Stats(*paths).dump_stats(target)
+        return
+    stacks: Counter = Counter()
+    for path in paths:
+        with open(path) as f:
+            for line in f:
+                stack, _, count = line.rstrip("\n").rpartition(" ")
+                if stack:
+                    stacks[stack] += int(count)
+    _write(stacks, target)
+
+
+def profile_report(directory: Optional[str] = None, slowest: float = 0.01) -> ProfileReport:
+    """Merge the profiles written by all processes to a profile directory.
+
+    Writes `<directory>/<parser>.<file type>.pstats` (or `.collapsed`) summed over all processes.
+
+    Args:
+        directory: Profile directory (default: `PARSE_PATROL_PROFILE`, or `parse-patrol-profiles`)
+        slowest: Fraction of the parses to list as the slowest
+
+    Returns:
+        ProfileReport with per-group timings and the slowest parses with their profiles
+    """
+    directory = directory or os.environ.get(PROFILE_ENV) or DEFAULT_DIRECTORY
+    sessions: List[Dict[str, Any]] = []
+    parts: Dict[str, List[str]] = {}
+    for entry in sorted(os.scandir(directory), key=lambda e: e.name) if os.path.isdir(directory) else []:
+        index = os.path.join(entry.path, "sessions.jsonl")
+        if not entry.is_dir() or not os.path.exists(index):
+            continue
+        try:
+            with open(os.path.join(entry.path, "slowest.json")) as f:
+                kept = json.load(f)
+        except (OSError, ValueError):
+            kept = {}
+        with open(index) as f:
+            for line in f:
+                try:
+                    session = json.loads(line)
+                except ValueError:  # a line cut off by a crash
+                    continue
+                session["profile"] = kept.get(str(session.get("id")))
+                sessions.append(session)
+        for name in os.listdir(entry.path):
+            if name.endswith(tuple(EXTENSIONS.values())):
+                parts.setdefault(name, []).append(os.path.join(entry.path, name))
+
+    merged: Dict[Tuple[str, str], List[str]] = {}
+    for name, paths in sorted(parts.items()):
+        target = os.path.join(directory, name)
+        _merge(paths, target)
+        merged.setdefault(tuple(os.path.splitext(name)[0].split(".", 1)), []).append(target)
+
+    times: Dict[Tuple[str, str], List[float]] = {}
+    for entry in sessions:
+        times.setdefault((entry["parser"], entry["file_type"]), []).append(entry["wall_time"])
+    groups = []
+    for (parser, file_type), walls in times.items():
+        walls.sort()
+        groups.append(ProfileGroup(
+            parser=parser,
+            file_type=file_type,
+            files=len(walls),
+            total_time=sum(walls),
+            mean_time=sum(walls) / len(walls),
+            p99_time=walls[max(0, math.ceil(0.99 * len(walls)) - 1)],
+            max_time=walls[-1],
+            profiles=merged.get((_safe(parser), _safe(file_type)), []),
+        ))
+    groups.sort(key=lambda group: group.total_time, reverse=True)
+
+    count = max(1, math.ceil(slowest * len(sessions))) if sessions else 0
+    slow = sorted(sessions, key=lambda entry: entry["wall_time"], reverse=True)[:count]
+    return ProfileReport(
+        directory=directory,
+        groups=groups,
+        slowest=[SlowFile(
+            source=entry["source"],
+            parser=entry["parser"],
+            file_type=entry["file_type"],
+            wall_time=entry["wall_time"],
+            profile=os.path.join(directory, entry["profile"]) if entry.get("profile") else None,
+        ) for entry in slow],
+    )
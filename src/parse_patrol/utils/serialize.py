@@ -0,0 +1,128 @@
+"""
+Fast JSON serialization of parse results.
+
+`model_dump_json` walks every element of the models' nested float lists in Python-facing
+Pydantic code; for large results (MO coefficients, Hessians, cube grids, trajectories) this
+is the dominant cost after parsing. `dump_fast` hands models, nested lists and NumPy arrays
+straight to orjson (`OPT_SERIALIZE_NUMPY`), which writes them to JSON bytes in C, with no
+intermediate Python lists for arrays:
+
+- models are serialized field by field, like `model_dump_json` (same keys, same values)
+- `SharedResult`s from worker processes (see `shm.py`) are written from the shared arrays
+- `precision` rounds floats to that many decimals, to shrink payloads
+
+Without orjson installed (`pip install parse-patrol[json]`), the standard library `json`
+module is used, with the same output.
+
+```python
+from parse_patrol.utils.serialize import dump_fast
+
+payload = dump_fast(model)                  # bytes
+small = dump_fast(model, precision=6)       # floats rounded to 6 decimals
+```
+"""
+
+import json
+import math
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from .shm import SharedResult, _restore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the json extra
+    orjson = None  # type: ignore[assignment]
+
+
+def _fields(model: BaseModel) -> Dict[str, Any]:
+    """The model's fields, without copying their values (nested models stay models)."""
+    return {name: getattr(model, name) for name in type(model).model_fields}
+
+
+def _default(value: Any) -> Any:
+    """Types orjson does not serialize natively (called by it for each such value)."""
+    if isinstance(value, BaseModel):
+        return _fields(value)
+    if hasattr(value, "tolist"):  # NumPy scalars, non-contiguous or object arrays
+        return value.tolist()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    # Anything else (e.g., timedelta, Path) as Pydantic would write it; raises TypeError otherwise
+    return to_jsonable_python(value)
+
+
+def _round(value: Any, precision: int) -> Any:
+    """Round every float in a result; numeric lists are rounded as NumPy arrays when possible."""
+    if isinstance(value, float):
+        return round(value, precision)
+    if isinstance(value, BaseModel):
+        return {name: _round(item, precision) for name, item in _fields(value).items()}
+    if isinstance(value, dict):
+        return {key: _round(item, precision) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) or hasattr(value, "dtype"):
+        try:
+            import numpy as np
+
+            array = np.asarray(value)
+        except (ImportError, ValueError):  # no NumPy, or a ragged list
+            array = None
+        if array is not None and array.dtype.kind == "f":
+            rounded = np.round(array, precision)
+            return rounded.item() if rounded.ndim == 0 else np.ascontiguousarray(rounded)
+        if array is not None and array.dtype.kind in "biu":
+            return value
+        if hasattr(value, "tolist"):
+            value = value.tolist()
+        return [_round(item, precision) for item in value] if isinstance(value, (list, tuple)) else value
+    return value
+
+
+def dump_fast(result: Any, precision: Optional[int] = None, indent: bool = False) -> bytes:
+    """Serialize a parse result to JSON bytes.
+
+    Args:
+        result: A model (or SharedResult), or any structure of dicts, lists, numbers and NumPy arrays
+        precision: Round floats to this many decimals (default: full precision)
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        UTF-8 JSON bytes; NaN and infinity are written as null, as by `model_dump_json`
+
+    Raises:
+        PydanticSerializationError: If the result holds a value that cannot be serialized
+    """
+    if isinstance(result, SharedResult):
+        # Serialize straight from the shared arrays, then drop the views so the block can be freed
+        with result.attach() as arrays:
+            restored = _restore(result.skeleton, arrays.values())
+            payload = dump_fast(restored, precision, indent)
+            del restored
+        return payload
+    if precision is not None:
+        result = _round(result, precision)
+
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(result, default=_default, option=option)
+
+    text = json.dumps(_plain(result), indent=2 if indent else None, separators=None if indent else (",", ":"),
+                      ensure_ascii=False, allow_nan=False)
+    return text.encode("utf-8")
+
+
+def _plain(value: Any) -> Any:
+    """The result as plain Python types for the `json` module, with NaN and infinity as None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if isinstance(value, (BaseModel, set, frozenset, tuple)) or hasattr(value, "tolist"):
+        return _plain(_default(value))
+    return value
@@ -0,0 +1,234 @@
+"""
+Shared-memory transport of parse results from worker processes.
+
+Results made of long nested lists (MO coefficients, Hessians, cube grids, trajectories)
+are slow to pickle through a process pool's result pipe, and unpickling them blocks the
+parent. `share` (in the worker) moves every numeric array field of at least
+`MIN_SHARED_ELEMENTS` values into one `multiprocessing.shared_memory` block and returns
+a small picklable `SharedResult` instead of the model; `receive` (in the parent) rebuilds
+the model from it, or `SharedResult.attach` maps the arrays as NumPy views without copying.
+
+Ownership of the block travels with the pickled `SharedResult`: the receiving copy frees
+the block when it is rebuilt, discarded, or garbage-collected unread, and `attach` hands
+ownership on to the returned views. Without NumPy, or on platforms without POSIX shared
+memory (Windows frees a block as soon as the worker closes it), results are passed through
+unchanged.
+
+```python
+from parse_patrol.utils.shm import receive, share
+
+future = pool.submit(share_parse, path)   # worker: return share(cclib_parse(path))
+model = receive(future.result())
+
+with future.result().attach() as arrays:  # or, zero-copy
+    mocoeffs = arrays["mocoeffs"]          # np.ndarray view into the shared block
+```
+"""
+
+import os
+import sys
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+MIN_SHARED_ELEMENTS = 4096
+_ALIGN = 64
+
+
+class _ArrayRef:
+    """Placeholder for an array moved to shared memory."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def __reduce__(self) -> Tuple[Any, Tuple[int]]:
+        return _ArrayRef, (self.index,)
+
+
+class SharedResult:
+    """Picklable descriptor of a parse result whose arrays live in a shared memory block."""
+
+    def __init__(self, name: str, skeleton: Any, specs: List[Tuple[str, int, Tuple[int, ...], str]]):
+        self.name = name
+        self.skeleton = skeleton  # the model, with _ArrayRef in place of shared arrays
+        self.specs = specs  # (field path, offset, shape, dtype) per array
+        self._owner = True
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Pickling (to the parent) hands the block over to the unpickled copy
+        state = dict(self.__dict__)
+        self._owner = False
+        return state
+
+    def __del__(self) -> None:
+        if getattr(self, "_owner", False):
+            self.discard()
+
+    def __repr__(self) -> str:
+        return f"SharedResult({self.name!r}, {[path for path, *_ in self.specs]})"
+
+    def attach(self) -> "SharedArrays":
+        """Map the arrays zero-copy; they stay valid until the returned object is closed."""
+        arrays = SharedArrays(self)
+        self._owner = False
+        return arrays
+
+    def to_model(self) -> Any:
+        """Rebuild the model with plain lists, then free the block."""
+        with self.attach() as arrays:
+            values = [array.tolist() for array in arrays.values()]
+        return _restore(self.skeleton, values)
+
+    def discard(self) -> None:
+        """Free the block without reading it."""
+        self._owner = False
+        try:
+            block = shared_memory.SharedMemory(self.name)
+        except FileNotFoundError:
+            return
+        block.close()
+        _unlink(block)
+
+
+class SharedArrays:
+    """NumPy views of the arrays of a `SharedResult`, keyed by dotted field path (e.g., 'cube.data')."""
+
+    def __init__(self, result: SharedResult):
+        import numpy as np
+
+        self._block: Optional[shared_memory.SharedMemory] = shared_memory.SharedMemory(result.name)
+        self._arrays: Dict[str, Any] = {
+            path: np.ndarray(shape, dtype=np.dtype(dtype), buffer=self._block.buf, offset=offset)
+            for path, offset, shape, dtype in result.specs
+        }
+
+    def __getitem__(self, path: str) -> Any:
+        return self._arrays[path]
+
+    def keys(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def values(self) -> List[Any]:
+        return list(self._arrays.values())
+
+    def close(self) -> None:
+        """Drop the views and free the block; views kept elsewhere must be released first."""
+        self._arrays.clear()
+        if self._block is not None:
+            self._block.close()
+            _unlink(self._block)
+            self._block = None
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _unlink(block: shared_memory.SharedMemory) -> None:
+    try:
+        block.unlink()
+    except FileNotFoundError:  # already freed by another handle
+        resource_tracker.unregister(block._name, "shared_memory")  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _create(size: int) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    return shared_memory.SharedMemory(create=True, size=size)
+
+
+def _untrack(block: shared_memory.SharedMemory) -> None:
+    # The receiver owns the block: keep this process's resource tracker from unlinking it
+    # when the worker exits (a forked worker may run its own tracker)
+    if sys.version_info < (3, 13):
+        resource_tracker.unregister(block._name, "shared_memory")  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def _element_count(value: Any) -> int:
+    """Number of elements of a nested list, from the length of its first items (cheap, assumes rectangular)."""
+    count = 1
+    while isinstance(value, list):
+        if not value:
+            return 0
+        count *= len(value)
+        value = value[0]
+    return count if isinstance(value, (int, float)) else 0
+
+
+def _strip(value: Any, path: str, arrays: List[Tuple[str, Any]], min_elements: int) -> Any:
+    """Replace large numeric arrays by `_ArrayRef`s, collecting them under dotted paths ('cube.data')."""
+    import numpy as np
+
+    if isinstance(value, BaseModel):
+        updates = {name: _strip(getattr(value, name), f"{path}{name}.", arrays, min_elements) for name in type(value).model_fields}
+        return value.model_copy(update={name: new for name, new in updates.items() if new is not getattr(value, name)})
+    if isinstance(value, dict):
+        stripped = {key: _strip(item, f"{path}{key}.", arrays, min_elements) for key, item in value.items()}
+        return stripped if any(stripped[key] is not value[key] for key in value) else value
+    if isinstance(value, np.ndarray) or _element_count(value) >= min_elements:
+        try:
+            array = np.asarray(value)
+        except ValueError:  # ragged
+            return value
+        if array.dtype.kind not in "biuf" or array.size < min_elements:
+            return value
+        arrays.append((path.rstrip("."), array))
+        return _ArrayRef(len(arrays) - 1)
+    return value
+
+
+def _restore(value: Any, arrays: List[Any]) -> Any:
+    if isinstance(value, _ArrayRef):
+        return arrays[value.index]
+    if isinstance(value, BaseModel):
+        updates = {name: _restore(getattr(value, name), arrays) for name in type(value).model_fields}
+        return value.model_copy(update={name: new for name, new in updates.items() if new is not getattr(value, name)})
+    if isinstance(value, dict):
+        return {key: _restore(item, arrays) for key, item in value.items()}
+    return value
+
+
+def share(model: Any, min_elements: int = MIN_SHARED_ELEMENTS) -> Any:
+    """Move the large numeric arrays of a model into shared memory (call in the worker).
+
+    Returns:
+        A SharedResult, or the model itself if it has no arrays of at least `min_elements` values
+    """
+    if not isinstance(model, BaseModel) or os.name != "posix":
+        return model
+    try:
+        import numpy as np
+    except ImportError:
+        return model
+    arrays: List[Tuple[str, Any]] = []
+    skeleton = _strip(model, "", arrays, min_elements)
+    if not arrays:
+        return model
+
+    specs, offset = [], 0
+    for path, array in arrays:
+        specs.append((path, offset, array.shape, array.dtype.str))
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+    block = _create(max(offset, 1))
+    try:
+        for (_, start, shape, dtype), (_, array) in zip(specs, arrays):
+            view = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=start)
+            view[...] = array
+            del view
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    _untrack(block)
+    block.close()  # the block outlives this mapping until the receiver unlinks it
+    return SharedResult(block.name, skeleton, specs)
+
+
+def receive(result: Any) -> Any:
+    """The model behind a worker's result: rebuilt from a SharedResult, or the result itself."""
+    return result.to_model() if isinstance(result, SharedResult) else result
@@ -0,0 +1,300 @@
+"""
+Content-based format sniffing with a fast header probe.
+
+`sniff` reads only the first `HEAD_BYTES` of a file, plus the last `TAIL_BYTES` for the
+completion status, and classifies the program, version and file type via precompiled
+signatures. Results are cached per (path, size, mtime), so routing a file through
+several parsers never scans it twice. Compressed files and archive members (see
+`parse_patrol.utils.sources`) are sniffed from their decompressed content.
+
+```python
+from parse_patrol.utils.sniff import sniff
+
+info = sniff("my_calculation.log")
+print(info.program, info.version, info.file_type, info.completed)  # gaussian Gaussian 16 Rev. A.03 log True
+```
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Pattern, Tuple
+
+from pydantic import BaseModel, Field
+
+from .metrics import record_cache
+from .sources import MemorySource, is_archive, is_virtual, logical_name, open_binary, source_stat
+
+HEAD_BYTES = 8192
+TAIL_BYTES = 4096
+CACHE_SIZE = 4096
+
+
+class FileSignature(BaseModel):
+    """What a file is, as far as its head and tail tell."""
+
+    path: str = Field(description="Path of the sniffed file")
+    size: int = Field(description="File size in bytes (decompressed, for compressed files and archive members)")
+    program: Optional[str] = Field(default=None, description="Producing program in lower case (e.g., 'gaussian', 'orca', 'vasp')")
+    version: Optional[str] = Field(default=None, description="Program version if found in the header (e.g., 'Gaussian 16 Rev. A.03', 'ORCA 5.0.4')")
+    file_type: Optional[str] = Field(default=None, description="Kind of file: 'log', 'input', 'fchk', 'chk', 'cube', 'xyz', 'molden', 'poscar', 'chgcar', 'locpot', 'outcar', 'archive' or 'binary'")
+    completed: Optional[bool] = Field(default=None, description="Whether a log ends with the program's normal-termination message (None if not applicable)")
+    binary: bool = Field(default=False, description="Whether the header contains NUL bytes")
+    cclib_parser: Optional[str] = Field(default=None, description="Name of the matching cclib parser class (e.g., 'Gaussian', 'ORCA')")
+    iodata_format: Optional[str] = Field(default=None, description="Name of the matching iodata format module (e.g., 'fchk', 'gaussianlog')")
+
+
+class _Signature(NamedTuple):
+    program: str
+    trigger: Pattern[bytes]
+    version: Optional[Tuple[Pattern[bytes], str]] = None
+    success: Optional[Pattern[bytes]] = None
+    cclib_parser: Optional[str] = None
+    iodata_format: Optional[str] = None
+
+
+# Program output (log) signatures, tried in order on the header
+_LOG_SIGNATURES = (
+    _Signature(
+        "gaussian",
+        re.compile(rb"Gaussian, Inc\.|Entering Gaussian System"),
+        (re.compile(rb"Gaussian (\d\d):\s+\S+-G\d\dRev([A-Z]\.\d\d)"), "Gaussian {0} Rev. {1}"),
+        re.compile(rb"Normal termination of Gaussian"),
+        "Gaussian",
+        "gaussianlog",
+    ),
+    _Signature(
+        "orca",
+        re.compile(rb"\* O   R   C   A \*|O   R   C   A"),
+        (re.compile(rb"Program Version (\d+\.\d+\.\d+)"), "ORCA {0}"),
+        re.compile(rb"ORCA TERMINATED NORMALLY"),
+        "ORCA",
+        "orcalog",
+    ),
+    _Signature(
+        "qchem",
+        re.compile(rb"Welcome to Q-Chem|A Quantum Leap Into The Future Of Chemistry"),
+        (re.compile(rb"Q-Chem (\d+\.\d+(?:\.\d+)?)"), "Q-Chem {0}"),
+        re.compile(rb"Thank you very much for using Q-Chem"),
+        "QChem",
+    ),
+    _Signature(
+        "nwchem",
+        re.compile(rb"Northwest Computational Chemistry Package"),
+        (re.compile(rb"\(NWChem\) (\d+\.\d+(?:\.\d+)?)"), "NWChem {0}"),
+        re.compile(rb"Total times\s+cpu:"),
+        "NWChem",
+    ),
+    _Signature(
+        "psi4",
+        re.compile(rb"Psi4: An Open-Source Ab Initio Electronic Structure Package"),
+        (re.compile(rb"Psi4 (\d+\.\d+(?:\.\d+)?)"), "Psi4 {0}"),
+        re.compile(rb"Psi4 exiting successfully"),
+        "Psi4",
+    ),
+    _Signature(
+        "gamess",
+        re.compile(rb"GAMESS VERSION|Firefly \(PC GAMESS\)"),
+        (re.compile(rb"GAMESS VERSION = ([^*\n]+?)\s*\*"), "GAMESS {0}"),
+        re.compile(rb"EXECUTION OF GAMESS TERMINATED NORMALLY"),
+        "GAMESS",
+    ),
+    _Signature(
+        "molpro",
+        re.compile(rb"PROGRAM SYSTEM MOLPRO"),
+        (re.compile(rb"Version (\d+\.\d+)"), "Molpro {0}"),
+        re.compile(rb"Molpro calculation terminated"),
+        "Molpro",
+    ),
+    _Signature("turbomole", re.compile(rb"TURBOMOLE"), None, re.compile(rb"ended normally"), "Turbomole"),
+    _Signature("adf", re.compile(rb"Amsterdam Density Functional"), None, re.compile(rb"NORMAL TERMINATION"), "ADF"),
+    _Signature("dalton", re.compile(rb"Dalton - An Electronic Structure Program"), None, None, "DALTON"),
+    _Signature("jaguar", re.compile(rb"Jaguar version"), None, re.compile(rb"completed on"), "Jaguar"),
+    _Signature("molcas", re.compile(rb"MOLCAS"), None, re.compile(rb"Happy landing"), "Molcas"),
+    _Signature("mopac", re.compile(rb"MOPAC20"), None, re.compile(rb"== MOPAC DONE =="), "MOPAC"),
+    _Signature("xtb", re.compile(rb"x T B"), None, re.compile(rb"normal termination of xtb"), "XTB"),
+    _Signature("vasp", re.compile(rb"\A\s*vasp\.\d"), (re.compile(rb"\A\s*vasp\.(\d+\.\d+(?:\.\d+)?)"), "VASP {0}"),
+               re.compile(rb"General timing and accounting")),
+)
+
+# Structured formats recognized by their layout
+_FCHK = re.compile(rb"\A[^\n]*\n[^\n]*\nNumber of atoms\s+I\s+-?\d")
+_GAUSSIAN_INPUT = re.compile(rb"\A(?:[ \t]*(?:%[^\n]*)?\r?\n)*[ \t]*#[^\n]*\n")
+_CUBE = re.compile(rb"\A[^\n]*\n[^\n]*\n\s*-?\d+(?:\s+-?\d+\.\d*){3}[^\n]*\n(?:\s*-?\d+(?:\s+-?\d+\.\d*){3}\s*\n){3}")
+_XYZ = re.compile(rb"\A\s*(\d+)[ \t]*\r?\n[^\n]*\n\s*[A-Za-z]{1,3}\d*\s+[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?\s+[-+]?\d*\.?\d+")
+_MOLDEN = re.compile(rb"\A\s*\[Molden Format\]", re.IGNORECASE)
+# VASP files have fixed names (often with a suffix, e.g. POSCAR.relaxed); OUTCAR is also recognized by content
+_VASP_NAMES = (("POSCAR", "poscar"), ("CONTCAR", "poscar"), ("CHGCAR", "chgcar"), ("LOCPOT", "locpot"), ("OUTCAR", "outcar"))
+
+_EXTENSIONS: Dict[str, Tuple[Optional[str], str]] = {
+    ".log": (None, "log"),
+    ".out": (None, "log"),
+    ".gjf": ("gaussian", "input"),
+    ".com": ("gaussian", "input"),
+    ".fchk": ("gaussian", "fchk"),
+    ".fch": ("gaussian", "fchk"),
+    ".chk": ("gaussian", "chk"),
+    ".cube": (None, "cube"),
+    ".cub": (None, "cube"),
+    ".xyz": (None, "xyz"),
+    ".molden": (None, "molden"),
+}
+
+# Display names of the programs, e.g. for `detected_software`
+PROGRAM_NAMES = {
+    "gaussian": "Gaussian", "orca": "ORCA", "qchem": "Q-Chem", "nwchem": "NWChem", "psi4": "Psi4",
+    "gamess": "GAMESS", "molpro": "Molpro", "turbomole": "TURBOMOLE", "adf": "ADF", "dalton": "DALTON",
+    "jaguar": "Jaguar", "molcas": "MOLCAS", "mopac": "MOPAC", "xtb": "xtb", "vasp": "VASP",
+}
+
+_IODATA_FORMATS = {"fchk": "fchk", "cube": "cube", "xyz": "xyz", "molden": "molden", "poscar": "poscar",
+                   "chgcar": "chgcar", "locpot": "locpot", "input": "gaussianinput"}
+
+_cache: "OrderedDict[Tuple[str, int, int], FileSignature]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _read_stream_probe(filepath: str) -> Tuple[bytes, bytes, int]:
+    # Compressed streams cannot seek to their end cheaply: stream through, keeping the last bytes
+    with open_binary(filepath) as f:
+        head = f.read(HEAD_BYTES)
+        size, tail = len(head), b""
+        while chunk := f.read(1 << 20):
+            size += len(chunk)
+            tail = (tail + chunk)[-TAIL_BYTES:]
+    return head, tail, size
+
+
+def read_probe(filepath: str, size: Optional[int] = None) -> Tuple[bytes, bytes]:
+    """Read the head and tail of a file (the tail is empty when the head covers it all).
+
+    Compressed files and archive members are decompressed on the fly.
+    """
+    if is_virtual(filepath):
+        return _read_stream_probe(filepath)[:2]
+    if size is None:
+        size = os.path.getsize(filepath)
+    with open(filepath, "rb") as f:
+        head = f.read(HEAD_BYTES)
+        if size <= HEAD_BYTES:
+            return head, b""
+        f.seek(max(size - TAIL_BYTES, HEAD_BYTES))
+        return head, f.read()
+
+
+def classify(head: bytes, tail: bytes = b"", filepath: str = "", size: Optional[int] = None) -> FileSignature:
+    """Classify a file from its head and tail bytes.
+
+    Args:
+        head: First bytes of the file (up to `HEAD_BYTES`)
+        tail: Last bytes of the file (empty if `head` holds the whole file)
+        filepath: Path of the file, used for the extension fallback
+        size: File size in bytes (default: length of head + tail)
+
+    Returns:
+        FileSignature; fields stay None when the content does not tell
+    """
+    basename = os.path.basename(logical_name(filepath))
+    ext = os.path.splitext(basename)[1].lower()
+    info = FileSignature(path=filepath, size=len(head) + len(tail) if size is None else size)
+    vasp_type = next((file_type for name, file_type in _VASP_NAMES if name in basename), None)
+
+    if b"\x00" in head or (is_archive(filepath) and not is_virtual(filepath)):
+        info.binary = True
+        if ext == ".chk":
+            info.program, info.file_type = "gaussian", "chk"
+        elif is_archive(basename):
+            info.file_type = "archive"
+        else:
+            info.file_type = "binary"
+        return info
+
+    # Layout-based formats first: they are cheap to recognize and unambiguous
+    if _FCHK.match(head):
+        info.program, info.file_type, info.cclib_parser = "gaussian", "fchk", "FChk"
+    elif _MOLDEN.match(head):
+        info.file_type = "molden"
+    elif _CUBE.match(head):
+        info.file_type = "cube"
+    elif _XYZ.match(head):
+        info.file_type = "xyz"
+    elif _GAUSSIAN_INPUT.match(head):
+        info.program, info.file_type = "gaussian", "input"
+    elif vasp_type in ("poscar", "chgcar", "locpot"):
+        info.program, info.file_type = "vasp", vasp_type
+    else:
+        end = tail or head
+        for signature in _LOG_SIGNATURES:
+            if not signature.trigger.search(head):
+                continue
+            info.program = signature.program
+            info.file_type = "outcar" if signature.program == "vasp" else "log"
+            info.cclib_parser = signature.cclib_parser
+            info.iodata_format = signature.iodata_format
+            if signature.version is not None:
+                pattern, template = signature.version
+                m = pattern.search(head)
+                if m:
+                    info.version = template.format(*(g.decode("ascii", "replace").strip() for g in m.groups()))
+            if signature.success is not None:
+                info.completed = bool(signature.success.search(end))
+            break
+        else:
+            program, file_type = ("vasp", vasp_type) if vasp_type else _EXTENSIONS.get(ext, (None, None))
+            info.program, info.file_type = program, file_type
+
+    if info.iodata_format is None and info.file_type in _IODATA_FORMATS:
+        info.iodata_format = _IODATA_FORMATS[info.file_type]
+    return info
+
+
+def sniff(filepath: str, probe: Optional[Tuple[bytes, bytes]] = None) -> FileSignature:
+    """Classify a file by its content, reading at most `HEAD_BYTES + TAIL_BYTES`.
+
+    Results are cached per (path, size, modification time); a rewritten file is sniffed anew.
+
+    Args:
+        filepath: Path of the file, or in-memory data as a `MemorySource` (not cached)
+        probe: Head and tail already read with `read_probe`, used instead of reading them again
+
+    Returns:
+        FileSignature with program, version, file type and completion status
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    if isinstance(filepath, MemorySource):
+        # Nothing to cache by: classify the buffer's head and tail directly
+        data, size = filepath.data, len(filepath)
+        tail = bytes(data[max(size - TAIL_BYTES, HEAD_BYTES):]) if size > HEAD_BYTES else b""
+        return classify(bytes(data[:HEAD_BYTES]), tail, filepath.name, size)
+
+    path = os.path.abspath(filepath)
+    st = source_stat(path)
+    key = (path, st.st_size, st.st_mtime_ns)
+    with _cache_lock:
+        info = _cache.get(key)
+        if info is not None:
+            _cache.move_to_end(key)
+    record_cache("sniff", info is not None)
+    if info is not None:
+        return info
+
+    if is_virtual(path):
+        head, tail, size = _read_stream_probe(path)
+    else:
+        head, tail = probe if probe is not None else read_probe(path, st.st_size)
+        size = st.st_size
+    info = classify(head, tail, str(filepath), size)
+    with _cache_lock:
+        _cache[key] = info
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return info
+
+
+def clear_cache() -> None:
+    """Forget all sniffed files."""
+    with _cache_lock:
+        _cache.clear()
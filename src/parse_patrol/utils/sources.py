@@ -0,0 +1,251 @@
+"""
+Compressed files, archive members and in-memory data as parser inputs.
+
+Besides plain paths, the parsers accept:
+
+- compressed files: `job.log.gz`, `job.out.bz2`, `job.fchk.xz`, decompressed on the fly
+- archive members: `bundle.tar.gz::run1/job.log` or `raw.zip::job.fchk`, read straight
+  out of tar (any compression) and zip archives, without extracting them
+- in-memory data: `bytes`, `bytearray`, `memoryview` or binary/text file-like objects
+  (e.g., an object-store download or a database blob), wrapped in a `MemorySource`
+
+Such "virtual" sources never touch the disk, except for libraries that only read from a
+path (iodata), which get a temporary copy via `local_path`. Format detection uses the name
+without the compression suffix (`job.log.gz` is a `.log`); in-memory data is detected from
+its content, or from the name given to its `MemorySource`.
+
+```python
+from parse_patrol.utils.sources import iter_members
+from parse_patrol import gaussian_parse
+
+for member in iter_members("bundle.tar.gz"):
+    print(member, gaussian_parse(member).final_energy)
+```
+"""
+
+import bz2
+import codecs
+import gzip
+import io
+import lzma
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Optional, Tuple, Union
+
+MEMBER_SEPARATOR = "::"
+
+_DECOMPRESSORS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+_TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz", ".tbz2", ".tar.xz", ".txz")
+ARCHIVE_SUFFIXES = _TAR_SUFFIXES + (".zip",)
+
+
+class MemorySource:
+    """In-memory file content, with an optional file name as format hint.
+
+    The data is kept as given (bytes-like objects are not copied); text is encoded as UTF-8.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, memoryview, str], name: Optional[str] = None):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.data = memoryview(data).cast("B") if isinstance(data, memoryview) else data
+        self.name = name or "<memory>"
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return f"MemorySource({self.name!r}, {len(self)} bytes)"
+
+
+# Everything the parsers accept as input
+Source = Union[str, "os.PathLike[str]", bytes, bytearray, memoryview, IO[Any], MemorySource]
+
+
+def as_source(source: Source) -> Union[str, MemorySource]:
+    """Normalize a parser input: paths become `str`, in-memory data a `MemorySource`.
+
+    File-like objects are read once (from their current position), keeping their `name` as hint.
+    """
+    if isinstance(source, (str, MemorySource)):
+        return source
+    if isinstance(source, os.PathLike):
+        return os.fspath(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return MemorySource(source)
+    if hasattr(source, "read"):
+        name = getattr(source, "name", None)
+        return MemorySource(source.read(), name if isinstance(name, str) else None)
+    raise TypeError(f"Unsupported parser input: {type(source).__name__}")
+
+
+def split_source(filepath: Union[str, MemorySource]) -> Tuple[str, Optional[str]]:
+    """Split `archive::member` into (archive, member); plain paths give (path, None)."""
+    if isinstance(filepath, MemorySource):
+        return filepath.name, None
+    container, sep, member = str(filepath).partition(MEMBER_SEPARATOR)
+    return (container, member) if sep else (container, None)
+
+
+def is_archive(filepath: str) -> bool:
+    """Whether a path names a tar or zip archive (by its suffix)."""
+    return str(filepath).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _compression(name: str) -> Optional[str]:
+    ext = os.path.splitext(name)[1].lower()
+    return ext if ext in _DECOMPRESSORS and not is_archive(name) else None
+
+
+def is_virtual(filepath: Union[str, MemorySource]) -> bool:
+    """Whether a source is not a plain file (compressed, an archive member, or in memory)."""
+    if isinstance(filepath, MemorySource):
+        return True
+    container, member = split_source(filepath)
+    return member is not None or _compression(container) is not None
+
+
+def logical_name(filepath: Union[str, MemorySource]) -> str:
+    """The name a source would have as a plain file: the member name, without compression suffix."""
+    container, member = split_source(filepath)
+    name = member if member is not None else container
+    return os.path.splitext(name)[0] if _compression(name) else name
+
+
+def source_stat(filepath: str) -> os.stat_result:
+    """`os.stat` of the file holding a source (the archive, for members)."""
+    return os.stat(split_source(filepath)[0])
+
+
+def source_exists(filepath: Union[str, MemorySource]) -> bool:
+    if isinstance(filepath, MemorySource):
+        return True
+    container, member = split_source(filepath)
+    if member is None:
+        return os.path.isfile(container)
+    try:
+        with _open_member(container, member):
+            return True
+    except (OSError, KeyError, tarfile.TarError, zipfile.BadZipFile):
+        return False
+
+
+@contextmanager
+def _open_member(container: str, member: str) -> Iterator[IO[bytes]]:
+    if container.lower().endswith(".zip"):
+        with zipfile.ZipFile(container) as archive, archive.open(member) as f:
+            yield f
+        return
+    with tarfile.open(container, "r:*") as archive:
+        f = archive.extractfile(member)
+        if f is None:
+            raise KeyError(f"{member} is not a regular file in {container}")
+        with f:
+            yield f
+
+
+@contextmanager
+def open_binary(filepath: Union[str, MemorySource]) -> Iterator[IO[bytes]]:
+    """Open any source for reading bytes, decompressing on the fly.
+
+    Raises:
+        FileNotFoundError: If the file (or archive) does not exist
+        KeyError: If the archive has no such member
+    """
+    if isinstance(filepath, MemorySource):
+        with io.BytesIO(filepath.data) as f:
+            yield f
+        return
+    container, member = split_source(filepath)
+    if member is None:
+        compression = _compression(container)
+        opener = _DECOMPRESSORS[compression] if compression else open
+        with opener(container, "rb") as f:
+            yield f
+        return
+    with _open_member(container, member) as f:
+        compression = _compression(member)
+        if compression is None:
+            yield f
+        else:
+            with _DECOMPRESSORS[compression](f, "rb") as inner:
+                yield inner
+
+
+class _TextStream(io.TextIOWrapper):
+    """Text stream named after the logical file, so readers do not see a compression suffix and decompress twice."""
+
+    def __init__(self, buffer: IO[bytes], name: str, errors: str):
+        super().__init__(buffer, encoding="utf-8", errors=errors)
+        self._logical_name = name
+
+    @property
+    def name(self) -> str:  # type: ignore[override]
+        return self._logical_name
+
+
+@contextmanager
+def open_text(filepath: Union[str, MemorySource], errors: str = "ignore") -> Iterator[IO[str]]:
+    """Open any source as UTF-8 text, decompressing on the fly."""
+    with open_binary(filepath) as f:
+        yield _TextStream(f, logical_name(filepath), errors)
+
+
+def read_bytes(filepath: Union[str, MemorySource]) -> Union[bytes, bytearray, memoryview]:
+    """Read a whole source as bytes; in-memory data is returned without copying."""
+    if isinstance(filepath, MemorySource):
+        return filepath.data
+    if not is_virtual(filepath):
+        with open(filepath, "rb") as f:
+            return f.read()
+    with open_binary(filepath) as f:
+        return f.read()
+
+
+def read_text(filepath: Union[str, MemorySource], errors: str = "ignore") -> str:
+    """Read a whole source as UTF-8 text (like `Path.read_text`, but for any source)."""
+    if not is_virtual(filepath):
+        with open(filepath, encoding="utf-8", errors=errors) as f:
+            return f.read()
+    return codecs.decode(read_bytes(filepath), "utf-8", errors)
+
+
+@contextmanager
+def local_path(filepath: Union[str, MemorySource]) -> Iterator[str]:
+    """A plain-file path for a source: the path itself, or a temporary decompressed copy.
+
+    The copy keeps the logical file name's suffix, for libraries that pick the format from it.
+    """
+    if not is_virtual(filepath):
+        yield str(filepath)
+        return
+    suffix = os.path.splitext(logical_name(filepath))[1]
+    with tempfile.TemporaryDirectory(prefix="parse_patrol_") as tmpdir:
+        path = os.path.join(tmpdir, "source" + suffix)
+        with open(path, "wb") as dst:
+            if isinstance(filepath, MemorySource):
+                dst.write(filepath.data)
+            else:
+                with open_binary(filepath) as src:
+                    shutil.copyfileobj(src, dst)
+        yield path
+
+
+def iter_members(archive: str) -> Iterator[str]:
+    """Yield the regular files in a tar or zip archive as `archive::member` sources."""
+    archive = str(archive)
+    if archive.lower().endswith(".zip"):
+        with zipfile.ZipFile(archive) as z:
+            names = [info.filename for info in z.infolist() if not info.is_dir()]
+    else:
+        with tarfile.open(archive, "r:*") as t:
+            names = [info.name for info in t if info.isfile()]
+    for name in names:
+        yield f"{archive}{MEMBER_SEPARATOR}{name}"
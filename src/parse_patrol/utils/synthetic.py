@@ -0,0 +1,538 @@
+"""
+Deterministic generator of synthetic computational chemistry files.
+
+Writes realistic Gaussian logs, inputs and formatted checkpoints, as well as XYZ
+trajectories and cube files, of arbitrary size. The files follow the layouts of the
+real programs closely enough for cclib, iodata and the custom Gaussian parser to read
+them, which makes them suitable for scaling tests and benchmarks without network access.
+
+All writers take a `seed`; the same arguments always produce byte-identical files,
+so scaling curves are comparable across releases and machines.
+
+```python
+from parse_patrol.utils.synthetic import write_gaussian_log
+
+write_gaussian_log("opt.log", natom=200, opt_steps=50, nfreq=30, seed=1)
+```
+"""
+
+import math
+import random
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+PathLike = Union[str, Path]
+
+BOHR_PER_ANGSTROM = 1.8897261254578281
+
+# symbol, atomic number, mass, relative abundance in generated molecules
+_ELEMENTS: List[Tuple[str, int, float, int]] = [
+    ("H", 1, 1.00783, 50),
+    ("C", 6, 12.00000, 30),
+    ("N", 7, 14.00307, 8),
+    ("O", 8, 15.99491, 8),
+    ("F", 9, 18.99840, 2),
+    ("S", 16, 31.97207, 2),
+]
+_SYMBOLS = {z: s for s, z, _, _ in _ELEMENTS}
+_MASSES = {z: m for _, z, m, _ in _ELEMENTS}
+_PARITY_SWAP = {1: 6, 6: 7, 7: 8, 8: 9, 9: 16, 16: 9}
+
+_TIMESTAMP = "Wed Jan  1 00:00:00 2025"
+_DATE = "1-Jan-2025"
+
+
+def random_molecule(natom: int, seed: int = 0) -> Tuple[List[int], List[List[float]]]:
+    """Generate atomic numbers and non-overlapping Cartesian coordinates (angstroms).
+
+    Atoms sit on a jittered cubic grid with 1.5 angstrom spacing.
+
+    Args:
+        natom: Number of atoms
+        seed: Random seed
+
+    Returns:
+        Tuple of (atomic numbers, coordinates)
+    """
+    if natom < 1:
+        raise ValueError("natom must be positive")
+    rng = random.Random(seed)
+    zs = [z for _, z, _, _ in _ELEMENTS]
+    weights = [w for _, _, _, w in _ELEMENTS]
+    atomnos = rng.choices(zs, weights=weights, k=natom)
+    if sum(atomnos) % 2:
+        # Swap the last element for one with odd-numbered difference, so the neutral molecule is closed-shell
+        atomnos[-1] = _PARITY_SWAP[atomnos[-1]]
+    side = math.ceil(natom ** (1 / 3))
+    offset = (side - 1) * 1.5 / 2
+    coords = []
+    for i in range(natom):
+        ix, iy, iz = i % side, (i // side) % side, i // (side * side)
+        coords.append([round(1.5 * c - offset + rng.uniform(-0.2, 0.2), 6) for c in (ix, iy, iz)])
+    return atomnos, coords
+
+
+def _electrons(atomnos: Sequence[int], charge: int) -> Tuple[int, int]:
+    """Return (number of electrons, multiplicity) of the lowest spin state."""
+    nelec = sum(atomnos) - charge
+    return nelec, 1 if nelec % 2 == 0 else 2
+
+
+def _orientation_block(title: str, atomnos: Sequence[int], coords: Sequence[Sequence[float]]) -> List[str]:
+    divider = " " + "-" * 69
+    lines = [
+        f"{title:^70}",
+        divider,
+        " Center     Atomic      Atomic             Coordinates (Angstroms)",
+        " Number     Number       Type             X           Y           Z",
+        divider,
+    ]
+    for i, (z, (x, y, c)) in enumerate(zip(atomnos, coords), start=1):
+        lines.append(f" {i:6d}{z:11d}{0:12d}    {x:12.6f}{y:12.6f}{c:12.6f}")
+    lines.append(divider)
+    return lines
+
+
+def _scf_block(energy: float, nbasis: int, nalpha: int, nbeta: int, natom: int, rng: random.Random) -> List[str]:
+    cycles = rng.randint(8, 20)
+    method = "RB3LYP" if nalpha == nbeta else "UB3LYP"
+    return [
+        f"    {nbasis} basis functions,  {3 * nbasis} primitive gaussians,  {nbasis} cartesian basis functions",
+        f"    {nalpha} alpha electrons       {nbeta} beta electrons",
+        f"       nuclear repulsion energy  {rng.uniform(100, 5000):16.10f} Hartrees.",
+        f" NAtoms= {natom:4d} NActive= {natom:4d} NUniq= {natom:4d} SFac= 1.00D+00 NAtFMM=   60 NAOKFM=F Big=F",
+        " Requested convergence on RMS density matrix=1.00D-08 within 128 cycles.",
+        " Requested convergence on MAX density matrix=1.00D-06.",
+        " Requested convergence on             energy=1.00D-06.",
+        " No special actions if energy rises.",
+        f" SCF Done:  E({method}) = {energy:17.9f}     A.U. after {cycles:4d} cycles",
+        f"            NFock= {cycles:2d}  Conv=0.{rng.randint(10, 99)}D-08     -V/T= 2.0048",
+    ]
+
+
+def _orbital_block(nalpha: int, nbasis: int, rng: random.Random) -> List[str]:
+    occ = sorted(rng.uniform(-20.0, -0.2) for _ in range(nalpha))
+    virt = sorted(rng.uniform(0.0, 5.0) for _ in range(nbasis - nalpha))
+    lines = [" " + "*" * 70, "", "            Population analysis using the SCF density.", "", " " + "*" * 70, ""]
+    for label, values in (("occ.", occ), ("virt.", virt)):
+        for i in range(0, len(values), 5):
+            chunk = "".join(f"{v:10.5f}" for v in values[i:i + 5])
+            lines.append(f" Alpha {label:>5} eigenvalues -- {chunk}")
+    return lines
+
+
+def _mulliken_block(atomnos: Sequence[int], rng: random.Random) -> List[str]:
+    charges = [rng.uniform(-0.6, 0.6) for _ in atomnos]
+    shift = sum(charges) / len(charges)
+    lines = [" Mulliken charges:", "               1"]
+    for i, (z, q) in enumerate(zip(atomnos, charges), start=1):
+        lines.append(f" {i:5d}  {_SYMBOLS[z]:<2} {q - shift:11.6f}")
+    lines.append(" Sum of Mulliken charges =   0.00000")
+    return lines
+
+
+def _convergence_block(step: int, opt_steps: int, rng: random.Random) -> List[str]:
+    converged = step == opt_steps - 1
+    scale = 10 ** (-step * 3.0 / max(opt_steps - 1, 1))
+    lines = [
+        f" Step number {step + 1:3d} out of a maximum of {max(100, opt_steps):4d}",
+        "         Item               Value     Threshold  Converged?",
+    ]
+    for item, threshold in (("Maximum Force", 0.00045), ("RMS     Force", 0.0003),
+                            ("Maximum Displacement", 0.0018), ("RMS     Displacement", 0.0012)):
+        value = threshold * 0.5 if converged else threshold * rng.uniform(5, 60) * scale + threshold * 1.01
+        lines.append(f" {item:<21}{value:12.6f}{threshold:13.6f}     {'YES' if value <= threshold else 'NO '}")
+    lines.append(f" Predicted change in Energy={-rng.uniform(1e-6, 1e-2) * scale:.6E}".replace("E", "D"))
+    if converged:
+        lines += [" Optimization completed.", "    -- Stationary point found."]
+    return lines
+
+
+def _frequency_block(atomnos: Sequence[int], nfreq: int, rng: random.Random) -> List[str]:
+    freqs = sorted(rng.uniform(30.0, 3600.0) for _ in range(nfreq))
+    lines = [
+        " Harmonic frequencies (cm**-1), IR intensities (KM/Mole), Raman scattering",
+        " activities (A**4/AMU), depolarization ratios for plane and unpolarized",
+        " incident light, reduced masses (AMU), force constants (mDyne/A),",
+        " and normal coordinates:",
+    ]
+    for start in range(0, nfreq, 3):
+        cols = list(range(start, min(start + 3, nfreq)))
+        lines.append("".join(f"{c + 1:23d}" for c in cols))
+        lines.append("".join(f"{'A':>23}" for _ in cols))
+        lines.append(" Frequencies --" + "".join(f"{freqs[c]:12.4f}           " for c in cols).rstrip())
+        lines.append(" Red. masses --" + "".join(f"{rng.uniform(1.0, 12.0):12.4f}           " for _ in cols).rstrip())
+        lines.append(" Frc consts  --" + "".join(f"{rng.uniform(0.01, 8.0):12.4f}           " for _ in cols).rstrip())
+        lines.append(" IR Inten    --" + "".join(f"{rng.uniform(0.0, 150.0):12.4f}           " for _ in cols).rstrip())
+        lines.append("  Atom  AN" + "      X      Y      Z  " * len(cols))
+        for i, z in enumerate(atomnos, start=1):
+            disp = "".join("".join(f"{rng.uniform(-0.5, 0.5):7.2f}" for _ in range(3)) + "  " for _ in cols)
+            lines.append(f" {i:5d}{z:4d}  {disp.rstrip()}")
+    return lines
+
+
+def _thermo_block(atomnos: Sequence[int], energy: float, nfreq: int, rng: random.Random) -> List[str]:
+    zpe = 0.0045 * nfreq * rng.uniform(0.8, 1.2)
+    e_corr = zpe * 1.04
+    h_corr = e_corr + 0.000944
+    g_corr = h_corr - 0.04 * rng.uniform(0.8, 1.2)
+    lines = [" -------------------", " - Thermochemistry -", " -------------------",
+             " Temperature   298.150 Kelvin.  Pressure   1.00000 Atm."]
+    for i, z in enumerate(atomnos, start=1):
+        lines.append(f" Atom {i:5d} has atomic number {z:2d} and mass {_MASSES[z]:9.5f}")
+    lines += [
+        f" Molecular mass: {sum(_MASSES[z] for z in atomnos):12.5f} amu.",
+        f" Zero-point vibrational energy {zpe * 2625499.639:12.1f} (Joules/Mol)",
+        f"                               {zpe * 627.5095:12.5f} (Kcal/Mol)",
+        f" Zero-point correction=                      {zpe:12.6f} (Hartree/Particle)",
+        f" Thermal correction to Energy=               {e_corr:12.6f}",
+        f" Thermal correction to Enthalpy=             {h_corr:12.6f}",
+        f" Thermal correction to Gibbs Free Energy=    {g_corr:12.6f}",
+        f" Sum of electronic and zero-point Energies=      {energy + zpe:15.6f}",
+        f" Sum of electronic and thermal Energies=         {energy + e_corr:15.6f}",
+        f" Sum of electronic and thermal Enthalpies=       {energy + h_corr:15.6f}",
+        f" Sum of electronic and thermal Free Energies=    {energy + g_corr:15.6f}",
+    ]
+    return lines
+
+
+def _job_header(route: str, title: str, charge: int, mult: int, atomnos: Sequence[int],
+                coords: Sequence[Sequence[float]], first: bool) -> List[str]:
+    lines: List[str] = []
+    if first:
+        lines += [
+            " Entering Gaussian System, Link 0=g16",
+            " Initial command:",
+            ' /opt/g16/l1.exe "/scratch/Gau-4242.inp" -scrdir="/scratch/"',
+            " Entering Link 1 = /opt/g16/l1.exe PID=      4242.",
+            "  ",
+            " Copyright (c) 1988-2017, Gaussian, Inc.  All Rights Reserved.",
+            "  ",
+            " This is part of the Gaussian(R) 16 program.  It is based on",
+            " the Gaussian(R) 09 system (copyright 2009, Gaussian, Inc.),",
+            "  ",
+            " Cite this work as:",
+            " Gaussian 16, Revision A.03,",
+            " M. J. Frisch, G. W. Trucks, H. B. Schlegel, G. E. Scuseria, ",
+            " and D. J. Fox, Gaussian, Inc., Wallingford CT, 2016.",
+            " ",
+            " ******************************************",
+            " Gaussian 16:  ES64L-G16RevA.03 25-Dec-2016",
+            f"{_DATE:>27} ",
+            " ******************************************",
+            " %chk=synthetic.chk",
+        ]
+    divider = " " + "-" * (len(route) + 2)
+    lines += [divider, f" {route}", divider, " 1/18=20,19=15,38=1/1,3;", " 99//99;"]
+    title_divider = " " + "-" * len(title)
+    lines += [title_divider, f" {title}", title_divider, " Symbolic Z-matrix:",
+              f" Charge = {charge:2d} Multiplicity = {mult}"]
+    for z, (x, y, c) in zip(atomnos, coords):
+        lines.append(f" {_SYMBOLS[z]:<2}{x:22.5f}{y:10.5f}{c:10.5f} ")
+    lines.append(" ")
+    return lines
+
+
+def _termination(rng: random.Random) -> List[str]:
+    return [
+        f" Job cpu time:       0 days  0 hours {rng.randint(0, 59):2d} minutes {rng.uniform(0, 59):4.1f} seconds.",
+        f" Normal termination of Gaussian 16 at {_TIMESTAMP}.",
+    ]
+
+
+def write_gaussian_log(
+    path: PathLike,
+    natom: int = 10,
+    opt_steps: int = 1,
+    nfreq: Optional[int] = None,
+    charge: int = 0,
+    link1: bool = False,
+    complete: bool = True,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic Gaussian 16 output file.
+
+    The file contains one geometry/SCF/convergence section per optimization step
+    (Input and Standard orientation tables, SCF Done, orbital energies, Mulliken charges,
+    Converged? table), followed by a frequency and thermochemistry section.
+
+    Args:
+        path: Output path
+        natom: Number of atoms
+        opt_steps: Number of optimization steps (1 is a single point)
+        nfreq: Number of vibrational frequencies; defaults to 3N-6 (0 disables the frequency job)
+        charge: Net charge
+        link1: Write the frequency calculation as a second job (`--Link1--`), like `opt freq`
+        complete: Whether to end with "Normal termination"; False mimics a truncated/running job
+        seed: Random seed
+
+    Returns:
+        Path of the written file
+    """
+    rng = random.Random(seed)
+    atomnos, final = random_molecule(natom, seed)
+    nelec, mult = _electrons(atomnos, charge)
+    nalpha, nbeta = (nelec + mult - 1) // 2, (nelec - mult + 1) // 2
+    nbasis = max(nalpha + 1, 4 * natom)
+    if nfreq is None:
+        nfreq = max(3 * natom - 6, 1)
+
+    # Geometry relaxes toward the final structure, the energy decreases monotonically
+    e_final = -37.8 * sum(atomnos) / 6 * rng.uniform(0.98, 1.02)
+    start = [[c + rng.uniform(-0.3, 0.3) for c in xyz] for xyz in final]
+    opt = opt_steps > 1
+    route = "#p opt b3lyp/6-31g(d)" if opt else "#p b3lyp/6-31g(d)"
+    if nfreq and not link1:
+        route = route.replace(" b3lyp", " freq b3lyp")
+
+    lines = _job_header(route, "synthetic", charge, mult, atomnos, start, first=True)
+    if opt:
+        lines += [" GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad",
+                  " Berny optimization.", " Initialization pass.",
+                  f" Number of steps in this run={opt_steps:6d} maximum allowed number of steps={max(100, opt_steps):6d}."]
+    for step in range(opt_steps):
+        weight = 0.5 ** step if step < opt_steps - 1 else 0.0
+        coords = [[f + weight * (s - f) for f, s in zip(fx, sx)] for fx, sx in zip(final, start)]
+        energy = e_final + 0.05 * weight
+        lines += _orientation_block("Input orientation:", atomnos, coords)
+        lines += _orientation_block("Standard orientation:", atomnos, coords)
+        lines.append(f" Rotational constants (GHZ): {rng.uniform(0.1, 5):14.7f}{rng.uniform(0.1, 5):15.7f}{rng.uniform(0.1, 5):15.7f}")
+        lines += _scf_block(energy, nbasis, nalpha, nbeta, natom, rng)
+        lines += _orbital_block(nalpha, nbasis, rng)
+        lines += _mulliken_block(atomnos, rng)
+        if opt:
+            lines += _convergence_block(step, opt_steps, rng)
+            lines.append(" GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad")
+
+    if nfreq:
+        if link1:
+            lines += _termination(rng)
+            lines += [" Link1:  Proceeding to internal job step number  2."]
+            lines += _job_header("#p freq b3lyp/6-31g(d) geom=allcheck", "synthetic", charge, mult, atomnos, final, first=False)
+            lines += _orientation_block("Standard orientation:", atomnos, final)
+            lines += _scf_block(e_final, nbasis, nalpha, nbeta, natom, rng)
+        lines += _frequency_block(atomnos, nfreq, rng)
+        lines.append("")
+        lines += _thermo_block(atomnos, e_final, nfreq, rng)
+
+    if complete:
+        lines += _termination(rng)
+
+    path = Path(path)
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def write_gaussian_gjf(
+    path: PathLike,
+    natom: int = 10,
+    jobs: int = 1,
+    charge: int = 0,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic Gaussian input file.
+
+    Args:
+        path: Output path
+        natom: Number of atoms
+        jobs: Number of jobs; jobs after the first are separated by `--Link1--`
+        charge: Net charge
+        seed: Random seed
+
+    Returns:
+        Path of the written file
+    """
+    atomnos, coords = random_molecule(natom, seed)
+    _, mult = _electrons(atomnos, charge)
+    routes = ["# opt b3lyp/6-31g(d)", "# freq b3lyp/6-31g(d) geom=check guess=read"]
+    sections = []
+    for job in range(jobs):
+        lines = ["%chk=synthetic.chk", routes[min(job, 1)], "", f"synthetic job {job + 1}", "", f"{charge} {mult}"]
+        for z, (x, y, c) in zip(atomnos, coords):
+            lines.append(f" {_SYMBOLS[z]:<2}{x:22.8f}{y:14.8f}{c:14.8f}")
+        sections.append("\n".join(lines) + "\n\n")
+    path = Path(path)
+    path.write_text("--Link1--\n".join(sections))
+    return path
+
+
+def _fchk_int(label: str, value: int) -> str:
+    return f"{label:<40}   I     {value:>12d}\n"
+
+
+def _fchk_real(label: str, value: float) -> str:
+    return f"{label:<40}   R     {value:22.15E}\n"
+
+
+def _fchk_ints(label: str, values: Sequence[int]) -> str:
+    out = [f"{label:<40}   I   N={len(values):>12d}\n"]
+    for i in range(0, len(values), 6):
+        out.append("".join(f"{v:12d}" for v in values[i:i + 6]) + "\n")
+    return "".join(out)
+
+
+def _fchk_reals(label: str, values: Sequence[float]) -> str:
+    out = [f"{label:<40}   R   N={len(values):>12d}\n"]
+    for i in range(0, len(values), 5):
+        out.append("".join(f"{v:16.8E}" for v in values[i:i + 5]) + "\n")
+    return "".join(out)
+
+
+def write_gaussian_fchk(
+    path: PathLike,
+    natom: int = 10,
+    nbasis: Optional[int] = None,
+    charge: int = 0,
+    complete: bool = True,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic Gaussian formatted checkpoint file.
+
+    The basis consists of single-primitive s shells spread over the atoms, so the
+    file size is dominated by the `nbasis * nbasis` MO coefficient block.
+
+    Args:
+        path: Output path
+        natom: Number of atoms
+        nbasis: Number of basis functions (default: 4 per atom); must exceed the number of alpha electrons
+        charge: Net charge
+        complete: Whether to write all values; False truncates the MO coefficients section
+        seed: Random seed
+
+    Returns:
+        Path of the written file
+    """
+    rng = random.Random(seed)
+    atomnos, coords = random_molecule(natom, seed)
+    nelec, mult = _electrons(atomnos, charge)
+    nalpha, nbeta = (nelec + mult - 1) // 2, (nelec - mult + 1) // 2
+    nbasis = nbasis if nbasis is not None else max(nalpha + 1, 4 * natom)
+    if nbasis < nalpha:
+        raise ValueError(f"nbasis={nbasis} is smaller than the number of alpha electrons ({nalpha})")
+
+    shell_map = [1 + i * natom // nbasis for i in range(nbasis)]  # shells grouped by atom, like formchk
+    bohr = [c * BOHR_PER_ANGSTROM for xyz in coords for c in xyz]
+    mo_coeffs = [rng.uniform(-1.0, 1.0) for _ in range(nbasis * nbasis)]
+    energy = -37.8 * sum(atomnos) / 6 * rng.uniform(0.98, 1.02)
+
+    parts = [
+        "synthetic\n",
+        f"{'SP':<10}{'RB3LYP':<30}{'6-31G(d)':>30}\n",
+        _fchk_int("Number of atoms", natom),
+        _fchk_int("Charge", charge),
+        _fchk_int("Multiplicity", mult),
+        _fchk_int("Number of electrons", nelec),
+        _fchk_int("Number of alpha electrons", nalpha),
+        _fchk_int("Number of beta electrons", nbeta),
+        _fchk_int("Number of basis functions", nbasis),
+        _fchk_int("Number of independent functions", nbasis),
+        _fchk_ints("Atomic numbers", atomnos),
+        _fchk_reals("Nuclear charges", [float(z) for z in atomnos]),
+        _fchk_reals("Current cartesian coordinates", bohr),
+        _fchk_reals("Real atomic weights", [_MASSES[z] for z in atomnos]),
+        _fchk_int("Number of contracted shells", nbasis),
+        _fchk_int("Number of primitive shells", nbasis),
+        _fchk_ints("Shell types", [0] * nbasis),
+        _fchk_ints("Number of primitives per shell", [1] * nbasis),
+        _fchk_ints("Shell to atom map", shell_map),
+        _fchk_reals("Primitive exponents", [rng.uniform(0.1, 50.0) for _ in range(nbasis)]),
+        _fchk_reals("Contraction coefficients", [1.0] * nbasis),
+        _fchk_reals("Coordinates of each shell", [c for atom in shell_map for c in bohr[3 * (atom - 1):3 * atom]]),
+        _fchk_real("SCF Energy", energy),
+        _fchk_real("Total Energy", energy),
+        _fchk_reals("Alpha Orbital Energies", sorted(rng.uniform(-20.0, 5.0) for _ in range(nbasis))),
+        _fchk_reals("Alpha MO coefficients", mo_coeffs),
+        _fchk_reals("Mulliken Charges", [rng.uniform(-0.5, 0.5) for _ in range(natom)]),
+        _fchk_reals("Dipole Moment", [rng.uniform(-2.0, 2.0) for _ in range(3)]),
+    ]
+    text = "".join(parts)
+    if not complete:
+        # Cut the file in the middle of the MO coefficients, like an interrupted formchk
+        cut = text.index("Alpha MO coefficients")
+        text = text[:cut + (len(text) - cut) // 2]
+    path = Path(path)
+    path.write_text(text)
+    return path
+
+
+def write_xyz(
+    path: PathLike,
+    natom: int = 10,
+    nframes: int = 1,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic (multi-frame) XYZ file, e.g. an MD trajectory.
+
+    Successive frames follow a small random walk, and the comment line carries the
+    frame index and a synthetic energy.
+
+    Args:
+        path: Output path
+        natom: Number of atoms per frame
+        nframes: Number of frames
+        seed: Random seed
+
+    Returns:
+        Path of the written file
+    """
+    rng = random.Random(seed)
+    atomnos, coords = random_molecule(natom, seed)
+    energy = -37.8 * sum(atomnos) / 6
+    path = Path(path)
+    with open(path, "w") as f:
+        for frame in range(nframes):
+            f.write(f"{natom}\nframe={frame} energy={energy + rng.uniform(-0.01, 0.01):.8f}\n")
+            for z, xyz in zip(atomnos, coords):
+                f.write(f"{_SYMBOLS[z]:<2} {xyz[0]:14.8f} {xyz[1]:14.8f} {xyz[2]:14.8f}\n")
+            coords = [[c + rng.gauss(0.0, 0.01) for c in xyz] for xyz in coords]
+    return path
+
+
+def write_cube(
+    path: PathLike,
+    natom: int = 10,
+    shape: Tuple[int, int, int] = (20, 20, 20),
+    spacing: float = 0.2,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic Gaussian cube file with a density-like volumetric grid.
+
+    Args:
+        path: Output path
+        natom: Number of atoms
+        shape: Number of grid points along each axis
+        spacing: Grid spacing (bohr)
+        seed: Random seed
+
+    Returns:
+        Path of the written file
+    """
+    atomnos, coords = random_molecule(natom, seed)
+    bohr = [[c * BOHR_PER_ANGSTROM for c in xyz] for xyz in coords]
+    nx, ny, nz = shape
+    origin = [-(n - 1) * spacing / 2 for n in shape]
+    path = Path(path)
+    with open(path, "w") as f:
+        f.write("synthetic cube\nelectron density\n")
+        f.write(f"{natom:5d}{origin[0]:12.6f}{origin[1]:12.6f}{origin[2]:12.6f}\n")
+        for axis, n in enumerate(shape):
+            vec = [spacing if k == axis else 0.0 for k in range(3)]
+            f.write(f"{n:5d}{vec[0]:12.6f}{vec[1]:12.6f}{vec[2]:12.6f}\n")
+        for z, (x, y, c) in zip(atomnos, bohr):
+            f.write(f"{z:5d}{float(z):12.6f}{x:12.6f}{y:12.6f}{c:12.6f}\n")
+        # Sum of Slater-like densities of the first (up to) 8 atoms, z fastest; the other atoms
+        # only appear in the header, which keeps large grids cheap to generate
+        for i in range(nx):
+            x = origin[0] + i * spacing
+            for j in range(ny):
+                y = origin[1] + j * spacing
+                row = []
+                for k in range(nz):
+                    zz = origin[2] + k * spacing
+                    value = 0.0
+                    for ax, ay, az in bohr[:8]:
+                        value += math.exp(-2.0 * math.sqrt((x - ax) ** 2 + (y - ay) ** 2 + (zz - az) ** 2))
+                    row.append(value)
+                for start in range(0, nz, 6):
+                    f.write("".join(f"{v:13.5E}" for v in row[start:start + 6]) + "\n")
+    return path
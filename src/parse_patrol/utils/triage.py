@@ -0,0 +1,300 @@
+"""
+Fast triage of corrupted computational chemistry files.
+
+Every file is checked cheaply, from its head and tail only (see `parse_patrol.utils.sniff`):
+
+- `empty`: zero length
+- `binary`: NUL bytes in a text format (binary Gaussian .chk files are expected)
+- `encoding`: head or tail are not valid UTF-8
+- `truncated`: a program log without its normal-termination message in the tail
+- `fchk_incomplete`: a formatted checkpoint section with fewer values than declared
+
+FCHK sections are validated by seeking over their fixed-width value blocks, so even
+multi-GB checkpoints only cost a read per section header.
+Files are checked in parallel threads; full parses (`parse=True`) run only for files that
+pass, in the shared process pool of `parse_patrol.utils.pool`. A missing path is reported as
+an `unreadable` file rather than raised.
+
+```python
+from parse_patrol.utils.triage import triage
+
+report = triage(".data", parse=True)
+for item in report.corrupted:
+    print(item.path, [issue.code for issue in item.issues])
+```
+"""
+
+import codecs
+import math
+import os
+import re
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from .sniff import FileSignature, read_probe, sniff
+from .pool import get_pool
+from .sources import is_virtual, open_binary, source_stat
+
+TriageStatus = Literal["ok", "corrupted", "parsed", "parse_failed"]
+
+
+class TriageIssue(BaseModel):
+    """A single problem found in a file."""
+
+    code: Literal["unreadable", "empty", "binary", "encoding", "truncated", "fchk_incomplete"] = Field(description="Machine-readable issue type")
+    detail: str = Field(description="Human-readable explanation")
+
+
+class FileTriage(BaseModel):
+    """Triage result of one file."""
+
+    path: str = Field(description="Path of the file")
+    size: int = Field(default=0, description="File size in bytes")
+    status: TriageStatus = Field(description="'corrupted' if any issue was found, 'ok' if not; 'parsed'/'parse_failed' after a full parse")
+    issues: List[TriageIssue] = Field(default_factory=list, description="Problems found by the cheap checks")
+    program: Optional[str] = Field(default=None, description="Sniffed program (e.g., 'gaussian')")
+    file_type: Optional[str] = Field(default=None, description="Sniffed file type (e.g., 'log', 'fchk')")
+    parser: Optional[str] = Field(default=None, description="Parser used for the full parse")
+    parse_error: Optional[str] = Field(default=None, description="Error raised or reported by the full parse")
+
+
+class TriageReport(BaseModel):
+    """Machine-readable triage report of a set of files."""
+
+    files: List[FileTriage] = Field(default_factory=list, description="Per-file results, sorted by path")
+    counts: Dict[str, int] = Field(default_factory=dict, description="Number of files per status")
+
+    @property
+    def corrupted(self) -> List[FileTriage]:
+        """Files that failed the cheap checks or the full parse."""
+        return [f for f in self.files if f.status in ("corrupted", "parse_failed")]
+
+
+# Fixed-width layout of formatted checkpoint arrays: values per line, characters per value
+_FCHK_LAYOUT = {b"I": (6, 12), b"R": (5, 16), b"C": (5, 12), b"L": (72, 1)}
+_FCHK_HEADER = re.compile(rb"^([A-Za-z].{0,41}?)\s+([IRCL])\s+(N=)?\s*([-+]?\S+)\s*$")
+
+# Programs whose logs have a normal-termination message (see sniff signatures)
+_TERMINATING_TYPES = ("log", "outcar")
+
+
+def _check_encoding(head: bytes, tail: bytes) -> Optional[TriageIssue]:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        decoder.decode(head, final=False)  # the probe may cut a multi-byte character
+        start = 0
+        while start < min(len(tail), 3) and 0x80 <= tail[start] <= 0xBF:
+            start += 1  # skip continuation bytes of a character cut at the tail offset
+        tail[start:].decode("utf-8")
+    except UnicodeDecodeError as e:
+        return TriageIssue(code="encoding", detail=f"Invalid UTF-8: {e.reason}")
+    return None
+
+
+def check_fchk(filepath: str) -> Optional[TriageIssue]:
+    """Check that every FCHK array section holds as many values as its header declares.
+
+    Sections in the standard fixed-width layout are skipped with a seek; any other
+    section is read line by line.
+
+    Args:
+        filepath: Path of the formatted checkpoint file
+
+    Returns:
+        A `fchk_incomplete` issue, or None if the file is complete
+    """
+    # Compressed sources have no cheap size; seeks past their end are caught by `tell()` instead
+    size = None if is_virtual(filepath) else os.path.getsize(filepath)
+    with open_binary(filepath) as f:
+        f.readline()  # title
+        f.readline()  # job type, method, basis
+        while True:
+            line = f.readline()
+            if not line or not line.strip():
+                return None
+            m = _FCHK_HEADER.match(line)
+            if not m:
+                return TriageIssue(code="fchk_incomplete", detail=f"Unexpected line at byte {f.tell() - len(line)}: {line[:40]!r}")
+            if not m.group(3):
+                continue  # scalar
+            label, kind, count = m.group(1).decode("ascii", "replace"), m.group(2), int(m.group(4))
+
+            start = f.tell()
+            per_line, width = _FCHK_LAYOUT[kind]
+            eol = 2 if line.endswith(b"\r\n") else 1
+            full, rest = divmod(count, per_line)
+            nbytes = full * (per_line * width + eol) + (rest * width + eol if rest else 0)
+            if size is None or start + nbytes <= size:
+                f.seek(start + nbytes)
+                following = f.readline() if f.tell() == start + nbytes else None
+                if following is not None and (not following or _FCHK_HEADER.match(following)):
+                    f.seek(start + nbytes)
+                    continue
+
+            # Non-standard layout (or truncated): read the section
+            f.seek(start)
+            if kind in (b"C", b"L"):
+                # String values may contain blanks, so count lines instead
+                for _ in range(math.ceil(count / per_line)):
+                    if not f.readline():
+                        return TriageIssue(code="fchk_incomplete", detail=f"Section '{label}' ends early")
+                continue
+            found = 0
+            while found < count:
+                line = f.readline()
+                if not line or _FCHK_HEADER.match(line):
+                    return TriageIssue(code="fchk_incomplete", detail=f"Section '{label}' has {found} of {count} values")
+                found += len(line.split())
+
+
+def triage_file(filepath: str) -> FileTriage:
+    """Run the cheap checks on a single file.
+
+    Args:
+        filepath: Path of the file
+
+    Returns:
+        FileTriage with status 'ok' or 'corrupted'
+    """
+    try:
+        size = source_stat(filepath).st_size
+        if size == 0:
+            return FileTriage(path=filepath, status="corrupted", issues=[TriageIssue(code="empty", detail="File is empty")])
+        head, tail = read_probe(filepath, size)
+        info = sniff(filepath, probe=(head, tail))
+    except OSError as e:
+        return FileTriage(path=filepath, status="corrupted", issues=[TriageIssue(code="unreadable", detail=str(e))])
+
+    issues: List[TriageIssue] = []
+    if info.binary:
+        if info.file_type not in ("chk", "archive"):
+            issues.append(TriageIssue(code="binary", detail="NUL bytes in the file header"))
+    else:
+        issue = _check_encoding(head, tail)
+        if issue:
+            issues.append(issue)
+        if info.file_type in _TERMINATING_TYPES and info.completed is False:
+            issues.append(TriageIssue(code="truncated", detail=f"No normal-termination message at the end of the {info.program} output"))
+        if info.file_type == "fchk":
+            try:
+                issue = check_fchk(filepath)
+            except (OSError, ValueError) as e:
+                issue = TriageIssue(code="fchk_incomplete", detail=str(e))
+            if issue:
+                issues.append(issue)
+
+    return FileTriage(
+        path=filepath,
+        size=size,
+        status="corrupted" if issues else "ok",
+        issues=issues,
+        program=info.program,
+        file_type=info.file_type,
+    )
+
+
+def _default_parser(info: FileSignature) -> Optional[str]:
+    """Name of the parse function suited for a sniffed file."""
+    if info.program == "gaussian" and info.file_type in ("log", "input", "fchk"):
+        return "gaussian_parse"
+    if info.cclib_parser:
+        return "cclib_parse"
+    if info.iodata_format:
+        return "iodata_parse"
+    return None
+
+
+def _full_parse(filepath: str, name: str) -> Tuple[TriageStatus, Optional[str]]:
+    """Parse a file in a worker process; returns only the status and error, not the model."""
+    import parse_patrol
+
+    try:
+        model = getattr(parse_patrol, name)(filepath)
+    except Exception as e:
+        return "parse_failed", f"{type(e).__name__}: {e}"
+    error = (getattr(model, "metadata", None) or {}).get("error")
+    return ("parse_failed", error) if error else ("parsed", None)
+
+
+def iter_files(root: str, recursive: bool = True) -> Iterable[str]:
+    """Yield the regular files under `root` (or `root` itself if it is a file), skipping hidden entries.
+
+    Raises:
+        FileNotFoundError: If `root` does not exist
+    """
+    if os.path.isfile(root):
+        yield root
+        return
+    if not os.path.isdir(root):
+        raise FileNotFoundError(f"No such file or directory: '{root}'")
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
+
+def triage(
+    paths: Union[str, Iterable[str]],
+    parse: bool = False,
+    recursive: bool = True,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> TriageReport:
+    """Triage files or directory trees in parallel.
+
+    Args:
+        paths: A file or directory, or an iterable of them; missing ones are reported as 'unreadable'
+        parse: Fully parse the files that pass the checks, with the parser matching their sniffed type
+        recursive: Descend into subdirectories
+        max_workers: Number of threads for the cheap checks (default: ThreadPoolExecutor's default)
+        executor: Executor for the full parses (default: the shared pool of `utils.pool`)
+
+    Returns:
+        TriageReport with per-file results and counts per status
+    """
+    roots = [paths] if isinstance(paths, (str, os.PathLike)) else list(paths)
+    files = set()
+    missing = []
+    for root in map(os.fspath, roots):
+        if not os.path.exists(root):
+            missing.append(root)
+            continue
+        files.update(iter_files(root, recursive))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as threads:
+        results = list(threads.map(triage_file, sorted(files)))
+    results.extend(
+        FileTriage(path=root, status="corrupted", issues=[TriageIssue(code="unreadable", detail="No such file or directory")])
+        for root in missing
+    )
+    results.sort(key=lambda result: result.path)
+
+    if parse:
+        import parse_patrol
+
+        executor = executor or get_pool()
+        futures: List[Tuple[FileTriage, Future]] = []
+        for result in results:
+            name = _default_parser(sniff(result.path)) if result.status == "ok" else None
+            if name and hasattr(parse_patrol, name):
+                result.parser = name
+                futures.append((result, executor.submit(_full_parse, result.path, name)))
+        for result, future in futures:
+            try:
+                result.status, result.parse_error = future.result()
+            except Exception as e:  # e.g., the worker died
+                result.status, result.parse_error = "parse_failed", f"{type(e).__name__}: {e}"
+
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    return TriageReport(files=results, counts=counts)
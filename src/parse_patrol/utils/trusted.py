@@ -0,0 +1,80 @@
+"""
+Trusted construction of parser models, without re-validating parser output.
+
+`ccdata_to_model` and `iodata_to_model` fill their models with values that were just
+converted from cclib/iodata NumPy arrays with `.tolist()`, so they already have the
+declared types. Validating them again visits every element: for 100k-atom coordinates or
+a cube grid, that costs about as much as the conversion itself. The converters therefore
+build models with `model_construct` by default, and validate on demand:
+
+- per call: `iodata_parse(path, validate=True)`
+- globally: the `PARSE_PATROL_VALIDATE` environment variable (`1`, `true`, ...)
+- after the fact: `validate_model(model)`
+
+```python
+from parse_patrol.utils.trusted import build_model, validate_model
+
+model = build_model(IODataModel, fields)   # no validation
+checked = validate_model(model)            # raises pydantic.ValidationError on bad data
+```
+"""
+
+import os
+import typing
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+VALIDATE_ENV = "PARSE_PATROL_VALIDATE"
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def resolve_validate(validate: Optional[bool]) -> bool:
+    """The `validate` argument, or the `PARSE_PATROL_VALIDATE` environment variable when it is None."""
+    if validate is None:
+        return os.environ.get(VALIDATE_ENV, "").strip().lower() not in {"", "0", "false", "no", "off"}
+    return validate
+
+
+def _model_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The model class of a `Model` or `Optional[Model]` field annotation."""
+    for candidate in (annotation, *typing.get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+def _construct(cls: Type[M], fields: Dict[str, Any]) -> M:
+    # model_construct does not build nested models: do it for dict values of model fields
+    for name, value in fields.items():
+        info = cls.model_fields.get(name)
+        nested = _model_type(info.annotation) if info is not None and isinstance(value, dict) else None
+        if nested is not None:
+            fields[name] = _construct(nested, value)
+    return cls.model_construct(**fields)
+
+
+def build_model(cls: Type[M], fields: Dict[str, Any], validate: Optional[bool] = None) -> M:
+    """Build a model from converted parser output, validating only if asked to.
+
+    Args:
+        cls: Model class
+        fields: Field values, of the declared types (nested models as dicts)
+        validate: Validate the fields (default: `PARSE_PATROL_VALIDATE` environment variable)
+
+    Raises:
+        pydantic.ValidationError: If validating and a field does not match its type
+    """
+    if resolve_validate(validate):
+        return cls(**fields)
+    return _construct(cls, dict(fields))
+
+
+def validate_model(model: M) -> M:
+    """Validate a (trusted-built) model, returning a validated copy.
+
+    Raises:
+        pydantic.ValidationError: If a field does not match its type
+    """
+    return type(model).model_validate(model.model_dump(warnings=False))  # mismatches are reported by the validation
@@ -0,0 +1,185 @@
+"""
+Compact binary (MessagePack) encoding of parse results, for service-to-service transfer.
+
+JSON writes every float as up to 24 characters of text, and reading it back means parsing
+that text and rebuilding nested lists. `encode` writes a model as MessagePack instead, with
+its numeric array fields (coordinates, MO coefficients, Hessians, cube grids, ...) packed as
+raw little-endian buffers in a NumPy extension type. A payload is an envelope
+
+    {"schema": SCHEMA_VERSION, "type": "<model class name>", "data": {<fields>}}
+
+so the receiver can rebuild the right model (`CCDataModel`, `CustomGaussianDataModel`,
+`IODataModel` or `MergedModel`) and refuse payloads written by a newer format version.
+
+```python
+from parse_patrol.utils.wire import decode, encode
+
+payload = encode(model)                    # bytes
+model = decode(payload)                    # the same model, with plain lists
+fields = decode(payload, as_model=False)   # field dict, arrays as read-only np.ndarray
+```
+
+Requires `msgpack` (`pip install parse-patrol[msgpack]`) and NumPy for the array fields.
+Numeric lists come back as lists of the array's type: a list mixing ints and floats is
+decoded as floats.
+"""
+
+import importlib
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from .serialize import _round
+from .shm import SharedResult, _element_count, _restore
+from .trusted import build_model
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - exercised without the msgpack extra
+    msgpack = None  # type: ignore[assignment]
+
+SCHEMA_VERSION = 1
+EXT_NDARRAY = 1
+MIN_ARRAY_ELEMENTS = 8  # shorter numeric lists are cheaper as plain MessagePack arrays
+
+# Models a payload may name, as (module, class): only these are rebuilt by `decode`
+MODELS: Dict[str, Tuple[str, str]] = {
+    "CCDataModel": ("parse_patrol.parsers.cclib.utils", "CCDataModel"),
+    "CustomGaussianDataModel": ("parse_patrol.parsers.gaussian.utils", "CustomGaussianDataModel"),
+    "IODataModel": ("parse_patrol.parsers.iodata.utils", "IODataModel"),
+    "MergedModel": ("parse_patrol.dispatch", "MergedModel"),
+}
+
+
+def _require_msgpack() -> None:
+    if msgpack is None:
+        raise ImportError("msgpack is required for the binary format: pip install parse-patrol[msgpack]")
+
+
+def _pack_value(value: Any) -> Any:
+    """Models as field dicts, and rectangular numeric lists as NumPy arrays."""
+    if isinstance(value, BaseModel):
+        return {name: _pack_value(getattr(value, name)) for name in type(value).model_fields}
+    if isinstance(value, dict):
+        return {key: _pack_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if _element_count(list(value) if isinstance(value, tuple) else value) >= MIN_ARRAY_ELEMENTS:
+            try:
+                import numpy as np
+
+                array = np.asarray(value)
+            except (ImportError, ValueError):  # no NumPy, or a ragged list
+                array = None
+            if array is not None and array.dtype.kind in "biuf":
+                return array
+        return [_pack_value(item) for item in value]
+    return value
+
+
+def _default(value: Any) -> Any:
+    """Types MessagePack does not pack natively (called by it for each such value)."""
+    if hasattr(value, "dtype") and hasattr(value, "shape"):
+        if value.ndim == 0:  # NumPy scalar
+            return value.item()
+        if value.dtype.kind not in "biuf":
+            return value.tolist()
+        array = value.astype(value.dtype.newbyteorder("<"), copy=False)
+        header = msgpack.packb((array.dtype.str, list(array.shape)))
+        return msgpack.ExtType(EXT_NDARRAY, header + array.tobytes())
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    # Anything else (e.g., timedelta, Path) as Pydantic would write it; raises TypeError otherwise
+    return to_jsonable_python(value)
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code != EXT_NDARRAY:
+        return msgpack.ExtType(code, data)
+    import numpy as np
+
+    unpacker = msgpack.Unpacker(use_list=True)
+    unpacker.feed(data)
+    dtype, shape = unpacker.unpack()
+    offset = unpacker.tell()
+    return np.frombuffer(data, dtype=np.dtype(dtype), offset=offset).reshape(shape)
+
+
+def _to_lists(value: Any) -> Any:
+    if hasattr(value, "dtype") and hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, dict):
+        return {key: _to_lists(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_to_lists(item) for item in value]
+    return value
+
+
+def model_class(name: str) -> type:
+    """The model class registered under `name` in `MODELS`.
+
+    Raises:
+        ValueError: If the name is not registered
+        ImportError: If the model's parser dependencies are missing
+    """
+    if name not in MODELS:
+        raise ValueError(f"Unknown model type {name!r} (expected one of {sorted(MODELS)})")
+    module, attribute = MODELS[name]
+    return getattr(importlib.import_module(module), attribute)
+
+
+def encode(result: Any, precision: Optional[int] = None) -> bytes:
+    """Encode a parse result as MessagePack bytes.
+
+    Args:
+        result: A model (or SharedResult), or any structure of dicts, lists, numbers and NumPy arrays
+        precision: Round floats to this many decimals before packing (default: full precision)
+
+    Returns:
+        Envelope with the schema version, the model class name (None for plain data) and the fields
+
+    Raises:
+        ImportError: If msgpack is not installed
+    """
+    _require_msgpack()
+    if isinstance(result, SharedResult):
+        # Pack straight from the shared arrays, then drop the views so the block can be freed
+        with result.attach() as arrays:
+            restored = _restore(result.skeleton, arrays.values())
+            payload = encode(restored, precision)
+            del restored
+        return payload
+    name = type(result).__name__ if isinstance(result, BaseModel) else None
+    data = _pack_value(result)
+    if precision is not None:
+        data = _round(data, precision)
+    envelope = {"schema": SCHEMA_VERSION, "type": name, "data": data}
+    return msgpack.packb(envelope, default=_default, use_bin_type=True)
+
+
+def decode(payload: bytes, as_model: bool = True, validate: Optional[bool] = None) -> Any:
+    """Decode MessagePack bytes written by `encode`.
+
+    Args:
+        payload: Encoded result
+        as_model: Rebuild the model with plain lists; if False, return the encoded fields
+            with arrays as read-only NumPy arrays over the payload (no per-element copies)
+        validate: Validate the rebuilt model (default: `PARSE_PATROL_VALIDATE` environment variable)
+
+    Raises:
+        ImportError: If msgpack is not installed
+        ValueError: If the payload is not an envelope of a supported schema version, or names an unknown model
+    """
+    _require_msgpack()
+    envelope = msgpack.unpackb(payload, ext_hook=_ext_hook, raw=False, strict_map_key=False)
+    if not isinstance(envelope, dict) or "schema" not in envelope or "data" not in envelope:
+        raise ValueError("Not a parse-patrol payload (missing schema or data)")
+    if envelope["schema"] > SCHEMA_VERSION:
+        raise ValueError(f"Unsupported payload schema version {envelope['schema']} (this version reads up to {SCHEMA_VERSION})")
+    data = envelope["data"]
+    if not as_model:
+        return data
+    data = _to_lists(data)
+    if envelope.get("type") is None:
+        return data
+    return build_model(model_class(envelope["type"]), data, validate)
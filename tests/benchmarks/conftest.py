@@ -0,0 +1,89 @@
+"""
+Shared fixtures for the parser benchmark suite.
+
+Inputs are generated locally with `parse_patrol.utils.synthetic` (deterministic, no network access) and scale with the sizes listed in
+the `PARSE_PATROL_BENCH_SIZES` environment variable (comma-separated, default "1,10,100").
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.utils.synthetic import write_cube, write_gaussian_fchk, write_gaussian_gjf, write_gaussian_log, write_xyz
+
+DATA_DIR = Path(__file__).resolve().parents[2] / ".pipelines" / "data" / "gaussian"
+FREQUENCY_LOG = DATA_DIR / "FREQUENCY.LOG"
+
+BENCH_SIZES = [int(n) for n in os.environ.get("PARSE_PATROL_BENCH_SIZES", "1,10,100").split(",")]
+
+_throughput: List[str] = []
+
+
+def record_throughput(benchmark, nbytes: int, nfiles: int = 1) -> None:
+    """Store MB/s and files/s in the benchmark's extra info (saved with `--benchmark-autosave`)."""
+    stats = getattr(benchmark, "stats", None)
+    if stats is None:  # benchmarks disabled
+        return
+    mean = stats.stats.mean
+    benchmark.extra_info["bytes"] = nbytes
+    benchmark.extra_info["MB/s"] = nbytes / mean / 1e6
+    benchmark.extra_info["files/s"] = nfiles / mean
+    _throughput.append(f"{benchmark.name:<60} {nbytes / 1e6:9.3f} MB {nbytes / mean / 1e6:9.2f} MB/s {nfiles / mean:9.1f} files/s")
+
+
+def pytest_terminal_summary(terminalreporter):
+    if _throughput:
+        terminalreporter.section("parser throughput")
+        for line in _throughput:
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture
+def throughput():
+    """The `record_throughput` helper, as a fixture."""
+    return record_throughput
+
+
+@pytest.fixture(scope="session")
+def frequency_log() -> Path:
+    """The bundled 109 KB frequency calculation log."""
+    return FREQUENCY_LOG
+
+
+@pytest.fixture(scope="session")
+def bench_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("bench")
+
+
+@pytest.fixture(scope="session", params=BENCH_SIZES, ids=lambda n: f"steps{n}")
+def gaussian_log(request, bench_dir) -> Path:
+    return write_gaussian_log(bench_dir / f"opt_{request.param}.log", natom=10, opt_steps=request.param, nfreq=24)
+
+
+@pytest.fixture(scope="session", params=BENCH_SIZES, ids=lambda n: f"nbasis{20 * n}")
+def gaussian_fchk(request, bench_dir) -> Path:
+    return write_gaussian_fchk(bench_dir / f"mo_{request.param}.fchk", natom=2, nbasis=20 * request.param)
+
+
+@pytest.fixture(scope="session", params=BENCH_SIZES, ids=lambda n: f"natom{10 * n}")
+def gaussian_gjf(request, bench_dir) -> Path:
+    return write_gaussian_gjf(bench_dir / f"input_{request.param}.gjf", natom=10 * request.param)
+
+
+@pytest.fixture(scope="session", params=BENCH_SIZES, ids=lambda n: f"natom{100 * n}")
+def xyz_file(request, bench_dir) -> Path:
+    return write_xyz(bench_dir / f"coords_{request.param}.xyz", natom=100 * request.param)
+
+
+@pytest.fixture(scope="session", params=BENCH_SIZES, ids=lambda n: f"grid{10 * n}k")
+def cube_file(request, bench_dir) -> Path:
+    side = round((10_000 * request.param) ** (1 / 3))
+    return write_cube(bench_dir / f"grid_{request.param}.cube", shape=(side, side, side))
@@ -0,0 +1,224 @@
+"""
+Performance benchmarks for the parsers, the model converters and JSON serialization.
+
+Requires `pytest-benchmark` (`uv sync --extra bench`); skipped otherwise.
+See `tests/README.md` for storing and comparing baselines.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _import_or_skip(module_path: str, *names: str):
+    try:
+        module = __import__(module_path, fromlist=list(names))
+    except ImportError:
+        pytest.skip(f"{module_path} dependencies not available")
+    return [getattr(module, name) for name in names]
+
+
+@pytest.fixture(scope="module")
+def gaussian():
+    return _import_or_skip("parse_patrol.parsers.gaussian.utils", "gaussian_parse")[0]
+
+
+@pytest.fixture(scope="module")
+def cclib_api():
+    return _import_or_skip("parse_patrol.parsers.cclib.utils", "cclib_parse", "ccdata_to_model", "cclib")
+
+
+@pytest.fixture(scope="module")
+def iodata_api():
+    return _import_or_skip("parse_patrol.parsers.iodata.utils", "iodata_parse", "iodata_to_model", "iodata_package")
+
+
+# Gaussian parser
+
+@pytest.mark.benchmark(group="gaussian-log")
+def test_gaussian_parse_log(benchmark, gaussian, gaussian_log, throughput):
+    result = benchmark(gaussian, str(gaussian_log))
+    assert result.scfenergies
+    throughput(benchmark, gaussian_log.stat().st_size)
+
+
+@pytest.mark.benchmark(group="gaussian-log")
+def test_gaussian_parse_bundled_log(benchmark, gaussian, throughput, frequency_log):
+    result = benchmark(gaussian, str(frequency_log))
+    assert result.vibfreqs
+    throughput(benchmark, frequency_log.stat().st_size)
+
+
+@pytest.mark.benchmark(group="gaussian-fchk")
+def test_gaussian_parse_fchk(benchmark, gaussian, gaussian_fchk, throughput):
+    result = benchmark(gaussian, str(gaussian_fchk))
+    assert result.natom
+    throughput(benchmark, gaussian_fchk.stat().st_size)
+
+
+@pytest.mark.benchmark(group="gaussian-gjf")
+def test_gaussian_parse_gjf(benchmark, gaussian, gaussian_gjf, throughput):
+    result = benchmark(gaussian, str(gaussian_gjf))
+    assert result.natom
+    throughput(benchmark, gaussian_gjf.stat().st_size)
+
+
+# Numeric conversion: bulk tokenizer vs one float() per token
+
+@pytest.fixture(scope="module")
+def fortran_block():
+    import random
+
+    rng = random.Random(0)
+    values = [f"{rng.uniform(-10, 10):16.8E}".replace("E", "D") for _ in range(200_000)]
+    return "\n".join(" ".join(values[i:i + 5]) for i in range(0, len(values), 5)).encode()
+
+
+@pytest.mark.benchmark(group="numeric")
+def test_fortran_floats_bulk(benchmark, fortran_block, throughput):
+    fortran_floats = _import_or_skip("parse_patrol.utils.numeric", "fortran_floats")[0]
+    result = benchmark(fortran_floats, fortran_block)
+    assert len(result) == 200_000
+    throughput(benchmark, len(fortran_block))
+
+
+@pytest.mark.benchmark(group="numeric")
+def test_fortran_floats_per_token(benchmark, fortran_block, throughput):
+    _safe_float = _import_or_skip("parse_patrol.parsers.gaussian.utils", "_safe_float")[0]
+    result = benchmark(lambda: [_safe_float(token) for token in fortran_block.split()])
+    assert len(result) == 200_000
+    throughput(benchmark, len(fortran_block))
+
+
+# cclib parser
+
+@pytest.mark.benchmark(group="cclib")
+def test_cclib_parse_log(benchmark, cclib_api, gaussian_log, throughput):
+    cclib_parse, _, _ = cclib_api
+    result = benchmark.pedantic(cclib_parse, args=(str(gaussian_log),), rounds=3, iterations=1)
+    assert result.scfenergies
+    throughput(benchmark, gaussian_log.stat().st_size)
+
+
+@pytest.mark.benchmark(group="cclib")
+def test_cclib_parse_bundled_log(benchmark, cclib_api, throughput, frequency_log):
+    cclib_parse, _, _ = cclib_api
+    result = benchmark.pedantic(cclib_parse, args=(str(frequency_log),), rounds=5, iterations=1)
+    assert result.vibfreqs
+    throughput(benchmark, frequency_log.stat().st_size)
+
+
+@pytest.mark.benchmark(group="converters")
+def test_ccdata_to_model(benchmark, cclib_api, frequency_log):
+    _, ccdata_to_model, cclib = cclib_api
+    ccdata = cclib.io.ccopen(str(frequency_log)).parse()
+    result = benchmark(ccdata_to_model, ccdata, str(frequency_log))
+    assert result.natom
+
+
+# iodata parser
+
+@pytest.mark.benchmark(group="iodata")
+def test_iodata_parse_xyz(benchmark, iodata_api, xyz_file, throughput):
+    iodata_parse, _, _ = iodata_api
+    result = benchmark(iodata_parse, str(xyz_file))
+    assert result.atnums
+    throughput(benchmark, xyz_file.stat().st_size)
+
+
+@pytest.mark.benchmark(group="converters")
+def test_iodata_to_model(benchmark, iodata_api, xyz_file):
+    _, iodata_to_model, iodata_package = iodata_api
+    data = iodata_package.load_one(str(xyz_file))
+    result = benchmark(iodata_to_model, data, str(xyz_file))
+    assert result.atcoords
+
+
+# Model validation: validated vs trusted (model_construct) conversion of the same parse
+
+@pytest.mark.benchmark(group="validation-cclib")
+@pytest.mark.parametrize("validate", [True, False], ids=["validated", "trusted"])
+def test_ccdata_to_model_validation(benchmark, cclib_api, gaussian_log, validate):
+    _, ccdata_to_model, cclib = cclib_api
+    ccdata = cclib.io.ccopen(str(gaussian_log)).parse()
+    result = benchmark(ccdata_to_model, ccdata, str(gaussian_log), validate)
+    assert result.scfenergies
+
+
+@pytest.mark.benchmark(group="validation-iodata-xyz")
+@pytest.mark.parametrize("validate", [True, False], ids=["validated", "trusted"])
+def test_iodata_to_model_validation(benchmark, iodata_api, xyz_file, validate):
+    _, iodata_to_model, iodata_package = iodata_api
+    data = iodata_package.load_one(str(xyz_file))
+    result = benchmark(iodata_to_model, data, str(xyz_file), validate)
+    assert result.atcoords
+
+
+@pytest.mark.benchmark(group="validation-iodata-cube")
+@pytest.mark.parametrize("validate", [True, False], ids=["validated", "trusted"])
+def test_iodata_cube_validation(benchmark, iodata_api, cube_file, validate):
+    _, iodata_to_model, iodata_package = iodata_api
+    data = iodata_package.load_one(str(cube_file))
+    result = benchmark(iodata_to_model, data, str(cube_file), validate)
+    assert result.cube.shape
+
+
+# Model serialization
+
+@pytest.mark.benchmark(group="serialization")
+def test_gaussian_model_json(benchmark, gaussian, gaussian_log, throughput):
+    model = gaussian(str(gaussian_log))
+    payload = benchmark(model.model_dump_json)
+    throughput(benchmark, len(payload))
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_cclib_model_json(benchmark, cclib_api, throughput, frequency_log):
+    cclib_parse, _, _ = cclib_api
+    model = cclib_parse(str(frequency_log))
+    payload = benchmark(model.model_dump_json)
+    throughput(benchmark, len(payload))
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_iodata_model_json(benchmark, iodata_api, xyz_file, throughput):
+    iodata_parse, _, _ = iodata_api
+    model = iodata_parse(str(xyz_file))
+    payload = benchmark(model.model_dump_json)
+    throughput(benchmark, len(payload))
+
+
+@pytest.mark.benchmark(group="serialization-cube")
+@pytest.mark.parametrize("path", ["model_dump_json", "dump_fast", "dump_fast-shared"])
+def test_cube_json(benchmark, iodata_api, cube_file, throughput, path):
+    iodata_parse, _, _ = iodata_api
+    dump_fast = _import_or_skip("parse_patrol.utils.serialize", "dump_fast")[0]
+    share = _import_or_skip("parse_patrol.utils.shm", "share")[0]
+    model = iodata_parse(str(cube_file))
+    if path == "model_dump_json":
+        payload = benchmark(model.model_dump_json)
+    elif path == "dump_fast":
+        payload = benchmark(dump_fast, model)
+    else:  # as received from a worker process: arrays in shared memory (sharing itself not timed)
+        payload = benchmark.pedantic(dump_fast, setup=lambda: ((share(model),), {}), rounds=10)
+    throughput(benchmark, len(payload))
+
+
+@pytest.mark.benchmark(group="wire-cube")
+@pytest.mark.parametrize("step", ["json-encode", "json-decode", "msgpack-encode", "msgpack-decode", "msgpack-decode-arrays"])
+def test_cube_wire(benchmark, iodata_api, cube_file, throughput, step):
+    iodata_parse, _, _ = iodata_api
+    encode, decode = _import_or_skip("parse_patrol.utils.wire", "encode", "decode")
+    _import_or_skip("msgpack", "packb")
+    model = iodata_parse(str(cube_file))
+    if step == "json-encode":
+        payload = benchmark(model.model_dump_json)
+    elif step == "json-decode":
+        payload = model.model_dump_json()
+        benchmark(type(model).model_validate_json, payload)
+    elif step == "msgpack-encode":
+        payload = benchmark(encode, model)
+    else:
+        payload = encode(model)
+        benchmark(decode, payload, as_model=step == "msgpack-decode")
+    throughput(benchmark, len(payload))
@@ -0,0 +1,15 @@
+"""
+Shared test setup.
+"""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def parser_stats_file(tmp_path_factory):
+    """Keep the learned parser order of the test run (and its pool workers) out of the user's cache."""
+    os.environ["PARSE_PATROL_STATS"] = str(tmp_path_factory.mktemp("stats") / "parser_stats.json")
+    yield
+    os.environ.pop("PARSE_PATROL_STATS", None)
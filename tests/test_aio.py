@@ -0,0 +1,89 @@
+"""
+Tests for the asyncio parse API.
+"""
+
+import sys
+import os
+import asyncio
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol import aio
+from parse_patrol.parsers.gaussian.utils import gaussian_parse
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestAio:
+    """Test suite for the async parsers and parse_stream."""
+
+    @pytest.fixture(autouse=True)
+    def pool(self):
+        aio.configure(2)
+        yield
+        aio.shutdown()
+
+    @pytest.mark.unit
+    def test_parse(self):
+        """Async parsers return the same model as the sync ones, also for in-memory data."""
+        reference = gaussian_parse(FREQUENCY_LOG)
+
+        async def main():
+            with open(FREQUENCY_LOG, "rb") as f:
+                data = f.read()
+            return await asyncio.gather(
+                aio.gaussian_parse(FREQUENCY_LOG), aio.gaussian_parse(memoryview(data)), aio.parse_any(FREQUENCY_LOG)
+            )
+
+        from_path, from_memory, any_model = asyncio.run(main())
+        assert from_path.final_energy == from_memory.final_energy == reference.final_energy
+        assert any_model.metadata["parse_any"]["parser"] == "gaussian"
+
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(aio.parse_any("missing.log"))
+
+    @pytest.mark.unit
+    def test_parse_stream(self, tmp_path):
+        """Results cover every source; failures are reported, and `ordered` keeps input order."""
+        (tmp_path / "junk.log").write_bytes(b"\x00\x01" * 100)
+        paths = [FREQUENCY_LOG, str(tmp_path / "junk.log"), FREQUENCY_LOG, str(tmp_path / "missing.log")]
+
+        async def collect(sources, **kwargs):
+            return [result async for result in aio.parse_stream(sources, **kwargs)]
+
+        async def produce():
+            for path in paths:
+                await asyncio.sleep(0)
+                yield path
+
+        results = asyncio.run(collect(paths, parser="gaussian", max_pending=1, ordered=True))
+        assert [r.source for r in results] == paths
+        assert [r.error is None for r in results] == [True, False, True, False]
+        assert results[0].model.final_energy == results[2].model.final_energy
+
+        results = asyncio.run(collect(produce(), max_pending=3))
+        assert sorted(r.source for r in results) == sorted(paths)
+        assert sum(r.error is None for r in results) == 2
+
+    @pytest.mark.unit
+    def test_backpressure_and_cancel(self):
+        """A consumer that stops early leaves no work behind; at most max_pending jobs are in flight."""
+        started = []
+
+        def sources():
+            for _ in range(100):
+                started.append(1)
+                yield FREQUENCY_LOG
+
+        async def main():
+            stream = aio.parse_stream(sources(), parser="gaussian", max_pending=2)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        assert asyncio.run(main()).error is None
+        assert len(started) <= 3
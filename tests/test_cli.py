@@ -0,0 +1,114 @@
+"""
+Tests for the parse-patrol command line tool.
+"""
+
+import sys
+import os
+import json
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.cli import expand_paths, main
+from parse_patrol.dispatch import STATS
+from parse_patrol.utils.synthetic import write_gaussian_log
+
+
+def _records(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestCli:
+    """Test suite for `parse-patrol parse`."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        snapshot = STATS.to_dict()
+        root = tmp_path / "tree"
+        (root / "sub").mkdir(parents=True)
+        write_gaussian_log(root / "a.log", natom=3, opt_steps=1, seed=1)
+        write_gaussian_log(root / "sub" / "b.log", natom=4, opt_steps=2, seed=2)
+        write_gaussian_log(root / "sub" / "c.log", natom=5, opt_steps=1, seed=3)
+        (root / "notes.txt").write_text("not a chemistry file\n")
+        yield root
+        STATS.load(snapshot)
+
+    @pytest.mark.unit
+    def test_expand_paths(self, tree):
+        """Directories are walked, globs expanded, and every file listed once."""
+        files = list(expand_paths([str(tree / "sub"), str(tree / "**" / "*.log")]))
+        assert [os.path.basename(f) for f in files] == ["b.log", "c.log", "a.log"]
+        with pytest.raises(FileNotFoundError):
+            list(expand_paths([str(tree / "missing")]))
+
+    @pytest.mark.unit
+    def test_parse_and_resume(self, tree, tmp_path, capsys):
+        """Records are appended per file, and a rerun after an interrupted write parses only the rest."""
+        output = tmp_path / "results.jsonl"
+        assert main(["parse", str(tree / "**" / "*.log"), "-o", str(output), "-j", "1", "--fields", "natom,final_energy"]) == 0
+        records = _records(output)
+        assert {r["status"] for r in records} == {"ok"}
+        assert sorted(r["data"]["natom"] for r in records) == [3, 4, 5]
+        assert set(records[0]["data"]) == {"natom", "final_energy"}
+        assert "3 ok" in capsys.readouterr().err
+
+        # An interrupted run: the last record is torn
+        with open(output, "rb") as f:
+            content = f.read()
+        with open(output, "wb") as f:
+            f.write(content[:-20])
+        assert main(["parse", str(tree), "-o", str(output), "-j", "1", "-q"]) == 0
+        err = capsys.readouterr().err
+        assert "2 already done" in err and "1 ok" in err and "1 unsupported" in err
+        records = _records(output)
+        assert len(records) == 4 and len({r["path"] for r in records}) == 4
+
+    @pytest.mark.unit
+    def test_parallel_json_output(self, tree, tmp_path):
+        """Worker processes parse the files; per-file JSON results are listed in the checkpoint."""
+        output = tmp_path / "results"
+        assert main(["parse", str(tree / "sub"), "-o", str(output), "-f", "json", "-j", "2", "-p", "gaussian"]) == 0
+        checkpoint = _records(output / "_checkpoint.jsonl")
+        assert len(checkpoint) == 2 and {r["parser"] for r in checkpoint} == {"gaussian"}
+        for entry in checkpoint:
+            with open(output / entry["result"]) as f:
+                assert json.load(f)["data"]["natom"] in (4, 5)
+        assert main(["parse", str(tree / "missing"), "-o", str(output)]) == 2
+
+    @pytest.mark.unit
+    def test_parquet_resume_and_restart(self, tree, tmp_path):
+        """Parquet parts share one schema, and neither an interrupted run nor --restart duplicates rows."""
+        ds = pytest.importorskip("pyarrow.dataset")
+        output = tmp_path / "results"
+        args = ["parse", str(tree), "-o", str(output), "-f", "parquet", "-j", "1", "-q", "--batch-size", "1"]
+        assert main(args) == 0
+
+        def rows():
+            table = ds.dataset(str(output), format="parquet").to_table()
+            return sorted(table.column("path").to_pylist()), table.schema
+
+        paths, schema = rows()
+        assert len(paths) == 4 and len(set(paths)) == 4
+        assert str(schema.field("natom").type) == "int64" and str(schema.field("metadata").type) == "string"
+
+        # Interrupted after the last part was written, before its checkpoint line
+        lines = (output / "_checkpoint.jsonl").read_bytes().splitlines(keepends=True)
+        (output / "_checkpoint.jsonl").write_bytes(b"".join(lines[:-1]))
+        assert main(args) == 0
+        assert rows()[0] == paths
+
+        assert main(args + ["--restart"]) == 0
+        assert rows()[0] == paths
+        assert len(list(output.glob("part-*.parquet"))) == 4
+
+    @pytest.mark.unit
+    def test_json_restart(self, tree, tmp_path):
+        """--restart removes the per-file results of the earlier run."""
+        output = tmp_path / "results"
+        assert main(["parse", str(tree), "-o", str(output), "-f", "json", "-j", "1", "-q"]) == 0
+        assert main(["parse", str(tree / "a.log"), "-o", str(output), "-f", "json", "-j", "1", "-q", "--restart"]) == 0
+        assert [p.name for p in output.glob("*.json")] == [_records(output / "_checkpoint.jsonl")[0]["result"]]
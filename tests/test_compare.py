@@ -0,0 +1,74 @@
+"""
+Tests for the cross-parser comparison engine and the canonical field mapping.
+"""
+
+import sys
+import os
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+pytest.importorskip("numpy")
+
+from parse_patrol import available_parsers
+from parse_patrol.compare import compare_corpus, compare_models, compare_parsers
+from parse_patrol.dispatch import STATS
+from parse_patrol.utils.synthetic import write_gaussian_fchk
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestCompare:
+    """Test suite for per-field agreement across parsers."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_stats(self):
+        snapshot = STATS.to_dict()
+        yield
+        STATS.load(snapshot)
+
+    @pytest.fixture
+    def all_parsers(self):
+        if not {"gaussian", "cclib", "iodata"} <= set(available_parsers()):
+            pytest.skip("Gaussian, cclib and iodata parsers required")
+
+    @pytest.mark.unit
+    def test_log_fields_agree(self, all_parsers):
+        """The Gaussian parser and cclib agree on a log once units are aligned."""
+        report = compare_parsers(FREQUENCY_LOG)
+        assert report.parsers == ["gaussian", "cclib"]
+        assert "iodata" in report.errors  # iodata does not read Gaussian logs
+        fields = {field.name: field for field in report.fields}
+        for name in ("atomic_numbers", "coordinates", "total_energy", "frequencies", "enthalpy"):
+            assert fields[name].agree, name
+        assert fields["total_energy"].unit == "hartree"
+        assert report.disagreements == []
+
+    @pytest.mark.unit
+    def test_fchk_units_aligned(self, all_parsers, tmp_path):
+        """Bohr (iodata) and angstrom (cclib, gaussian) coordinates are compared in angstrom."""
+        path = write_gaussian_fchk(tmp_path / "mo.fchk", natom=3, nbasis=20)
+        report = compare_corpus([str(path)], max_workers=2)[0]
+        assert sorted(report.parsers) == ["cclib", "gaussian", "iodata"]
+        coordinates = next(field for field in report.fields if field.name == "coordinates")
+        assert coordinates.agree and coordinates.max_abs_diff < 1e-8
+        assert len(coordinates.values) == 3
+
+    @pytest.mark.unit
+    def test_disagreement(self):
+        """Differences beyond tolerance, shape mismatches and single reports are told apart."""
+        from parse_patrol.parsers.cclib.utils import CCDataModel
+        from parse_patrol.parsers.iodata.utils import IODataModel
+        cclib_model = CCDataModel(natom=2, atomnos=[1, 1], atomcoords=[[[0.0, 0.0, 0.0], [0.0, 0.0, 0.74]]], scfenergies=[-27.211386245988])
+        iodata_model = IODataModel(atnums=[1, 1, 1], atcoords=[[0.0, 0.0, 0.0], [0.0, 0.0, 1.4]], energy=-1.1)
+        fields = {field.name: field for field in compare_models({"cclib": cclib_model, "iodata": iodata_model})}
+        assert fields["natom"].agree is False
+        assert fields["atomic_numbers"].agree is False and fields["atomic_numbers"].max_abs_diff is None
+        assert fields["total_energy"].agree is False
+        assert fields["total_energy"].max_abs_diff == pytest.approx(0.1)
+        assert fields["total_energy"].values["cclib"] == pytest.approx(-1.0)
+        tolerant = {field.name: field for field in compare_models({"cclib": cclib_model, "iodata": iodata_model}, tolerances={"total_energy": (0.0, 0.2)})}
+        assert tolerant["total_energy"].agree is True
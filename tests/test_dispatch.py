@@ -0,0 +1,120 @@
+"""
+Tests for the unified `parse_any` entry point and its strategies.
+"""
+
+import sys
+import os
+import subprocess
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.dispatch import ParserStats, STATS, candidate_parsers, parse_any
+from parse_patrol.utils.synthetic import write_gaussian_fchk, write_xyz
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestDispatch:
+    """Test suite for parser selection, fallback, race and merge."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_stats(self):
+        snapshot = STATS.to_dict()
+        STATS.clear()
+        yield
+        STATS.load(snapshot)
+
+    @pytest.fixture
+    def gaussian_and_cclib(self):
+        from parse_patrol import available_parsers
+        if not {"gaussian", "cclib"} <= set(available_parsers()):
+            pytest.skip("Gaussian and cclib parsers required")
+
+    @pytest.mark.unit
+    def test_learned_order(self):
+        """Parsers that fail for a file type move to the back; faster ones to the front."""
+        stats = ParserStats()
+        assert stats.order("gaussian:log", ["gaussian", "cclib"]) == ["gaussian", "cclib"]
+        for _ in range(3):
+            stats.record("gaussian:log", "gaussian", False, 0.01)
+            stats.record("gaussian:log", "cclib", True, 0.5)
+        assert stats.order("gaussian:log", ["gaussian", "cclib"]) == ["cclib", "gaussian"]
+        assert stats.order("gaussian:fchk", ["gaussian", "cclib"]) == ["gaussian", "cclib"]
+
+    @pytest.mark.unit
+    def test_order_shared_between_processes(self, tmp_path, monkeypatch):
+        """Counts merged into the stats file by one process order the parsers of the next."""
+        path = str(tmp_path / "parser_stats.json")
+        stats = ParserStats(persist=True, path=path)
+        for _ in range(3):
+            stats.record("gaussian:log", "gaussian", False, 0.01)
+            stats.record("gaussian:log", "cclib", True, 0.5)
+        stats.sync()
+        ParserStats(persist=True, path=path).record("gaussian:log", "iodata", True, 0.1)  # not merged yet
+
+        monkeypatch.setenv("PARSE_PATROL_STATS", path)
+        code = "from parse_patrol.dispatch import STATS; print(','.join(STATS.order('gaussian:log', ['gaussian', 'cclib'])))"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env={**os.environ, "PYTHONPATH": src_path})
+        assert result.stdout.strip() == "cclib,gaussian"
+
+        # A second process adds its counts at exit; a third sees both
+        code = "from parse_patrol.dispatch import STATS; STATS.record('gaussian:log', 'cclib', False, 0.5)"
+        subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": src_path})
+        merged = ParserStats(persist=True, path=path)
+        merged.order("gaussian:log", [])
+        assert merged.to_dict()["gaussian:log"]["cclib"] == {"successes": 3, "failures": 1, "time": 2.0}
+
+    @pytest.mark.unit
+    def test_fallback(self, gaussian_and_cclib):
+        """The first suited parser that succeeds wins, and the attempt is recorded."""
+        assert candidate_parsers(FREQUENCY_LOG)[:2] == ["gaussian", "cclib"]
+        result = parse_any(FREQUENCY_LOG)
+        assert result.metadata["parse_any"]["parser"] == "gaussian"
+        assert STATS.to_dict()["gaussian:log"]["gaussian"]["successes"] == 1
+
+        # An explicit order with a parser unsuited for logs falls back
+        result = parse_any(FREQUENCY_LOG, parsers=["iodata", "cclib"])
+        assert result.metadata["parse_any"]["parser"] == "cclib"
+        assert "iodata" in result.metadata["parse_any"]["errors"]
+
+    @pytest.mark.unit
+    def test_race(self, gaussian_and_cclib):
+        """Racing parsers in processes returns one good result."""
+        result = parse_any(FREQUENCY_LOG, strategy="race", parsers=["cclib", "gaussian"], timeout=60)
+        assert result.metadata["parse_any"]["parser"] in ("cclib", "gaussian")
+        assert result.atomcoords
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="POSIX shared memory in /dev/shm required")
+    def test_race_frees_shared_results(self, gaussian_and_cclib, tmp_path):
+        """Shared-memory results of losers and of racers cut off by the timeout are freed."""
+        path = str(write_gaussian_fchk(tmp_path / "big.fchk", natom=4, nbasis=200))  # cclib shares its MOs
+        before = set(os.listdir("/dev/shm"))
+        for timeout in (0.05, 0.2, 0.5, 60):
+            try:
+                parse_any(path, strategy="race", parsers=["gaussian", "cclib"], timeout=timeout)
+            except ValueError:
+                pass
+        assert set(os.listdir("/dev/shm")) - before == set()
+
+    @pytest.mark.unit
+    def test_merge(self, gaussian_and_cclib):
+        """Merged fields use canonical names and record which parser provided them."""
+        merged = parse_any(FREQUENCY_LOG, strategy="merge", parsers=["gaussian", "cclib"])
+        assert merged.parsers == ["gaussian", "cclib"]
+        assert merged.provenance["frequencies"] == "gaussian"
+        assert merged.provenance["moenergies"] == "cclib"
+        assert merged.data["natom"] == 20
+        assert "vibfreqs" not in merged.data
+        assert merged.data["total_energy"] == pytest.approx(-291.0768, abs=1e-4)
+
+    @pytest.mark.unit
+    def test_no_parser(self, tmp_path):
+        """Files no parser handles raise a ValueError listing the errors."""
+        path = write_xyz(tmp_path / "coords.xyz", natom=3)
+        with pytest.raises(ValueError):
+            parse_any(str(path), parsers=["gaussian"])
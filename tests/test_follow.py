@@ -0,0 +1,136 @@
+"""
+Tests for incremental parsing of growing Gaussian logs.
+"""
+
+import sys
+import os
+import random
+import time
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.parsers.gaussian.follow import GaussianLogFollower, GaussianLogWatcher
+from parse_patrol.parsers.gaussian.utils import gaussian_parse
+from parse_patrol.utils.synthetic import write_gaussian_log
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+def _fields(model):
+    return {k: v for k, v in model if k != "metadata"}
+
+
+class TestFollow:
+    """Test suite for the log follower and watcher."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_chunks_match_full_parse(self, tmp_path, seed):
+        """Feeding a log in arbitrary chunks (cutting lines and blocks) gives the full-parse result."""
+        for path in (FREQUENCY_LOG, write_gaussian_log(tmp_path / "opt.log", natom=8, opt_steps=5, nfreq=6, seed=seed)):
+            data = open(path, "rb").read()
+            follower = GaussianLogFollower(str(path))
+            rng = random.Random(seed)
+            start = 0
+            while start < len(data):
+                end = start + rng.randint(1, 4000)
+                follower.feed(data[start:end])
+                start = end
+            assert _fields(follower.snapshot()) == _fields(gaussian_parse(str(path)))
+            assert follower.completed
+
+    @pytest.mark.unit
+    def test_poll_growing_log(self, tmp_path):
+        """Polls only read appended bytes; the geometry is the last complete block."""
+        source = write_gaussian_log(tmp_path / "source.log", natom=5, opt_steps=3, seed=2)
+        data = source.read_bytes()
+        cut = data.index(b"Standard orientation", data.index(b"Step number   2 ")) + 200  # mid-block
+
+        live = tmp_path / "live.log"
+        live.write_bytes(data[:cut])
+        follower = GaussianLogFollower(str(live))
+        model = follower.poll()
+        assert follower.offset == cut
+        assert model.metadata["geometries"] == 2
+        assert model.metadata["opt_step"] == 2
+        assert not model.metadata["completed"]
+
+        with open(live, "ab") as f:
+            f.write(data[cut:])
+        model = follower.poll()
+        assert follower.offset == len(data)
+        assert model.atomcoords == gaussian_parse(str(source)).atomcoords
+        assert model.metadata["optimization_converged"] and model.metadata["completed"]
+        assert all(item["converged"] for item in model.metadata["convergence"].values())
+
+        # A restarted job (shorter file) is parsed from the start
+        live.write_bytes(data[:cut])
+        assert follower.poll().metadata["geometries"] == 2
+
+    @pytest.mark.unit
+    def test_poll_replaced_log(self, tmp_path):
+        """A log replaced by a longer one, by rename or rewritten in place, is parsed from the start."""
+        live = write_gaussian_log(tmp_path / "live.log", natom=3, opt_steps=1, seed=5, complete=False)
+        follower = GaussianLogFollower(str(live))
+        assert follower.poll().natom == 3
+
+        renamed = write_gaussian_log(tmp_path / "restart.log", natom=6, opt_steps=2, seed=6)
+        os.replace(renamed, live)
+        assert _fields(follower.poll()) == _fields(gaussian_parse(str(live)))
+
+        # Same inode and a later mtime, but other first bytes
+        other = write_gaussian_log(tmp_path / "other.log", natom=8, opt_steps=4, seed=7)
+        assert other.stat().st_size > live.stat().st_size
+        live.write_bytes(other.read_bytes())
+        assert _fields(follower.poll()) == _fields(gaussian_parse(str(other)))
+        assert follower.offset == other.stat().st_size
+
+    @pytest.mark.unit
+    def test_watcher(self, tmp_path):
+        """The watcher reports only logs that changed, and skips missing ones."""
+        first = write_gaussian_log(tmp_path / "first.log", natom=3, seed=3)
+        second = write_gaussian_log(tmp_path / "second.log", natom=4, seed=4)
+        watcher = GaussianLogWatcher([str(first), str(second), str(tmp_path / "pending.log")])
+        assert set(watcher.poll()) == {str(first), str(second)}
+        assert watcher.poll() == {}
+        with open(second, "a") as f:
+            f.write(" SCF Done:  E(RB3LYP) =  -1.0     A.U. after   10 cycles\n")
+        changed = watcher.poll()
+        assert list(changed) == [str(second)]
+        assert changed[str(second)].final_energy == -1.0
+        watcher.remove(str(tmp_path / "pending.log"))
+        assert [path for path, _ in watcher.watch(interval=0)] == []  # all terminated: stops at once
+
+    @pytest.mark.unit
+    def test_watcher_prune(self, tmp_path, monkeypatch):
+        """Followers of terminated jobs are pruned, and so are idle ones given a TTL."""
+        done = write_gaussian_log(tmp_path / "done.log", natom=3, seed=3)
+        running = write_gaussian_log(tmp_path / "running.log", natom=3, complete=False, seed=4)
+        watcher = GaussianLogWatcher([str(done), str(running)])
+        watcher.poll()
+        assert watcher.prune(idle=60) == [str(done)]
+        assert watcher.paths == [str(running)]
+
+        clock = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: clock + 120)
+        assert watcher.prune() == []
+        assert watcher.prune(idle=60) == [str(running)]
+        assert watcher.paths == []
+
+    @pytest.mark.unit
+    def test_follow_tool_drops_finished_jobs(self, tmp_path):
+        """The MCP tool does not keep a follower once its job terminated."""
+        pytest.importorskip("mcp")
+        from parse_patrol.parsers.gaussian import __main__ as server
+
+        done = write_gaussian_log(tmp_path / "done.log", natom=3, seed=3)
+        running = write_gaussian_log(tmp_path / "running.log", natom=3, complete=False, seed=4)
+        assert server._follow(str(done)).metadata["completed"]
+        assert not server._follow(str(running)).metadata["completed"]
+        assert str(done) not in server._watcher.paths
+        assert str(running) in server._watcher.paths
+        server._watcher.remove(str(running))
@@ -0,0 +1,93 @@
+"""
+Tests for streaming the frames of multi-frame files with iodata.
+"""
+
+import sys
+import os
+import asyncio
+import time
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol import available_parsers
+from parse_patrol.utils.synthetic import write_xyz
+
+pytestmark = pytest.mark.skipif("iodata" not in available_parsers(), reason="iodata not installed")
+
+
+class TestFrames:
+    """Test suite for iodata_iter_frames and iodata_sample_frames."""
+
+    @pytest.fixture
+    def trajectory(self, tmp_path):
+        return str(write_xyz(tmp_path / "md.xyz", natom=5, nframes=50, seed=3))
+
+    @pytest.mark.unit
+    def test_iter_frames(self, trajectory):
+        """Frames come out lazily, sliced like a list, as models or NumPy arrays."""
+        from parse_patrol.parsers.iodata.utils import iodata_iter_frames, iodata_parse
+
+        frames = iodata_iter_frames(trajectory, start=10, stop=40, step=10)
+        first = next(frames)
+        assert first.index == 10 and first.title.startswith("frame=10 ")
+        assert [frame.index for frame in frames] == [20, 30]
+
+        all_frames = list(iodata_iter_frames(trajectory))
+        assert len(all_frames) == 50
+        assert all_frames[0].atcoords == iodata_parse(trajectory).atcoords
+        assert all_frames[0].atcoords != all_frames[1].atcoords
+
+        raw = next(iodata_iter_frames(trajectory, start=49, arrays=True))
+        assert raw.atcoords.shape == (5, 3)
+        assert raw.atcoords.tolist() == all_frames[49].atcoords
+
+    @pytest.mark.unit
+    def test_sample_frames(self, trajectory):
+        """Sampling counts every frame in range and keeps a reproducible, ordered sample."""
+        from parse_patrol.parsers.iodata.utils import iodata_sample_frames
+
+        sample = iodata_sample_frames(trajectory, samples=4, step=2, seed=1)
+        assert sample.nframes == 25
+        indices = [frame.index for frame in sample.frames]
+        assert len(indices) == 4 and indices == sorted(indices)
+        assert all(index % 2 == 0 for index in indices)
+        assert all(frame.title.startswith(f"frame={frame.index} ") for frame in sample.frames)
+        assert indices == [frame.index for frame in iodata_sample_frames(trajectory, samples=4, step=2, seed=1).frames]
+
+        assert iodata_sample_frames(trajectory, samples=0).frames == []
+        assert len(iodata_sample_frames(trajectory, samples=100).frames) == 50
+
+    @pytest.mark.unit
+    def test_sample_tool_off_event_loop(self, trajectory, monkeypatch):
+        """The MCP sampling tool leaves the event loop free while it reads the trajectory."""
+        pytest.importorskip("mcp")
+        from parse_patrol.parsers.iodata import __main__ as server
+        from parse_patrol.parsers.iodata.utils import iodata_sample_frames
+
+        def slow_sample(*args, **kwargs):
+            time.sleep(0.5)  # a long trajectory
+            return iodata_sample_frames(*args, **kwargs)
+
+        monkeypatch.setattr(server, "iodata_sample_frames", slow_sample)
+
+        async def main():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.create_task(tick())
+            sample = await server.iodata_sample_trajectory(trajectory, samples=3)
+            ticker.cancel()
+            return sample, ticks
+
+        sample, ticks = asyncio.run(main())
+        assert sample.nframes == 50 and len(sample.frames) == 3
+        assert ticks >= 10
@@ -0,0 +1,79 @@
+"""
+Tests for the section offset index of Gaussian logs.
+"""
+
+import sys
+import os
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.parsers.gaussian import index
+from parse_patrol.parsers.gaussian.index import IndexedLog, build_index, index_path, load_index
+from parse_patrol.parsers.gaussian.utils import gaussian_parse
+from parse_patrol.utils.synthetic import write_gaussian_log
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestLogIndex:
+    """Test suite for build_index, load_index and IndexedLog."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PARSE_PATROL_CACHE_DIR", str(tmp_path / "cache"))
+        index._memory.clear()
+        return tmp_path / "cache"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("kwargs", [{"natom": 6, "opt_steps": 4, "nfreq": 5}, {"natom": 4, "opt_steps": 2, "nfreq": 3, "link1": True}])
+    def test_model_matches_full_parse(self, tmp_path, kwargs):
+        """Reading only the indexed sections gives the same model as a full parse."""
+        for path in (FREQUENCY_LOG, str(write_gaussian_log(tmp_path / "job.log", **kwargs))):
+            reference = gaussian_parse(path).model_dump()
+            model = IndexedLog(path).to_model().model_dump()
+            reference["metadata"]["source"] = model["metadata"]["source"]
+            assert model == reference
+
+    @pytest.mark.unit
+    def test_sections_and_queries(self, tmp_path):
+        path = str(write_gaussian_log(tmp_path / "job.log", natom=5, opt_steps=3, nfreq=4, link1=True))
+        built = build_index(path)
+        with open(path, "rb") as f:
+            for offset in built.sections["scf"]:
+                f.seek(offset)
+                assert b"SCF Done:" in f.readline()
+        log = IndexedLog(path)
+        assert log.jobs == 2
+        assert log.geometries == len(built.sections["orientation"]) > 1
+        reference = gaussian_parse(path)
+        assert log.energies() == reference.scfenergies
+        assert log.geometry() == (reference.atomnos, reference.atomcoords)
+        assert log.geometry(0) != log.geometry()
+
+        model = log.query(["energies", "thermochemistry"])
+        assert model.final_energy == reference.final_energy and model.zpve == reference.zpve
+        assert model.atomcoords is None and model.vibfreqs is None
+        with pytest.raises(ValueError):
+            log.query(["orbitals"])
+
+    @pytest.mark.unit
+    def test_cache(self, tmp_path, cache_dir, monkeypatch):
+        """The index is saved and reused; a changed log is indexed anew."""
+        path = str(write_gaussian_log(tmp_path / "job.log", natom=3, nfreq=2))
+        load_index(path)
+        assert os.path.exists(index_path(path))
+        assert str(cache_dir) in index_path(path)
+
+        index._memory.clear()
+        monkeypatch.setattr(index, "build_index", lambda p: pytest.fail("index rebuilt"))
+        assert load_index(path).sections["frequencies"]
+        monkeypatch.undo()
+        monkeypatch.setenv("PARSE_PATROL_CACHE_DIR", str(cache_dir))
+
+        with open(path, "ab") as f:
+            f.write(b" SCF Done:  E(RB3LYP) =  -1.00000000     A.U. after    1 cycles\n")
+        assert IndexedLog(path).energies()[-1] == -1.0
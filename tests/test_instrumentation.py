@@ -0,0 +1,66 @@
+"""
+Tests for the opt-in parse instrumentation layer.
+Uses the bundled Gaussian example files, so no network access is required.
+"""
+
+import sys
+import os
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.pipelines', 'data', 'gaussian')
+FREQUENCY_LOG = os.path.join(DATA_DIR, 'FREQUENCY.LOG')
+
+
+class TestInstrumentation:
+    """Test suite for per-stage parse instrumentation."""
+
+    @pytest.fixture(autouse=True)
+    def setup_imports(self, monkeypatch):
+        """Import the Gaussian parser, skipping if its dependencies are missing."""
+        try:
+            from parse_patrol.parsers.gaussian.utils import gaussian_parse
+        except ImportError:
+            pytest.skip("Gaussian parser dependencies not available")
+        from parse_patrol.utils import instrumentation
+        monkeypatch.delenv(instrumentation.INSTRUMENT_ENV, raising=False)
+        self.gaussian_parse = gaussian_parse
+        self.instrumentation = instrumentation
+
+    @pytest.mark.unit
+    def test_disabled_by_default(self):
+        """Without opt-in, no record is attached to the result."""
+        result = self.gaussian_parse(FREQUENCY_LOG)
+        assert "instrumentation" not in (result.metadata or {})
+
+    @pytest.mark.unit
+    def test_record_attached_and_hook_called(self):
+        """An instrumented parse attaches per-stage records and notifies hooks."""
+        records = []
+        hook = self.instrumentation.register_hook(records.append)
+        try:
+            result = self.gaussian_parse(FREQUENCY_LOG, instrument=True)
+        finally:
+            self.instrumentation.unregister_hook(hook)
+
+        record = result.metadata["instrumentation"]
+        assert record["parser"] == "gaussian"
+        assert record["file_size"] == os.path.getsize(FREQUENCY_LOG)
+        assert [s["name"] for s in record["stages"]] == ["sniff", "read", "extract", "geometry", "validate"]
+        assert all(s["peak_memory"] is not None for s in record["stages"])
+        assert record["wall_time"] >= sum(s["wall_time"] for s in record["stages"])
+
+        assert len(records) == 1
+        assert records[0].parser == "gaussian"
+
+    @pytest.mark.unit
+    def test_env_time_only(self, monkeypatch):
+        """The environment variable enables time-only instrumentation."""
+        monkeypatch.setenv(self.instrumentation.INSTRUMENT_ENV, "time")
+        result = self.gaussian_parse(FREQUENCY_LOG)
+        stages = result.metadata["instrumentation"]["stages"]
+        assert stages and all(s["peak_memory"] is None for s in stages)
@@ -0,0 +1,92 @@
+"""
+Tests for isolated parsing under time and memory limits.
+"""
+
+import sys
+import os
+import time
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.dispatch import STATS, parse_any
+from parse_patrol.utils import isolate
+from parse_patrol.utils.isolate import ParseLimitError, get_limits, isolated_parse, set_limits
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestIsolate:
+    """Test suite for isolated_parse, its limits and parse_any(isolated=True)."""
+
+    @pytest.fixture(autouse=True)
+    def workers(self, monkeypatch):
+        monkeypatch.setattr(isolate, "_DEFAULT_LIMITS", {})
+        monkeypatch.setattr(isolate, "_PARSER_LIMITS", {})
+        snapshot = STATS.to_dict()
+        yield
+        STATS.load(snapshot)
+        isolate.shutdown()
+
+    @pytest.mark.unit
+    def test_limit_resolution(self, monkeypatch):
+        """Call arguments win over per-parser limits, which win over defaults and the environment."""
+        monkeypatch.setenv("PARSE_PATROL_TIMEOUT", "30")
+        monkeypatch.setenv("PARSE_PATROL_MEMORY_MB", "2048")
+        set_limits(timeout=60)
+        set_limits("cclib", memory_mb=4096)
+        assert get_limits("gaussian") == isolate.Limits(timeout=60, memory_mb=2048)
+        assert get_limits("cclib", timeout=5) == isolate.Limits(timeout=5, memory_mb=4096)
+        with pytest.raises(ValueError, match="Unknown limits"):
+            set_limits("cclib", memory=1)
+
+    @pytest.mark.unit
+    def test_parse_and_reuse(self):
+        """A good parse returns the model, and the worker is kept for the next parse."""
+        result = isolated_parse("gaussian", FREQUENCY_LOG, timeout=60)
+        assert result.status == "ok" and result.model.final_energy is not None
+        assert result.unwrap() is result.model
+        worker = isolate._idle[-1]
+        assert isolated_parse("gaussian", FREQUENCY_LOG).status == "ok"
+        assert isolate._idle == [worker]
+
+        failed = isolated_parse(os.stat, "missing.log")
+        assert (failed.status, failed.error_type) == ("error", "FileNotFoundError")
+        with pytest.raises(FileNotFoundError):
+            failed.unwrap()
+
+    @pytest.mark.unit
+    def test_timeout_and_crash(self):
+        """Hanging and crashing parses are reported, and their workers replaced."""
+        start = time.perf_counter()
+        result = isolated_parse(time.sleep, 30, timeout=0.5)
+        assert result.status == "timeout" and time.perf_counter() - start < 10
+        assert isolate._idle == []
+        with pytest.raises(ParseLimitError) as info:
+            result.unwrap()
+        assert info.value.result.status == "timeout"
+
+        crashed = isolated_parse(os._exit, 3)
+        assert crashed.status == "crashed" and "code 3" in crashed.error
+        assert isolated_parse(abs, -2).model == 2
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(isolate.resource is None or not os.path.exists("/proc/self/statm"), reason="needs RLIMIT_AS and /proc")
+    def test_memory_limits(self):
+        """Allocations beyond the address-space cap fail, and resident memory beyond the RSS cap is killed."""
+        result = isolated_parse(bytearray, 8 << 30, memory_mb=1024)
+        assert result.status == "oom" and "1024 MiB" in result.error
+        result = isolated_parse(os.urandom, 512 << 20, rss_mb=100, timeout=60)
+        assert result.status == "oom" and "100 MiB" in result.error
+        assert isolated_parse(abs, -1).status == "ok"
+
+    @pytest.mark.unit
+    def test_parse_any_isolated(self):
+        """parse_any runs its attempts isolated and counts a limit hit as a failed attempt."""
+        model = parse_any(FREQUENCY_LOG, parsers=["gaussian"], isolated=True, timeout=60)
+        assert model.metadata["parse_any"]["parser"] == "gaussian"
+        with pytest.raises(ValueError, match="timeout"):
+            parse_any(FREQUENCY_LOG, parsers=["gaussian"], isolated=True, timeout=1e-3)
@@ -0,0 +1,99 @@
+"""
+Tests for per-job parsing of multi-job (Link1) Gaussian logs and inputs.
+"""
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.parsers.gaussian import index
+from parse_patrol.parsers.gaussian.jobs import gaussian_parse_jobs, iter_gaussian_jobs, log_job_spans
+from parse_patrol.parsers.gaussian.utils import gaussian_parse
+from parse_patrol.utils.synthetic import write_gaussian_gjf, write_gaussian_log
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestGaussianJobs:
+    """Test suite for iter_gaussian_jobs and gaussian_parse_jobs."""
+
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PARSE_PATROL_CACHE_DIR", str(tmp_path / "cache"))
+        index._memory.clear()
+
+    @pytest.mark.unit
+    def test_log_jobs_split(self, tmp_path):
+        """An opt + freq log gives one model per job, each with only its own results."""
+        path = str(write_gaussian_log(tmp_path / "job.log", natom=5, opt_steps=3, nfreq=4, link1=True))
+        opt, freq = gaussian_parse_jobs(path)
+        merged = gaussian_parse(path)
+
+        assert opt.scfenergies == merged.scfenergies[:3]
+        assert freq.scfenergies == merged.scfenergies[3:]
+        assert opt.vibfreqs is None and freq.vibfreqs == merged.vibfreqs
+        assert freq.sum_electronic_and_thermal_free_energies == merged.sum_electronic_and_thermal_free_energies
+        assert opt.route.startswith("#p opt") and "freq" in freq.route
+        assert [m.metadata["job"] for m in (opt, freq)] == [0, 1]
+        assert all(m.metadata["jobs"] == 2 and m.metadata["completed"] for m in (opt, freq))
+        assert opt.metadata["offset"] == 0 and freq.metadata["offset"] == log_job_spans(path)[1][0]
+
+    @pytest.mark.unit
+    def test_parallel_and_in_memory_match(self, tmp_path):
+        """Parallel, sequential and in-memory parsing give the same jobs."""
+        path = str(write_gaussian_log(tmp_path / "job.log", natom=4, opt_steps=2, nfreq=3, link1=True))
+        sequential = gaussian_parse_jobs(path, parallel=False)
+        with ThreadPoolExecutor(2) as executor:
+            assert gaussian_parse_jobs(path, parallel=True, executor=executor) == sequential
+        assert gaussian_parse_jobs(path, parallel=True, max_workers=2) == sequential
+
+        with open(path, "rb") as f:
+            in_memory = gaussian_parse_jobs(f.read())
+        assert [m.model_dump(exclude={"metadata"}) for m in in_memory] == [m.model_dump(exclude={"metadata"}) for m in sequential]
+        assert [m.metadata["offset"] for m in in_memory] == [m.metadata["offset"] for m in sequential]
+
+    @pytest.mark.unit
+    def test_single_job_log(self):
+        """A log without Link1 is one job, equal to the full parse."""
+        (model,) = gaussian_parse_jobs(FREQUENCY_LOG)
+        reference = gaussian_parse(FREQUENCY_LOG)
+        assert model.model_dump(exclude={"route", "metadata"}) == reference.model_dump(exclude={"route", "metadata"})
+        assert model.metadata["jobs"] == 1
+
+    @pytest.mark.unit
+    def test_input_jobs(self, tmp_path):
+        """Every job of a --Link1-- input is parsed, not only the first."""
+        path = write_gaussian_gjf(tmp_path / "job.gjf", natom=3, jobs=3)
+        jobs = list(iter_gaussian_jobs(path))
+
+        assert [m.title for m in jobs] == ["synthetic job 1", "synthetic job 2", "synthetic job 3"]
+        assert jobs[0].route.startswith("# opt") and all("freq" in m.route for m in jobs[1:])
+        assert all(m.natom == 3 and m.metadata["jobs"] == 3 for m in jobs)
+        assert jobs[0].model_dump(exclude={"metadata"}) == gaussian_parse(path).model_dump(exclude={"metadata"})
+
+    @pytest.mark.unit
+    def test_lazy(self, tmp_path):
+        """Jobs are parsed one at a time as the iterator advances."""
+        path = str(write_gaussian_log(tmp_path / "job.log", natom=4, opt_steps=2, nfreq=3, link1=True))
+        jobs = iter_gaussian_jobs(path)
+        assert next(jobs).metadata["job"] == 0
+        assert next(jobs).metadata["job"] == 1
+        with pytest.raises(StopIteration):
+            next(jobs)
+
+    @pytest.mark.unit
+    def test_wrapped_route(self, tmp_path):
+        """A route wrapped over several lines (even inside a keyword) is joined back."""
+        path = tmp_path / "wrapped.log"
+        write_gaussian_log(path, natom=3, link1=True)
+        text = path.read_text().replace(" #p b3lyp/6-31g(d)\n", " #p b3lyp/6-31g(d) scf=(tight,maxcy\n cle=200) int=ultrafine\n", 1)
+        path.write_text(text)
+        first = gaussian_parse_jobs(str(path))[0]
+        assert first.route == "#p b3lyp/6-31g(d) scf=(tight,maxcycle=200) int=ultrafine"
@@ -0,0 +1,99 @@
+"""
+Tests for the incremental-parsing manifest.
+"""
+
+import sys
+import os
+import json
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.utils.manifest import Manifest, scan
+from parse_patrol.utils.synthetic import write_gaussian_gjf, write_gaussian_log
+
+
+class TestManifest:
+    """Test suite for change detection and re-parsing."""
+
+    @pytest.fixture
+    def tree(self, tmp_path):
+        root = tmp_path / "tree"
+        for sub in ("a", "b"):
+            (root / sub).mkdir(parents=True)
+        write_gaussian_log(root / "a" / "opt.log", natom=4, opt_steps=2, seed=1)
+        write_gaussian_gjf(root / "b" / "job.gjf", natom=3, seed=2)
+        (root / "b" / "blob.bin").write_bytes(b"\x00\x01" * 64)
+        return root
+
+    @pytest.mark.unit
+    def test_rescan_skips_unchanged(self, tree, tmp_path):
+        """Only new or changed files are parsed again; touched files are recognized by their hash."""
+        db, results = tmp_path / "manifest.sqlite", tmp_path / "results"
+        with Manifest(str(db)) as manifest:
+            report = manifest.scan(str(tree), results_dir=str(results))
+            assert report.counts == {"new": 3, "parsed": 3}
+            log = manifest.get(str(tree / "a" / "opt.log"))
+            assert (log.status, log.parser, log.program, log.file_type) == ("parsed", "gaussian", "gaussian", "log")
+            assert json.load(open(log.result_path))["natom"] == 4
+            assert manifest.get(str(tree / "b" / "blob.bin")).status == "skipped"
+
+            assert manifest.scan(str(tree), results_dir=str(results)).counts == {"unchanged": 3}
+
+            os.utime(tree / "a" / "opt.log", ns=(0, 10**9))
+            write_gaussian_gjf(tree / "b" / "job.gjf", natom=5, seed=2)
+            (tree / "b" / "blob.bin").unlink()
+            report = manifest.scan(str(tree), results_dir=str(results))
+            assert report.changed == [str(tree / "b" / "job.gjf")]
+            assert report.removed == [str(tree / "b" / "blob.bin")]
+            assert report.unchanged == 1
+            assert manifest.get(str(tree / "a" / "opt.log")).mtime_ns == 10**9
+            assert json.load(open(manifest.get(str(tree / "b" / "job.gjf")).result_path))["natom"] == 5
+            assert len(manifest.entries()) == 2
+
+    @pytest.mark.unit
+    def test_file_deleted_during_scan(self, tree, tmp_path, monkeypatch):
+        """A file deleted between listing and stat is skipped, and reported as removed if it was known."""
+        from parse_patrol.utils import manifest as manifest_module
+        with Manifest(str(tmp_path / "manifest.sqlite")) as manifest:
+            assert manifest.scan(str(tree)).counts == {"new": 3, "parsed": 3}
+            listed = list(manifest_module.iter_files(str(tree), True))
+            monkeypatch.setattr(manifest_module, "iter_files", lambda root, recursive: iter(listed + [str(tree / "gone.log")]))
+            (tree / "b" / "blob.bin").unlink()
+            report = manifest.scan(str(tree))
+            assert report.removed == [str(tree / "b" / "blob.bin")]
+            assert report.counts == {"unchanged": 2, "removed": 1}
+
+    @pytest.mark.unit
+    def test_failures_and_explicit_parser(self, tree):
+        """Failed parses are recorded and only retried on request; the manifest skips itself."""
+        report = scan(str(tree), parser="iodata")
+        assert report.failed == [str(tree / "a" / "opt.log"), str(tree / "b" / "blob.bin")]
+        assert scan(str(tree), parser="iodata").counts == {"unchanged": 3}
+        report = scan(str(tree), parser="gaussian", retry_failed=True)
+        assert report.counts == {"unchanged": 1, "changed": 2, "parsed": 1, "failed": 1}
+        assert report.failed == [str(tree / "b" / "blob.bin")]
+        assert os.path.exists(tree / ".parse_patrol_manifest.sqlite")
+
+    @pytest.mark.unit
+    def test_interrupted_scan_keeps_progress(self, tree, tmp_path, monkeypatch):
+        """Files recorded before an interruption are committed; the next scan parses only the rest."""
+        db = str(tmp_path / "manifest.sqlite")
+        put = Manifest._put
+
+        def interrupt_second(self, entry):
+            if self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0] == 1:
+                raise KeyboardInterrupt
+            put(self, entry)
+
+        monkeypatch.setattr(Manifest, "_put", interrupt_second)
+        with Manifest(db) as manifest, pytest.raises(KeyboardInterrupt):
+            manifest.scan(str(tree), max_workers=1)
+        monkeypatch.setattr(Manifest, "_put", put)
+
+        with Manifest(db) as manifest:
+            assert len(manifest.entries()) == 1
+            assert manifest.scan(str(tree)).counts == {"unchanged": 1, "new": 2, "parsed": 2}
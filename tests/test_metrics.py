@@ -0,0 +1,109 @@
+"""
+Tests for the metrics registry and its Prometheus text exposition.
+"""
+
+import sys
+import os
+import asyncio
+import urllib.request
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.utils.metrics import (
+    CACHE_REQUESTS, MetricsRegistry, TOOL_CALLS, TOOL_ERRORS, TOOL_IN_FLIGHT,
+    label_parser, record_cache, start_http_server, track_tool,
+)
+from parse_patrol.utils.pool import create_pool
+
+
+class TestMetrics:
+    """Test suite for metrics collection and rendering."""
+
+    @pytest.mark.unit
+    def test_prometheus_rendering(self):
+        """Counters, gauges and histograms render in the Prometheus text format."""
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls.", ["tool"])
+        latency = registry.histogram("latency_seconds", "Latency.", ["tool"], buckets=[0.1, 1.0])
+        calls.inc(tool='say "hi"')
+        latency.observe(0.5, tool="a")
+
+        text = registry.render()
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{tool="say \\"hi\\""} 1.0' in text
+        assert 'latency_seconds_bucket{tool="a",le="0.1"} 0' in text
+        assert 'latency_seconds_bucket{tool="a",le="1.0"} 1' in text
+        assert 'latency_seconds_bucket{tool="a",le="+Inf"} 1' in text
+        assert 'latency_seconds_count{tool="a"} 1' in text
+
+        with pytest.raises(ValueError):
+            calls.inc(wrong="label")
+
+    @pytest.mark.unit
+    def test_track_tool(self):
+        """Wrapped tools count calls and errors by exception type, and keep their signature."""
+        async def sample_tool(filepath: str) -> str:
+            """Sample docstring."""
+            if filepath == "bad":
+                raise ValueError("bad input")
+            return filepath
+
+        tracked = track_tool(sample_tool, parser="test")
+        assert tracked.__doc__ == "Sample docstring."
+        assert asyncio.run(tracked(filepath="good")) == "good"
+        with pytest.raises(ValueError):
+            asyncio.run(tracked("bad"))
+
+        assert TOOL_CALLS.value(tool="sample_tool", parser="test") == 2
+        assert TOOL_ERRORS.value(tool="sample_tool", parser="test", exception="ValueError") == 1
+        assert TOOL_IN_FLIGHT.value(tool="sample_tool") == 0
+
+    @pytest.mark.unit
+    def test_reported_errors_and_parser_label(self):
+        """Errors returned in the result count as errors; tools can label the parser they used."""
+        class Result:
+            def __init__(self, metadata):
+                self.metadata = metadata
+
+        async def reporting_tool(filepath: str):
+            if filepath.endswith(".json"):
+                return '{"error": "unreadable"}'
+            label_parser("gaussian")
+            return [Result({}), Result({"error": "no SCF energies"})]
+
+        tracked = track_tool(reporting_tool, parser="auto")
+        asyncio.run(tracked("a.log"))
+        asyncio.run(tracked("a.json"))
+
+        assert TOOL_CALLS.value(tool="reporting_tool", parser="gaussian") == 1
+        assert TOOL_ERRORS.value(tool="reporting_tool", parser="gaussian", exception="ReportedError") == 1
+        assert TOOL_ERRORS.value(tool="reporting_tool", parser="auto", exception="ReportedError") == 1
+
+    @pytest.mark.unit
+    def test_worker_counts(self):
+        """Counters incremented in pool workers reach the registry of this process."""
+        pool = create_pool(1)
+        try:
+            pool.submit(record_cache, "worker_test", True).result(timeout=120)
+            pool.submit(record_cache, "worker_test", False).result(timeout=120)
+        finally:
+            pool.shutdown()
+        assert CACHE_REQUESTS.value(cache="worker_test", result="hit") == 1
+        assert CACHE_REQUESTS.value(cache="worker_test", result="miss") == 1
+
+    @pytest.mark.unit
+    def test_http_endpoint(self):
+        """The optional HTTP endpoint serves the registry."""
+        registry = MetricsRegistry()
+        registry.counter("scraped_total", "Scrapes.").inc()
+        server = start_http_server(0, registry=registry)
+        try:
+            port = server.server_address[1]
+            body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5).read().decode()
+        finally:
+            server.shutdown()
+        assert "scraped_total 1.0" in body
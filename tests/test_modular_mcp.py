@@ -8,6 +8,7 @@ import sys
 import pytest
 import os
 import logging
+import subprocess
 
 # Add src to path for imports
 src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
@@ -107,3 +108,18 @@ class TestModularMCP:
                     else:
                         # Expected failure case
                         pass
+
+    @pytest.mark.unit
+    def test_import_has_no_side_effects(self):
+        """Importing the server module neither starts the worker pool nor binds the metrics port."""
+        code = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "import parse_patrol.__main__\n"
+            "from parse_patrol.utils import pool\n"
+            "print(pool._pool is None and not pool._server_started)\n"
+        )
+        env = dict(os.environ, PARSE_PATROL_METRICS_PORT="0")
+        result = subprocess.run([sys.executable, "-c", code, src_path], capture_output=True, text=True, env=env, timeout=120)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "True"
+        assert "Serving metrics" not in result.stderr
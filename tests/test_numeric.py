@@ -0,0 +1,80 @@
+"""
+Tests for the bulk conversion of Fortran-formatted numbers.
+"""
+
+import sys
+import os
+import re
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.parsers.gaussian.utils import gaussian_parse
+from parse_patrol.utils.numeric import fortran_floats, fortran_ints
+from parse_patrol.utils.synthetic import random_molecule, write_gaussian_fchk, write_gaussian_gjf, write_gaussian_log
+
+
+class TestFortranNumbers:
+    """Test suite for fortran_floats, fortran_ints and their use in the Gaussian parser."""
+
+    @pytest.mark.unit
+    def test_exponents_and_whitespace(self):
+        """D and E exponents, signs and line breaks are all accepted."""
+        block = b"  1.0D+00 -2.5d-01  3.0E+00\n\n  -4.00000000E-02 5\r\n"
+        assert fortran_floats(block) == [1.0, -0.25, 3.0, -0.04, 5.0]
+        assert fortran_floats(block.decode()) == [1.0, -0.25, 3.0, -0.04, 5.0]
+        assert fortran_floats(b"2.0 4.0", scale=0.5) == [1.0, 2.0]
+        assert fortran_floats(b"") == []
+        assert fortran_ints(b"    6    1\n    8") == [6, 1, 8]
+
+    @pytest.mark.unit
+    def test_whitespace_only(self):
+        """A block of whitespace holds no values (np.fromstring alone would return one)."""
+        for block in (b" ", b"\n", b"  \r\n  ", " "):
+            assert fortran_floats(block) == []
+            assert fortran_ints(block) == []
+        with pytest.raises(ValueError):
+            fortran_floats(b" ", count=1)
+
+    @pytest.mark.unit
+    def test_empty_frequency_lines(self, tmp_path):
+        """A log whose frequency lines carry no values has no frequencies."""
+        path = write_gaussian_log(tmp_path / "freq.log", natom=4, nfreq=6)  # two lines of three
+        assert gaussian_parse(path).vibfreqs
+        path.write_text(re.sub(r"(?m)^ Frequencies --.*$", " Frequencies --   ", path.read_text()))
+        assert gaussian_parse(path).vibfreqs is None
+
+    @pytest.mark.unit
+    def test_malformed(self):
+        """A non-numeric token or a wrong count raises instead of truncating the result."""
+        with pytest.raises(ValueError):
+            fortran_floats(b"1.0 2.0 x 3.0")
+        with pytest.raises(ValueError):
+            fortran_floats(b"1.0 2.0", count=3)
+        with pytest.raises(ValueError):
+            fortran_ints(b"1 2.5")
+
+    @pytest.mark.unit
+    def test_fchk_blocks(self, tmp_path):
+        """FCHK atomic numbers and coordinates are read from their blocks only."""
+        path = write_gaussian_fchk(tmp_path / "job.fchk", natom=7, seed=3)
+        atomnos, coords = random_molecule(7, seed=3)
+        model = gaussian_parse(path)
+        assert model.atomnos == atomnos
+        assert [c for xyz in model.atomcoords for c in xyz] == pytest.approx([c for xyz in coords for c in xyz], abs=1e-6)
+
+        with open(path, "rb") as f:
+            assert gaussian_parse(f.read()).model_dump(exclude={"metadata"}) == model.model_dump(exclude={"metadata"})
+
+    @pytest.mark.unit
+    def test_gjf_zmatrix_atoms_skipped(self, tmp_path):
+        """Atoms with symbolic coordinates are skipped, as before the bulk conversion."""
+        path = write_gaussian_gjf(tmp_path / "job.gjf", natom=3)
+        reference = gaussian_parse(path)
+        path.write_text(path.read_text().replace("\n0 1\n", "\n0 1\n O  r1  0.0  0.0\n", 1))
+        model = gaussian_parse(path)
+        assert model.natom == 3
+        assert model.atomnos == reference.atomnos and model.atomcoords == reference.atomcoords
@@ -0,0 +1,57 @@
+"""
+Tests for the shared pool of pre-warmed parser workers.
+"""
+
+import sys
+import os
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.dispatch import _run_parser
+from parse_patrol.utils import pool
+from parse_patrol.utils.pool import create_pool, default_max_tasks
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestWorkerPool:
+    """Test suite for preloading, recycling and recovery of the worker pool."""
+
+    @pytest.mark.unit
+    def test_preloaded_workers(self):
+        """Workers come from the fork server with the parsers already imported."""
+        if pool.context().get_start_method() != "forkserver":
+            pytest.skip("forkserver not available")
+        executor = create_pool(1)
+        try:
+            assert executor.submit(eval, "'parse_patrol.parsers.gaussian.utils' in __import__('sys').modules").result(timeout=60)
+            assert executor.submit(os.getppid).result() != os.getpid()
+            model, error, _ = executor.submit(_run_parser, "gaussian", FREQUENCY_LOG).result(timeout=60)
+            assert error is None and model.final_energy is not None
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.unit
+    def test_recycling_and_recovery(self, monkeypatch):
+        """Workers are replaced after max_tasks_per_child tasks, and after one of them died."""
+        executor = create_pool(1, max_tasks_per_child=2)
+        try:
+            pids = [executor.submit(os.getpid).result(timeout=60) for _ in range(5)]
+            assert executor.generations == 3
+            assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+
+            with pytest.raises(BrokenProcessPool):
+                executor.submit(os._exit, 1).result(timeout=60)
+            assert executor.submit(abs, -3).result(timeout=60) == 3
+        finally:
+            executor.shutdown()
+
+        monkeypatch.setenv("PARSE_PATROL_MAX_TASKS_PER_CHILD", "0")
+        assert default_max_tasks() is None
+        monkeypatch.delenv("PARSE_PATROL_MAX_TASKS_PER_CHILD")
+        assert default_max_tasks() == pool.DEFAULT_MAX_TASKS_PER_CHILD
@@ -0,0 +1,99 @@
+"""
+Tests for the opt-in parse profiler.
+"""
+
+import sys
+import os
+import pstats
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.cli import main
+from parse_patrol.dispatch import STATS
+from parse_patrol.parsers.gaussian.utils import gaussian_parse
+from parse_patrol.utils import profiling
+from parse_patrol.utils.profiling import profile_report
+from parse_patrol.utils.synthetic import write_gaussian_gjf, write_gaussian_log
+
+
+class TestProfiling:
+    """Test suite for profiled parse sessions and the merged profile report."""
+
+    @pytest.fixture
+    def files(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(profiling.PROFILE_ENV, raising=False)
+        monkeypatch.delenv(profiling.PROFILER_ENV, raising=False)
+        snapshot = STATS.to_dict()
+        paths = []
+        for i in range(4):
+            paths.append(str(write_gaussian_log(tmp_path / f"opt{i}.log", natom=30, opt_steps=1 + 8 * i, seed=i)))
+        paths.append(str(write_gaussian_gjf(tmp_path / "job.gjf", natom=5)))
+        yield paths
+        profiling.disable()
+        STATS.load(snapshot)
+
+    @pytest.mark.unit
+    def test_cprofile_groups(self, files, tmp_path):
+        """Profiles are summed per parser and file type, and the slowest parse keeps its own."""
+        profiling.enable(str(tmp_path / "profiles"))
+        for path in files:
+            gaussian_parse(path)
+        assert gaussian_parse(files[0], instrument=False).metadata.get("instrumentation") is None
+        profiling.disable()
+
+        report = profile_report(str(tmp_path / "profiles"))
+        groups = {(group.parser, group.file_type): group for group in report.groups}
+        assert groups[("gaussian", "log")].files == 4 and groups[("gaussian", "input")].files == 1
+        stats = pstats.Stats(groups[("gaussian", "log")].profiles[0])
+        assert any(name == "_gaussian_dispatch" for _, _, name in stats.stats)
+        (slow,) = report.slowest
+        assert slow.wall_time == groups[("gaussian", "log")].max_time and os.path.exists(slow.profile)
+
+    @pytest.mark.unit
+    def test_sessions_appended(self, files, tmp_path):
+        """Each dump appends only the new sessions; the collector does not keep them."""
+        collector = profiling.enable(str(tmp_path / "profiles"))
+        gaussian_parse(files[0])
+        root = collector.dump()
+        gaussian_parse(files[1])
+        assert collector.dump() == root and collector.dump() == root
+        assert collector._pending == []
+        with open(os.path.join(root, "sessions.jsonl")) as f:
+            assert len(f.readlines()) == 2
+
+        report = profile_report(str(tmp_path / "profiles"))
+        assert [group.files for group in report.groups] == [2]
+        assert report.slowest[0].source in files[:2] and os.path.exists(report.slowest[0].profile)
+
+    @pytest.mark.unit
+    def test_sampled_stacks(self, files, tmp_path, monkeypatch):
+        """Per-call profiling with the sampler writes collapsed stacks of the parser's frames."""
+        monkeypatch.setenv(profiling.PROFILE_ENV, str(tmp_path / "samples"))
+        monkeypatch.setenv(profiling.PROFILER_ENV, "sample")
+        monkeypatch.setattr(profiling, "SAMPLE_INTERVAL", 0.001)
+        big = str(write_gaussian_log(tmp_path / "big.log", natom=100, opt_steps=80, seed=9))
+        model = gaussian_parse(big, instrument="profile")
+        assert model.metadata["instrumentation"]["wall_time"] > 0
+        profiling.disable()
+
+        (group,) = profile_report(str(tmp_path / "samples")).groups
+        with open(group.profiles[0]) as f:
+            lines = f.read().splitlines()
+        assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert any("gaussian/utils.py" in line for line in lines)
+
+    @pytest.mark.unit
+    def test_cli(self, files, tmp_path, capsys):
+        """`parse --profile` profiles a run, `profile` reports it."""
+        directory = str(tmp_path / "cli")
+        assert main(["parse", *files, "-o", str(tmp_path / "out.jsonl"), "-j", "1", "-q", "--profile", directory]) == 0
+        capsys.readouterr()
+        assert main(["profile", directory]) == 0
+        out = capsys.readouterr().out
+        assert "gaussian/log: 4 files" in out
+        assert any(path in out.split("slowest:")[1] for path in files)
+        assert main(["profile", str(tmp_path / "empty")]) == 2
@@ -0,0 +1,85 @@
+"""
+Tests for the fast JSON serialization of parse results.
+"""
+
+import sys
+import os
+import asyncio
+import json
+from multiprocessing import shared_memory
+
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+np = pytest.importorskip("numpy")
+
+from parse_patrol import aio
+from parse_patrol.parsers.gaussian.utils import CustomGaussianDataModel, gaussian_parse
+from parse_patrol.utils import serialize
+from parse_patrol.utils.serialize import dump_fast
+from parse_patrol.utils.shm import share
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run with orjson (if installed) and with the standard library fallback."""
+    if request.param == "orjson":
+        if serialize.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(serialize, "orjson", None)
+    return request.param
+
+
+class TestDumpFast:
+    """Test suite for dump_fast and aio.parse_json."""
+
+    @pytest.fixture
+    def model(self):
+        rng = np.random.default_rng(0)
+        return CustomGaussianDataModel(
+            natom=3000,
+            atomnos=rng.integers(1, 10, 3000).tolist(),
+            atomcoords=rng.normal(size=(3000, 3)).tolist(),
+            temperature=float("nan"),
+            metadata={"source": "big.log", "grid": rng.normal(size=(16, 16, 16)).tolist()},
+        )
+
+    @pytest.mark.unit
+    def test_same_as_model_dump_json(self, backend, model):
+        """Models serialize to the same JSON as `model_dump_json`, NaN included."""
+        for item in (model, gaussian_parse(FREQUENCY_LOG)):
+            assert json.loads(dump_fast(item)) == json.loads(item.model_dump_json())
+        assert json.loads(dump_fast(model, indent=True)) == json.loads(model.model_dump_json())
+
+    @pytest.mark.unit
+    def test_arrays_and_precision(self, backend):
+        """NumPy arrays and scalars are written directly, and floats can be rounded."""
+        data = {"grid": np.arange(6.0).reshape(2, 3)[:, ::2] / 3, "scalar": np.float32(1.25), "ints": [1, 2], "pair": (0.123456, None)}
+        assert json.loads(dump_fast(data)) == {"grid": [[0.0, 2 / 3], [1.0, 5 / 3]], "scalar": 1.25, "ints": [1, 2], "pair": [0.123456, None]}
+        assert json.loads(dump_fast(data, precision=2)) == {"grid": [[0.0, 0.67], [1.0, 1.67]], "scalar": 1.25, "ints": [1, 2], "pair": [0.12, None]}
+
+    @pytest.mark.unit
+    def test_shared_result(self, backend, model):
+        """Shared results are serialized from shared memory, which is freed afterwards."""
+        result = share(model)
+        payload = dump_fast(result, precision=4)
+        assert json.loads(payload) == json.loads(dump_fast(model, precision=4))
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(result.name)
+
+    @pytest.mark.unit
+    def test_parse_json(self):
+        """The async API parses in the pool and returns JSON bytes."""
+        aio.configure(1)
+        try:
+            payload = asyncio.run(aio.parse_json(FREQUENCY_LOG, "gaussian", precision=3))
+        finally:
+            aio.shutdown()
+        assert json.loads(payload)["final_energy"] == round(gaussian_parse(FREQUENCY_LOG).final_energy, 3)
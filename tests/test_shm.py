@@ -0,0 +1,79 @@
+"""
+Tests for the shared-memory transport of parse results.
+"""
+
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+np = pytest.importorskip("numpy")
+
+from parse_patrol.dispatch import _run_parser_shared
+from parse_patrol.parsers.gaussian.utils import CustomGaussianDataModel
+from parse_patrol.utils.shm import SharedResult, receive, share
+from parse_patrol.utils.synthetic import write_gaussian_log
+
+
+def _freed(result: SharedResult) -> bool:
+    try:
+        shared_memory.SharedMemory(result.name).close()
+    except FileNotFoundError:
+        return True
+    return False
+
+
+class TestSharedMemory:
+    """Test suite for share/receive."""
+
+    @pytest.fixture
+    def model(self):
+        rng = np.random.default_rng(0)
+        return CustomGaussianDataModel(
+            natom=3000,
+            atomnos=rng.integers(1, 10, 3000).tolist(),
+            atomcoords=rng.normal(size=(3000, 3)).tolist(),
+            vibfreqs=[1.0, 2.0],
+            metadata={"source": "big.log", "grid": rng.normal(size=(16, 16, 16)).tolist()},
+        )
+
+    @pytest.mark.unit
+    def test_roundtrip(self, model):
+        """Large arrays (also nested in dicts) travel through shared memory; the rest is pickled as is."""
+        result = share(model)
+        assert isinstance(result, SharedResult)
+        assert sorted(path for path, *_ in result.specs) == ["atomcoords", "metadata.grid"]
+        with result.attach() as arrays:
+            assert arrays["atomcoords"].shape == (3000, 3)
+            assert arrays["metadata.grid"].tolist() == model.metadata["grid"]
+        assert _freed(result)
+
+        result = share(model, min_elements=1000)
+        assert "atomnos" in [path for path, *_ in result.specs]
+        restored = receive(result)
+        assert restored == model
+        assert type(restored.atomnos[0]) is int
+        assert _freed(result)
+
+        small = CustomGaussianDataModel(natom=1, atomcoords=[[0.0, 0.0, 0.0]])
+        assert share(small) is small
+        assert receive(small) is small
+
+    @pytest.mark.unit
+    def test_pool(self, tmp_path):
+        """Results parsed in worker processes arrive intact, and their blocks are freed."""
+        log = str(write_gaussian_log(tmp_path / "big.log", natom=1500, nfreq=3))
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            model, error, _ = pool.submit(_run_parser_shared, "gaussian", log).result()
+        assert error is None and isinstance(model, SharedResult)
+        from parse_patrol.parsers.gaussian.utils import gaussian_parse
+        assert receive(model) == gaussian_parse(log)
+        assert _freed(model)
+
+        model.discard()  # already freed: no error
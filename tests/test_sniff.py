@@ -0,0 +1,95 @@
+"""
+Tests for the content-based format sniffing.
+"""
+
+import sys
+import os
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.utils import sniff as sniff_module
+from parse_patrol.utils.metrics import CACHE_REQUESTS
+from parse_patrol.utils.synthetic import write_cube, write_gaussian_fchk, write_gaussian_gjf, write_gaussian_log, write_xyz
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian")
+
+
+class TestSniff:
+    """Test suite for header/tail based file classification."""
+
+    @pytest.mark.unit
+    def test_bundled_gaussian_files(self):
+        """Program, version, type and completion of the bundled Gaussian files."""
+        log = sniff_module.sniff(os.path.join(DATA_DIR, "FREQUENCY.LOG"))
+        assert (log.program, log.version, log.file_type, log.completed) == ("gaussian", "Gaussian 09 Rev. D.01", "log", True)
+        assert log.cclib_parser == "Gaussian"
+
+        gjf = sniff_module.sniff(os.path.join(DATA_DIR, "frequency.gjf"))
+        assert (gjf.program, gjf.file_type) == ("gaussian", "input")
+
+        chk = sniff_module.sniff(os.path.join(DATA_DIR, "frequency.chk"))
+        assert chk.binary and chk.file_type == "chk"
+
+    @pytest.mark.unit
+    def test_content_beats_extension(self, tmp_path):
+        """Misnamed files are classified by their content."""
+        assert sniff_module.sniff(str(write_gaussian_fchk(tmp_path / "a.txt", natom=3))).file_type == "fchk"
+        assert sniff_module.sniff(str(write_gaussian_gjf(tmp_path / "b.txt", natom=3))).file_type == "input"
+        assert sniff_module.sniff(str(write_xyz(tmp_path / "c.txt", natom=3))).file_type == "xyz"
+        assert sniff_module.sniff(str(write_cube(tmp_path / "d.txt", natom=3, shape=(3, 3, 3)))).file_type == "cube"
+        assert sniff_module.sniff(str(write_gaussian_log(tmp_path / "e.txt", natom=3))).file_type == "log"
+
+    @pytest.mark.unit
+    def test_truncated_log(self, tmp_path):
+        """A log without the termination message in its tail is not completed."""
+        path = write_gaussian_log(tmp_path / "running.log", natom=20, opt_steps=5, complete=False)
+        assert os.path.getsize(path) > sniff_module.HEAD_BYTES + sniff_module.TAIL_BYTES
+        info = sniff_module.sniff(str(path))
+        assert info.program == "gaussian" and info.completed is False
+
+    @pytest.mark.unit
+    def test_cache(self, tmp_path):
+        """Repeated sniffs hit the cache until the file changes."""
+        path = write_gaussian_log(tmp_path / "job.log", natom=3, complete=False)
+        hits = CACHE_REQUESTS.value(cache="sniff", result="hit")
+
+        assert sniff_module.sniff(str(path)).completed is False
+        assert sniff_module.sniff(str(path)).completed is False
+        assert CACHE_REQUESTS.value(cache="sniff", result="hit") == hits + 1
+
+        write_gaussian_log(path, natom=3, opt_steps=2)
+        assert sniff_module.sniff(str(path)).completed is True
+
+    @pytest.mark.unit
+    def test_parsers_route_by_content(self, tmp_path):
+        """The Gaussian parser dispatches a misnamed log to the log parser."""
+        try:
+            from parse_patrol.parsers.gaussian.utils import gaussian_parse
+        except ImportError:
+            pytest.skip("Gaussian parser dependencies not available")
+
+        result = gaussian_parse(str(write_gaussian_log(tmp_path / "job.txt", natom=4, nfreq=3)))
+        assert result.natom == 4
+        assert result.metadata["parser"] == "gaussian-log"
+        assert result.metadata["completed"] is True
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name,file_type", [
+        ("POSCAR", "poscar"), ("CONTCAR", "poscar"), ("CHGCAR", "chgcar"), ("LOCPOT", "locpot"), ("OUTCAR", "outcar"),
+    ])
+    def test_vasp_names(self, tmp_path, name, file_type):
+        """VASP files are recognized by name, also with POSCAR-style content only."""
+        path = tmp_path / f"{name}.relaxed"
+        path.write_text("Si2\n1.0\n5.43 0.0 0.0\n0.0 5.43 0.0\n0.0 0.0 5.43\nSi\n2\nDirect\n0.0 0.0 0.0\n0.25 0.25 0.25\n")
+        info = sniff_module.sniff(str(path))
+        assert (info.program, info.file_type) == ("vasp", file_type)
+
+        try:
+            from parse_patrol.parsers.iodata.utils import _iodata_to_dict
+        except ImportError:
+            return
+        assert _iodata_to_dict(object(), str(path))["detected_software"] == "VASP"
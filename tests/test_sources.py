@@ -0,0 +1,140 @@
+"""
+Tests for compressed files, archive members and in-memory data as parser inputs.
+"""
+
+import sys
+import os
+import bz2
+import gzip
+import io
+import lzma
+import tarfile
+import zipfile
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.parsers.gaussian.utils import gaussian_parse
+from parse_patrol.utils.sniff import sniff
+from parse_patrol.utils.sources import MemorySource, as_source, iter_members, local_path, logical_name, read_text, source_exists
+from parse_patrol.utils.synthetic import write_gaussian_fchk
+from parse_patrol.utils.triage import triage
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestSources:
+    """Test suite for reading through compression and archives."""
+
+    @pytest.fixture
+    def bundle(self, tmp_path):
+        log = open(FREQUENCY_LOG, "rb").read()
+        fchk = write_gaussian_fchk(tmp_path / "mo.fchk", natom=3, nbasis=20)
+        (tmp_path / "job.log.gz").write_bytes(gzip.compress(log))
+        (tmp_path / "job.out.bz2").write_bytes(bz2.compress(log))
+        (tmp_path / "mo.fchk.xz").write_bytes(lzma.compress(fchk.read_bytes()))
+        with tarfile.open(tmp_path / "bundle.tar.gz", "w:gz") as tar:
+            tar.add(FREQUENCY_LOG, "run/job.log")
+        with zipfile.ZipFile(tmp_path / "raw.zip", "w") as z:
+            z.write(fchk, "mo.fchk")
+            z.writestr("job.log.gz", gzip.compress(log))
+        fchk.unlink()
+        return tmp_path
+
+    @pytest.mark.unit
+    def test_names(self):
+        assert logical_name("a/job.log.gz") == "a/job.log"
+        assert logical_name("bundle.tar.gz") == "bundle.tar.gz"
+        assert logical_name("raw.zip::run/job.fchk.xz") == "run/job.fchk"
+
+    @pytest.mark.unit
+    def test_gaussian_parse_sources(self, bundle):
+        """Compressed files and archive members parse like the plain file."""
+        reference = gaussian_parse(FREQUENCY_LOG)
+        sources = [str(bundle / "job.log.gz"), str(bundle / "job.out.bz2")]
+        sources += list(iter_members(bundle / "bundle.tar.gz"))
+        sources += [m for m in iter_members(bundle / "raw.zip") if m.endswith(".gz")]
+        assert sources[2].endswith("bundle.tar.gz::run/job.log")
+        for source in sources:
+            info = sniff(source)
+            assert (info.program, info.file_type, info.completed) == ("gaussian", "log", True)
+            assert info.size == os.path.getsize(FREQUENCY_LOG)
+            model = gaussian_parse(source)
+            assert model.final_energy == reference.final_energy
+            assert model.vibfreqs == reference.vibfreqs
+
+        fchk = gaussian_parse(str(bundle / "mo.fchk.xz"))
+        assert fchk.natom == 3
+        assert gaussian_parse(f"{bundle / 'raw.zip'}::mo.fchk").atomcoords == fchk.atomcoords
+
+    @pytest.mark.unit
+    def test_other_parsers(self, bundle):
+        """cclib streams the decompressed text; iodata reads a temporary copy."""
+        from parse_patrol import available_parsers
+        if "cclib" in available_parsers():
+            from parse_patrol.parsers.cclib.utils import cclib_parse
+            assert cclib_parse(str(bundle / "job.log.gz")).natom == 20
+            assert cclib_parse(f"{bundle / 'raw.zip'}::mo.fchk").natom == 3
+        if "iodata" in available_parsers():
+            from parse_patrol.parsers.iodata.utils import iodata_parse
+            assert iodata_parse(str(bundle / "mo.fchk.xz")).atnums == gaussian_parse(str(bundle / "mo.fchk.xz")).atomnos
+        with local_path(str(bundle / "mo.fchk.xz")) as path:
+            assert path.endswith(".fchk") and os.path.exists(path)
+        assert not os.path.exists(path)
+
+    @pytest.mark.unit
+    def test_missing_and_triage(self, bundle):
+        """Missing members are reported; archives are not flagged as binary garbage."""
+        assert source_exists(f"{bundle / 'raw.zip'}::mo.fchk")
+        assert not source_exists(f"{bundle / 'raw.zip'}::missing.log")
+        assert gaussian_parse(f"{bundle / 'raw.zip'}::missing.log").metadata["error"].startswith("File not found")
+        assert "Normal termination" in read_text(f"{bundle / 'bundle.tar.gz'}::run/job.log")
+
+        text = lzma.decompress((bundle / "mo.fchk.xz").read_bytes())
+        (bundle / "cut.fchk.gz").write_bytes(gzip.compress(text[: len(text) // 2]))
+        report = triage(str(bundle))
+        assert sniff(str(bundle / "raw.zip")).file_type == "archive"
+        assert [os.path.basename(f.path) for f in report.corrupted] == ["cut.fchk.gz"]
+        assert report.corrupted[0].issues[0].code == "fchk_incomplete"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("chunk", [7, 64, 1 << 20])
+    def test_memoryview_lines(self, monkeypatch, chunk):
+        """Memoryviews are split into lines a chunk at a time, like bytes.splitlines."""
+        from parse_patrol.parsers.gaussian import utils
+        monkeypatch.setattr(utils, "_LINES_CHUNK", chunk)
+        data = open(FREQUENCY_LOG, "rb").read()[:5000] + b"a line longer than a chunk " * 10 + b"\r\nlast\rline"
+        assert utils._read_lines(MemorySource(memoryview(data))) == data.splitlines()
+
+    @pytest.mark.unit
+    def test_in_memory(self, bundle):
+        """Bytes, memoryviews and file-like objects parse like the file they hold."""
+        data = open(FREQUENCY_LOG, "rb").read()
+        reference = gaussian_parse(FREQUENCY_LOG)
+        inputs = [data, bytearray(data), memoryview(data), io.BytesIO(data),
+                  io.StringIO(data.decode("utf-8")), MemorySource(data, "job.log")]
+        for source in inputs:
+            model = gaussian_parse(source)
+            assert model.final_energy == reference.final_energy
+            assert model.vibfreqs == reference.vibfreqs
+            assert model.atomcoords == reference.atomcoords
+
+        fchk = lzma.decompress((bundle / "mo.fchk.xz").read_bytes())
+        assert gaussian_parse(memoryview(fchk)).atomcoords == gaussian_parse(str(bundle / "mo.fchk.xz")).atomcoords
+        assert gaussian_parse(memoryview(bytearray(fchk))).atomnos == gaussian_parse(fchk).atomnos
+        assert as_source(memoryview(data)).data.obj is data  # not copied
+        with open(FREQUENCY_LOG, "rb") as f:
+            assert str(as_source(f)) == FREQUENCY_LOG
+        with pytest.raises(TypeError):
+            as_source(42)
+
+        from parse_patrol import available_parsers
+        if "cclib" in available_parsers():
+            from parse_patrol.parsers.cclib.utils import cclib_parse
+            assert cclib_parse(io.BytesIO(data)).natom == 20
+        if "iodata" in available_parsers():
+            from parse_patrol.parsers.iodata.utils import iodata_parse
+            assert iodata_parse(MemorySource(fchk, "mo.fchk")).atnums == [int(a) for a in gaussian_parse(fchk).atomnos]
@@ -0,0 +1,74 @@
+"""
+Tests for the synthetic input generator used by the scaling benchmarks.
+"""
+
+import sys
+import os
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.utils.synthetic import write_gaussian_fchk, write_gaussian_gjf, write_gaussian_log, write_xyz
+
+
+class TestSynthetic:
+    """Test suite for the synthetic file writers."""
+
+    @pytest.mark.unit
+    def test_deterministic(self, tmp_path):
+        """The same arguments produce byte-identical files; another seed does not."""
+        a = write_gaussian_log(tmp_path / "a.log", natom=6, opt_steps=3, seed=7)
+        b = write_gaussian_log(tmp_path / "b.log", natom=6, opt_steps=3, seed=7)
+        c = write_gaussian_log(tmp_path / "c.log", natom=6, opt_steps=3, seed=8)
+        assert a.read_bytes() == b.read_bytes()
+        assert a.read_bytes() != c.read_bytes()
+
+    @pytest.mark.unit
+    def test_gaussian_parser_reads_output(self, tmp_path):
+        """The custom Gaussian parser extracts the configured sizes."""
+        try:
+            from parse_patrol.parsers.gaussian.utils import gaussian_parse
+        except ImportError:
+            pytest.skip("Gaussian parser dependencies not available")
+
+        log = gaussian_parse(str(write_gaussian_log(tmp_path / "opt.log", natom=8, opt_steps=4, nfreq=9)))
+        assert log.natom == 8
+        assert len(log.scfenergies) == 4
+        assert len(log.vibfreqs) == 9
+        assert log.scfenergies[-1] == min(log.scfenergies)
+
+        fchk = gaussian_parse(str(write_gaussian_fchk(tmp_path / "mo.fchk", natom=3, nbasis=30)))
+        assert fchk.natom == 3
+
+        gjf = gaussian_parse(str(write_gaussian_gjf(tmp_path / "input.gjf", natom=5)))
+        assert gjf.natom == 5
+
+    @pytest.mark.unit
+    def test_community_parsers_read_output(self, tmp_path):
+        """cclib reads the logs, iodata the FCHK and XYZ files."""
+        try:
+            from parse_patrol.parsers.cclib.utils import cclib_parse
+            from parse_patrol.parsers.iodata.utils import iodata_parse
+        except ImportError:
+            pytest.skip("cclib/iodata dependencies not available")
+
+        log = cclib_parse(str(write_gaussian_log(tmp_path / "opt.log", natom=5, opt_steps=3, nfreq=9, link1=True)))
+        assert log.natom == 5
+        assert len(log.vibfreqs) == 9
+        assert log.optdone
+
+        fchk = iodata_parse(str(write_gaussian_fchk(tmp_path / "mo.fchk", natom=3, nbasis=30)))
+        assert len(fchk.atnums) == 3
+        assert fchk.energy is not None
+
+        xyz = iodata_parse(str(write_xyz(tmp_path / "traj.xyz", natom=4, nframes=3)))
+        assert len(xyz.atnums) == 4
+
+    @pytest.mark.unit
+    def test_fchk_basis_too_small(self, tmp_path):
+        """An FCHK cannot hold fewer basis functions than occupied orbitals."""
+        with pytest.raises(ValueError):
+            write_gaussian_fchk(tmp_path / "mo.fchk", natom=10, nbasis=2)
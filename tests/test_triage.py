@@ -0,0 +1,75 @@
+"""
+Tests for the corrupted-file triage.
+"""
+
+import sys
+import os
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.utils.synthetic import write_gaussian_fchk, write_gaussian_log, write_xyz
+from parse_patrol.utils.triage import check_fchk, triage, triage_file
+
+
+class TestTriage:
+    """Test suite for the cheap corruption checks and the parallel report."""
+
+    @pytest.mark.unit
+    def test_issues(self, tmp_path):
+        """Each kind of corruption is reported with its code."""
+        empty = tmp_path / "empty.log"
+        empty.write_bytes(b"")
+        garbage = tmp_path / "garbage.out"
+        garbage.write_bytes(b"\x00\xff" * 1000)
+        latin = tmp_path / "latin.xyz"
+        latin.write_bytes("1\ncaf\xe9\nH 0.0 0.0 0.0\n".encode("latin-1"))
+        truncated = write_gaussian_log(tmp_path / "truncated.log", natom=20, opt_steps=3, complete=False)
+
+        assert [i.code for i in triage_file(str(empty)).issues] == ["empty"]
+        assert [i.code for i in triage_file(str(garbage)).issues] == ["binary"]
+        assert [i.code for i in triage_file(str(latin)).issues] == ["encoding"]
+        assert [i.code for i in triage_file(str(truncated)).issues] == ["truncated"]
+
+    @pytest.mark.unit
+    def test_fchk_sections(self, tmp_path):
+        """Complete checkpoints pass, a checkpoint cut inside an array does not."""
+        assert check_fchk(str(write_gaussian_fchk(tmp_path / "ok.fchk", natom=4, nbasis=200))) is None
+
+        issue = check_fchk(str(write_gaussian_fchk(tmp_path / "cut.fchk", natom=4, nbasis=200, complete=False)))
+        assert issue.code == "fchk_incomplete"
+        assert "Alpha MO coefficients" in issue.detail
+
+    @pytest.mark.unit
+    def test_report_over_tree(self, tmp_path):
+        """A directory tree is triaged recursively; only passing files are parsed."""
+        (tmp_path / "sub").mkdir()
+        write_gaussian_log(tmp_path / "ok.log", natom=4, nfreq=3)
+        write_gaussian_log(tmp_path / "sub" / "crashed.log", natom=4, complete=False)
+        write_xyz(tmp_path / "sub" / "coords.xyz", natom=3)
+        (tmp_path / ".hidden").write_bytes(b"")
+
+        report = triage(str(tmp_path))
+        assert [os.path.basename(f.path) for f in report.files] == ["ok.log", "coords.xyz", "crashed.log"]
+        assert report.counts == {"ok": 2, "corrupted": 1}
+        assert [os.path.basename(f.path) for f in report.corrupted] == ["crashed.log"]
+
+        try:
+            from parse_patrol.parsers.gaussian.utils import gaussian_parse  # noqa: F401
+        except ImportError:
+            pytest.skip("Gaussian parser dependencies not available")
+        parsed = triage(str(tmp_path / "ok.log"), parse=True)
+        assert parsed.files[0].status == "parsed"
+        assert parsed.files[0].parser == "gaussian_parse"
+
+    @pytest.mark.unit
+    def test_missing_path(self, tmp_path):
+        """A missing root is reported as unreadable, next to the files of the roots that exist."""
+        write_xyz(tmp_path / "coords.xyz", natom=3)
+        report = triage([str(tmp_path / "missing"), str(tmp_path)])
+        assert report.counts == {"ok": 1, "corrupted": 1}
+        assert report.corrupted[0].path == str(tmp_path / "missing")
+        assert [i.code for i in report.corrupted[0].issues] == ["unreadable"]
@@ -0,0 +1,68 @@
+"""
+Tests for the trusted (unvalidated) construction of parser models.
+"""
+
+import sys
+import os
+import pytest
+from pydantic import ValidationError
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from parse_patrol.utils.synthetic import write_cube, write_xyz
+from parse_patrol.utils.trusted import VALIDATE_ENV, build_model, resolve_validate, validate_model
+
+try:
+    from parse_patrol.parsers.iodata.utils import IODataCubeModel, IODataModel, iodata_parse
+    IODATA_AVAILABLE = True
+except ImportError:
+    IODATA_AVAILABLE = False
+
+
+@pytest.mark.skipif(not IODATA_AVAILABLE, reason="iodata dependencies not available")
+class TestTrustedModels:
+    """Test suite for build_model, validate_model and the converters' `validate` option."""
+
+    @pytest.mark.unit
+    def test_validate_resolution(self, monkeypatch):
+        """`validate` defaults to the environment variable, off when unset."""
+        monkeypatch.delenv(VALIDATE_ENV, raising=False)
+        assert resolve_validate(None) is False
+        monkeypatch.setenv(VALIDATE_ENV, "1")
+        assert resolve_validate(None) is True
+        assert resolve_validate(False) is False
+
+    @pytest.mark.unit
+    def test_build_trusted_and_validated(self):
+        """Trusted models skip validation, including nested models; validation stays available."""
+        fields = {"atnums": [1, 8], "cube": {"origin": [0.0] * 3, "axes": [[1.0, 0.0, 0.0]] * 3, "data": [[[0.5]]], "shape": [1, 1, 1]}}
+        trusted = build_model(IODataModel, fields, validate=False)
+        assert isinstance(trusted.cube, IODataCubeModel)
+        assert trusted.model_dump() == build_model(IODataModel, fields, validate=True).model_dump()
+
+        bad = build_model(IODataModel, {"atnums": ["not a number"]}, validate=False)
+        assert bad.atnums == ["not a number"]
+        with pytest.raises(ValidationError):
+            validate_model(bad)
+        with pytest.raises(ValidationError):
+            build_model(IODataModel, {"atnums": ["not a number"]}, validate=True)
+
+    @pytest.mark.unit
+    def test_parse_modes_agree(self, tmp_path):
+        """Trusted and validated parses of the same file give the same model."""
+        for path in (write_xyz(tmp_path / "mol.xyz", natom=20), write_cube(tmp_path / "grid.cube", natom=3, shape=(4, 5, 6))):
+            trusted = iodata_parse(path, validate=False)
+            validated = iodata_parse(path, validate=True)
+            assert trusted.model_dump() == validated.model_dump()
+            assert validate_model(trusted) == validated
+
+    @pytest.mark.unit
+    def test_cube_and_cell(self, tmp_path):
+        """Cube grids and their cell vectors convert to nested lists."""
+        model = iodata_parse(write_cube(tmp_path / "grid.cube", natom=3, shape=(4, 5, 6)), validate=True)
+        assert model.cube.shape == [4, 5, 6]
+        assert len(model.cube.data) == 4 and len(model.cube.data[0][0]) == 6
+        assert len(model.cellvecs) == 3 and len(model.cellvecs[0]) == 3
@@ -0,0 +1,114 @@
+"""
+Tests for the MessagePack wire format of parse results.
+"""
+
+import sys
+import os
+import asyncio
+from multiprocessing import shared_memory
+
+import pytest
+
+# Add src to path for imports
+src_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+np = pytest.importorskip("numpy")
+msgpack = pytest.importorskip("msgpack")
+
+from parse_patrol import aio
+from parse_patrol.parsers.gaussian.utils import CustomGaussianDataModel, gaussian_parse
+from parse_patrol.utils.manifest import Manifest
+from parse_patrol.utils.shm import share
+from parse_patrol.utils.synthetic import write_cube, write_gaussian_log
+from parse_patrol.utils.wire import SCHEMA_VERSION, decode, encode
+
+FREQUENCY_LOG = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".pipelines", "data", "gaussian", "FREQUENCY.LOG")
+
+
+class TestWire:
+    """Test suite for encode/decode and the msgpack output of the batch APIs."""
+
+    @pytest.fixture
+    def model(self):
+        rng = np.random.default_rng(0)
+        return CustomGaussianDataModel(
+            natom=500,
+            atomnos=rng.integers(1, 10, 500).tolist(),
+            atomcoords=rng.normal(size=(500, 3)).tolist(),
+            temperature=float("nan"),
+            metadata={"source": "big.log", "grid": rng.normal(size=(8, 8, 8)).tolist(), "labels": ["a", "b"]},
+        )
+
+    @pytest.mark.unit
+    def test_round_trip(self, model, tmp_path):
+        """Every parser's model decodes to an equal model, with arrays packed as raw buffers."""
+        models = [model, gaussian_parse(FREQUENCY_LOG)]
+        try:
+            from parse_patrol.parsers.cclib.utils import cclib_parse
+            models.append(cclib_parse(FREQUENCY_LOG))
+        except ImportError:
+            pass
+        try:
+            from parse_patrol.parsers.iodata.utils import iodata_parse
+            models.append(iodata_parse(write_cube(tmp_path / "grid.cube", natom=3, shape=(4, 5, 6))))
+        except ImportError:
+            pass
+        for item in models:
+            decoded = decode(encode(item))
+            assert type(decoded) is type(item)
+            assert decoded.model_dump_json() == item.model_dump_json()
+
+        payload = encode(model)
+        assert len(payload) < len(model.model_dump_json())
+        fields = decode(payload, as_model=False)
+        assert isinstance(fields["atomcoords"], np.ndarray) and fields["atomcoords"].shape == (500, 3)
+        assert fields["atomnos"].dtype.kind == "i"
+        assert fields["metadata"]["labels"] == ["a", "b"]
+        assert np.isnan(fields["temperature"])
+
+    @pytest.mark.unit
+    def test_precision_and_shared(self, model):
+        """Floats can be rounded, and shared results are packed from shared memory, which is then freed."""
+        rounded = decode(encode(model, precision=2))
+        assert rounded.atomcoords[0] == [round(x, 2) for x in model.atomcoords[0]]
+
+        result = share(model, min_elements=64)
+        assert decode(encode(result)).model_dump_json() == model.model_dump_json()
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(result.name)
+
+    @pytest.mark.unit
+    def test_rejects_foreign_payloads(self):
+        """Newer schema versions, unknown model types and non-envelopes are refused."""
+        with pytest.raises(ValueError, match="schema version"):
+            decode(msgpack.packb({"schema": SCHEMA_VERSION + 1, "type": None, "data": {}}))
+        with pytest.raises(ValueError, match="Unknown model type"):
+            decode(msgpack.packb({"schema": SCHEMA_VERSION, "type": "os.system", "data": {}}))
+        with pytest.raises(ValueError, match="Not a parse-patrol payload"):
+            decode(msgpack.packb([1, 2, 3]))
+        assert decode(encode({"energies": [1.5] * 10})) == {"energies": [1.5] * 10}
+
+    @pytest.mark.unit
+    def test_batch_outputs(self, tmp_path):
+        """parse_stream and manifest scans can deliver msgpack payloads."""
+        async def collect():
+            return [result async for result in aio.parse_stream([FREQUENCY_LOG], parser="gaussian", output="msgpack")]
+
+        aio.configure(1)
+        try:
+            (result,) = asyncio.run(collect())
+        finally:
+            aio.shutdown()
+        assert result.model is None
+        assert decode(result.data).final_energy == gaussian_parse(FREQUENCY_LOG).final_energy
+
+        (tmp_path / "tree").mkdir()
+        write_gaussian_log(tmp_path / "tree" / "opt.log", natom=4, opt_steps=2, seed=1)
+        with Manifest(str(tmp_path / "manifest.sqlite")) as manifest:
+            manifest.scan(str(tmp_path / "tree"), results_dir=str(tmp_path / "results"), result_format="msgpack")
+            entry = manifest.get(str(tmp_path / "tree" / "opt.log"))
+        assert entry.result_path.endswith(".msgpack")
+        with open(entry.result_path, "rb") as f:
+            assert decode(f.read()).natom == 4